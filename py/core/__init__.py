@@ -80,6 +80,9 @@ __all__ = [
     "VectorSearchResult",
     "SearchSettings",
     "HybridSearchSettings",
+    "HybridSearchExecutionMode",
+    "VectorSearchPlan",
+    "VectorSearchPlanSettings",
     # User abstractions
     "Token",
     "TokenData",
@@ -110,6 +113,7 @@ __all__ = [
     "LogFilterCriteria",
     "LogProcessor",
     # Logging Providers
+    "LogBufferSettings",
     "PersistentLoggingConfig",
     # Run Manager
     "RunManager",
@@ -117,6 +121,8 @@ __all__ = [
     ## PARSERS
     # Base parser
     "AsyncParser",
+    "ParserExecutionMode",
+    "ParserExecutor",
     ## PIPELINE
     # Base pipeline
     "AsyncPipeline",
@@ -129,11 +135,14 @@ __all__ = [
     "Provider",
     "ProviderConfig",
     # Auth provider
+    "AuthCache",
+    "AuthCacheSettings",
     "AuthConfig",
     "AuthProvider",
     # Crypto provider
     "CryptoConfig",
     "CryptoProvider",
+    "PasswordHashPool",
     # Email provider
     "EmailConfig",
     "EmailProvider",
@@ -141,12 +150,19 @@ __all__ = [
     "DatabaseConfig",
     "DatabaseProvider",
     # Embedding provider
+    "EmbeddingBatchingSettings",
+    "EmbeddingCache",
+    "EmbeddingCacheSettings",
     "EmbeddingConfig",
+    "EmbeddingMicroBatcher",
     "EmbeddingProvider",
+    "EmbeddingRateLimitSettings",
+    "EmbeddingRequestScheduler",
     # LLM provider
     "CompletionConfig",
     "CompletionProvider",
     ## UTILS
+    "CharacterTextSplitter",
     "RecursiveCharacterTextSplitter",
     "TextSplitter",
     "run_pipeline",
@@ -159,7 +159,7 @@ class R2RStreamingAgent(R2RAgent):
     ) -> AsyncGenerator[str, None]:
         function_name = None
         function_arguments = ""
-        content_buffer = ""
+        content_parts: list[str] = []
 
         async for chunk in stream:
             delta = chunk.choices[0].delta
@@ -197,9 +197,9 @@ class R2RStreamingAgent(R2RAgent):
                 if delta.function_call.arguments:
                     function_arguments += delta.function_call.arguments
             elif delta.content:
-                if content_buffer == "":
+                if not content_parts:
                     yield "<completion>"
-                content_buffer += delta.content
+                content_parts.append(delta.content)
                 yield delta.content
 
             if chunk.choices[0].finish_reason == "function_call":
@@ -224,17 +224,19 @@ class R2RStreamingAgent(R2RAgent):
                 function_arguments = ""
 
             elif chunk.choices[0].finish_reason == "stop":
-                if content_buffer:
+                if content_parts:
                     await self.conversation.add_message(
-                        Message(role="assistant", content=content_buffer)
+                        Message(
+                            role="assistant", content="".join(content_parts)
+                        )
                     )
                 self._completed = True
                 yield "</completion>"
 
         # Handle any remaining content after the stream ends
-        if content_buffer and not self._completed:
+        if content_parts and not self._completed:
             await self.conversation.add_message(
-                Message(role="assistant", content=content_buffer)
+                Message(role="assistant", content="".join(content_parts))
             )
             self._completed = True
             yield "</completion>"
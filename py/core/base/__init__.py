@@ -48,6 +48,9 @@ __all__ = [
     "VectorSearchResult",
     "SearchSettings",
     "HybridSearchSettings",
+    "HybridSearchExecutionMode",
+    "VectorSearchPlan",
+    "VectorSearchPlanSettings",
     # KG abstractions
     "KGCreationSettings",
     "KGEnrichmentSettings",
@@ -82,6 +85,7 @@ __all__ = [
     "LogAnalyticsConfig",
     "LogFilterCriteria",
     "LogProcessor",
+    "LogBufferSettings",
     "PersistentLoggingConfig",
     # Run Manager
     "RunManager",
@@ -89,6 +93,8 @@ __all__ = [
     ## PARSERS
     # Base parser
     "AsyncParser",
+    "ParserExecutionMode",
+    "ParserExecutor",
     ## PIPELINE
     # Base pipeline
     "AsyncPipeline",
@@ -101,11 +107,14 @@ __all__ = [
     "Provider",
     "ProviderConfig",
     # Auth provider
+    "AuthCache",
+    "AuthCacheSettings",
     "AuthConfig",
     "AuthProvider",
     # Crypto provider
     "CryptoConfig",
     "CryptoProvider",
+    "PasswordHashPool",
     # Email provider
     "EmailConfig",
     "EmailProvider",
@@ -114,8 +123,14 @@ __all__ = [
     "DatabaseProvider",
     "PostgresConfigurationSettings",
     # Embedding provider
+    "EmbeddingBatchingSettings",
+    "EmbeddingCache",
+    "EmbeddingCacheSettings",
     "EmbeddingConfig",
+    "EmbeddingMicroBatcher",
     "EmbeddingProvider",
+    "EmbeddingRateLimitSettings",
+    "EmbeddingRequestScheduler",
     # Ingestion provider
     "IngestionConfig",
     "IngestionProvider",
@@ -124,6 +139,7 @@ __all__ = [
     "CompletionConfig",
     "CompletionProvider",
     ## UTILS
+    "CharacterTextSplitter",
     "RecursiveCharacterTextSplitter",
     "TextSplitter",
     "run_pipeline",
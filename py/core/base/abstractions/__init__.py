@@ -51,6 +51,7 @@ from shared.abstractions.llm import (
 from shared.abstractions.prompt import Prompt
 from shared.abstractions.search import (
     AggregateSearchResult,
+    HybridSearchExecutionMode,
     HybridSearchSettings,
     KGCommunityResult,
     KGEntityResult,
@@ -61,6 +62,8 @@ from shared.abstractions.search import (
     KGSearchResultType,
     KGSearchSettings,
     SearchSettings,
+    VectorSearchPlan,
+    VectorSearchPlanSettings,
     VectorSearchResult,
 )
 from shared.abstractions.user import Token, TokenData, UserStats
@@ -128,9 +131,12 @@ __all__ = [
     "KGCommunityResult",
     "KGGlobalResult",
     "KGSearchSettings",
+    "VectorSearchPlan",
+    "VectorSearchPlanSettings",
     "VectorSearchResult",
     "SearchSettings",
     "HybridSearchSettings",
+    "HybridSearchExecutionMode",
     # KG abstractions
     "KGCreationSettings",
     "KGEnrichmentSettings",
@@ -13,6 +13,7 @@ from shared.api.models.ingestion.responses import (
     WrappedCreateVectorIndexResponse,
     WrappedDeleteVectorIndexResponse,
     WrappedIngestionResponse,
+    WrappedListFilterIndicesResponse,
     WrappedListVectorIndicesResponse,
     WrappedMetadataUpdateResponse,
     WrappedSelectVectorIndexResponse,
@@ -96,6 +97,7 @@ __all__ = [
     "CreateVectorIndexResponse",
     "WrappedCreateVectorIndexResponse",
     "WrappedListVectorIndicesResponse",
+    "WrappedListFilterIndicesResponse",
     "WrappedDeleteVectorIndexResponse",
     "WrappedSelectVectorIndexResponse",
     "UpdateResponse",
@@ -1,4 +1,9 @@
-from .base import PersistentLoggingConfig, RunInfoLog, RunType
+from .base import (
+    LogBufferSettings,
+    PersistentLoggingConfig,
+    RunInfoLog,
+    RunType,
+)
 from .log_processor import (
     AnalysisTypes,
     LogAnalytics,
@@ -17,6 +22,7 @@ __all__ = [
     "LogFilterCriteria",
     "LogProcessor",
     # Logging Providers
+    "LogBufferSettings",
     "PersistentLoggingConfig",
     "RunInfoLog",
     # Run Manager
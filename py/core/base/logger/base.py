@@ -21,11 +21,26 @@ class RunInfoLog(BaseModel):
     user_id: UUID
 
 
+class LogBufferSettings(BaseModel):
+    """Settings for writing run logs in batches instead of one per call."""
+
+    enabled: bool = True
+    # A flush starts once this many records are queued or after the interval
+    max_batch_size: int = 512
+    flush_interval_ms: int = 250
+    # Records beyond the queue limit are dropped; past the sampling
+    # watermark only one in `sample_every` records is kept for each key
+    max_queue_size: int = 20_000
+    sample_watermark: float = 0.5
+    sample_every: int = 10
+
+
 class PersistentLoggingConfig(ProviderConfig):
     provider: str = "local"
     log_table: str = "logs"
     log_info_table: str = "log_info"
     logging_path: Optional[str] = None
+    buffer_settings: LogBufferSettings = LogBufferSettings()
 
     def validate_config(self) -> None:
         pass
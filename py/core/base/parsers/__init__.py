@@ -1,5 +1,8 @@
 from .base_parser import AsyncParser
+from .executor import ParserExecutionMode, ParserExecutor
 
 __all__ = [
     "AsyncParser",
+    "ParserExecutionMode",
+    "ParserExecutor",
 ]
@@ -3,11 +3,16 @@
 from abc import ABC, abstractmethod
 from typing import AsyncGenerator, Generic, TypeVar
 
+from .executor import INLINE_PARSER_EXECUTOR, ParserExecutor
+
 T = TypeVar("T")
 
 
 class AsyncParser(ABC, Generic[T]):
 
+    # Replaced by the ingestion provider with its configured executor
+    executor: ParserExecutor = INLINE_PARSER_EXECUTOR
+
     @abstractmethod
     async def ingest(self, data: T, **kwargs) -> AsyncGenerator[str, None]:
         pass
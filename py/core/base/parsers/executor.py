@@ -0,0 +1,114 @@
+"""Runs CPU-bound parser work off the event loop."""
+
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from enum import Enum
+from functools import partial
+from typing import Any, AsyncGenerator, Callable, Iterator, Optional
+
+logger = logging.getLogger()
+
+_EXHAUSTED = object()
+
+
+class ParserExecutionMode(str, Enum):
+    INLINE = "inline"
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+def _collect(func: Callable[..., Iterator[Any]], *args, **kwargs) -> list:
+    return list(func(*args, **kwargs))
+
+
+class ParserExecutor:
+    """
+    Executes synchronous parsing functions for async parsers.
+
+    `inline` runs them on the calling thread, `thread` on a thread pool and
+    `process` on a process pool, which keeps pure-Python parsing from holding
+    the GIL while the API serves requests. Work submitted in `process` mode
+    must be picklable, i.e. module-level functions and plain arguments.
+    """
+
+    def __init__(
+        self,
+        mode: ParserExecutionMode = ParserExecutionMode.THREAD,
+        max_workers: Optional[int] = None,
+    ):
+        self.mode = ParserExecutionMode(mode)
+        self.max_workers = max_workers
+        self._executor: Optional[Executor] = None
+
+    @property
+    def executor(self) -> Optional[Executor]:
+        if self.mode == ParserExecutionMode.INLINE:
+            return None
+        if self._executor is None:
+            if self.mode == ParserExecutionMode.PROCESS:
+                # Forking a process that runs an event loop and driver
+                # threads is unsafe, so workers are spawned fresh
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="r2r-parser",
+                )
+            logger.info(
+                f"Started {self.mode.value} parser executor with max_workers={self.max_workers}"
+            )
+        return self._executor
+
+    async def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Runs `func(*args, **kwargs)` and returns its result."""
+        if self.mode == ParserExecutionMode.INLINE:
+            return func(*args, **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor, partial(func, *args, **kwargs)
+        )
+
+    async def iterate(
+        self, func: Callable[..., Iterator[Any]], *args, **kwargs
+    ) -> AsyncGenerator[Any, None]:
+        """
+        Yields the items of the synchronous generator `func(*args, **kwargs)`.
+
+        In `thread` mode items are pulled one at a time so they reach the
+        caller as soon as they are produced. Generators cannot cross process
+        boundaries, so `process` mode collects the results in the worker
+        first; parsers that can split their input, like the PDF parser,
+        submit several smaller calls with `run` instead.
+        """
+        if self.mode == ParserExecutionMode.INLINE:
+            for item in func(*args, **kwargs):
+                yield item
+        elif self.mode == ParserExecutionMode.THREAD:
+            iterator = iter(func(*args, **kwargs))
+            loop = asyncio.get_running_loop()
+            while True:
+                item = await loop.run_in_executor(
+                    self.executor, next, iterator, _EXHAUSTED
+                )
+                if item is _EXHAUSTED:
+                    break
+                yield item
+        else:
+            for item in await self.run(_collect, func, *args, **kwargs):
+                yield item
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+
+INLINE_PARSER_EXECUTOR = ParserExecutor(ParserExecutionMode.INLINE)
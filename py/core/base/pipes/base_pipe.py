@@ -127,9 +127,12 @@ class AsyncPipe(Generic[T]):
 
         async def wrapped_run() -> AsyncGenerator[Any, None]:
             async with manage_run(run_manager, RunType.UNSPECIFIED) as run_id:  # type: ignore
-                self.log_worker_task = asyncio.create_task(  # type: ignore
+                # Runs of a shared pipe can overlap (e.g. concurrent streams),
+                # so each run owns and cancels its own log worker.
+                log_worker_task = asyncio.create_task(
                     self.log_worker(), name=f"log-worker-{self.config.name}"
                 )
+                self.log_worker_task = log_worker_task  # type: ignore
                 try:
                     async for result in self._run_logic(  # type: ignore
                         input, state, run_id, *args, **kwargs  # type: ignore
@@ -142,13 +145,10 @@ class AsyncPipe(Generic[T]):
                         self.log_queue.task_done()
 
                     # Cancel and wait for the log worker task
-                    if (
-                        self.log_worker_task
-                        and not self.log_worker_task.done()
-                    ):
-                        self.log_worker_task.cancel()
+                    if not log_worker_task.done():
+                        log_worker_task.cancel()
                         try:
-                            await self.log_worker_task
+                            await log_worker_task
                         except asyncio.CancelledError:
                             pass
 
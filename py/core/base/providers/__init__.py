@@ -1,6 +1,6 @@
-from .auth import AuthConfig, AuthProvider
+from .auth import AuthCache, AuthCacheSettings, AuthConfig, AuthProvider
 from .base import AppConfig, Provider, ProviderConfig
-from .crypto import CryptoConfig, CryptoProvider
+from .crypto import CryptoConfig, CryptoProvider, PasswordHashPool
 from .database import (
     CollectionHandler,
     DatabaseConfig,
@@ -17,13 +17,24 @@ from .database import (
     VectorHandler,
 )
 from .email import EmailConfig, EmailProvider
-from .embedding import EmbeddingConfig, EmbeddingProvider
+from .embedding import (
+    EmbeddingBatchingSettings,
+    EmbeddingCache,
+    EmbeddingCacheSettings,
+    EmbeddingConfig,
+    EmbeddingMicroBatcher,
+    EmbeddingProvider,
+    EmbeddingRateLimitSettings,
+    EmbeddingRequestScheduler,
+)
 from .ingestion import ChunkingStrategy, IngestionConfig, IngestionProvider
 from .llm import CompletionConfig, CompletionProvider
 from .orchestration import OrchestrationConfig, OrchestrationProvider, Workflow
 
 __all__ = [
     # Auth provider
+    "AuthCache",
+    "AuthCacheSettings",
     "AuthConfig",
     "AuthProvider",
     # Base provider classes
@@ -37,6 +48,7 @@ __all__ = [
     # Crypto provider
     "CryptoConfig",
     "CryptoProvider",
+    "PasswordHashPool",
     # Email provider
     "EmailConfig",
     "EmailProvider",
@@ -55,8 +67,14 @@ __all__ = [
     "PostgresConfigurationSettings",
     "DatabaseProvider",
     # Embedding provider
+    "EmbeddingBatchingSettings",
+    "EmbeddingCache",
+    "EmbeddingCacheSettings",
     "EmbeddingConfig",
+    "EmbeddingMicroBatcher",
     "EmbeddingProvider",
+    "EmbeddingRateLimitSettings",
+    "EmbeddingRequestScheduler",
     # LLM provider
     "CompletionConfig",
     "CompletionProvider",
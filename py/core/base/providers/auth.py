@@ -1,9 +1,16 @@
+import asyncio
+import hashlib
 import logging
+import time
 from abc import ABC, abstractmethod
-from typing import Optional
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Optional
+from uuid import UUID
 
 from fastapi import Security
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from pydantic import BaseModel
 
 from ...utils import generate_user_id
 from ..abstractions import R2RException, Token, TokenData
@@ -16,6 +23,206 @@ from .email import EmailProvider
 logger = logging.getLogger()
 
 
+class AuthCacheSettings(BaseModel):
+    enabled: bool = True
+    max_tokens: int = 10_000
+    max_users: int = 10_000
+    token_ttl_seconds: float = 300.0
+    # User records change through other workers too, keep this short
+    user_ttl_seconds: float = 30.0
+    blacklist_refresh_seconds: float = 5.0
+
+
+class AuthCache:
+    """
+    Per-worker cache for the authentication fast path.
+
+    Validated tokens and user records are kept in bounded LRU maps with TTL
+    expiry. Blacklisted tokens are mirrored into an in-memory set that is
+    refreshed incrementally from the database, so a token revoked by
+    another worker is rejected within `blacklist_refresh_seconds`. Tokens
+    are stored as SHA-256 digests.
+    """
+
+    # Re-read rows this far behind the newest one seen to cover clock skew
+    # between workers writing the blacklist
+    BLACKLIST_OVERLAP = timedelta(seconds=60)
+
+    def __init__(self, settings: AuthCacheSettings):
+        self.settings = settings
+        self._tokens: OrderedDict[bytes, tuple[float, TokenData]] = (
+            OrderedDict()
+        )
+        self._users: OrderedDict[str, tuple[float, UserResponse]] = (
+            OrderedDict()
+        )
+        self._blacklist: set[bytes] = set()
+        self._blacklist_loaded = False
+        self._blacklist_since: Optional[datetime] = None
+        self._blacklist_refreshed_at = 0.0
+        self._refresh_lock = asyncio.Lock()
+
+        self.token_hits = 0
+        self.token_misses = 0
+        self.user_hits = 0
+        self.user_misses = 0
+        self.blacklist_refreshes = 0
+
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        token_lookups = self.token_hits + self.token_misses
+        user_lookups = self.user_hits + self.user_misses
+        return {
+            "tokens": len(self._tokens),
+            "users": len(self._users),
+            "blacklisted_tokens": len(self._blacklist),
+            "token_hits": self.token_hits,
+            "token_misses": self.token_misses,
+            "token_hit_rate": (
+                self.token_hits / token_lookups if token_lookups else 0.0
+            ),
+            "user_hits": self.user_hits,
+            "user_misses": self.user_misses,
+            "user_hit_rate": (
+                self.user_hits / user_lookups if user_lookups else 0.0
+            ),
+            "blacklist_refreshes": self.blacklist_refreshes,
+        }
+
+    def get_token(self, token: str) -> Optional[TokenData]:
+        key = self._digest(token)
+        entry = self._tokens.get(key)
+        if entry is None or entry[0] <= time.time():
+            self._tokens.pop(key, None)
+            self.token_misses += 1
+            return None
+        self._tokens.move_to_end(key)
+        self.token_hits += 1
+        return entry[1]
+
+    def put_token(self, token: str, token_data: TokenData) -> None:
+        expires_at = time.time() + self.settings.token_ttl_seconds
+        if token_data.exp:
+            # Never serve a token past its own expiry
+            expires_at = min(expires_at, token_data.exp.timestamp())
+        key = self._digest(token)
+        self._tokens[key] = (expires_at, token_data)
+        self._tokens.move_to_end(key)
+        while len(self._tokens) > self.settings.max_tokens:
+            self._tokens.popitem(last=False)
+
+    def get_user(self, email: str) -> Optional[UserResponse]:
+        entry = self._users.get(email)
+        if entry is None or entry[0] <= time.monotonic():
+            self._users.pop(email, None)
+            self.user_misses += 1
+            return None
+        self._users.move_to_end(email)
+        self.user_hits += 1
+        # Callers get their own copy so the cached record cannot be mutated
+        return entry[1].model_copy(deep=True)
+
+    def put_user(self, user: UserResponse) -> None:
+        self._users[user.email] = (
+            time.monotonic() + self.settings.user_ttl_seconds,
+            user.model_copy(deep=True),
+        )
+        self._users.move_to_end(user.email)
+        while len(self._users) > self.settings.max_users:
+            self._users.popitem(last=False)
+
+    def invalidate_user(
+        self, user_id: Optional[UUID] = None, email: Optional[str] = None
+    ) -> None:
+        if email is not None:
+            self._users.pop(email, None)
+        if user_id is not None:
+            for cached_email, (_, user) in list(self._users.items()):
+                if user.id == user_id:
+                    del self._users[cached_email]
+
+    def invalidate_users(self) -> None:
+        self._users.clear()
+
+    def blacklist(self, token: str) -> None:
+        key = self._digest(token)
+        self._blacklist.add(key)
+        self._tokens.pop(key, None)
+
+    def reset_blacklist(self) -> None:
+        """Forces a full reload, e.g. after expired rows were deleted."""
+        self._blacklist = set()
+        self._blacklist_loaded = False
+        self._blacklist_since = None
+
+    async def is_blacklisted(
+        self,
+        token: str,
+        fetch: Callable[
+            [Optional[datetime]], Awaitable[list[tuple[str, datetime]]]
+        ],
+    ) -> Optional[bool]:
+        """
+        Checks the blacklist mirror, refreshing it from `fetch` when stale.
+        Returns None when the mirror could not be loaded, in which case the
+        caller should check the database directly.
+        """
+        if (
+            time.monotonic() - self._blacklist_refreshed_at
+            >= self.settings.blacklist_refresh_seconds
+        ):
+            await self._refresh_blacklist(fetch)
+        if not self._blacklist_loaded:
+            return None
+        return self._digest(token) in self._blacklist
+
+    async def _refresh_blacklist(
+        self,
+        fetch: Callable[
+            [Optional[datetime]], Awaitable[list[tuple[str, datetime]]]
+        ],
+    ) -> None:
+        async with self._refresh_lock:
+            if (
+                time.monotonic() - self._blacklist_refreshed_at
+                < self.settings.blacklist_refresh_seconds
+            ):
+                return
+            since = (
+                self._blacklist_since - self.BLACKLIST_OVERLAP
+                if self._blacklist_since
+                else None
+            )
+            try:
+                rows = await fetch(since)
+            except Exception as e:
+                logger.warning(f"Failed to refresh token blacklist: {e}")
+                self._blacklist_refreshed_at = time.monotonic()
+                return
+            for token, blacklisted_at in rows:
+                self._blacklist.add(self._digest(token))
+                if blacklisted_at.tzinfo is None:
+                    blacklisted_at = blacklisted_at.replace(
+                        tzinfo=timezone.utc
+                    )
+                if (
+                    self._blacklist_since is None
+                    or blacklisted_at > self._blacklist_since
+                ):
+                    self._blacklist_since = blacklisted_at
+            if self._blacklist_since is None:
+                self._blacklist_since = datetime.now(timezone.utc)
+            self._blacklist_loaded = True
+            self._blacklist_refreshed_at = time.monotonic()
+            self.blacklist_refreshes += 1
+            for key in self._blacklist.intersection(self._tokens):
+                del self._tokens[key]
+
+
 class AuthConfig(ProviderConfig):
     secret_key: Optional[str] = None
     require_authentication: bool = False
@@ -24,6 +231,7 @@ class AuthConfig(ProviderConfig):
     default_admin_password: str = "change_me_immediately"
     access_token_lifetime_in_minutes: Optional[int] = None
     refresh_token_lifetime_in_days: Optional[int] = None
+    cache_settings: AuthCacheSettings = AuthCacheSettings()
 
     @property
     def supported_providers(self) -> list[str]:
@@ -56,20 +264,42 @@ class AuthProvider(Provider, ABC):
         self.crypto_provider = crypto_provider
         self.database_provider = database_provider
         self.email_provider = email_provider
+        self.cache: Optional[AuthCache] = (
+            AuthCache(config.cache_settings)
+            if config.cache_settings.enabled
+            else None
+        )
+        self._default_admin_user: Optional[UserResponse] = None
         super().__init__(config)
         self.config: AuthConfig = config  # for type hinting
 
+    def invalidate_user(
+        self, user_id: Optional[UUID] = None, email: Optional[str] = None
+    ) -> None:
+        """Drops cached records for a user whose data has changed."""
+        if self.cache:
+            self.cache.invalidate_user(user_id=user_id, email=email)
+
+    def invalidate_users(self) -> None:
+        """Drops every cached user, e.g. after a collection is deleted."""
+        if self.cache:
+            self.cache.invalidate_users()
+
     def _get_default_admin_user(self) -> UserResponse:
-        return UserResponse(
-            id=generate_user_id(self.admin_email),
-            email=self.admin_email,
-            hashed_password=self.crypto_provider.get_password_hash(
-                self.admin_password
-            ),
-            is_superuser=True,
-            is_active=True,
-            is_verified=True,
-        )
+        # Served to every unauthenticated request, so the password is
+        # hashed once rather than per request
+        if self._default_admin_user is None:
+            self._default_admin_user = UserResponse(
+                id=generate_user_id(self.admin_email),
+                email=self.admin_email,
+                hashed_password=self.crypto_provider.get_password_hash(
+                    self.admin_password
+                ),
+                is_superuser=True,
+                is_active=True,
+                is_verified=True,
+            )
+        return self._default_admin_user.model_copy(deep=True)
 
     @abstractmethod
     def create_access_token(self, data: dict) -> str:
@@ -1,11 +1,24 @@
+import asyncio
+import logging
+import os
+import time
 from abc import ABC, abstractmethod
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
 
+from ..abstractions import R2RException
 from .base import Provider, ProviderConfig
 
+logger = logging.getLogger()
+
 
 class CryptoConfig(ProviderConfig):
     provider: Optional[str] = None
+    # Threads hashing passwords, defaults to min(4, CPU count)
+    hash_workers: Optional[int] = None
+    # Hashes admitted at once, including those running; beyond this
+    # requests are rejected with a 503 instead of queueing indefinitely
+    max_pending_hashes: int = 64
 
     @property
     def supported_providers(self) -> list[str]:
@@ -16,6 +29,98 @@ class CryptoConfig(ProviderConfig):
             raise ValueError(f"Unsupported crypto provider: {self.provider}")
 
 
+class PasswordHashPool:
+    """
+    Bounded thread pool for password hashing.
+
+    Key-stretching hashes are deliberately slow, so running them on the
+    event loop stalls every other request on the worker. Work submitted
+    here runs on `max_workers` threads; hashing libraries like bcrypt
+    release the GIL while they compute. At most `max_pending` operations
+    are admitted at a time and the rest fail fast, so a login storm cannot
+    build an unbounded backlog.
+    """
+
+    def __init__(self, max_workers: Optional[int], max_pending: int):
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.max_pending = max_pending
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.pending = 0
+        self._stats: dict[str, Any] = {
+            "completed": 0,
+            "rejected": 0,
+            "max_pending": 0,
+            "total_queue_ms": 0.0,
+            "max_queue_ms": 0.0,
+            "total_run_ms": 0.0,
+        }
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="r2r-crypto"
+            )
+        return self._executor
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        completed = self._stats["completed"]
+        return {
+            **self._stats,
+            "pending": self.pending,
+            "avg_queue_ms": (
+                self._stats["total_queue_ms"] / completed if completed else 0.0
+            ),
+            "avg_run_ms": (
+                self._stats["total_run_ms"] / completed if completed else 0.0
+            ),
+        }
+
+    async def run(self, func: Callable[..., Any], *args) -> Any:
+        if self.pending >= self.max_pending:
+            self._stats["rejected"] += 1
+            raise R2RException(
+                status_code=503,
+                message="Too many concurrent password operations, please retry.",
+            )
+        self.pending += 1
+        self._stats["max_pending"] = max(
+            self._stats["max_pending"], self.pending
+        )
+        submitted = time.perf_counter()
+
+        def timed() -> tuple[float, float, Any]:
+            started = time.perf_counter()
+            result = func(*args)
+            return started, time.perf_counter(), result
+
+        try:
+            (
+                started,
+                finished,
+                result,
+            ) = await asyncio.get_running_loop().run_in_executor(
+                self.executor, timed
+            )
+        finally:
+            self.pending -= 1
+
+        queue_ms = (started - submitted) * 1000
+        self._stats["completed"] += 1
+        self._stats["total_queue_ms"] += queue_ms
+        self._stats["max_queue_ms"] = max(
+            self._stats["max_queue_ms"], queue_ms
+        )
+        self._stats["total_run_ms"] += (finished - started) * 1000
+        return result
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+
 class CryptoProvider(Provider, ABC):
     def __init__(self, config: CryptoConfig):
         if not isinstance(config, CryptoConfig):
@@ -23,6 +128,9 @@ class CryptoProvider(Provider, ABC):
                 "CryptoProvider must be initialized with a CryptoConfig"
             )
         super().__init__(config)
+        self.hash_pool = PasswordHashPool(
+            config.hash_workers, config.max_pending_hashes
+        )
 
     @abstractmethod
     def get_password_hash(self, password: str) -> str:
@@ -34,6 +142,18 @@ class CryptoProvider(Provider, ABC):
     ) -> bool:
         pass
 
+    async def async_get_password_hash(self, password: str) -> str:
+        """Hashes `password` on the hash pool, off the event loop."""
+        return await self.hash_pool.run(self.get_password_hash, password)
+
+    async def async_verify_password(
+        self, plain_password: str, hashed_password: str
+    ) -> bool:
+        """Verifies `plain_password` on the hash pool, off the event loop."""
+        return await self.hash_pool.run(
+            self.verify_password, plain_password, hashed_password
+        )
+
     @abstractmethod
     def generate_verification_code(self, length: int = 32) -> str:
         pass
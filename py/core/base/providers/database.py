@@ -1,7 +1,6 @@
 import logging
 from abc import ABC, abstractmethod
 from datetime import datetime
-from io import BytesIO
 from typing import (
     Any,
     AsyncGenerator,
@@ -223,6 +222,19 @@ class DocumentHandler(Handler):
     ) -> None:
         pass
 
+    @abstractmethod
+    async def get_document_ids(
+        self,
+        filter_user_ids: Optional[list[UUID]] = None,
+        filter_document_ids: Optional[list[UUID]] = None,
+        filter_collection_ids: Optional[list[UUID]] = None,
+    ) -> list[UUID]:
+        pass
+
+    @abstractmethod
+    async def delete_documents(self, document_ids: list[UUID]) -> int:
+        pass
+
     @abstractmethod
     async def get_documents_overview(
         self,
@@ -373,6 +385,12 @@ class TokenHandler(Handler):
     async def is_token_blacklisted(self, token: str) -> bool:
         pass
 
+    @abstractmethod
+    async def get_blacklisted_tokens(
+        self, since: Optional[datetime] = None
+    ) -> list[tuple[str, datetime]]:
+        pass
+
     @abstractmethod
     async def clean_expired_blacklisted_tokens(
         self,
@@ -517,6 +535,10 @@ class VectorHandler(Handler):
     async def upsert_entries(self, entries: list[VectorEntry]) -> None:
         pass
 
+    @abstractmethod
+    async def bulk_upsert_entries(self, entries: list[VectorEntry]) -> None:
+        pass
+
     @abstractmethod
     async def semantic_search(
         self, query_vector: list[float], search_settings: SearchSettings
@@ -546,6 +568,18 @@ class VectorHandler(Handler):
     ) -> dict[str, dict[str, str]]:
         pass
 
+    @abstractmethod
+    async def get_document_ids_by_filters(
+        self, filters: dict[str, Any]
+    ) -> list[UUID]:
+        pass
+
+    @abstractmethod
+    async def delete_document_chunks(
+        self, document_ids: list[UUID], filters: dict[str, Any]
+    ) -> Tuple[int, list[UUID]]:
+        pass
+
     @abstractmethod
     async def assign_document_to_collection_vector(
         self, document_id: UUID, collection_id: UUID
@@ -610,6 +644,44 @@ class VectorHandler(Handler):
     ) -> None:
         pass
 
+    @abstractmethod
+    async def create_collection_index(
+        self,
+        collection_id: UUID,
+        index_measure: IndexMeasure = IndexMeasure.cosine_distance,
+        index_arguments: Optional[IndexArgsHNSW] = None,
+        concurrently: bool = True,
+    ) -> str:
+        pass
+
+    @abstractmethod
+    async def delete_collection_index(
+        self, collection_id: UUID, concurrently: bool = True
+    ) -> None:
+        pass
+
+    @abstractmethod
+    async def list_filter_indices(self) -> list[dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    async def recommend_filter_indices(
+        self, min_usage: int = 1
+    ) -> list[dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    async def create_filter_index(
+        self, key: Optional[str] = None, concurrently: bool = True
+    ) -> str:
+        pass
+
+    @abstractmethod
+    async def delete_filter_index(
+        self, index_name: str, concurrently: bool = True
+    ) -> None:
+        pass
+
     @abstractmethod
     async def get_semantic_neighbors(
         self,
@@ -705,6 +777,17 @@ class KGHandler(Handler):
         """Add a community report."""
         pass
 
+    @abstractmethod
+    async def reuse_community_report(
+        self,
+        collection_id: UUID,
+        community_number: int,
+        level: int,
+        fingerprint: str,
+    ) -> Optional[str]:
+        """Copy an earlier report with the same fingerprint to a community."""
+        pass
+
     @abstractmethod
     async def get_community_details(
         self, community_number: int, collection_id: UUID
@@ -719,6 +802,16 @@ class KGHandler(Handler):
         """Get community reports for a collection."""
         pass
 
+    @abstractmethod
+    async def stream_community_reports(
+        self,
+        collection_ids: Optional[list[UUID]] = None,
+        level: Optional[int] = None,
+        batch_size: int = 1000,
+    ) -> AsyncGenerator[CommunityReport, None]:
+        """Stream community reports, highest rated first."""
+        pass
+
     @abstractmethod
     async def check_community_reports_exist(
         self, collection_id: UUID, offset: int, limit: int
@@ -750,6 +843,13 @@ class KGHandler(Handler):
         """Delete a node using document ID."""
         pass
 
+    @abstractmethod
+    async def delete_graphs_for_documents(
+        self, document_ids: list[UUID]
+    ) -> dict[str, int]:
+        """Delete the entities and triples of many documents."""
+        pass
+
     # Entity and Triple management
     @abstractmethod
     async def get_entities(
@@ -765,6 +865,13 @@ class KGHandler(Handler):
         """Get entities from storage."""
         pass
 
+    @abstractmethod
+    async def get_entity_embeddings(
+        self, collection_id: UUID, batch_size: int = 10_000
+    ) -> Tuple[Any, Any]:
+        """Get entity ids and description embeddings as arrays."""
+        raise NotImplementedError
+
     @abstractmethod
     async def get_triples(
         self,
@@ -823,8 +930,35 @@ class KGHandler(Handler):
 
     # Other operations
     @abstractmethod
-    async def create_vector_index(self) -> None:
-        """Create vector index."""
+    async def create_vector_index(
+        self,
+        table_name: VectorTableName,
+        index_measure: IndexMeasure = IndexMeasure.cosine_distance,
+        index_method: IndexMethod = IndexMethod.auto,
+        index_arguments: Optional[
+            Union[IndexArgsIVFFlat, IndexArgsHNSW]
+        ] = None,
+        index_name: Optional[str] = None,
+        concurrently: bool = True,
+    ) -> str:
+        """Create vector index on a knowledge graph table."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_vector_indices(
+        self, table_name: VectorTableName
+    ) -> list[dict[str, Any]]:
+        """List vector indices of a knowledge graph table."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_vector_index(
+        self,
+        index_name: str,
+        table_name: VectorTableName,
+        concurrently: bool = True,
+    ) -> None:
+        """Delete vector index of a knowledge graph table."""
         raise NotImplementedError
 
     @abstractmethod
@@ -864,6 +998,25 @@ class KGHandler(Handler):
         """Get existing entity extraction IDs."""
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_completed_extraction_ids(
+        self, document_ids: list[UUID]
+    ) -> dict[UUID, set[UUID]]:
+        """Get the extracted chunk IDs of each document."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def add_extraction_checkpoint(
+        self, document_id: UUID, extraction_ids: list[UUID]
+    ) -> None:
+        """Record chunks whose triples extraction finished."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_extraction_checkpoints(self, document_id: UUID) -> None:
+        """Delete the extraction checkpoints of a document."""
+        raise NotImplementedError
+
     @abstractmethod
     async def get_all_triples(
         self, collection_id: UUID, document_ids: Optional[list[UUID]] = None
@@ -951,9 +1104,9 @@ class FileHandler(Handler):
         self,
         document_id: UUID,
         file_name: str,
-        file_content: BytesIO,
+        file_content: BinaryIO,
         file_type: Optional[str] = None,
-    ) -> None:
+    ) -> int:
         """Store a new file in the database."""
         pass
 
@@ -964,11 +1117,23 @@ class FileHandler(Handler):
         """Retrieve a file from storage."""
         pass
 
+    @abstractmethod
+    def stream_file(
+        self, document_id: UUID, start: int = 0, end: Optional[int] = None
+    ) -> AsyncGenerator[bytes, None]:
+        """Stream a byte range of a file from storage."""
+        pass
+
     @abstractmethod
     async def delete_file(self, document_id: UUID) -> bool:
         """Delete a file from storage."""
         pass
 
+    @abstractmethod
+    async def delete_files(self, document_ids: list[UUID]) -> int:
+        """Delete the files of many documents from storage."""
+        pass
+
     @abstractmethod
     async def get_files_overview(
         self,
@@ -1130,6 +1295,19 @@ class DatabaseProvider(Provider):
             document_id, version
         )
 
+    async def get_document_ids(
+        self,
+        filter_user_ids: Optional[list[UUID]] = None,
+        filter_document_ids: Optional[list[UUID]] = None,
+        filter_collection_ids: Optional[list[UUID]] = None,
+    ) -> list[UUID]:
+        return await self.document_handler.get_document_ids(
+            filter_user_ids, filter_document_ids, filter_collection_ids
+        )
+
+    async def delete_documents(self, document_ids: list[UUID]) -> int:
+        return await self.document_handler.delete_documents(document_ids)
+
     async def get_documents_overview(
         self,
         filter_user_ids: Optional[list[UUID]] = None,
@@ -1276,6 +1454,11 @@ class DatabaseProvider(Provider):
     async def is_token_blacklisted(self, token: str) -> bool:
         return await self.token_handler.is_token_blacklisted(token)
 
+    async def get_blacklisted_tokens(
+        self, since: Optional[datetime] = None
+    ) -> list[tuple[str, datetime]]:
+        return await self.token_handler.get_blacklisted_tokens(since)
+
     async def clean_expired_blacklisted_tokens(
         self,
         max_age_hours: int = 7 * 24,
@@ -1405,6 +1588,9 @@ class DatabaseProvider(Provider):
     async def upsert_entries(self, entries: list[VectorEntry]) -> None:
         return await self.vector_handler.upsert_entries(entries)
 
+    async def bulk_upsert_entries(self, entries: list[VectorEntry]) -> None:
+        return await self.vector_handler.bulk_upsert_entries(entries)
+
     async def semantic_search(
         self, query_vector: list[float], search_settings: SearchSettings
     ) -> list[VectorSearchResult]:
@@ -1446,6 +1632,18 @@ class DatabaseProvider(Provider):
     ) -> dict[str, dict[str, str]]:
         return await self.vector_handler.delete(filters)
 
+    async def get_document_ids_by_filters(
+        self, filters: dict[str, Any]
+    ) -> list[UUID]:
+        return await self.vector_handler.get_document_ids_by_filters(filters)
+
+    async def delete_document_chunks(
+        self, document_ids: list[UUID], filters: dict[str, Any]
+    ) -> Tuple[int, list[UUID]]:
+        return await self.vector_handler.delete_document_chunks(
+            document_ids, filters
+        )
+
     async def assign_document_to_collection_vector(
         self, document_id: UUID, collection_id: UUID
     ) -> None:
@@ -1521,6 +1719,44 @@ class DatabaseProvider(Provider):
             index_name, table_name, concurrently
         )
 
+    async def create_collection_index(
+        self,
+        collection_id: UUID,
+        index_measure: IndexMeasure = IndexMeasure.cosine_distance,
+        index_arguments: Optional[IndexArgsHNSW] = None,
+        concurrently: bool = True,
+    ) -> str:
+        return await self.vector_handler.create_collection_index(
+            collection_id, index_measure, index_arguments, concurrently
+        )
+
+    async def delete_collection_index(
+        self, collection_id: UUID, concurrently: bool = True
+    ) -> None:
+        return await self.vector_handler.delete_collection_index(
+            collection_id, concurrently
+        )
+
+    async def list_filter_indices(self) -> list[dict[str, Any]]:
+        return await self.vector_handler.list_filter_indices()
+
+    async def recommend_filter_indices(
+        self, min_usage: int = 1
+    ) -> list[dict[str, Any]]:
+        return await self.vector_handler.recommend_filter_indices(min_usage)
+
+    async def create_filter_index(
+        self, key: Optional[str] = None, concurrently: bool = True
+    ) -> str:
+        return await self.vector_handler.create_filter_index(key, concurrently)
+
+    async def delete_filter_index(
+        self, index_name: str, concurrently: bool = True
+    ) -> None:
+        return await self.vector_handler.delete_filter_index(
+            index_name, concurrently
+        )
+
     async def get_semantic_neighbors(
         self,
         document_id: UUID,
@@ -1603,6 +1839,18 @@ class DatabaseProvider(Provider):
         """Forward to KG handler add_community_report method."""
         return await self.kg_handler.add_community_report(community_report)
 
+    async def reuse_community_report(
+        self,
+        collection_id: UUID,
+        community_number: int,
+        level: int,
+        fingerprint: str,
+    ) -> Optional[str]:
+        """Forward to KG handler reuse_community_report method."""
+        return await self.kg_handler.reuse_community_report(
+            collection_id, community_number, level, fingerprint
+        )
+
     async def get_community_details(
         self, community_number: int, collection_id: UUID
     ) -> Tuple[int, list[Entity], list[Triple]]:
@@ -1617,6 +1865,17 @@ class DatabaseProvider(Provider):
         """Forward to KG handler get_community_reports method."""
         return await self.kg_handler.get_community_reports(collection_id)
 
+    async def stream_community_reports(
+        self,
+        collection_ids: Optional[list[UUID]] = None,
+        level: Optional[int] = None,
+        batch_size: int = 1000,
+    ) -> AsyncGenerator[CommunityReport, None]:
+        """Forward to KG handler stream_community_reports method."""
+        return self.kg_handler.stream_community_reports(  # type: ignore
+            collection_ids, level, batch_size
+        )
+
     async def check_community_reports_exist(
         self, collection_id: UUID, offset: int, limit: int
     ) -> List[int]:
@@ -1652,7 +1911,19 @@ class DatabaseProvider(Provider):
             document_id, collection_id
         )
 
+    async def delete_graphs_for_documents(
+        self, document_ids: list[UUID]
+    ) -> dict[str, int]:
+        return await self.kg_handler.delete_graphs_for_documents(document_ids)
+
     # Entity and Triple operations
+    async def get_entity_embeddings(
+        self, collection_id: UUID, batch_size: int = 10_000
+    ) -> Tuple[Any, Any]:
+        return await self.kg_handler.get_entity_embeddings(
+            collection_id, batch_size
+        )
+
     async def get_entities(
         self,
         collection_id: Optional[UUID],
@@ -1755,8 +2026,40 @@ class DatabaseProvider(Provider):
     ) -> AsyncGenerator[Any, None]:
         return self.kg_handler.vector_query(query, **kwargs)  # type: ignore
 
-    async def create_vector_index(self) -> None:
-        return await self.kg_handler.create_vector_index()
+    async def create_vector_index(
+        self,
+        table_name: VectorTableName,
+        index_measure: IndexMeasure = IndexMeasure.cosine_distance,
+        index_method: IndexMethod = IndexMethod.auto,
+        index_arguments: Optional[
+            Union[IndexArgsIVFFlat, IndexArgsHNSW]
+        ] = None,
+        index_name: Optional[str] = None,
+        concurrently: bool = True,
+    ) -> str:
+        return await self.kg_handler.create_vector_index(
+            table_name,
+            index_measure,
+            index_method,
+            index_arguments,
+            index_name,
+            concurrently,
+        )
+
+    async def list_vector_indices(
+        self, table_name: VectorTableName
+    ) -> list[dict[str, Any]]:
+        return await self.kg_handler.list_vector_indices(table_name)
+
+    async def delete_vector_index(
+        self,
+        index_name: str,
+        table_name: VectorTableName,
+        concurrently: bool = True,
+    ) -> None:
+        return await self.kg_handler.delete_vector_index(
+            index_name, table_name, concurrently
+        )
 
     async def delete_triples(self, triple_ids: list[int]) -> None:
         return await self.kg_handler.delete_triples(triple_ids)
@@ -1783,6 +2086,21 @@ class DatabaseProvider(Provider):
             document_id
         )
 
+    async def get_completed_extraction_ids(
+        self, document_ids: list[UUID]
+    ) -> dict[UUID, set[UUID]]:
+        return await self.kg_handler.get_completed_extraction_ids(document_ids)
+
+    async def add_extraction_checkpoint(
+        self, document_id: UUID, extraction_ids: list[UUID]
+    ) -> None:
+        return await self.kg_handler.add_extraction_checkpoint(
+            document_id, extraction_ids
+        )
+
+    async def delete_extraction_checkpoints(self, document_id: UUID) -> None:
+        return await self.kg_handler.delete_extraction_checkpoints(document_id)
+
     async def add_prompt(
         self, name: str, template: str, input_types: dict[str, str]
     ) -> None:
@@ -1832,9 +2150,9 @@ class DatabaseProvider(Provider):
         self,
         document_id: UUID,
         file_name: str,
-        file_content: BytesIO,
+        file_content: BinaryIO,
         file_type: Optional[str] = None,
-    ) -> None:
+    ) -> int:
         return await self.file_handler.store_file(
             document_id, file_name, file_content, file_type
         )
@@ -1844,9 +2162,17 @@ class DatabaseProvider(Provider):
     ) -> Optional[tuple[str, BinaryIO, int]]:
         return await self.file_handler.retrieve_file(document_id)
 
+    def stream_file(
+        self, document_id: UUID, start: int = 0, end: Optional[int] = None
+    ) -> AsyncGenerator[bytes, None]:
+        return self.file_handler.stream_file(document_id, start, end)
+
     async def delete_file(self, document_id: UUID) -> bool:
         return await self.file_handler.delete_file(document_id)
 
+    async def delete_files(self, document_ids: list[UUID]) -> int:
+        return await self.file_handler.delete_files(document_ids)
+
     async def get_files_overview(
         self,
         filter_document_ids: Optional[list[UUID]] = None,
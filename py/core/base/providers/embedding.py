@@ -1,10 +1,15 @@
 import asyncio
+import hashlib
+import json
 import logging
 import random
 import time
+import unicodedata
 from abc import abstractmethod
+from array import array
+from collections import OrderedDict, deque
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Optional
 
 from litellm import AuthenticationError
 
@@ -12,6 +17,7 @@ from core.base.abstractions import VectorQuantizationSettings
 
 from ..abstractions import (
     EmbeddingPurpose,
+    R2RSerializable,
     VectorSearchResult,
     default_embedding_prefixes,
 )
@@ -20,6 +26,692 @@ from .base import Provider, ProviderConfig
 logger = logging.getLogger()
 
 
+class EmbeddingCacheSettings(R2RSerializable):
+    enabled: bool = True
+    max_entries: int = 10_000
+    ttl_seconds: float = 3600.0
+    purposes: list[EmbeddingPurpose] = [EmbeddingPurpose.QUERY]
+    # Set to "sqlite" to share cached embeddings between workers
+    shared_backend: Optional[str] = None
+    sqlite_path: str = "embedding_cache.sqlite"
+
+
+class SqliteEmbeddingCacheBackend:
+    """
+    Embedding store shared by every worker on a host. Vectors are kept as
+    packed float64 so they round-trip exactly.
+    """
+
+    TABLE_NAME = "embedding_cache"
+
+    def __init__(self, path: str, ttl_seconds: float):
+        try:
+            import aiosqlite
+
+            self.aiosqlite = aiosqlite
+        except ImportError:
+            raise ImportError(
+                "Please install aiosqlite to use the sqlite embedding cache."
+            )
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.conn = None
+        self._lock = asyncio.Lock()
+
+    async def _get_connection(self):
+        async with self._lock:
+            if self.conn is None:
+                conn = await self.aiosqlite.connect(self.path)
+                await conn.execute("PRAGMA journal_mode=WAL;")
+                await conn.execute(
+                    f"""
+                    CREATE TABLE IF NOT EXISTS {self.TABLE_NAME} (
+                        key TEXT PRIMARY KEY,
+                        vector BLOB,
+                        created_at REAL
+                    )
+                    """
+                )
+                await conn.commit()
+                self.conn = conn
+        return self.conn
+
+    async def get_many(self, keys: list[str]) -> dict[str, list[float]]:
+        conn = await self._get_connection()
+        placeholders = ", ".join("?" for _ in keys)
+        async with conn.execute(
+            f"""
+            SELECT key, vector FROM {self.TABLE_NAME}
+            WHERE key IN ({placeholders}) AND created_at > ?
+            """,
+            (*keys, time.time() - self.ttl_seconds),
+        ) as cursor:
+            rows = await cursor.fetchall()
+        return {key: array("d", vector).tolist() for key, vector in rows}
+
+    async def put_many(self, items: dict[str, list[float]]) -> None:
+        conn = await self._get_connection()
+        now = time.time()
+        await conn.executemany(
+            f"""
+            INSERT OR REPLACE INTO {self.TABLE_NAME} (key, vector, created_at)
+            VALUES (?, ?, ?)
+            """,
+            [
+                (key, array("d", vector).tobytes(), now)
+                for key, vector in items.items()
+            ],
+        )
+        await conn.execute(
+            f"DELETE FROM {self.TABLE_NAME} WHERE created_at <= ?",
+            (now - self.ttl_seconds,),
+        )
+        await conn.commit()
+
+    async def close(self) -> None:
+        if self.conn:
+            await self.conn.close()
+            self.conn = None
+
+
+class EmbeddingCache:
+    """
+    Bounded LRU cache of embeddings with TTL expiry. Concurrent requests for
+    the same key share one in-flight computation, and an optional shared
+    backend lets workers reuse each other's results.
+    """
+
+    def __init__(self, settings: EmbeddingCacheSettings):
+        self.settings = settings
+        self._entries: OrderedDict[str, tuple[float, list[float]]] = (
+            OrderedDict()
+        )
+        self._inflight: dict[str, asyncio.Future] = {}
+        self.shared_backend: Optional[SqliteEmbeddingCacheBackend] = None
+        if settings.shared_backend == "sqlite":
+            self.shared_backend = SqliteEmbeddingCacheBackend(
+                settings.sqlite_path, settings.ttl_seconds
+            )
+        elif settings.shared_backend:
+            raise ValueError(
+                f"Unsupported embedding cache backend: {settings.shared_backend}"
+            )
+
+        self.hits = 0
+        self.shared_hits = 0
+        self.coalesced = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(
+        model: str,
+        dimension: Optional[int],
+        purpose: EmbeddingPurpose,
+        prefix: str,
+        text: str,
+        extra: Optional[dict] = None,
+    ) -> str:
+        normalized = " ".join(unicodedata.normalize("NFC", text).split())
+        payload = json.dumps(
+            [model, dimension, purpose.value, prefix, normalized, extra or {}],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.shared_hits + self.coalesced + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "shared_hits": self.shared_hits,
+            "coalesced": self.coalesced,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": (lookups - self.misses) / lookups if lookups else 0.0,
+        }
+
+    def _get_local(self, key: str) -> Optional[list[float]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, vector = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return vector
+
+    def _put_local(self, key: str, vector: list[float]) -> None:
+        self._entries[key] = (
+            time.monotonic() + self.settings.ttl_seconds,
+            vector,
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.settings.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def get_or_embed(
+        self,
+        keys: list[str],
+        texts: list[str],
+        embed: Callable[[list[str]], Awaitable[list[list[float]]]],
+    ) -> list[list[float]]:
+        results: dict[str, list[float]] = {}
+        for key in keys:
+            if key in results:
+                continue
+            if (vector := self._get_local(key)) is not None:
+                results[key] = vector
+                self.hits += 1
+
+        if self.shared_backend and (
+            remote_keys := list({k for k in keys if k not in results})
+        ):
+            try:
+                shared = await self.shared_backend.get_many(remote_keys)
+            except Exception as e:
+                logger.warning(f"Shared embedding cache lookup failed: {e}")
+                shared = {}
+            for key, vector in shared.items():
+                self._put_local(key, vector)
+                results[key] = vector
+                self.shared_hits += 1
+
+        waiting: dict[str, tuple[asyncio.Future, str]] = {}
+        owned: dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key in results or key in waiting or key in owned:
+                continue
+            if key in self._inflight:
+                waiting[key] = (self._inflight[key], text)
+                self.coalesced += 1
+            else:
+                future = asyncio.get_running_loop().create_future()
+                # Failures are re-raised to the owner; waiters see them too
+                future.add_done_callback(
+                    lambda f: f.cancelled() or f.exception()
+                )
+                self._inflight[key] = future
+                owned[key] = text
+
+        if owned:
+            self.misses += len(owned)
+            try:
+                vectors = await embed(list(owned.values()))
+            except BaseException as e:
+                for key in owned:
+                    future = self._inflight.pop(key)
+                    if future.done():
+                        continue
+                    if isinstance(e, asyncio.CancelledError):
+                        future.cancel()
+                    else:
+                        future.set_exception(e)
+                raise
+            computed = dict(zip(owned.keys(), vectors))
+            for key, vector in computed.items():
+                self._put_local(key, vector)
+                results[key] = vector
+                self._inflight.pop(key).set_result(vector)
+            if self.shared_backend:
+                try:
+                    await self.shared_backend.put_many(computed)
+                except Exception as e:
+                    logger.warning(f"Shared embedding cache write failed: {e}")
+
+        for key, (future, text) in waiting.items():
+            try:
+                results[key] = await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # The request we joined was cancelled, embed it ourselves
+                results[key] = (await embed([text]))[0]
+
+        # Callers get their own copies so cached vectors cannot be mutated
+        return [list(results[key]) for key in keys]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class EmbeddingBatchingSettings(R2RSerializable):
+    enabled: bool = False
+    max_wait_ms: float = 5.0
+    max_texts: int = 256
+    max_tokens: int = 100_000
+
+
+class _PendingBatch:
+    def __init__(self, task: dict[str, Any]):
+        self.task = task
+        self.texts: list[str] = []
+        self.tokens = 0
+        # (future, offset, count, enqueued_at) per submitted request
+        self.requests: list[tuple[asyncio.Future, int, int, float]] = []
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+class EmbeddingMicroBatcher:
+    """
+    Coalesces concurrent embedding requests into shared upstream calls.
+    Requests with the same stage, purpose and kwargs are held for at most
+    `max_wait_ms`, or until the batch reaches `max_texts` / `max_tokens`,
+    then sent as one request whose results are fanned back out.
+    """
+
+    def __init__(
+        self,
+        settings: EmbeddingBatchingSettings,
+        execute: Callable[[dict[str, Any]], Awaitable[list[list[float]]]],
+        estimate_tokens: Callable[[str], int],
+    ):
+        self.settings = settings
+        self.execute = execute
+        self.estimate_tokens = estimate_tokens
+        self._pending: dict[str, _PendingBatch] = {}
+        self._inflight: set[asyncio.Task] = set()
+
+        self.batches_sent = 0
+        self.requests_batched = 0
+        self.texts_sent = 0
+        self.total_queue_delay = 0.0
+        self.max_queue_delay = 0.0
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        return {
+            "batches_sent": self.batches_sent,
+            "requests_batched": self.requests_batched,
+            "texts_sent": self.texts_sent,
+            "avg_fill_rate": (
+                self.texts_sent / (self.batches_sent * self.settings.max_texts)
+                if self.batches_sent
+                else 0.0
+            ),
+            "avg_queue_delay_ms": (
+                1000 * self.total_queue_delay / self.requests_batched
+                if self.requests_batched
+                else 0.0
+            ),
+            "max_queue_delay_ms": 1000 * self.max_queue_delay,
+        }
+
+    @staticmethod
+    def _group_key(task: dict[str, Any]) -> str:
+        return json.dumps(
+            [
+                str(task.get("stage")),
+                str(task.get("purpose")),
+                task.get("kwargs") or {},
+            ],
+            sort_keys=True,
+            default=str,
+        )
+
+    async def submit(self, task: dict[str, Any]) -> list[list[float]]:
+        texts = task["texts"]
+        tokens = sum(self.estimate_tokens(text) for text in texts)
+        if (
+            len(texts) >= self.settings.max_texts
+            or tokens >= self.settings.max_tokens
+        ):
+            # Already a full batch on its own
+            return await self.execute(task)
+
+        key = self._group_key(task)
+        batch = self._pending.get(key)
+        if batch and (
+            len(batch.texts) + len(texts) > self.settings.max_texts
+            or batch.tokens + tokens > self.settings.max_tokens
+        ):
+            self._flush(key, batch)
+            batch = None
+        if batch is None:
+            batch = _PendingBatch(task)
+            self._pending[key] = batch
+            batch.timer = asyncio.get_running_loop().call_later(
+                self.settings.max_wait_ms / 1000, self._flush, key, batch
+            )
+
+        future = asyncio.get_running_loop().create_future()
+        batch.requests.append(
+            (future, len(batch.texts), len(texts), time.monotonic())
+        )
+        batch.texts.extend(texts)
+        batch.tokens += tokens
+
+        if (
+            len(batch.texts) >= self.settings.max_texts
+            or batch.tokens >= self.settings.max_tokens
+        ):
+            self._flush(key, batch)
+
+        return await future
+
+    def _flush(self, key: str, batch: _PendingBatch) -> None:
+        if self._pending.get(key) is not batch:
+            return
+        del self._pending[key]
+        if batch.timer:
+            batch.timer.cancel()
+        task = asyncio.create_task(self._send(batch))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _send(self, batch: _PendingBatch) -> None:
+        now = time.monotonic()
+        for _, _, _, enqueued_at in batch.requests:
+            delay = now - enqueued_at
+            self.total_queue_delay += delay
+            self.max_queue_delay = max(self.max_queue_delay, delay)
+        self.batches_sent += 1
+        self.requests_batched += len(batch.requests)
+        self.texts_sent += len(batch.texts)
+
+        try:
+            vectors = await self.execute({**batch.task, "texts": batch.texts})
+        except BaseException as e:
+            for future, _, _, _ in batch.requests:
+                if future.done():
+                    continue
+                if isinstance(e, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+            return
+
+        for future, offset, count, _ in batch.requests:
+            if not future.done():
+                future.set_result(vectors[offset : offset + count])
+
+
+class EmbeddingRateLimitSettings(R2RSerializable):
+    enabled: bool = False
+    # Per-request packing budget, requests above it are split
+    max_tokens_per_request: int = 100_000
+    max_texts_per_request: int = 2048
+    # Provider quotas used to pace requests, unset means unpaced
+    tokens_per_minute: Optional[int] = None
+    requests_per_minute: Optional[int] = None
+    # AIMD concurrency, capped by `concurrent_request_limit`
+    initial_concurrency: int = 8
+    min_concurrency: int = 1
+    decrease_factor: float = 0.5
+    latency_target_ms: Optional[float] = None
+
+
+class TokenBucket:
+    """Paces consumption to `rate_per_minute`, allowing one minute of burst."""
+
+    def __init__(self, rate_per_minute: float):
+        self.rate = rate_per_minute / 60
+        self.capacity = float(rate_per_minute)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, amount: float) -> None:
+        amount = min(amount, self.capacity)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity,
+                    self.tokens + (now - self.updated_at) * self.rate,
+                )
+                self.updated_at = now
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return
+                await asyncio.sleep((amount - self.tokens) / self.rate)
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Concurrency limit with additive increase / multiplicative decrease. Each
+    success grows the limit by 1 / limit (about +1 per window of requests);
+    overload signals shrink it by `decrease_factor`, at most once per cooldown
+    so a burst of 429s counts as one signal.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        minimum: int,
+        maximum: int,
+        decrease_factor: float,
+        cooldown_seconds: float = 1.0,
+    ):
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = float(min(max(initial, self.minimum), self.maximum))
+        self.decrease_factor = decrease_factor
+        self.cooldown_seconds = cooldown_seconds
+        self.in_flight = 0
+        self._last_decrease = 0.0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        async with self._condition:
+            await self._condition.wait_for(
+                lambda: self.in_flight < int(self.limit)
+            )
+            self.in_flight += 1
+
+    async def release(self) -> None:
+        async with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    def increase(self) -> None:
+        self.limit = min(self.maximum, self.limit + 1 / self.limit)
+
+    def decrease(self) -> None:
+        now = time.monotonic()
+        if now - self._last_decrease < self.cooldown_seconds:
+            return
+        self._last_decrease = now
+        self.limit = max(self.minimum, self.limit * self.decrease_factor)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough upper bound of ~4 characters per token for English text."""
+    return len(text) // 4 + 1
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    current: Optional[BaseException] = error
+    while current is not None:
+        if getattr(current, "status_code", None) == 429:
+            return True
+        if "ratelimit" in type(current).__name__.lower():
+            return True
+        message = str(current).lower()
+        if "429" in message or "rate limit" in message:
+            return True
+        current = current.__cause__
+    return False
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    current: Optional[BaseException] = error
+    while current is not None:
+        response = getattr(current, "response", None)
+        headers = getattr(response, "headers", None) or {}
+        if value := headers.get("retry-after"):
+            try:
+                return float(value)
+            except ValueError:
+                return None
+        current = current.__cause__
+    return None
+
+
+class EmbeddingRequestScheduler:
+    """
+    Packs texts into requests by token budget, paces them against the
+    provider's token and request quotas, and adapts concurrency from 429s
+    and latency.
+    """
+
+    THROUGHPUT_WINDOW_SECONDS = 60.0
+
+    def __init__(
+        self,
+        settings: EmbeddingRateLimitSettings,
+        execute_task: Callable[[dict[str, Any]], Awaitable[list[list[float]]]],
+        count_tokens: Callable[[str], int],
+        max_concurrency: int,
+        max_retries: int,
+        initial_backoff: float,
+        max_backoff: float,
+    ):
+        self.settings = settings
+        self.execute_task = execute_task
+        self.count_tokens = count_tokens
+        self.max_retries = max_retries
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.limiter = AdaptiveConcurrencyLimiter(
+            initial=settings.initial_concurrency,
+            minimum=settings.min_concurrency,
+            maximum=max_concurrency,
+            decrease_factor=settings.decrease_factor,
+        )
+        self.token_bucket = (
+            TokenBucket(settings.tokens_per_minute)
+            if settings.tokens_per_minute
+            else None
+        )
+        self.request_bucket = (
+            TokenBucket(settings.requests_per_minute)
+            if settings.requests_per_minute
+            else None
+        )
+
+        self.requests = 0
+        self.rate_limited = 0
+        self.tokens_processed = 0
+        self.total_latency = 0.0
+        self._completions: deque[tuple[float, int]] = deque()
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "rate_limited": self.rate_limited,
+            "tokens_processed": self.tokens_processed,
+            "tokens_per_second": self.tokens_per_second,
+            "concurrency_limit": int(self.limiter.limit),
+            "in_flight": self.limiter.in_flight,
+            "avg_latency_ms": (
+                1000 * self.total_latency / self.requests
+                if self.requests
+                else 0.0
+            ),
+        }
+
+    @property
+    def tokens_per_second(self) -> float:
+        """Effective throughput over the recent window."""
+        now = time.monotonic()
+        while (
+            self._completions
+            and now - self._completions[0][0] > self.THROUGHPUT_WINDOW_SECONDS
+        ):
+            self._completions.popleft()
+        if not self._completions:
+            return 0.0
+        elapsed = max(now - self._completions[0][0], 1.0)
+        return sum(tokens for _, tokens in self._completions) / elapsed
+
+    def pack(self, texts: list[str]) -> list[tuple[list[str], int]]:
+        batches: list[tuple[list[str], int]] = []
+        batch: list[str] = []
+        batch_tokens = 0
+        for text in texts:
+            tokens = self.count_tokens(text)
+            if batch and (
+                batch_tokens + tokens > self.settings.max_tokens_per_request
+                or len(batch) >= self.settings.max_texts_per_request
+            ):
+                batches.append((batch, batch_tokens))
+                batch, batch_tokens = [], 0
+            batch.append(text)
+            batch_tokens += tokens
+        if batch:
+            batches.append((batch, batch_tokens))
+        return batches
+
+    async def execute(self, task: dict[str, Any]) -> list[list[float]]:
+        batches = self.pack(task["texts"])
+        if len(batches) == 1:
+            texts, tokens = batches[0]
+            return await self._execute_batch({**task, "texts": texts}, tokens)
+        results = await asyncio.gather(
+            *(
+                self._execute_batch({**task, "texts": texts}, tokens)
+                for texts, tokens in batches
+            )
+        )
+        return [vector for result in results for vector in result]
+
+    async def _execute_batch(
+        self, task: dict[str, Any], tokens: int
+    ) -> list[list[float]]:
+        retries = 0
+        backoff = self.initial_backoff
+        while True:
+            await self.limiter.acquire()
+            try:
+                if self.token_bucket:
+                    await self.token_bucket.acquire(tokens)
+                if self.request_bucket:
+                    await self.request_bucket.acquire(1)
+                started_at = time.monotonic()
+                vectors = await self.execute_task(task)
+            except AuthenticationError:
+                raise
+            except Exception as e:
+                retries += 1
+                delay = random.uniform(0, backoff)
+                if is_rate_limit_error(e):
+                    self.rate_limited += 1
+                    self.limiter.decrease()
+                    delay = retry_after_seconds(e) or delay
+                logger.warning(
+                    f"Embedding request failed (attempt {retries}): {str(e)}"
+                )
+                if retries >= self.max_retries:
+                    raise
+            else:
+                latency = time.monotonic() - started_at
+                self.requests += 1
+                self.total_latency += latency
+                self.tokens_processed += tokens
+                self._completions.append((time.monotonic(), tokens))
+                if (
+                    self.settings.latency_target_ms
+                    and latency * 1000 > self.settings.latency_target_ms
+                ):
+                    self.limiter.decrease()
+                else:
+                    self.limiter.increase()
+                return vectors
+            finally:
+                await self.limiter.release()
+
+            await asyncio.sleep(delay)
+            backoff = min(backoff * 2, self.max_backoff)
+
+
 class EmbeddingConfig(ProviderConfig):
     provider: str
     base_model: str
@@ -36,6 +728,11 @@ class EmbeddingConfig(ProviderConfig):
     quantization_settings: VectorQuantizationSettings = (
         VectorQuantizationSettings()
     )
+    cache_settings: EmbeddingCacheSettings = EmbeddingCacheSettings()
+    batching_settings: EmbeddingBatchingSettings = EmbeddingBatchingSettings()
+    rate_limit_settings: EmbeddingRateLimitSettings = (
+        EmbeddingRateLimitSettings()
+    )
 
     ## deprecated
     rerank_dimension: Optional[int] = None
@@ -66,8 +763,83 @@ class EmbeddingProvider(Provider):
         self.config: EmbeddingConfig = config
         self.semaphore = asyncio.Semaphore(config.concurrent_request_limit)
         self.current_requests = 0
+        self.cache: Optional[EmbeddingCache] = (
+            EmbeddingCache(config.cache_settings)
+            if config.cache_settings.enabled
+            else None
+        )
+        # Token counter for the base model, set by providers that know it
+        self.tokenizer: Optional[Callable[[str], int]] = None
+        self.scheduler: Optional[EmbeddingRequestScheduler] = (
+            EmbeddingRequestScheduler(
+                config.rate_limit_settings,
+                execute_task=self._execute_task,
+                count_tokens=self._estimate_tokens,
+                max_concurrency=config.concurrent_request_limit,
+                max_retries=config.max_retries,
+                initial_backoff=config.initial_backoff,
+                max_backoff=config.max_backoff,
+            )
+            if config.rate_limit_settings.enabled
+            else None
+        )
+        self.batcher: Optional[EmbeddingMicroBatcher] = (
+            EmbeddingMicroBatcher(
+                config.batching_settings,
+                self._dispatch_async,
+                self._estimate_tokens,
+            )
+            if config.batching_settings.enabled
+            else None
+        )
+
+    def _estimate_tokens(self, text: str) -> int:
+        if self.tokenizer is not None:
+            return self.tokenizer(text)
+        return estimate_tokens(text)
+
+    def _cache_key(self, task: dict[str, Any], text: str) -> str:
+        purpose = task.get("purpose", EmbeddingPurpose.INDEX)
+        prefixes = getattr(self, "prefixes", None) or {}
+        return EmbeddingCache.make_key(
+            model=self.config.base_model,
+            dimension=self.config.base_dimension,
+            purpose=purpose,
+            prefix=prefixes.get(purpose, ""),
+            text=text,
+            extra=task.get("kwargs"),
+        )
 
     async def _execute_with_backoff_async(self, task: dict[str, Any]):
+        if (
+            self.cache is None
+            or "texts" not in task
+            or task.get("stage", self.PipeStage.BASE) != self.PipeStage.BASE
+            or task.get("purpose", EmbeddingPurpose.INDEX)
+            not in self.cache.settings.purposes
+        ):
+            return await self._submit_async(task)
+
+        texts = task["texts"]
+
+        async def embed(missing_texts: list[str]) -> list[list[float]]:
+            return await self._submit_async({**task, "texts": missing_texts})
+
+        return await self.cache.get_or_embed(
+            [self._cache_key(task, text) for text in texts], texts, embed
+        )
+
+    async def _submit_async(self, task: dict[str, Any]):
+        if self.batcher is not None and "texts" in task:
+            return await self.batcher.submit(task)
+        return await self._dispatch_async(task)
+
+    async def _dispatch_async(self, task: dict[str, Any]):
+        if self.scheduler is not None and "texts" in task:
+            return await self.scheduler.execute(task)
+        return await self._execute_with_retries_async(task)
+
+    async def _execute_with_retries_async(self, task: dict[str, Any]):
         retries = 0
         backoff = self.config.initial_backoff
         while retries < self.config.max_retries:
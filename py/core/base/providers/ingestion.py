@@ -4,6 +4,7 @@ from enum import Enum
 from typing import Optional
 
 from core.base.abstractions import ChunkEnrichmentSettings
+from core.base.parsers import ParserExecutionMode, ParserExecutor
 
 from .base import Provider, ProviderConfig
 from .database import DatabaseProvider
@@ -34,6 +35,13 @@ class IngestionConfig(ProviderConfig):
     chunks_for_document_summary: int = 128
     document_summary_model: str = "openai/gpt-4o-mini"
 
+    vector_storage_batch_size: int = 128
+    use_bulk_vector_upsert: bool = False
+    use_streaming_ingestion: bool = False
+
+    parser_execution_mode: ParserExecutionMode = ParserExecutionMode.THREAD
+    parser_max_workers: Optional[int] = None
+
     @property
     def supported_providers(self) -> list[str]:
         return ["r2r", "unstructured_local", "unstructured_api"]
@@ -48,6 +56,7 @@ class IngestionProvider(Provider, ABC):
     config: IngestionConfig
     database_provider: DatabaseProvider
     llm_provider: CompletionProvider
+    parser_executor: ParserExecutor
 
     def __init__(
         self,
@@ -77,14 +77,19 @@ class CompletionProvider(Provider):
         retries = 0
         backoff = self.config.initial_backoff
         while retries < self.config.max_retries:
+            streamed = False
             try:
                 async with self.semaphore:
                     async for chunk in await self._execute_task(task):
+                        streamed = True
                         yield chunk
                 return  # Successful completion of the stream
             except AuthenticationError as e:
                 raise
             except Exception as e:
+                if streamed:
+                    # Retrying would replay chunks the caller already has
+                    raise
                 logger.warning(
                     f"Streaming request failed (attempt {retries + 1}): {str(e)}"
                 )
@@ -8,6 +8,7 @@ from .base import Provider, ProviderConfig
 class Workflow(Enum):
     INGESTION = "ingestion"
     KG = "kg"
+    MANAGEMENT = "management"
 
 
 class OrchestrationConfig(ProviderConfig):
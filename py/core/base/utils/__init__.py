@@ -1,4 +1,5 @@
 from shared.utils import (
+    CharacterTextSplitter,
     RecursiveCharacterTextSplitter,
     TextSplitter,
     _decorate_vector_type,
@@ -37,6 +38,7 @@ __all__ = [
     "generate_user_id",
     "generate_collection_id_from_name",
     "generate_default_prompt_id",
+    "CharacterTextSplitter",
     "RecursiveCharacterTextSplitter",
     "TextSplitter",
     "llm_cost_per_million_tokens",
@@ -1,6 +1,4 @@
-import base64
 import logging
-from io import BytesIO
 from pathlib import Path as pathlib_Path
 from typing import Optional, Union
 from uuid import UUID
@@ -30,6 +28,7 @@ from core.base.api.models import (
     WrappedCreateVectorIndexResponse,
     WrappedDeleteVectorIndexResponse,
     WrappedIngestionResponse,
+    WrappedListFilterIndicesResponse,
     WrappedListVectorIndicesResponse,
     WrappedMetadataUpdateResponse,
     WrappedUpdateResponse,
@@ -98,6 +97,16 @@ class IngestionRouter(BaseRouter):
                     if self.orchestration_provider.config.provider != "simple"
                     else "Vector index deletion task completed successfully."
                 ),
+                "create-filter-index": (
+                    "Filter index creation task queued successfully."
+                    if self.orchestration_provider.config.provider != "simple"
+                    else "Filter index creation task completed successfully."
+                ),
+                "delete-filter-index": (
+                    "Filter index deletion task queued successfully."
+                    if self.orchestration_provider.config.provider != "simple"
+                    else "Filter index deletion task completed successfully."
+                ),
                 "select-vector-index": (
                     "Vector index selection task queued successfully."
                     if self.orchestration_provider.config.provider != "simple"
@@ -177,14 +186,12 @@ class IngestionRouter(BaseRouter):
                     # If user is not a superuser, set user_id in metadata
                     metadata["user_id"] = str(auth_user.id)
 
-            file_datas = await self._process_files(files)
-
             messages: list[dict[str, Union[str, None]]] = []
-            for it, file_data in enumerate(file_datas):
-                content_length = len(file_data["content"])
-                file_content = BytesIO(base64.b64decode(file_data["content"]))
-
-                file_data.pop("content", None)
+            for it, file in enumerate(files):
+                file_data = {
+                    "filename": file.filename,
+                    "content_type": file.content_type,
+                }
                 document_id = (
                     document_ids[it]
                     if document_ids
@@ -193,26 +200,29 @@ class IngestionRouter(BaseRouter):
                     )
                 )
 
+                # stream the spooled upload into storage, the workflow only
+                # gets the document id to read it back by
+                file_name = file_data["filename"]
+                file_size = await self.service.providers.database.store_file(
+                    document_id,
+                    file_name,
+                    file.file,
+                    file_data["content_type"],
+                )
+
                 workflow_input = {
                     "file_data": file_data,
                     "document_id": str(document_id),
                     "metadata": metadatas[it] if metadatas else None,
                     "ingestion_config": ingestion_config,
                     "user": auth_user.model_dump_json(),
-                    "size_in_bytes": content_length,
+                    "size_in_bytes": file_size,
                     "collection_ids": (
                         collection_ids[it] if collection_ids else None
                     ),
                     "is_update": False,
                 }
 
-                file_name = file_data["filename"]
-                await self.service.providers.database.store_file(
-                    document_id,
-                    file_name,
-                    file_content,
-                    file_data["content_type"],
-                )
                 if run_with_orchestration:
                     raw_message: dict[str, Union[str, None]] = await self.orchestration_provider.run_workflow(  # type: ignore
                         "ingest-files",
@@ -300,11 +310,12 @@ class IngestionRouter(BaseRouter):
                         )
                     metadata["user_id"] = str(auth_user.id)
 
-            file_datas = await self._process_files(files)
-
             processed_data = []
-            for it, file_data in enumerate(file_datas):
-                content = base64.b64decode(file_data.pop("content"))
+            for it, file in enumerate(files):
+                file_data = {
+                    "filename": file.filename,
+                    "content_type": file.content_type,
+                }
                 document_id = (
                     document_ids[it]
                     if document_ids
@@ -313,17 +324,17 @@ class IngestionRouter(BaseRouter):
                     )
                 )
 
-                await self.service.providers.database.store_file(
+                file_size = await self.service.providers.database.store_file(
                     document_id,
                     file_data["filename"],
-                    BytesIO(content),
+                    file.file,
                     file_data["content_type"],
                 )
 
                 processed_data.append(
                     {
                         "file_data": file_data,
-                        "file_length": len(content),
+                        "file_length": file_size,
                         "document_id": str(document_id),
                     }
                 )
@@ -708,18 +719,149 @@ class IngestionRouter(BaseRouter):
 
             return raw_message  # type: ignore
 
-    @staticmethod
-    async def _process_files(files):
-        import base64
+        list_filter_indices_extras = self.openapi_extras.get(
+            "list_filter_indices", {}
+        )
+        list_filter_indices_descriptions = list_filter_indices_extras.get(
+            "input_descriptions", {}
+        )
+
+        @self.router.get(
+            "/list_filter_indices",
+            openapi_extra=list_filter_indices_extras.get("openapi_extra"),
+        )
+        @self.base_endpoint
+        async def list_filter_indices_app(
+            min_usage: int = Query(
+                default=1,
+                ge=1,
+                description=list_filter_indices_descriptions.get("min_usage"),
+            ),
+            auth_user=Depends(self.service.providers.auth.auth_wrapper),
+        ) -> WrappedListFilterIndicesResponse:
+            """
+            List the indices on chunk metadata, and the indices recommended for the metadata filters searches have used.
+
+            """
+            database = self.service.providers.database
+            return {  # type: ignore
+                "indices": await database.list_filter_indices(),
+                "recommendations": await database.recommend_filter_indices(
+                    min_usage
+                ),
+            }
+
+        create_filter_index_extras = self.openapi_extras.get(
+            "create_filter_index", {}
+        )
+        create_filter_index_descriptions = create_filter_index_extras.get(
+            "input_descriptions", {}
+        )
+
+        @self.router.post(
+            "/create_filter_index",
+            openapi_extra=create_filter_index_extras.get("openapi_extra"),
+        )
+        @self.base_endpoint
+        async def create_filter_index_app(
+            key: Optional[str] = Body(
+                None,
+                description=create_filter_index_descriptions.get("key"),
+            ),
+            recommended: bool = Body(
+                default=False,
+                description=create_filter_index_descriptions.get(
+                    "recommended"
+                ),
+            ),
+            min_usage: int = Body(
+                default=1,
+                ge=1,
+                description=create_filter_index_descriptions.get("min_usage"),
+            ),
+            concurrently: bool = Body(
+                default=True,
+                description=create_filter_index_descriptions.get(
+                    "concurrently"
+                ),
+            ),
+            auth_user=Depends(self.service.providers.auth.auth_wrapper),
+        ) -> WrappedCreateVectorIndexResponse:
+            """
+            Create an index serving metadata filters: an expression index for range filters on `key`, or without a key, a GIN index for equality, `$in` and `$contains` filters.
+            With `recommended`, creates the missing indices `list_filter_indices` recommends instead.
+
+            """
+            if recommended:
+                # filter usage is recorded by the process compiling searches
+                recommendations = await self.service.providers.database.recommend_filter_indices(
+                    min_usage
+                )
+                keys = [
+                    recommendation["key"]
+                    for recommendation in recommendations
+                    if not recommendation["exists"]
+                ]
+            else:
+                keys = [key]
+
+            logger.info(
+                f"Creating filter indices for metadata keys {keys}, concurrently {concurrently}"
+            )
+
+            raw_message = await self.orchestration_provider.run_workflow(
+                "create-filter-index",
+                {
+                    "request": {
+                        "keys": keys,
+                        "concurrently": concurrently,
+                    },
+                },
+                options={
+                    "additional_metadata": {},
+                },
+            )
+
+            return raw_message  # type: ignore
+
+        delete_filter_index_extras = self.openapi_extras.get(
+            "delete_filter_index", {}
+        )
+        delete_filter_index_descriptions = delete_filter_index_extras.get(
+            "input_descriptions", {}
+        )
+
+        @self.router.delete(
+            "/delete_filter_index",
+            openapi_extra=delete_filter_index_extras.get("openapi_extra"),
+        )
+        @self.base_endpoint
+        async def delete_filter_index_app(
+            index_name: str = Body(
+                ...,
+                description=delete_filter_index_descriptions.get("index_name"),
+            ),
+            concurrently: bool = Body(
+                default=True,
+                description=delete_filter_index_descriptions.get(
+                    "concurrently"
+                ),
+            ),
+            auth_user=Depends(self.service.providers.auth.auth_wrapper),
+        ) -> WrappedDeleteVectorIndexResponse:
+            logger.info(f"Deleting filter index {index_name}")
 
-        file_datas = []
-        for file in files:
-            content = await file.read()
-            file_datas.append(
+            raw_message = await self.orchestration_provider.run_workflow(
+                "delete-filter-index",
                 {
-                    "filename": file.filename,
-                    "content": base64.b64encode(content).decode("utf-8"),
-                    "content_type": file.content_type,
-                }
+                    "request": {
+                        "index_name": index_name,
+                        "concurrently": concurrently,
+                    },
+                },
+                options={
+                    "additional_metadata": {},
+                },
             )
-        return file_datas
+
+            return raw_message  # type: ignore
@@ -7,8 +7,18 @@ import yaml
 from fastapi import Body, Depends, Query
 
 from core.base import Workflow
-from core.base.abstractions import EntityLevel, KGRunType
+from core.base.abstractions import (
+    EntityLevel,
+    IndexArgsHNSW,
+    IndexArgsIVFFlat,
+    IndexMeasure,
+    IndexMethod,
+    KGRunType,
+    VectorTableName,
+)
 from core.base.api.models import (
+    WrappedCreateVectorIndexResponse,
+    WrappedDeleteVectorIndexResponse,
     WrappedKGCommunitiesResponse,
     WrappedKGCreationResponse,
     WrappedKGEnrichmentResponse,
@@ -16,6 +26,7 @@ from core.base.api.models import (
     WrappedKGEntityDeduplicationResponse,
     WrappedKGTriplesResponse,
     WrappedKGTunePromptResponse,
+    WrappedListVectorIndicesResponse,
 )
 from core.base.logger.base import RunType
 from core.providers import (
@@ -66,6 +77,12 @@ class KGRouter(BaseRouter):
             workflow_messages["entity-deduplication"] = (
                 "KG Entity Deduplication task queued successfully."
             )
+            workflow_messages["kg-create-vector-index"] = (
+                "KG vector index creation task queued successfully."
+            )
+            workflow_messages["kg-delete-vector-index"] = (
+                "KG vector index deletion task queued successfully."
+            )
         else:
             workflow_messages["create-graph"] = (
                 "Graph created successfully, please run enrich-graph to enrich the graph for GraphRAG."
@@ -76,6 +93,12 @@ class KGRouter(BaseRouter):
             workflow_messages["entity-deduplication"] = (
                 "KG Entity Deduplication completed successfully."
             )
+            workflow_messages["kg-create-vector-index"] = (
+                "KG vector index created successfully."
+            )
+            workflow_messages["kg-delete-vector-index"] = (
+                "KG vector index deleted successfully."
+            )
 
         self.orchestration_provider.register_workflows(
             Workflow.KG,
@@ -500,3 +523,109 @@ class KGRouter(BaseRouter):
             )
 
             return {"message": "Graph deleted successfully."}
+
+        @self.router.post("/create_kg_vector_index")
+        @self.base_endpoint
+        async def create_kg_vector_index(
+            table_name: VectorTableName = Body(
+                ...,
+                description="Knowledge graph table to index, one of 'document_entity', 'collection_entity', 'chunk_triple' or 'community_report'.",
+            ),
+            index_method: IndexMethod = Body(
+                default=IndexMethod.hnsw,
+                description="Index method, 'hnsw' or 'ivfflat'.",
+            ),
+            index_measure: IndexMeasure = Body(
+                default=IndexMeasure.cosine_distance,
+                description="Distance measure the index serves.",
+            ),
+            index_arguments: Optional[
+                Union[IndexArgsIVFFlat, IndexArgsHNSW]
+            ] = Body(None, description="Build arguments of the index method."),
+            index_name: Optional[str] = Body(
+                None, description="Name of the index."
+            ),
+            concurrently: bool = Body(
+                default=True,
+                description="Whether to build the index without locking writes to the table.",
+            ),
+            auth_user=Depends(self.service.providers.auth.auth_wrapper),
+        ) -> WrappedCreateVectorIndexResponse:
+            """
+            Create an HNSW or IVFFlat index on the embeddings of a knowledge graph table, so that local search does not scan the whole table.
+            The `ef_search` and `probes` KG search settings tune the recall of the index per query.
+            """
+            if not auth_user.is_superuser:
+                logger.warning("Implement permission checks here.")
+
+            logger.info(
+                f"Creating KG vector index for {table_name} with method {index_method}, measure {index_measure}, concurrently {concurrently}"
+            )
+
+            return await self.orchestration_provider.run_workflow(  # type: ignore
+                "kg-create-vector-index",
+                {
+                    "request": {
+                        "table_name": table_name,
+                        "index_method": index_method,
+                        "index_measure": index_measure,
+                        "index_arguments": (
+                            index_arguments.model_dump()
+                            if index_arguments
+                            else None
+                        ),
+                        "index_name": index_name,
+                        "concurrently": concurrently,
+                    }
+                },
+                {},
+            )
+
+        @self.router.get("/list_kg_vector_indices")
+        @self.base_endpoint
+        async def list_kg_vector_indices(
+            table_name: VectorTableName = Query(
+                ..., description="Knowledge graph table to list indices for."
+            ),
+            auth_user=Depends(self.service.providers.auth.auth_wrapper),
+        ) -> WrappedListVectorIndicesResponse:
+            """
+            List the vector indices of a knowledge graph table.
+            """
+            indices = await self.service.list_vector_indices(table_name)
+            return {"indices": indices}  # type: ignore
+
+        @self.router.delete("/delete_kg_vector_index")
+        @self.base_endpoint
+        async def delete_kg_vector_index(
+            index_name: str = Body(..., description="Name of the index."),
+            table_name: VectorTableName = Body(
+                ..., description="Knowledge graph table of the index."
+            ),
+            concurrently: bool = Body(
+                default=True,
+                description="Whether to drop the index without locking the table.",
+            ),
+            auth_user=Depends(self.service.providers.auth.auth_wrapper),
+        ) -> WrappedDeleteVectorIndexResponse:
+            """
+            Delete a vector index of a knowledge graph table.
+            """
+            if not auth_user.is_superuser:
+                logger.warning("Implement permission checks here.")
+
+            logger.info(
+                f"Deleting KG vector index {index_name} from table {table_name}"
+            )
+
+            return await self.orchestration_provider.run_workflow(  # type: ignore
+                "kg-delete-vector-index",
+                {
+                    "request": {
+                        "index_name": index_name,
+                        "table_name": table_name,
+                        "concurrently": concurrently,
+                    }
+                },
+                {},
+            )
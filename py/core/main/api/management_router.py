@@ -3,15 +3,15 @@ import json
 import mimetypes
 import os
 from datetime import datetime, timezone
-from typing import Optional, Set, Union
+from typing import Optional, Set, Tuple, Union
 from uuid import UUID
 
 import psutil
-from fastapi import Body, Depends, Path, Query
+from fastapi import Body, Depends, Header, Path, Query
 from fastapi.responses import StreamingResponse
 from pydantic import Json
 
-from core.base import Message, R2RException
+from core.base import Message, R2RException, Workflow
 from core.base.api.models import (
     WrappedAddUserResponse,
     WrappedAnalyticsResponse,
@@ -56,6 +56,24 @@ class ManagementRouter(BaseRouter):
         self.service: ManagementService = service  # for type hinting
         self.start_time = datetime.now(timezone.utc)
 
+    def _register_workflows(self):
+
+        workflow_messages = {}
+        if self.orchestration_provider.config.provider == "hatchet":
+            workflow_messages["bulk-delete"] = (
+                "Bulk deletion task queued successfully."
+            )
+        else:
+            workflow_messages["bulk-delete"] = (
+                "Bulk deletion completed successfully."
+            )
+
+        self.orchestration_provider.register_workflows(
+            Workflow.MANAGEMENT,
+            self.service,
+            workflow_messages,
+        )
+
     # TODO: remove this from the management route, it should be at the base of the server
     def _setup_routes(self):
         @self.router.get("/health")
@@ -80,6 +98,14 @@ class ManagementRouter(BaseRouter):
                 ).total_seconds(),
                 "cpu_usage": psutil.cpu_percent(),
                 "memory_usage": psutil.virtual_memory().percent,
+                "auth_cache": (
+                    self.service.providers.auth.cache.stats
+                    if self.service.providers.auth.cache
+                    else None
+                ),
+                "password_hashing": (
+                    self.service.providers.auth.crypto_provider.hash_pool.stats
+                ),
             }
 
         @self.router.post("/update_prompt")
@@ -284,16 +310,79 @@ class ManagementRouter(BaseRouter):
 
             return await self.service.delete(filters=filters_dict)
 
+        @self.router.delete("/bulk_delete")
+        @self.base_endpoint
+        async def bulk_delete_app(
+            filters: str = Query(..., description="JSON-encoded filters"),
+            batch_size: Optional[int] = Query(
+                None,
+                gt=0,
+                description="Number of documents deleted per batch",
+            ),
+            auth_user=Depends(self.service.providers.auth.auth_wrapper),
+        ):
+            """
+            Deletes everything matching the filters in the background, in
+            batches of documents, cascading to their chunks, knowledge graph
+            data and stored files. Progress is reported in the workflow logs.
+            """
+            if not auth_user.is_superuser:
+                raise R2RException(
+                    "Only a superuser can call the `bulk_delete` endpoint.",
+                    403,
+                )
+
+            try:
+                filters_dict = json.loads(filters)
+            except json.JSONDecodeError:
+                raise R2RException(
+                    status_code=422, message="Invalid JSON in filters"
+                )
+
+            if not isinstance(filters_dict, dict):
+                raise R2RException(
+                    status_code=422, message="Filters must be a JSON object"
+                )
+
+            for key, value in filters_dict.items():
+                if not isinstance(value, dict):
+                    raise R2RException(
+                        status_code=422,
+                        message=f"Invalid filter format for key: {key}",
+                    )
+
+            self.service.validate_delete_filters(filters_dict)
+
+            return await self.orchestration_provider.run_workflow(  # type: ignore
+                "bulk-delete",
+                {
+                    "request": {
+                        "filters": filters_dict,
+                        "batch_size": batch_size,
+                    }
+                },
+                options={
+                    "additional_metadata": {},
+                },
+            )
+
         @self.router.get(
             "/download_file/{document_id}", response_class=StreamingResponse
         )
         @self.base_endpoint
         async def download_file_app(
             document_id: str = Path(..., description="Document ID"),
+            range_header: Optional[str] = Header(
+                None,
+                alias="Range",
+                description="A single `bytes` range of the file to download.",
+            ),
             auth_user=Depends(self.service.providers.auth.auth_wrapper),
         ):
             """
             Download a file by its document ID as a stream.
+
+            A `Range` header with a single byte range, e.g. `bytes=0-1023` or `bytes=-1024`, downloads only that part of the file with a `206 Partial Content` response.
             """
             # TODO: Add a check to see if the user has access to the file
 
@@ -304,31 +393,38 @@ class ManagementRouter(BaseRouter):
                     status_code=422, message="Invalid document ID format."
                 )
 
-            file_tuple = await self.service.download_file(document_uuid)
-            if not file_tuple:
-                raise R2RException(status_code=404, message="File not found.")
-
-            file_name, file_content, file_size = file_tuple
+            # raises a 404 before the response starts if there is no file
+            file_info = (
+                await self.service.providers.database.get_files_overview(
+                    filter_document_ids=[document_uuid], limit=1
+                )
+            )[0]
+            file_name, file_size = (
+                file_info["file_name"],
+                file_info["file_size"],
+            )
 
             mime_type, _ = mimetypes.guess_type(file_name)
             if not mime_type:
                 mime_type = "application/octet-stream"
 
-            async def file_stream():
-                chunk_size = 1024 * 1024  # 1MB
-                while True:
-                    data = file_content.read(chunk_size)
-                    if not data:
-                        break
-                    yield data
+            headers = {
+                "Content-Disposition": f'inline; filename="{file_name}"',
+                "Accept-Ranges": "bytes",
+            }
+            byte_range = self._parse_byte_range(range_header, file_size)
+            if byte_range:
+                start, end = byte_range
+                headers["Content-Range"] = f"bytes {start}-{end}/{file_size}"
+            else:
+                start, end = 0, file_size - 1
+            headers["Content-Length"] = str(end - start + 1)
 
             return StreamingResponse(  # type: ignore
-                file_stream(),
+                await self.service.stream_file(document_uuid, start, end + 1),
+                status_code=206 if byte_range else 200,
                 media_type=mime_type,
-                headers={
-                    "Content-Disposition": f'inline; filename="{file_name}"',
-                    "Content-Length": str(file_size),
-                },
+                headers=headers,
             )
 
         @self.router.get("/documents_overview")
@@ -964,3 +1060,36 @@ class ManagementRouter(BaseRouter):
         ) -> WrappedDeleteResponse:
             await self.service.delete_conversation(conversation_id)
             return None  # type: ignore
+
+    @staticmethod
+    def _parse_byte_range(
+        range_header: Optional[str], file_size: int
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Resolves the `bytes` range of a Range header to the first and last
+        byte it selects. Other units, multiple ranges and malformed headers
+        are ignored, and the whole file is served.
+        """
+        if not range_header or not range_header.startswith("bytes="):
+            return None
+        first, separator, last = range_header[len("bytes=") :].partition("-")
+        if not separator or not (first + last).isdigit():
+            return None
+
+        if first:
+            start = int(first)
+            if last and int(last) < start:
+                return None
+            end = min(int(last), file_size - 1) if last else file_size - 1
+        else:
+            # a suffix, the last bytes of the file
+            suffix = int(last)
+            start = max(file_size - suffix, 0) if suffix else file_size
+            end = file_size - 1
+
+        if start >= file_size:
+            raise R2RException(
+                status_code=416,
+                message=f"Range {range_header} is outside the file of {file_size} bytes.",
+            )
+        return start, end
@@ -1,14 +1,15 @@
-from typing import Union
+from typing import Optional, Union
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
 from fastapi.responses import JSONResponse
 
-from core.base import R2RException
+from core.base import AuthProvider, IngestionProvider, R2RException
 from core.providers import (
     HatchetOrchestrationProvider,
     SimpleOrchestrationProvider,
+    SqlitePersistentLoggingProvider,
 )
 
 from .api.auth_router import AuthRouter
@@ -31,6 +32,9 @@ class R2RApp:
         management_router: ManagementRouter,
         retrieval_router: RetrievalRouter,
         kg_router: KGRouter,
+        logging_provider: Optional[SqlitePersistentLoggingProvider] = None,
+        ingestion_provider: Optional[IngestionProvider] = None,
+        auth_provider: Optional[AuthProvider] = None,
     ):
         self.config = config
         self.ingestion_router = ingestion_router
@@ -39,6 +43,9 @@ class R2RApp:
         self.auth_router = auth_router
         self.kg_router = kg_router
         self.orchestration_provider = orchestration_provider
+        self.logging_provider = logging_provider
+        self.ingestion_provider = ingestion_provider
+        self.auth_provider = auth_provider
         self.app = FastAPI()
 
         @self.app.exception_handler(R2RException)
@@ -87,4 +94,18 @@ class R2RApp:
         # Run the FastAPI app
         config = uvicorn.Config(self.app, host=host, port=port)
         server = uvicorn.Server(config)
-        await server.serve()
+        try:
+            await server.serve()
+        finally:
+            await self.shutdown()
+
+    async def shutdown(self):
+        # Flush buffered run logs before the process exits
+        if self.logging_provider:
+            await self.logging_provider.close()
+        # Tear down the spawned parser worker processes
+        if self.ingestion_provider:
+            self.ingestion_provider.parser_executor.shutdown()
+        # and the password hashing threads
+        if self.auth_provider:
+            self.auth_provider.crypto_provider.hash_pool.shutdown()
@@ -254,5 +254,8 @@ class R2RBuilder:
         return R2RApp(
             config=self.config,
             orchestration_provider=orchestration_provider,
+            logging_provider=providers.logging,
+            ingestion_provider=providers.ingestion,
+            auth_provider=providers.auth,
             **routers,
         )
@@ -456,6 +456,8 @@ class R2RPipeFactory:
         return VectorStoragePipe(
             logging_provider=self.providers.logging,
             database_provider=self.providers.database,
+            storage_batch_size=self.config.ingestion.vector_storage_batch_size,
+            use_bulk_upsert=self.config.ingestion.use_bulk_vector_upsert,
             config=AsyncPipe.PipeConfig(name="vector_storage_pipe"),
         )
 
@@ -1,11 +1,15 @@
 from .hatchet.ingestion_workflow import hatchet_ingestion_factory
 from .hatchet.kg_workflow import hatchet_kg_factory
+from .hatchet.management_workflow import hatchet_management_factory
 from .simple.ingestion_workflow import simple_ingestion_factory
 from .simple.kg_workflow import simple_kg_factory
+from .simple.management_workflow import simple_management_factory
 
 __all__ = [
     "hatchet_ingestion_factory",
     "hatchet_kg_factory",
+    "hatchet_management_factory",
     "simple_ingestion_factory",
     "simple_kg_factory",
+    "simple_management_factory",
 ]
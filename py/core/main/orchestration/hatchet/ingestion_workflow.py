@@ -78,15 +78,31 @@ def hatchet_ingestion_factory(
                 )
 
                 ingestion_config = parsed_data["ingestion_config"] or {}
-                extractions_generator = (
-                    await self.ingestion_service.parse_file(
-                        document_info, ingestion_config
-                    )
+                streaming = self.ingestion_service.use_streaming_ingestion(
+                    ingestion_config
                 )
+                if streaming:
+                    # parsed, embedded and stored in one pass, only the
+                    # chunks for the document summary are kept
+                    await self.ingestion_service.update_document_status(
+                        document_info,
+                        status=IngestionStatus.EMBEDDING,
+                    )
+                    extractions = (
+                        await self.ingestion_service.stream_file_to_storage(
+                            document_info, ingestion_config
+                        )
+                    )
+                else:
+                    extractions_generator = (
+                        await self.ingestion_service.parse_file(
+                            document_info, ingestion_config
+                        )
+                    )
 
-                extractions = []
-                async for extraction in extractions_generator:
-                    extractions.append(extraction)
+                    extractions = []
+                    async for extraction in extractions_generator:
+                        extractions.append(extraction)
 
                 # serializable_extractions = [
                 #     extraction.to_dict() for extraction in extractions
@@ -111,34 +127,38 @@ def hatchet_ingestion_factory(
                     [extraction.to_dict() for extraction in extractions],
                 )
 
-                await self.ingestion_service.update_document_status(
-                    document_info,
-                    status=IngestionStatus.EMBEDDING,
-                )
-
                 # extractions = context.step_output("parse")["extractions"]
 
-                embedding_generator = (
-                    await self.ingestion_service.embed_document(
-                        [extraction.to_dict() for extraction in extractions]
+                if not streaming:
+                    await self.ingestion_service.update_document_status(
+                        document_info,
+                        status=IngestionStatus.EMBEDDING,
                     )
-                )
 
-                embeddings = []
-                async for embedding in embedding_generator:
-                    embeddings.append(embedding)
+                    embedding_generator = (
+                        await self.ingestion_service.embed_document(
+                            [
+                                extraction.to_dict()
+                                for extraction in extractions
+                            ]
+                        )
+                    )
 
-                await self.ingestion_service.update_document_status(
-                    document_info,
-                    status=IngestionStatus.STORING,
-                )
+                    embeddings = []
+                    async for embedding in embedding_generator:
+                        embeddings.append(embedding)
 
-                storage_generator = await self.ingestion_service.store_embeddings(  # type: ignore
-                    embeddings
-                )
+                    await self.ingestion_service.update_document_status(
+                        document_info,
+                        status=IngestionStatus.STORING,
+                    )
 
-                async for _ in storage_generator:
-                    pass
+                    storage_generator = await self.ingestion_service.store_embeddings(  # type: ignore
+                        embeddings
+                    )
+
+                    async for _ in storage_generator:
+                        pass
 
                 #     return {
                 #         "document_info": document_info.to_dict(),
@@ -668,6 +688,51 @@ def hatchet_ingestion_factory(
 
             return {"status": "Vector index deleted successfully."}
 
+    @orchestration_provider.workflow(
+        name="create-filter-index", timeout="360m"
+    )
+    class HatchetCreateFilterIndexWorkflow:
+        def __init__(self, ingestion_service: IngestionService):
+            self.ingestion_service = ingestion_service
+
+        @orchestration_provider.step(timeout="60m")
+        async def create_filter_index(self, context: Context) -> dict:
+            input_data = context.workflow_input()["request"]
+            parsed_data = (
+                IngestionServiceAdapter.parse_create_filter_index_input(
+                    input_data
+                )
+            )
+
+            for key in parsed_data["keys"]:
+                await self.ingestion_service.providers.database.create_filter_index(
+                    key, parsed_data["concurrently"]
+                )
+
+            return {
+                "status": "Filter index creation queued successfully.",
+            }
+
+    @orchestration_provider.workflow(name="delete-filter-index", timeout="30m")
+    class HatchetDeleteFilterIndexWorkflow:
+        def __init__(self, ingestion_service: IngestionService):
+            self.ingestion_service = ingestion_service
+
+        @orchestration_provider.step(timeout="10m")
+        async def delete_filter_index(self, context: Context) -> dict:
+            input_data = context.workflow_input()["request"]
+            parsed_data = (
+                IngestionServiceAdapter.parse_delete_filter_index_input(
+                    input_data
+                )
+            )
+
+            await self.ingestion_service.providers.database.delete_filter_index(
+                **parsed_data
+            )
+
+            return {"status": "Filter index deleted successfully."}
+
     @orchestration_provider.workflow(
         name="update-document-metadata",
         timeout="30m",
@@ -721,6 +786,8 @@ def hatchet_ingestion_factory(
     )
     create_vector_index_workflow = HatchetCreateVectorIndexWorkflow(service)
     delete_vector_index_workflow = HatchetDeleteVectorIndexWorkflow(service)
+    create_filter_index_workflow = HatchetCreateFilterIndexWorkflow(service)
+    delete_filter_index_workflow = HatchetDeleteFilterIndexWorkflow(service)
 
     return {
         "ingest_files": ingest_files_workflow,
@@ -730,4 +797,6 @@ def hatchet_ingestion_factory(
         "update_document_metadata": update_document_metadata_workflow,
         "create_vector_index": create_vector_index_workflow,
         "delete_vector_index": delete_vector_index_workflow,
+        "create_filter_index": create_filter_index_workflow,
+        "delete_filter_index": delete_filter_index_workflow,
     }
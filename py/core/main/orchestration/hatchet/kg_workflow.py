@@ -516,6 +516,42 @@ def hatchet_kg_factory(
                 "result": f"successfully ran kg community summary for communities {input_data['offset']} to {input_data['offset'] + len(community_summary)}"
             }
 
+    @orchestration_provider.workflow(
+        name="kg-create-vector-index", timeout="360m"
+    )
+    class KGCreateVectorIndexWorkflow:
+        def __init__(self, kg_service: KgService):
+            self.kg_service = kg_service
+
+        @orchestration_provider.step(retries=0, timeout="360m")
+        async def kg_create_vector_index(self, context: Context) -> dict:
+            input_data = context.workflow_input()["request"]
+
+            index_name = await self.kg_service.create_vector_index(
+                **input_data
+            )
+
+            return {
+                "result": f"successfully created vector index {index_name} on {input_data['table_name']}"
+            }
+
+    @orchestration_provider.workflow(
+        name="kg-delete-vector-index", timeout="30m"
+    )
+    class KGDeleteVectorIndexWorkflow:
+        def __init__(self, kg_service: KgService):
+            self.kg_service = kg_service
+
+        @orchestration_provider.step(retries=0, timeout="10m")
+        async def kg_delete_vector_index(self, context: Context) -> dict:
+            input_data = context.workflow_input()["request"]
+
+            await self.kg_service.delete_vector_index(**input_data)
+
+            return {
+                "result": f"successfully deleted vector index {input_data['index_name']}"
+            }
+
     return {
         "kg-extract": KGExtractDescribeEmbedWorkflow(service),
         "create-graph": CreateGraphWorkflow(service),
@@ -525,4 +561,6 @@ def hatchet_kg_factory(
         "kg-entity-deduplication-summary": EntityDeduplicationSummaryWorkflow(
             service
         ),
+        "kg-create-vector-index": KGCreateVectorIndexWorkflow(service),
+        "kg-delete-vector-index": KGDeleteVectorIndexWorkflow(service),
     }
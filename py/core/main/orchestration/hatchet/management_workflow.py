@@ -0,0 +1,40 @@
+import logging
+
+from hatchet_sdk import Context
+
+from core.base import OrchestrationProvider
+
+from ...services import ManagementService
+
+logger = logging.getLogger()
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from hatchet_sdk import Hatchet
+
+
+def hatchet_management_factory(
+    orchestration_provider: OrchestrationProvider, service: ManagementService
+) -> dict[str, "Hatchet.Workflow"]:
+
+    @orchestration_provider.workflow(name="bulk-delete", timeout="360m")
+    class BulkDeleteWorkflow:
+        def __init__(self, management_service: ManagementService):
+            self.management_service = management_service
+
+        @orchestration_provider.step(retries=1, timeout="360m")
+        async def bulk_delete(self, context: Context) -> dict:
+            input_data = context.workflow_input()["request"]
+
+            progress: dict = {}
+            async for progress in self.management_service.bulk_delete(
+                filters=input_data["filters"],
+                batch_size=input_data.get("batch_size"),
+            ):
+                context.log(
+                    f"Deleted {progress['documents_processed']} of {progress['documents_total']} documents: {progress}"
+                )
+
+            return {"result": progress}
+
+    return {"bulk-delete": BulkDeleteWorkflow(service)}
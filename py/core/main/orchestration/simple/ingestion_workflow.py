@@ -36,34 +36,50 @@ def simple_ingestion_factory(service: IngestionService):
             )
 
             ingestion_config = parsed_data["ingestion_config"]
-            extractions_generator = await service.parse_file(
-                document_info, ingestion_config
-            )
-            extractions = [
-                extraction.model_dump()
-                async for extraction in extractions_generator
-            ]
+            if service.use_streaming_ingestion(ingestion_config):
+                # parsed, embedded and stored in one pass
+                await service.update_document_status(
+                    document_info, status=IngestionStatus.EMBEDDING
+                )
+                summary_extractions = await service.stream_file_to_storage(
+                    document_info, ingestion_config
+                )
 
-            await service.update_document_status(
-                document_info, status=IngestionStatus.AUGMENTING
-            )
-            await service.augment_document_info(document_info, extractions)
+                await service.update_document_status(
+                    document_info, status=IngestionStatus.AUGMENTING
+                )
+                await service.augment_document_info(
+                    document_info, summary_extractions
+                )
+            else:
+                extractions_generator = await service.parse_file(
+                    document_info, ingestion_config
+                )
+                extractions = [
+                    extraction.model_dump()
+                    async for extraction in extractions_generator
+                ]
 
-            await service.update_document_status(
-                document_info, status=IngestionStatus.EMBEDDING
-            )
-            embedding_generator = await service.embed_document(extractions)
-            embeddings = [
-                embedding.model_dump()
-                async for embedding in embedding_generator
-            ]
+                await service.update_document_status(
+                    document_info, status=IngestionStatus.AUGMENTING
+                )
+                await service.augment_document_info(document_info, extractions)
 
-            await service.update_document_status(
-                document_info, status=IngestionStatus.STORING
-            )
-            storage_generator = await service.store_embeddings(embeddings)
-            async for _ in storage_generator:
-                pass
+                await service.update_document_status(
+                    document_info, status=IngestionStatus.EMBEDDING
+                )
+                embedding_generator = await service.embed_document(extractions)
+                embeddings = [
+                    embedding.model_dump()
+                    async for embedding in embedding_generator
+                ]
+
+                await service.update_document_status(
+                    document_info, status=IngestionStatus.STORING
+                )
+                storage_generator = await service.store_embeddings(embeddings)
+                async for _ in storage_generator:
+                    pass
 
             await service.finalize_ingestion(
                 document_info, is_update=is_update
@@ -385,6 +401,47 @@ def simple_ingestion_factory(service: IngestionService):
                 detail=f"Error during vector index deletion: {str(e)}",
             )
 
+    async def create_filter_index(input_data):
+        try:
+            from core.main import IngestionServiceAdapter
+
+            parsed_data = (
+                IngestionServiceAdapter.parse_create_filter_index_input(
+                    input_data
+                )
+            )
+
+            for key in parsed_data["keys"]:
+                await service.providers.database.create_filter_index(
+                    key, parsed_data["concurrently"]
+                )
+
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Error during filter index creation: {str(e)}",
+            )
+
+    async def delete_filter_index(input_data):
+        try:
+            from core.main import IngestionServiceAdapter
+
+            parsed_data = (
+                IngestionServiceAdapter.parse_delete_filter_index_input(
+                    input_data
+                )
+            )
+
+            await service.providers.database.delete_filter_index(**parsed_data)
+
+            return {"status": "Filter index deleted successfully."}
+
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Error during filter index deletion: {str(e)}",
+            )
+
     async def update_document_metadata(input_data):
         try:
             from core.main import IngestionServiceAdapter
@@ -425,4 +482,6 @@ def simple_ingestion_factory(service: IngestionService):
         "update-document-metadata": update_document_metadata,
         "create-vector-index": create_vector_index,
         "delete-vector-index": delete_vector_index,
+        "create-filter-index": create_filter_index,
+        "delete-filter-index": delete_filter_index,
     }
@@ -44,24 +44,11 @@ def simple_kg_factory(service: KgService):
             f"Creating graph for {len(document_ids)} documents with IDs: {document_ids}"
         )
 
-        for _, document_id in enumerate(document_ids):
-            # Extract triples from the document
-
-            try:
-                await service.kg_triples_extraction(
-                    document_id=document_id,
-                    **input_data["kg_creation_settings"],
-                )
-                # Describe the entities in the graph
-                await service.kg_entity_description(
-                    document_id=document_id,
-                    **input_data["kg_creation_settings"],
-                )
-
-            except Exception as e:
-                logger.error(
-                    f"Error in creating graph for document {document_id}: {e}"
-                )
+        # Chunks of all documents share one bounded extraction queue
+        await service.kg_collection_extraction(
+            document_ids=document_ids,
+            **input_data["kg_creation_settings"],
+        )
 
     async def enrich_graph(input_data):
 
@@ -153,9 +140,23 @@ def simple_kg_factory(service: KgService):
             **input_data["kg_entity_deduplication_settings"],
         )
 
+    async def create_vector_index(input_data):
+
+        index_name = await service.create_vector_index(**input_data)
+
+        return {"status": f"Vector index {index_name} created successfully."}
+
+    async def delete_vector_index(input_data):
+
+        await service.delete_vector_index(**input_data)
+
+        return {"status": "Vector index deleted successfully."}
+
     return {
         "create-graph": create_graph,
         "enrich-graph": enrich_graph,
         "kg-community-summary": kg_community_summary,
         "entity-deduplication": entity_deduplication_workflow,
+        "kg-create-vector-index": create_vector_index,
+        "kg-delete-vector-index": delete_vector_index,
     }
@@ -0,0 +1,19 @@
+import logging
+
+from ...services import ManagementService
+
+logger = logging.getLogger()
+
+
+def simple_management_factory(service: ManagementService):
+
+    async def bulk_delete(input_data):
+        async for progress in service.bulk_delete(
+            filters=input_data["filters"],
+            batch_size=input_data.get("batch_size"),
+        ):
+            logger.info(
+                f"Deleted {progress['documents_processed']} of {progress['documents_total']} documents: {progress}"
+            )
+
+    return {"bulk-delete": bulk_delete}
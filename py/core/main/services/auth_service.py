@@ -145,7 +145,9 @@ class AuthService(Service):
             user.bio = bio
         if profile_picture is not None:
             user.profile_picture = profile_picture
-        return await self.providers.database.update_user(user)
+        updated_user = await self.providers.database.update_user(user)
+        self.providers.auth.invalidate_user(user_id=user_id)
+        return updated_user
 
     @telemetry_event("DeleteUserAccount")
     async def delete_user(
@@ -162,13 +164,14 @@ class AuthService(Service):
             is_superuser
             or (
                 user.hashed_password is not None
-                and self.providers.auth.crypto_provider.verify_password(  # type: ignore
+                and await self.providers.auth.crypto_provider.async_verify_password(  # type: ignore
                     password, user.hashed_password
                 )
             )
         ):
             raise R2RException(status_code=400, message="Incorrect password")
         await self.providers.database.delete_user_relational(user_id)
+        self.providers.auth.invalidate_user(user_id=user_id)
         if delete_vector_data:
             await self.providers.database.delete_user_vector(user_id)
 
@@ -183,6 +186,8 @@ class AuthService(Service):
         await self.providers.database.clean_expired_blacklisted_tokens(
             max_age_hours, current_time
         )
+        if self.providers.auth.cache:
+            self.providers.auth.cache.reset_blacklist()
 
     @telemetry_event("GetUserVerificationCode")
     async def get_user_verification_code(
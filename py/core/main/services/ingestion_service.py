@@ -226,7 +226,7 @@ class IngestionService(Service):
     async def augment_document_info(
         self,
         document_info: DocumentInfo,
-        chunked_documents: list[dict],
+        chunked_documents: Sequence[Union[dict, DocumentExtraction]],
     ) -> None:
         if not self.config.ingestion.skip_document_summary:
             document = f"Document Title: {document_info.title}\n"
@@ -237,7 +237,11 @@ class IngestionService(Service):
             for chunk in chunked_documents[
                 0 : self.config.ingestion.chunks_for_document_summary
             ]:
-                document += chunk["data"]
+                document += (
+                    chunk.data  # type: ignore
+                    if isinstance(chunk, DocumentExtraction)
+                    else chunk["data"]
+                )
 
             messages = await self.providers.database.prompt_handler.get_message_payload(
                 system_prompt_name=self.config.ingestion.document_summary_system_prompt,
@@ -262,31 +266,52 @@ class IngestionService(Service):
 
     async def embed_document(
         self,
-        chunked_documents: list[dict],
+        chunked_documents: Union[
+            Sequence[Union[dict, DocumentExtraction]],
+            AsyncGenerator[DocumentExtraction, None],
+        ],
     ) -> AsyncGenerator[VectorEntry, None]:
+        extractions: Union[
+            list[DocumentExtraction], AsyncGenerator[DocumentExtraction, None]
+        ]
+        if isinstance(chunked_documents, AsyncGenerator):
+            extractions = chunked_documents
+        else:
+            extractions = [
+                (
+                    chunk
+                    if isinstance(chunk, DocumentExtraction)
+                    else DocumentExtraction.from_dict(chunk)
+                )
+                for chunk in chunked_documents
+            ]
         return await self.pipes.embedding_pipe.run(
-            input=self.pipes.embedding_pipe.Input(
-                message=[
-                    DocumentExtraction.from_dict(chunk)
-                    for chunk in chunked_documents
-                ]
-            ),
+            input=self.pipes.embedding_pipe.Input(message=extractions),
             state=None,
             run_manager=self.run_manager,
         )
 
     async def store_embeddings(
         self,
-        embeddings: Sequence[Union[dict, VectorEntry]],
+        embeddings: Union[
+            Sequence[Union[dict, VectorEntry]],
+            AsyncGenerator[VectorEntry, None],
+        ],
     ) -> AsyncGenerator[str, None]:
-        vector_entries = [
-            (
-                embedding
-                if isinstance(embedding, VectorEntry)
-                else VectorEntry.from_dict(embedding)
-            )
-            for embedding in embeddings
+        vector_entries: Union[
+            list[VectorEntry], AsyncGenerator[VectorEntry, None]
         ]
+        if isinstance(embeddings, AsyncGenerator):
+            vector_entries = embeddings
+        else:
+            vector_entries = [
+                (
+                    embedding
+                    if isinstance(embedding, VectorEntry)
+                    else VectorEntry.from_dict(embedding)
+                )
+                for embedding in embeddings
+            ]
 
         return await self.pipes.vector_storage_pipe.run(
             input=self.pipes.vector_storage_pipe.Input(message=vector_entries),
@@ -294,6 +319,48 @@ class IngestionService(Service):
             run_manager=self.run_manager,
         )
 
+    def use_streaming_ingestion(
+        self, ingestion_config: Optional[dict]
+    ) -> bool:
+        return (ingestion_config or {}).get(
+            "use_streaming_ingestion",
+            self.config.ingestion.use_streaming_ingestion,
+        )
+
+    async def stream_file_to_storage(
+        self,
+        document_info: DocumentInfo,
+        ingestion_config: Optional[dict],
+    ) -> list[DocumentExtraction]:
+        """
+        Parses, embeds and stores a document as one pipeline of bounded
+        batches, so no stage holds the whole document. Returns the leading
+        extractions used for the document summary.
+        """
+        summary_limit = (
+            0
+            if self.config.ingestion.skip_document_summary
+            else self.config.ingestion.chunks_for_document_summary
+        )
+        summary_extractions: list[DocumentExtraction] = []
+
+        extractions_generator = await self.parse_file(
+            document_info, ingestion_config or {}
+        )
+
+        async def extractions() -> AsyncGenerator[DocumentExtraction, None]:
+            async for extraction in extractions_generator:
+                if len(summary_extractions) < summary_limit:
+                    summary_extractions.append(extraction)
+                yield extraction
+
+        embedding_generator = await self.embed_document(extractions())
+        storage_generator = await self.store_embeddings(embedding_generator)
+        async for _ in storage_generator:
+            pass
+
+        return summary_extractions
+
     async def finalize_ingestion(
         self,
         document_info: DocumentInfo,
@@ -774,6 +841,20 @@ class IngestionServiceAdapter:
             "table_name": input_data.get("table_name"),
         }
 
+    @staticmethod
+    def parse_create_filter_index_input(input_data: dict) -> dict:
+        return {
+            "keys": input_data["keys"],
+            "concurrently": input_data.get("concurrently", True),
+        }
+
+    @staticmethod
+    def parse_delete_filter_index_input(input_data: dict) -> dict:
+        return {
+            "index_name": input_data["index_name"],
+            "concurrently": input_data.get("concurrently", True),
+        }
+
     @staticmethod
     def parse_update_document_metadata_input(data: dict) -> dict:
         return {
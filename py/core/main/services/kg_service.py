@@ -1,7 +1,7 @@
 import logging
 import math
 import time
-from typing import AsyncGenerator, Optional
+from typing import Any, AsyncGenerator, Optional, Union
 from uuid import UUID
 
 from fastapi import HTTPException
@@ -9,12 +9,18 @@ from fastapi import HTTPException
 from core.base import KGExtractionStatus, RunManager
 from core.base.abstractions import (
     GenerationConfig,
+    IndexArgsHNSW,
+    IndexArgsIVFFlat,
+    IndexMeasure,
+    IndexMethod,
     KGCreationSettings,
     KGEnrichmentSettings,
     KGEntityDeduplicationSettings,
     KGEntityDeduplicationType,
     R2RException,
+    VectorTableName,
 )
+from core.pipes.kg.extraction_scheduler import KGExtractionScheduler
 from core.providers.logger.r2r_logger import SqlitePersistentLoggingProvider
 from core.telemetry.telemetry_decorator import telemetry_event
 
@@ -64,6 +70,7 @@ class KgService(Service):
         max_knowledge_triples: int,
         entity_types: list[str],
         relation_types: list[str],
+        max_concurrent_extractions: Optional[int] = None,
         **kwargs,
     ):
         try:
@@ -87,6 +94,7 @@ class KgService(Service):
                         "max_knowledge_triples": max_knowledge_triples,
                         "entity_types": entity_types,
                         "relation_types": relation_types,
+                        "max_concurrent_extractions": max_concurrent_extractions,
                         "logger": logger,
                     }
                 ),
@@ -115,6 +123,47 @@ class KgService(Service):
 
         return await _collect_results(result_gen)
 
+    @telemetry_event("kg_collection_extraction")
+    async def kg_collection_extraction(
+        self,
+        document_ids: list[UUID],
+        generation_config: GenerationConfig,
+        extraction_merge_count: int,
+        max_knowledge_triples: int,
+        entity_types: list[str],
+        relation_types: list[str],
+        max_description_input_length: int,
+        max_concurrent_extractions: int = 16,
+        extraction_tokens_per_minute: Optional[int] = None,
+        **kwargs,
+    ) -> dict:
+        """
+        Extracts triples and describes entities for many documents at once,
+        interleaving their chunks through one bounded work queue.
+        """
+
+        async def describe_entities(document_id: UUID):
+            return await self.kg_entity_description(
+                document_id=document_id,
+                max_description_input_length=max_description_input_length,
+            )
+
+        scheduler = KGExtractionScheduler(
+            extraction_pipe=self.pipes.kg_triples_extraction_pipe,
+            database_provider=self.providers.database,
+            describe_entities=describe_entities,
+            max_concurrent_extractions=max_concurrent_extractions,
+            tokens_per_minute=extraction_tokens_per_minute,
+        )
+        return await scheduler.run(
+            document_ids=document_ids,
+            generation_config=generation_config,
+            extraction_merge_count=extraction_merge_count,
+            max_knowledge_triples=max_knowledge_triples,
+            entity_types=entity_types,
+            relation_types=relation_types,
+        )
+
     @telemetry_event("get_document_ids_for_create_graph")
     async def get_document_ids_for_create_graph(
         self,
@@ -284,6 +333,60 @@ class KgService(Service):
             collection_id, cascade
         )
 
+    @telemetry_event("create_kg_vector_index")
+    async def create_vector_index(
+        self,
+        table_name: VectorTableName,
+        index_measure: IndexMeasure = IndexMeasure.cosine_distance,
+        index_method: IndexMethod = IndexMethod.auto,
+        index_arguments: Optional[
+            Union[dict, IndexArgsIVFFlat, IndexArgsHNSW]
+        ] = None,
+        index_name: Optional[str] = None,
+        concurrently: bool = True,
+        **kwargs,
+    ) -> str:
+        # workflow inputs arrive serialized
+        table_name = VectorTableName(table_name)
+        index_measure = IndexMeasure(index_measure)
+        index_method = IndexMethod(index_method)
+        if isinstance(index_arguments, dict):
+            index_arguments = (
+                IndexArgsIVFFlat(**index_arguments)
+                if index_method == IndexMethod.ivfflat
+                else IndexArgsHNSW(**index_arguments)
+            )
+        return await self.providers.database.create_vector_index(
+            table_name,
+            index_measure,
+            index_method,
+            index_arguments,
+            index_name,
+            concurrently,
+        )
+
+    @telemetry_event("list_kg_vector_indices")
+    async def list_vector_indices(
+        self,
+        table_name: VectorTableName,
+        **kwargs,
+    ) -> list[dict[str, Any]]:
+        return await self.providers.database.list_vector_indices(
+            VectorTableName(table_name)
+        )
+
+    @telemetry_event("delete_kg_vector_index")
+    async def delete_vector_index(
+        self,
+        index_name: str,
+        table_name: VectorTableName,
+        concurrently: bool = True,
+        **kwargs,
+    ) -> None:
+        return await self.providers.database.delete_vector_index(
+            index_name, VectorTableName(table_name), concurrently
+        )
+
     @telemetry_event("delete_node_via_document_id")
     async def delete_node_via_document_id(
         self,
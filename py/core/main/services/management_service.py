@@ -2,7 +2,15 @@ import logging
 import os
 from collections import defaultdict
 from importlib.metadata import version as get_version
-from typing import Any, BinaryIO, Dict, Optional, Tuple, Union
+from typing import (
+    Any,
+    AsyncGenerator,
+    BinaryIO,
+    Dict,
+    Optional,
+    Tuple,
+    Union,
+)
 from uuid import UUID
 
 import toml
@@ -218,137 +226,160 @@ class ManagementService(Service):
             limit=limit,
         )
 
-    @telemetry_event("Delete")
-    async def delete(
-        self,
-        filters: dict[str, Any],
-        *args,
-        **kwargs,
-    ):
-        """
-        Takes a list of filters like
-        "{key: {operator: value}, key: {operator: value}, ...}"
-        and deletes entries matching the given filters from both vector and relational databases.
+    # documents per set-based delete statement of `bulk_delete`
+    DELETE_BATCH_SIZE = 1_000
 
-        NOTE: This method is not atomic and may result in orphaned entries in the documents overview table.
-        NOTE: This method assumes that filters delete entire contents of any touched documents.
-        """
+    @staticmethod
+    def validate_delete_filters(filters: dict[str, Any]) -> None:
+        ALLOWED_FILTERS = {
+            "document_id",
+            "user_id",
+            "collection_ids",
+            "extraction_id",
+        }
 
-        def validate_filters(filters: dict[str, Any]) -> None:
-            ALLOWED_FILTERS = {
-                "document_id",
-                "user_id",
-                "collection_ids",
-                "extraction_id",
-            }
+        if not filters:
+            raise R2RException(status_code=422, message="No filters provided")
 
-            if not filters:
+        for field in filters:
+            if field not in ALLOWED_FILTERS:
                 raise R2RException(
-                    status_code=422, message="No filters provided"
+                    status_code=422,
+                    message=f"Invalid filter field: {field}",
                 )
 
-            for field in filters:
-                if field not in ALLOWED_FILTERS:
+        for field in ["document_id", "user_id", "extraction_id"]:
+            if field in filters:
+                op = next(iter(filters[field].keys()))
+                try:
+                    validate_uuid(filters[field][op])
+                except ValueError:
                     raise R2RException(
                         status_code=422,
-                        message=f"Invalid filter field: {field}",
+                        message=f"Invalid UUID: {filters[field][op]}",
                     )
 
-            for field in ["document_id", "user_id", "extraction_id"]:
-                if field in filters:
-                    op = next(iter(filters[field].keys()))
-                    try:
-                        validate_uuid(filters[field][op])
-                    except ValueError:
-                        raise R2RException(
-                            status_code=422,
-                            message=f"Invalid UUID: {filters[field][op]}",
-                        )
+        if "collection_ids" in filters:
+            op = next(iter(filters["collection_ids"].keys()))
+            for id_str in filters["collection_ids"][op]:
+                try:
+                    validate_uuid(id_str)
+                except ValueError:
+                    raise R2RException(
+                        status_code=422, message=f"Invalid UUID: {id_str}"
+                    )
 
-            if "collection_ids" in filters:
-                op = next(iter(filters["collection_ids"].keys()))
-                for id_str in filters["collection_ids"][op]:
-                    try:
-                        validate_uuid(id_str)
-                    except ValueError:
-                        raise R2RException(
-                            status_code=422, message=f"Invalid UUID: {id_str}"
+    async def _get_documents_to_delete(
+        self, filters: dict[str, Any]
+    ) -> list[UUID]:
+        """
+        The documents with chunks matching the filters, and the documents the
+        filters select in the documents overview, whether or not they have
+        chunks left.
+        """
+        document_ids = set(
+            await self.providers.database.get_document_ids_by_filters(filters)
+        )
+
+        relational_filters = {}
+        for field, filter_name in [
+            ("document_id", "filter_document_ids"),
+            ("user_id", "filter_user_ids"),
+            ("collection_ids", "filter_collection_ids"),
+        ]:
+            if field in filters:
+                op, value = next(iter(filters[field].items()))
+                if op in ("$eq", "$in", "$overlap", "$contains", "$any"):
+                    relational_filters[filter_name] = [
+                        UUID(str(id))
+                        for id in (
+                            value if isinstance(value, list) else [value]
                         )
+                    ]
+        if relational_filters:
+            document_ids.update(
+                await self.providers.database.get_document_ids(
+                    **relational_filters
+                )
+            )
+        return sorted(document_ids)
 
-        validate_filters(filters)
+    async def bulk_delete(
+        self,
+        filters: dict[str, Any],
+        batch_size: Optional[int] = None,
+    ) -> AsyncGenerator[dict[str, int], None]:
+        """
+        Deletes the chunks matching the filters. Documents left without
+        chunks are purged with their entities, triples and stored files.
 
-        logger.info(f"Deleting entries with filters: {filters}")
+        The affected documents are resolved up front, then deleted in
+        batches of `batch_size` documents, one statement per table and
+        batch. Yields the progress after each batch.
 
-        try:
-            vector_delete_results = await self.providers.database.delete(
-                filters
-            )
-        except Exception as e:
-            logger.error(f"Error deleting from vector database: {e}")
-            vector_delete_results = {}
-
-        document_ids_to_purge: set[UUID] = set()
-        if vector_delete_results:
-            document_ids_to_purge.update(
-                UUID(result.get("document_id"))
-                for result in vector_delete_results.values()
-                if result.get("document_id")
-            )
+        NOTE: The batches are not atomic, an interrupted delete is resumed by
+        running it again.
+        NOTE: This method assumes that filters delete entire contents of any touched documents.
+        """
+        self.validate_delete_filters(filters)
+        batch_size = batch_size or self.DELETE_BATCH_SIZE
 
-        relational_filters = {}
-        if "document_id" in filters:
-            relational_filters["filter_document_ids"] = [
-                filters["document_id"]["$eq"]
-            ]
-        if "user_id" in filters:
-            relational_filters["filter_user_ids"] = [filters["user_id"]["$eq"]]
-        if "collection_ids" in filters:
-            relational_filters["filter_collection_ids"] = list(
-                filters["collection_ids"]["$in"]
-            )
+        logger.info(f"Deleting entries with filters: {filters}")
 
-        if relational_filters:
-            try:
-                documents_overview = (
-                    await self.providers.database.get_documents_overview(
-                        **relational_filters  # type: ignore
-                    )
-                )["results"]
-            except Exception as e:
-                logger.error(
-                    f"Error fetching documents from relational database: {e}"
-                )
-                documents_overview = []
+        document_ids = await self._get_documents_to_delete(filters)
+        if not document_ids:
+            raise R2RException(
+                status_code=404, message="No entries found for deletion."
+            )
 
-            if documents_overview:
-                document_ids_to_purge.update(
-                    doc.id for doc in documents_overview
-                )
+        database = self.providers.database
+        progress = {
+            "documents_total": len(document_ids),
+            "documents_processed": 0,
+            "chunks_deleted": 0,
+            "documents_deleted": 0,
+            "entities_deleted": 0,
+            "triples_deleted": 0,
+            "files_deleted": 0,
+        }
+        for start in range(0, len(document_ids), batch_size):
+            batch = document_ids[start : start + batch_size]
 
-            if not document_ids_to_purge:
-                raise R2RException(
-                    status_code=404, message="No entries found for deletion."
+            chunks_deleted, purged = await database.delete_document_chunks(
+                batch, filters
+            )
+            progress["chunks_deleted"] += chunks_deleted
+            if purged:
+                graph = await database.delete_graphs_for_documents(purged)
+                progress["entities_deleted"] += graph["entities"]
+                progress["triples_deleted"] += graph["triples"]
+                progress["files_deleted"] += await database.delete_files(
+                    purged
                 )
+                # last, a rerun finds documents through the overview
+                progress[
+                    "documents_deleted"
+                ] += await database.delete_documents(purged)
+            progress["documents_processed"] += len(batch)
+            yield dict(progress)
 
-            for document_id in document_ids_to_purge:
-                remaining_chunks = (
-                    await self.providers.database.get_document_chunks(
-                        document_id
-                    )
-                )
-                if remaining_chunks["total_entries"] == 0:
-                    try:
-                        await self.providers.database.delete_from_documents_overview(
-                            document_id
-                        )
-                        logger.info(
-                            f"Deleted document ID {document_id} from documents_overview."
-                        )
-                    except Exception as e:
-                        logger.error(
-                            f"Error deleting document ID {document_id} from documents_overview: {e}"
-                        )
+    @telemetry_event("Delete")
+    async def delete(
+        self,
+        filters: dict[str, Any],
+        *args,
+        **kwargs,
+    ):
+        """
+        Takes a list of filters like
+        "{key: {operator: value}, key: {operator: value}, ...}"
+        and deletes entries matching the given filters from both vector and relational databases.
 
+        See `bulk_delete`, which the `bulk-delete` workflow runs in the background.
+        """
+        async for progress in self.bulk_delete(filters):
+            pass
+        logger.info(f"Deleted entries with filters {filters}: {progress}")
         return None
 
     @telemetry_event("DownloadFile")
@@ -359,6 +390,12 @@ class ManagementService(Service):
             return result
         return None
 
+    @telemetry_event("StreamFile")
+    async def stream_file(
+        self, document_id: UUID, start: int = 0, end: Optional[int] = None
+    ) -> AsyncGenerator[bytes, None]:
+        return self.providers.database.stream_file(document_id, start, end)
+
     @telemetry_event("DocumentsOverview")
     async def documents_overview(
         self,
@@ -546,6 +583,8 @@ class ManagementService(Service):
             collection_id
         )
         await self.providers.database.delete_collection_vector(collection_id)
+        # Any user may have been a member, drop every cached membership list
+        self.providers.auth.invalidate_users()
         return True
 
     @telemetry_event("ListCollections")
@@ -560,17 +599,21 @@ class ManagementService(Service):
     async def add_user_to_collection(
         self, user_id: UUID, collection_id: UUID
     ) -> None:
-        return await self.providers.database.add_user_to_collection(
+        result = await self.providers.database.add_user_to_collection(
             user_id, collection_id
         )
+        self.providers.auth.invalidate_user(user_id=user_id)
+        return result
 
     @telemetry_event("RemoveUserFromCollection")
     async def remove_user_from_collection(
         self, user_id: UUID, collection_id: UUID
     ) -> None:
-        return await self.providers.database.remove_user_from_collection(
+        result = await self.providers.database.remove_user_from_collection(
             user_id, collection_id
         )
+        self.providers.auth.invalidate_user(user_id=user_id)
+        return result
 
     @telemetry_event("GetUsersInCollection")
     async def get_users_in_collection(
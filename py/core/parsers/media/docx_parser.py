@@ -1,5 +1,5 @@
 from io import BytesIO
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Iterator
 
 from core.base.abstractions import DataType
 from core.base.parsers.base_parser import AsyncParser
@@ -10,6 +10,13 @@ from core.base.providers import (
 )
 
 
+def iter_docx_paragraphs(data: bytes) -> Iterator[str]:
+    from docx import Document
+
+    for paragraph in Document(BytesIO(data)).paragraphs:
+        yield paragraph.text
+
+
 class DOCXParser(AsyncParser[DataType]):
     """A parser for DOCX data."""
 
@@ -37,6 +44,5 @@ class DOCXParser(AsyncParser[DataType]):
         if isinstance(data, str):
             raise ValueError("DOCX data must be in bytes format.")
 
-        doc = self.Document(BytesIO(data))
-        for paragraph in doc.paragraphs:
-            yield paragraph.text
+        async for text in self.executor.iterate(iter_docx_paragraphs, data):
+            yield text
@@ -1,9 +1,11 @@
 # type: ignore
 import asyncio
 import base64
+import functools
 import logging
 import os
 import string
+import tempfile
 import unicodedata
 from io import BytesIO
 from typing import AsyncGenerator
@@ -13,6 +15,7 @@ from pdf2image import convert_from_path
 
 from core.base.abstractions import DataType, GenerationConfig
 from core.base.parsers.base_parser import AsyncParser
+from core.base.parsers.executor import ParserExecutionMode
 from core.base.providers import (
     CompletionProvider,
     DatabaseProvider,
@@ -206,6 +209,79 @@ class VLMPDFParser(AsyncParser[DataType]):
                 os.rmdir(temp_dir)
 
 
+# Pages extracted per executor call; the next batch is extracted while the
+# current one is consumed
+PDF_PAGES_PER_TASK = 16
+
+
+def _keep_character(x: str) -> bool:
+    return (
+        unicodedata.category(x)
+        in [
+            "Ll",
+            "Lu",
+            "Lt",
+            "Lm",
+            "Lo",
+            "Nl",
+            "No",
+        ]  # Keep letters and numbers
+        or "\u4E00" <= x <= "\u9FFF"  # Chinese characters
+        or "\u0600" <= x <= "\u06FF"  # Arabic characters
+        or "\u0400" <= x <= "\u04FF"  # Cyrillic letters
+        or "\u0370" <= x <= "\u03FF"  # Greek letters
+        or "\u0E00" <= x <= "\u0E7F"  # Thai
+        or "\u3040" <= x <= "\u309F"  # Japanese Hiragana
+        or "\u30A0" <= x <= "\u30FF"  # Katakana
+        or x in string.printable
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _read_pdf_file(path: str, mtime_ns: int, size: int):
+    from pypdf import PdfReader
+
+    return PdfReader(path)
+
+
+def open_pdf(source):
+    """
+    Opens a PDF from bytes, or from a file path. A worker process keeps the
+    file it opened last, so the batches of one document it extracts share a
+    single parse of the cross-reference table and page tree.
+    """
+    from pypdf import PdfReader
+
+    if isinstance(source, (bytes, bytearray)):
+        return PdfReader(BytesIO(source))
+    if isinstance(source, str):
+        stat = os.stat(source)
+        return _read_pdf_file(source, stat.st_mtime_ns, stat.st_size)
+    return source
+
+
+def count_pdf_pages(source) -> int:
+    return len(open_pdf(source).pages)
+
+
+def extract_pdf_pages(source, start: int, stop: int) -> list[str]:
+    """Extracts the text of pages `[start, stop)`, skipping empty pages."""
+    pdf = open_pdf(source)
+    texts = []
+    for page in pdf.pages[start:stop]:
+        page_text = page.extract_text()
+        if page_text is not None:
+            # Keep characters in common languages ; # Filter out non-printable characters
+            texts.append("".join(filter(_keep_character, page_text)))
+    return texts
+
+
+def _spill_to_file(data: bytes) -> str:
+    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as file:
+        file.write(data)
+        return file.name
+
+
 class BasicPDFParser(AsyncParser[DataType]):
     """A parser for PDF data."""
 
@@ -233,36 +309,54 @@ class BasicPDFParser(AsyncParser[DataType]):
         """Ingest PDF data and yield text from each page."""
         if isinstance(data, str):
             raise ValueError("PDF data must be in bytes format.")
-        pdf = self.PdfReader(BytesIO(data))
-        for page in pdf.pages:
-            page_text = page.extract_text()
-            if page_text is not None:
-                page_text = "".join(
-                    filter(
-                        lambda x: (
-                            unicodedata.category(x)
-                            in [
-                                "Ll",
-                                "Lu",
-                                "Lt",
-                                "Lm",
-                                "Lo",
-                                "Nl",
-                                "No",
-                            ]  # Keep letters and numbers
-                            or "\u4E00" <= x <= "\u9FFF"  # Chinese characters
-                            or "\u0600" <= x <= "\u06FF"  # Arabic characters
-                            or "\u0400" <= x <= "\u04FF"  # Cyrillic letters
-                            or "\u0370" <= x <= "\u03FF"  # Greek letters
-                            or "\u0E00" <= x <= "\u0E7F"  # Thai
-                            or "\u3040" <= x <= "\u309F"  # Japanese Hiragana
-                            or "\u30A0" <= x <= "\u30FF"  # Katakana
-                            or x in string.printable
-                        ),
-                        page_text,
-                    )
-                )  # Keep characters in common languages ; # Filter out non-printable characters
-                yield page_text
+
+        path = None
+        if self.executor.mode == ParserExecutionMode.PROCESS:
+            # Workers read the document from disk instead of receiving a
+            # pickled copy of it with every batch
+            path = await asyncio.to_thread(_spill_to_file, data)
+            source = path
+        else:
+            # Batches run one at a time, so they can share the reader
+            source = await self.executor.run(open_pdf, data)
+
+        pending = None
+        try:
+            num_pages = await self.executor.run(count_pdf_pages, source)
+
+            def extract(start: int) -> asyncio.Future:
+                stop = min(start + PDF_PAGES_PER_TASK, num_pages)
+                return asyncio.ensure_future(
+                    self.executor.run(extract_pdf_pages, source, start, stop)
+                )
+
+            pending = extract(0) if num_pages else None
+            for start in range(0, num_pages, PDF_PAGES_PER_TASK):
+                texts = await pending
+                next_start = start + PDF_PAGES_PER_TASK
+                pending = (
+                    extract(next_start) if next_start < num_pages else None
+                )
+                for page_text in texts:
+                    yield page_text
+        finally:
+            if pending is not None:
+                pending.cancel()
+            if path is not None:
+                os.remove(path)
+
+
+def partition_pdf_texts(
+    data: bytes, partition_strategy: str, chunking_strategy: str
+) -> list[str]:
+    from unstructured.partition.pdf import partition_pdf
+
+    elements = partition_pdf(
+        file=BytesIO(data),
+        partition_strategy=partition_strategy,
+        chunking_strategy=chunking_strategy,
+    )
+    return [element.text for element in elements]
 
 
 class PDFParserUnstructured(AsyncParser[DataType]):
@@ -294,12 +388,11 @@ class PDFParserUnstructured(AsyncParser[DataType]):
         data: DataType,
         partition_strategy: str = "hi_res",
         chunking_strategy="by_title",
+        **kwargs,
     ) -> AsyncGenerator[str, None]:
         # partition the pdf
-        elements = self.partition_pdf(
-            file=BytesIO(data),
-            partition_strategy=partition_strategy,
-            chunking_strategy=chunking_strategy,
+        texts = await self.executor.run(
+            partition_pdf_texts, data, partition_strategy, chunking_strategy
         )
-        for element in elements:
-            yield element.text
+        for text in texts:
+            yield text
@@ -1,5 +1,5 @@
 from io import BytesIO
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Iterator
 
 from core.base.abstractions import DataType
 from core.base.parsers.base_parser import AsyncParser
@@ -10,6 +10,15 @@ from core.base.providers import (
 )
 
 
+def iter_pptx_texts(data: bytes) -> Iterator[str]:
+    from pptx import Presentation
+
+    for slide in Presentation(BytesIO(data)).slides:
+        for shape in slide.shapes:
+            if hasattr(shape, "text"):
+                yield shape.text
+
+
 class PPTParser(AsyncParser[DataType]):
     """A parser for PPT data."""
 
@@ -36,8 +45,5 @@ class PPTParser(AsyncParser[DataType]):
         if isinstance(data, str):
             raise ValueError("PPT data must be in bytes format.")
 
-        prs = self.Presentation(BytesIO(data))
-        for slide in prs.slides:
-            for shape in slide.shapes:
-                if hasattr(shape, "text"):
-                    yield shape.text
+        async for text in self.executor.iterate(iter_pptx_texts, data):
+            yield text
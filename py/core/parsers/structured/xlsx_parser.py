@@ -1,6 +1,6 @@
 # type: ignore
 from io import BytesIO
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Iterator
 
 from core.base.abstractions import DataType
 from core.base.parsers.base_parser import AsyncParser
@@ -11,6 +11,15 @@ from core.base.providers import (
 )
 
 
+def iter_xlsx_rows(data: bytes) -> Iterator[str]:
+    from openpyxl import load_workbook
+
+    wb = load_workbook(filename=BytesIO(data))
+    for sheet in wb.worksheets:
+        for row in sheet.iter_rows(values_only=True):
+            yield ", ".join(map(str, row))
+
+
 class XLSXParser(AsyncParser[DataType]):
     """A parser for XLSX data."""
 
@@ -39,10 +48,8 @@ class XLSXParser(AsyncParser[DataType]):
         if isinstance(data, str):
             raise ValueError("XLSX data must be in bytes format.")
 
-        wb = self.load_workbook(filename=BytesIO(data))
-        for sheet in wb.worksheets:
-            for row in sheet.iter_rows(values_only=True):
-                yield ", ".join(map(str, row))
+        async for text in self.executor.iterate(iter_xlsx_rows, data):
+            yield text
 
 
 class XLSXParserAdvanced(AsyncParser[DataType]):
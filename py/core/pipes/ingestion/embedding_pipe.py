@@ -22,7 +22,9 @@ class EmbeddingPipe(AsyncPipe[VectorEntry]):
     """
 
     class Input(AsyncPipe.Input):
-        message: list[DocumentExtraction]
+        message: Union[
+            list[DocumentExtraction], AsyncGenerator[DocumentExtraction, None]
+        ]
 
     def __init__(
         self,
@@ -67,6 +69,19 @@ class EmbeddingPipe(AsyncPipe[VectorEntry]):
             for raw_vector, extraction in zip(vectors, extraction_batch)
         ]
 
+    @staticmethod
+    async def _iterate(
+        message: Union[
+            list[DocumentExtraction], AsyncGenerator[DocumentExtraction, None]
+        ],
+    ) -> AsyncGenerator[DocumentExtraction, None]:
+        if isinstance(message, list):
+            for item in message:
+                yield item
+        else:
+            async for item in message:
+                yield item
+
     async def _run_logic(  # type: ignore
         self,
         input: AsyncPipe.Input,
@@ -90,7 +105,10 @@ class EmbeddingPipe(AsyncPipe[VectorEntry]):
             return await self._process_batch(batch)
 
         try:
-            for item in input.message:
+            # Extractions are pulled from the input only while fewer than
+            # `concurrent_limit` batches are in flight, so a streamed input
+            # is consumed at the pace of the embedding provider.
+            async for item in self._iterate(input.message):
                 extraction_batch.append(item)
 
                 if len(extraction_batch) >= batch_size:
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, AsyncGenerator, Optional
+from typing import Any, AsyncGenerator, Optional, Union
 from uuid import UUID
 
 from core.base import AsyncState, DatabaseProvider, StorageResult, VectorEntry
@@ -11,7 +11,7 @@ logger = logging.getLogger()
 
 class VectorStoragePipe(AsyncPipe[StorageResult]):
     class Input(AsyncPipe.Input):
-        message: list[VectorEntry]
+        message: Union[list[VectorEntry], AsyncGenerator[VectorEntry, None]]
 
     def __init__(
         self,
@@ -19,6 +19,7 @@ class VectorStoragePipe(AsyncPipe[StorageResult]):
         config: AsyncPipe.PipeConfig,
         logging_provider: SqlitePersistentLoggingProvider,
         storage_batch_size: int = 128,
+        use_bulk_upsert: bool = False,
         *args,
         **kwargs,
     ):
@@ -33,6 +34,7 @@ class VectorStoragePipe(AsyncPipe[StorageResult]):
         )
         self.database_provider = database_provider
         self.storage_batch_size = storage_batch_size
+        self.use_bulk_upsert = use_bulk_upsert
 
     async def store(
         self,
@@ -43,7 +45,12 @@ class VectorStoragePipe(AsyncPipe[StorageResult]):
         """
 
         try:
-            await self.database_provider.upsert_entries(vector_entries)
+            if self.use_bulk_upsert:
+                await self.database_provider.bulk_upsert_entries(
+                    vector_entries
+                )
+            else:
+                await self.database_provider.upsert_entries(vector_entries)
         except Exception as e:
             error_message = (
                 f"Failed to store vector entries in the database: {e}"
@@ -51,6 +58,17 @@ class VectorStoragePipe(AsyncPipe[StorageResult]):
             logger.error(error_message)
             raise ValueError(error_message)
 
+    @staticmethod
+    async def _iterate(
+        message: Union[list[VectorEntry], AsyncGenerator[VectorEntry, None]],
+    ) -> AsyncGenerator[VectorEntry, None]:
+        if isinstance(message, list):
+            for item in message:
+                yield item
+        else:
+            async for item in message:
+                yield item
+
     async def _run_logic(  # type: ignore
         self,
         input: AsyncPipe.Input,
@@ -62,7 +80,7 @@ class VectorStoragePipe(AsyncPipe[StorageResult]):
         vector_batch = []
         document_counts: dict[UUID, int] = {}
 
-        for msg in input.message:
+        async for msg in self._iterate(input.message):
             vector_batch.append(msg)
             document_counts[msg.document_id] = (
                 document_counts.get(msg.document_id, 0) + 1
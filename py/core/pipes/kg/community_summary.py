@@ -1,4 +1,5 @@
 import asyncio
+import hashlib
 import json
 import logging
 import random
@@ -21,6 +22,32 @@ from core.providers.logger.r2r_logger import SqlitePersistentLoggingProvider
 logger = logging.getLogger()
 
 
+def community_fingerprint(
+    entities: list[Entity], triples: list[Triple]
+) -> str:
+    """
+    Hash of everything a community report is generated from, independent
+    of the order the entities and triples were loaded in.
+    """
+    lines = sorted(
+        "\x1f".join(("entity", str(e.id), e.name, e.description or ""))
+        for e in entities
+    ) + sorted(
+        "\x1f".join(
+            (
+                "triple",
+                str(t.id),
+                t.subject,
+                t.predicate,
+                t.object,
+                t.description or "",
+            )
+        )
+        for t in triples
+    )
+    return hashlib.sha256("\x1e".join(lines).encode()).hexdigest()
+
+
 class KGCommunitySummaryPipe(AsyncPipe):
     """
     Clusters entities and triples into communities within the knowledge graph using hierarchical Leiden algorithm.
@@ -149,6 +176,22 @@ class KGCommunitySummaryPipe(AsyncPipe):
                 f"Community {community_number} has no entities or triples."
             )
 
+        # a community that came out of clustering with the same entities and
+        # triples as an earlier one gets its report without an LLM call
+        fingerprint = community_fingerprint(entities, triples)
+        name = await self.database_provider.reuse_community_report(
+            collection_id=collection_id,
+            community_number=community_number,
+            level=community_level,
+            fingerprint=fingerprint,
+        )
+        if name is not None:
+            return {
+                "community_number": community_number,
+                "name": name,
+                "reused": True,
+            }
+
         for attempt in range(3):
 
             description = (
@@ -209,6 +252,7 @@ class KGCommunitySummaryPipe(AsyncPipe):
             rating=rating,
             rating_explanation=rating_explanation,
             findings=findings,
+            fingerprint=fingerprint,
             embedding=await self.embedding_provider.async_get_embedding(
                 "Summary:\n"
                 + summary
@@ -222,6 +266,7 @@ class KGCommunitySummaryPipe(AsyncPipe):
         return {
             "community_number": community_report.community_number,
             "name": community_report.name,
+            "reused": False,
         }
 
     async def _run_logic(  # type: ignore
@@ -273,6 +318,7 @@ class KGCommunitySummaryPipe(AsyncPipe):
 
         total_jobs = len(community_summary_jobs)
         total_errors = 0
+        total_reused = 0
         completed_community_summary_jobs = 0
         for community_summary in asyncio.as_completed(community_summary_jobs):
 
@@ -290,8 +336,13 @@ class KGCommunitySummaryPipe(AsyncPipe):
                 total_errors += 1
                 continue
 
+            total_reused += summary["reused"]
             yield summary
 
+        logger.info(
+            f"KGCommunitySummaryPipe: {total_jobs - total_reused - total_errors} community summaries generated, {total_reused} reused from reports with the same fingerprint"
+        )
+
         if total_errors > 0:
             raise ValueError(
                 f"KGCommunitySummaryPipe: Failed to generate community summaries for {total_errors} out of {total_jobs} communities. Please rerun the job if there are too many failures."
@@ -1,4 +1,4 @@
-import json
+import asyncio
 import logging
 from typing import Any, Union
 from uuid import UUID
@@ -18,8 +18,15 @@ from core.providers import (
 )
 from core.providers.logger.r2r_logger import SqlitePersistentLoggingProvider
 
+from .deduplication_engine import cluster_embeddings
+
 logger = logging.getLogger()
 
+# Strict by default, only near identical descriptions are merged
+DEFAULT_DESCRIPTION_DEDUPLICATION_EPS = 0.1
+
+ENTITY_BATCH_SIZE = 10_000
+
 
 class KGEntityDeduplicationPipe(AsyncPipe):
     def __init__(
@@ -141,68 +148,51 @@ class KGEntityDeduplicationPipe(AsyncPipe):
             )
 
     async def kg_description_entity_deduplication(
-        self, collection_id: UUID, **kwargs
+        self,
+        collection_id: UUID,
+        eps: float = DEFAULT_DESCRIPTION_DEDUPLICATION_EPS,
+        **kwargs,
     ):
-        from sklearn.cluster import DBSCAN
-
-        entities = (
-            await self.database_provider.get_entities(
-                collection_id=collection_id,
-                offset=0,
-                limit=-1,
-                extra_columns=["description_embedding"],
+        entity_ids, embeddings = (
+            await self.database_provider.get_entity_embeddings(
+                collection_id=collection_id
             )
-        )["entities"]
-
-        for entity in entities:
-            entity.description_embedding = json.loads(
-                entity.description_embedding
-            )
-
-        logger.info(
-            f"KGEntityDeduplicationPipe: Got {len(entities)} entities for collection {collection_id}"
         )
-
-        deduplication_source_keys = [
-            "extraction_ids",
-            "document_id",
-            "attributes",
-        ]
-        deduplication_target_keys = [
-            "extraction_ids",
-            "document_ids",
-            "attributes",
-        ]
-
-        deduplication_keys = list(
-            zip(deduplication_source_keys, deduplication_target_keys)
-        )
-
-        embeddings = [entity.description_embedding for entity in entities]
+        num_entities = len(entity_ids)
 
         logger.info(
-            f"KGEntityDeduplicationPipe: Running DBSCAN clustering on {len(embeddings)} embeddings"
-        )
-        # TODO: make eps a config, make it very strict for now
-        clustering = DBSCAN(eps=0.1, min_samples=2, metric="cosine").fit(
-            embeddings
+            f"KGEntityDeduplicationPipe: Got {num_entities} entities for collection {collection_id}, clustering with eps={eps}"
         )
-        labels = clustering.labels_
+        labels = await asyncio.to_thread(cluster_embeddings, embeddings, eps)
+        del embeddings
 
         # Log clustering results
-        n_clusters = len(set(labels)) - (1 if -1 in labels else 0)
-        n_noise = list(labels).count(-1)
+        clustered = (labels != -1).nonzero()[0]
+        n_clusters = int(labels.max()) + 1 if num_entities else 0
+        n_noise = num_entities - len(clustered)
         logger.info(
             f"KGEntityDeduplicationPipe: Found {n_clusters} clusters and {n_noise} noise points"
         )
 
+        # only entities with duplicates are loaded in full
+        entities_by_id = {}
+        for start in range(0, len(clustered), ENTITY_BATCH_SIZE):
+            for entity in (
+                await self.database_provider.get_entities(
+                    collection_id=collection_id,
+                    entity_ids=entity_ids[
+                        clustered[start : start + ENTITY_BATCH_SIZE]
+                    ].tolist(),
+                )
+            )["entities"]:
+                entities_by_id[entity.id] = entity
+
         # for all labels in the same cluster, we can deduplicate them by name
         deduplicated_entities: dict[int, list] = {}
-        for id, label in enumerate(labels):
-            if label != -1:
-                if label not in deduplicated_entities:
-                    deduplicated_entities[label] = []
-                deduplicated_entities[label].append(entities[id])
+        for index in clustered.tolist():
+            deduplicated_entities.setdefault(int(labels[index]), []).append(
+                entities_by_id[int(entity_ids[index])]
+            )
 
         # upsert deduplcated entities in the collection_entity table
         deduplicated_entities_list = []
@@ -254,7 +244,7 @@ class KGEntityDeduplicationPipe(AsyncPipe):
         )
 
         yield {
-            "result": f"successfully deduplicated {len(entities)} entities to {len(deduplicated_entities)} entities for collection {collection_id}",
+            "result": f"successfully deduplicated {num_entities} entities to {len(deduplicated_entities)} entities for collection {collection_id}",
             "num_entities": len(deduplicated_entities),
         }
 
@@ -297,7 +287,12 @@ class KGEntityDeduplicationPipe(AsyncPipe):
                 f"KGEntityDeduplicationPipe: Running description entity deduplication for collection {collection_id}"
             )
             async for result in self.kg_description_entity_deduplication(  # type: ignore
-                collection_id, **kwargs
+                collection_id,
+                eps=input.message.get(
+                    "description_deduplication_eps",
+                    DEFAULT_DESCRIPTION_DEDUPLICATION_EPS,
+                ),
+                **kwargs,
             ):
                 yield result
 
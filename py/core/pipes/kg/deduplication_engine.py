@@ -0,0 +1,217 @@
+"""Embedding similarity clustering for knowledge graph entity deduplication."""
+
+import logging
+import math
+import time
+from typing import Any, Optional
+
+logger = logging.getLogger()
+
+# Upper bound on the similarity block computed at once
+MAX_BLOCK_BYTES = 128 * 2**20
+
+# Up to this many entities every pair is compared; above it candidate
+# pairs come from inverted-file blocking
+EXACT_MAX_ENTITIES = 20_000
+
+# Cells each entity is assigned to when blocking; near duplicates that
+# straddle a cell boundary still meet in one of them
+DEFAULT_NPROBE = 2
+
+
+def _import_numpy():
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise ImportError(
+            "NumPy is not installed. Please install it to deduplicate entities by description."
+        ) from e
+    return np
+
+
+class UnionFind:
+    """Disjoint sets over `0..n-1`, merged in vectorized batches of pairs."""
+
+    def __init__(self, n: int):
+        self.np = _import_numpy()
+        self.parent = self.np.arange(n, dtype=self.np.int64)
+
+    def find(self, nodes: Any) -> Any:
+        parent = self.parent
+        roots = parent[nodes]
+        while True:
+            grandparents = parent[roots]
+            if (grandparents == roots).all():
+                return roots
+            # path halving, every node visited now points two levels up
+            parent[roots] = grandparents
+            roots = grandparents
+
+    def union(self, a: Any, b: Any) -> None:
+        np = self.np
+        while len(a):
+            root_a, root_b = self.find(a), self.find(b)
+            separate = root_a != root_b
+            high = np.maximum(root_a[separate], root_b[separate])
+            low = np.minimum(root_a[separate], root_b[separate])
+            # several pairs may hook the same root; the smallest target wins
+            # and the other pairs are retried against the new roots
+            np.minimum.at(self.parent, high, low)
+            a, b = high, low
+
+    def labels(self) -> Any:
+        """
+        Cluster label of each node, `-1` for nodes that were never merged,
+        following the `DBSCAN.labels_` convention for noise.
+        """
+        np = self.np
+        roots = self.find(np.arange(len(self.parent)))
+        _, inverse, counts = np.unique(
+            roots, return_inverse=True, return_counts=True
+        )
+        merged = counts[inverse] > 1
+        labels = np.full(len(roots), -1, dtype=np.int64)
+        if merged.any():
+            _, labels[merged] = np.unique(inverse[merged], return_inverse=True)
+        return labels
+
+
+def normalize(embeddings: Any) -> Any:
+    np = _import_numpy()
+    matrix = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    return matrix / norms
+
+
+def _similar_pairs(
+    matrix: Any, threshold: float, max_block_bytes: int
+) -> tuple[Any, Any]:
+    """
+    Index pairs `i < j` of rows of a normalized matrix whose cosine
+    similarity is at least `threshold`, one block of rows at a time.
+    """
+    np = _import_numpy()
+    n = len(matrix)
+    block_rows = max(1, max_block_bytes // (4 * max(n, 1)))
+    firsts, seconds = [], []
+    for start in range(0, n, block_rows):
+        end = min(start + block_rows, n)
+        similarity = matrix[start:end] @ matrix[start:].T
+        rows, columns = np.nonzero(similarity >= threshold)
+        del similarity
+        rows += start
+        columns += start
+        upper = columns > rows
+        firsts.append(rows[upper])
+        seconds.append(columns[upper])
+    if not firsts:
+        return np.empty(0, np.int64), np.empty(0, np.int64)
+    return np.concatenate(firsts), np.concatenate(seconds)
+
+
+def _train_centroids(
+    matrix: Any, num_cells: int, iterations: int, seed: int
+) -> Any:
+    """Spherical k-means on a sample of the rows."""
+    np = _import_numpy()
+    rng = np.random.default_rng(seed)
+    sample_size = min(len(matrix), 64 * num_cells)
+    sample = matrix[rng.choice(len(matrix), sample_size, replace=False)]
+    centroids = sample[rng.choice(sample_size, num_cells, replace=False)]
+    for _ in range(iterations):
+        assignment = np.argmax(sample @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignment, sample)
+        empty = ~sums.any(axis=1)
+        sums[empty] = centroids[empty]
+        centroids = normalize(sums)
+    return centroids
+
+
+def _assign_cells(
+    matrix: Any, centroids: Any, nprobe: int, max_block_bytes: int
+) -> Any:
+    """The `nprobe` most similar cells of each row."""
+    np = _import_numpy()
+    # the similarities, their negation and the int64 partition indices
+    block_rows = max(1, max_block_bytes // (16 * len(centroids)))
+    cells = np.empty((len(matrix), nprobe), dtype=np.int64)
+    for start in range(0, len(matrix), block_rows):
+        similarity = matrix[start : start + block_rows] @ centroids.T
+        cells[start : start + block_rows] = np.argpartition(
+            -similarity, nprobe - 1, axis=1
+        )[:, :nprobe]
+    return cells
+
+
+def cluster_embeddings(
+    embeddings: Any,
+    eps: float,
+    method: str = "auto",
+    nprobe: int = DEFAULT_NPROBE,
+    num_cells: Optional[int] = None,
+    max_block_bytes: int = MAX_BLOCK_BYTES,
+    seed: int = 0,
+) -> Any:
+    """
+    Groups embeddings whose cosine distance is within `eps`.
+
+    Entities are linked when their distance is at most `eps` and linked
+    entities are merged transitively, which is what `DBSCAN(eps,
+    min_samples=2, metric="cosine")` computes. Candidate pairs come from
+    blocked matrix products over the whole set (`exact`) or, for large
+    sets, only within inverted-file cells (`ivf`): entities are assigned
+    to their `nprobe` nearest of about `sqrt(n)` spherical k-means
+    centroids and compared with the other members of those cells. Memory
+    stays bounded by `max_block_bytes` per block either way.
+
+    A float32 matrix is normalized in place rather than copied. Returns one
+    label per embedding, `-1` for entities without duplicates.
+    """
+    np = _import_numpy()
+    start_time = time.time()
+    matrix = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    matrix /= norms
+    del norms
+    n = len(matrix)
+    if n == 0:
+        return np.empty(0, dtype=np.int64)
+    threshold = 1 - eps
+    if method == "auto":
+        method = "exact" if n <= EXACT_MAX_ENTITIES else "ivf"
+
+    union_find = UnionFind(n)
+    if method == "exact":
+        union_find.union(*_similar_pairs(matrix, threshold, max_block_bytes))
+    elif method == "ivf":
+        num_cells = num_cells or max(1, int(math.sqrt(n)))
+        nprobe = min(nprobe, num_cells)
+        centroids = _train_centroids(matrix, num_cells, 10, seed)
+        cells = _assign_cells(matrix, centroids, nprobe, max_block_bytes)
+        # rows grouped by cell, with the offsets where each cell starts
+        members = np.repeat(np.arange(n), nprobe)[
+            np.argsort(cells.ravel(), kind="stable")
+        ]
+        offsets = np.zeros(num_cells + 1, dtype=np.int64)
+        np.cumsum(
+            np.bincount(cells.ravel(), minlength=num_cells), out=offsets[1:]
+        )
+        for cell_start, cell_end in zip(offsets[:-1], offsets[1:]):
+            cell = members[cell_start:cell_end]
+            if len(cell) < 2:
+                continue
+            firsts, seconds = _similar_pairs(
+                matrix[cell], threshold, max_block_bytes
+            )
+            union_find.union(cell[firsts], cell[seconds])
+    else:
+        raise ValueError(f"Unknown deduplication method: {method}")
+
+    labels = union_find.labels()
+    logger.info(
+        f"Clustered {n} embeddings with {method} candidate search into {int(labels.max()) + 1} clusters in {time.time() - start_time:.2f} seconds"
+    )
+    return labels
@@ -113,7 +113,7 @@ class KGEntityDeduplicationSummaryPipe(AsyncPipe[Any]):
         )
 
         for i, entity in enumerate(entities_batch):
-            entity.description_embedding = str(embeddings[i])  # type: ignore
+            entity.description_embedding = embeddings[i]
             entity.collection_id = collection_id
 
         logger.info(
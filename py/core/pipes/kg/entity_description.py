@@ -136,7 +136,7 @@ class KGEntityDescriptionPipe(AsyncPipe):
                     (
                         out_entity.name,
                         out_entity.description,
-                        str(out_entity.description_embedding),
+                        out_entity.description_embedding,
                         out_entity.extraction_ids,
                         document_id,
                     )
@@ -0,0 +1,343 @@
+"""Collection-wide scheduling of knowledge graph triples extraction."""
+
+import asyncio
+import logging
+import random
+import time
+from typing import Any, Awaitable, Callable, Optional
+from uuid import UUID
+
+from core.base import (
+    DatabaseProvider,
+    DocumentExtraction,
+    GenerationConfig,
+    KGExtractionStatus,
+)
+from core.base.providers.embedding import (
+    AdaptiveConcurrencyLimiter,
+    TokenBucket,
+    estimate_tokens,
+    is_rate_limit_error,
+    retry_after_seconds,
+)
+
+from .triples_extraction import KGTriplesExtractionPipe
+
+logger = logging.getLogger()
+
+
+class KGExtractionScheduler:
+    """
+    Extracts triples for many documents through one work queue.
+
+    Chunk groups are interleaved round robin across a window of documents,
+    so the LLM stays busy between documents and no single large document
+    floods it. In-flight calls are capped by an AIMD limiter that backs off
+    on 429s, and calls are paced against a tokens-per-minute budget. Each
+    chunk group is checkpointed once its triples are stored, so a rerun
+    only extracts the chunks that are left.
+    """
+
+    LOG_EVERY_GROUPS = 100
+
+    def __init__(
+        self,
+        extraction_pipe: KGTriplesExtractionPipe,
+        database_provider: DatabaseProvider,
+        describe_entities: Callable[[UUID], Awaitable[Any]],
+        max_concurrent_extractions: int = 16,
+        tokens_per_minute: Optional[int] = None,
+        max_rate_limit_retries: int = 8,
+        initial_backoff: float = 1.0,
+        max_backoff: float = 64.0,
+    ):
+        self.extraction_pipe = extraction_pipe
+        self.database_provider = database_provider
+        self.describe_entities = describe_entities
+        self.max_concurrent_extractions = max(1, max_concurrent_extractions)
+        self.max_rate_limit_retries = max_rate_limit_retries
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.limiter = AdaptiveConcurrencyLimiter(
+            initial=self.max_concurrent_extractions,
+            minimum=1,
+            maximum=self.max_concurrent_extractions,
+            decrease_factor=0.5,
+        )
+        self.token_bucket = (
+            TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        )
+
+        self.chunks = 0
+        self.groups = 0
+        self.failed_groups = 0
+        self.rate_limited = 0
+        self.skipped_chunks = 0
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    @property
+    def chunks_per_minute(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        elapsed = (self.finished_at or time.monotonic()) - self.started_at
+        return 60 * self.chunks / max(elapsed, 1e-9)
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        return {
+            "chunks": self.chunks,
+            "groups": self.groups,
+            "failed_groups": self.failed_groups,
+            "skipped_chunks": self.skipped_chunks,
+            "rate_limited": self.rate_limited,
+            "chunks_per_minute": self.chunks_per_minute,
+            "concurrency_limit": int(self.limiter.limit),
+        }
+
+    async def run(
+        self,
+        document_ids: list[UUID],
+        generation_config: GenerationConfig,
+        extraction_merge_count: int,
+        max_knowledge_triples: int,
+        entity_types: list[str],
+        relation_types: list[str],
+    ) -> dict[str, Any]:
+        self.started_at = time.monotonic()
+        extraction_kwargs = {
+            "generation_config": generation_config,
+            "max_knowledge_triples": max_knowledge_triples,
+            "entity_types": entity_types,
+            "relation_types": relation_types,
+        }
+        # The prompt around the chunks, counted once against the budget
+        prompt_tokens = estimate_tokens(
+            "".join(
+                message["content"]
+                for message in await self.extraction_pipe.get_extraction_messages(
+                    "",
+                    max_knowledge_triples=max_knowledge_triples,
+                    entity_types=entity_types,
+                    relation_types=relation_types,
+                )
+            )
+        ) + (generation_config.max_tokens_to_sample or 0)
+
+        completed = await self.database_provider.get_completed_extraction_ids(
+            document_ids
+        )
+        queue: asyncio.Queue = asyncio.Queue(
+            maxsize=self.max_concurrent_extractions
+        )
+        describe_queue: asyncio.Queue = asyncio.Queue()
+        remaining: dict[UUID, int] = {}
+        failed: set[UUID] = set()
+
+        async def document_extracted(document_id: UUID) -> None:
+            remaining.pop(document_id)
+            await describe_queue.put(document_id)
+
+        async def produce() -> None:
+            async for document_id, groups in self._interleave(
+                document_ids, completed, extraction_merge_count, remaining
+            ):
+                if groups is None:
+                    await document_extracted(document_id)
+                else:
+                    await queue.put((document_id, groups))
+            for _ in range(self.max_concurrent_extractions):
+                await queue.put(None)
+
+        async def work() -> None:
+            while (item := await queue.get()) is not None:
+                document_id, group = item
+                if not await self._extract_group(
+                    group, prompt_tokens, extraction_kwargs
+                ):
+                    failed.add(document_id)
+                remaining[document_id] -= 1
+                if remaining[document_id] == 0:
+                    await document_extracted(document_id)
+
+        async def describe() -> None:
+            # Entity descriptions run one document at a time, overlapping
+            # with the extraction of the documents still in the queue
+            while (document_id := await describe_queue.get()) is not None:
+                await self._finish_document(
+                    document_id, document_id not in failed
+                )
+
+        describer = asyncio.create_task(describe())
+        tasks = [
+            asyncio.create_task(produce()),
+            *(
+                asyncio.create_task(work())
+                for _ in range(self.max_concurrent_extractions)
+            ),
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await describe_queue.put(None)
+            await describer
+        self.finished_at = time.monotonic()
+
+        logger.info(
+            f"KGExtractionScheduler: extracted {self.chunks} chunks in {self.groups} groups from {len(document_ids)} documents "
+            f"at {self.chunks_per_minute:.1f} chunks/min ({self.failed_groups} groups failed, {self.skipped_chunks} chunks already extracted)"
+        )
+        return self.stats
+
+    async def _interleave(
+        self,
+        document_ids: list[UUID],
+        completed: dict[UUID, set[UUID]],
+        extraction_merge_count: int,
+        remaining: dict[UUID, int],
+    ):
+        """
+        Yields `(document_id, group)` round robin over a window of
+        documents, loading chunks only as documents enter the window. A
+        document with nothing left to extract is yielded once with `None`.
+        """
+        pending = iter(document_ids)
+        window: list[tuple[UUID, list[list[DocumentExtraction]]]] = []
+        while True:
+            while len(window) < self.max_concurrent_extractions:
+                document_id = next(pending, None)
+                if document_id is None:
+                    break
+                groups = await self._load_groups(
+                    document_id,
+                    completed.get(document_id, set()),
+                    extraction_merge_count,
+                )
+                remaining[document_id] = len(groups)
+                if groups:
+                    window.append((document_id, groups[::-1]))
+                else:
+                    yield document_id, None
+            if not window:
+                return
+            next_window = []
+            for document_id, groups in window:
+                yield document_id, groups.pop()
+                if groups:
+                    next_window.append((document_id, groups))
+            window = next_window
+
+    async def _load_groups(
+        self,
+        document_id: UUID,
+        completed: set[UUID],
+        extraction_merge_count: int,
+    ) -> list[list[DocumentExtraction]]:
+        await self.database_provider.set_workflow_status(
+            id=document_id,
+            status_type="kg_extraction_status",
+            status=KGExtractionStatus.PROCESSING,
+        )
+        extractions = await self.extraction_pipe.get_document_extractions(
+            document_id
+        )
+        remaining = [
+            extraction
+            for extraction in extractions
+            if extraction.id not in completed
+        ]
+        self.skipped_chunks += len(extractions) - len(remaining)
+        remaining.sort(
+            key=lambda x: x.metadata.get("chunk_order", float("inf"))
+        )
+        return [
+            remaining[i : i + extraction_merge_count]
+            for i in range(0, len(remaining), extraction_merge_count)
+        ]
+
+    async def _extract_group(
+        self,
+        group: list[DocumentExtraction],
+        prompt_tokens: int,
+        extraction_kwargs: dict[str, Any],
+    ) -> bool:
+        document_id = group[0].document_id
+        tokens = prompt_tokens + sum(
+            estimate_tokens(extraction.data) for extraction in group  # type: ignore
+        )
+        retries = 0
+        backoff = self.initial_backoff
+        while True:
+            await self.limiter.acquire()
+            try:
+                if self.token_bucket:
+                    await self.token_bucket.acquire(tokens)
+                kg_extraction = await self.extraction_pipe.extract_kg(
+                    extractions=group,
+                    raise_on_failure=True,
+                    **extraction_kwargs,
+                )
+            except Exception as e:
+                retries += 1
+                if (
+                    not is_rate_limit_error(e)
+                    or retries > self.max_rate_limit_retries
+                ):
+                    logger.error(
+                        f"KGExtractionScheduler: failed to extract chunks {[str(extraction.id) for extraction in group]} of document {document_id}: {e}"
+                    )
+                    self.failed_groups += 1
+                    return False
+                self.rate_limited += 1
+                self.limiter.decrease()
+                delay = retry_after_seconds(e) or random.uniform(0, backoff)
+            else:
+                self.limiter.increase()
+                break
+            finally:
+                await self.limiter.release()
+
+            await asyncio.sleep(delay)
+            backoff = min(backoff * 2, self.max_backoff)
+
+        try:
+            await self.database_provider.add_kg_extractions([kg_extraction])
+            await self.database_provider.add_extraction_checkpoint(
+                document_id, [extraction.id for extraction in group]  # type: ignore
+            )
+        except Exception as e:
+            logger.error(
+                f"KGExtractionScheduler: failed to store extraction for document {document_id}: {e}"
+            )
+            self.failed_groups += 1
+            return False
+
+        self.groups += 1
+        self.chunks += len(group)
+        if self.groups % self.LOG_EVERY_GROUPS == 0:
+            logger.info(
+                f"KGExtractionScheduler: {self.chunks} chunks extracted, {self.chunks_per_minute:.1f} chunks/min"
+            )
+        return True
+
+    async def _finish_document(
+        self, document_id: UUID, succeeded: bool
+    ) -> None:
+        if succeeded:
+            try:
+                await self.describe_entities(document_id)
+                await self.database_provider.delete_extraction_checkpoints(
+                    document_id
+                )
+                return
+            except Exception as e:
+                logger.error(
+                    f"KGExtractionScheduler: error describing entities of document {document_id}: {e}"
+                )
+        await self.database_provider.set_workflow_status(
+            id=document_id,
+            status_type="kg_extraction_status",
+            status=KGExtractionStatus.FAILED,
+        )
@@ -4,6 +4,7 @@ import logging
 import re
 import time
 from typing import Any, AsyncGenerator, Optional, Union
+from uuid import UUID
 
 from core.base import (
     AsyncState,
@@ -65,6 +66,42 @@ class KGTriplesExtractionPipe(AsyncPipe[dict]):
         self.pipe_run_info = None
         self.graph_rag = graph_rag
 
+    async def get_extraction_messages(
+        self,
+        text: str,
+        max_knowledge_triples: int,
+        entity_types: list[str],
+        relation_types: list[str],
+    ) -> list[dict]:
+        return await self.database_provider.prompt_handler.get_message_payload(
+            task_prompt_name=self.database_provider.config.kg_creation_settings.kg_triples_extraction_prompt,
+            task_inputs={
+                "input": text,
+                "max_knowledge_triples": max_knowledge_triples,
+                "entity_types": "\n".join(entity_types),
+                "relation_types": "\n".join(relation_types),
+            },
+        )
+
+    async def get_document_extractions(
+        self, document_id: UUID
+    ) -> list[DocumentExtraction]:
+        return [
+            DocumentExtraction(
+                id=extraction["extraction_id"],
+                document_id=extraction["document_id"],
+                user_id=extraction["user_id"],
+                collection_ids=extraction["collection_ids"],
+                data=extraction["text"],
+                metadata=extraction["metadata"],
+            )
+            for extraction in (
+                await self.database_provider.get_document_chunks(
+                    document_id=document_id
+                )
+            )["results"]
+        ]
+
     async def extract_kg(
         self,
         extractions: list[DocumentExtraction],
@@ -76,22 +113,23 @@ class KGTriplesExtractionPipe(AsyncPipe[dict]):
         delay: int = 2,
         task_id: Optional[int] = None,
         total_tasks: Optional[int] = None,
+        raise_on_failure: bool = False,
     ) -> KGExtraction:
         """
         Extracts NER triples from a extraction with retries.
+
+        Once retries are exhausted an empty extraction is returned, or the
+        last error is raised when `raise_on_failure` is set.
         """
 
         # combine all extractions into a single string
         combined_extraction: str = " ".join([extraction.data for extraction in extractions])  # type: ignore
 
-        messages = await self.database_provider.prompt_handler.get_message_payload(
-            task_prompt_name=self.database_provider.config.kg_creation_settings.kg_triples_extraction_prompt,
-            task_inputs={
-                "input": combined_extraction,
-                "max_knowledge_triples": max_knowledge_triples,
-                "entity_types": "\n".join(entity_types),
-                "relation_types": "\n".join(relation_types),
-            },
+        messages = await self.get_extraction_messages(
+            combined_extraction,
+            max_knowledge_triples=max_knowledge_triples,
+            entity_types=entity_types,
+            relation_types=relation_types,
         )
 
         for attempt in range(retries):
@@ -198,7 +236,8 @@ class KGTriplesExtractionPipe(AsyncPipe[dict]):
                     logger.error(
                         f"Failed after retries with for extraction {extractions[0].id} of document {extractions[0].document_id}: {e}"
                     )
-                    # raise e # you should raise an error.
+                    if raise_on_failure:
+                        raise
         # add metadata to entities and triples
 
         logger.info(
@@ -233,6 +272,9 @@ class KGTriplesExtractionPipe(AsyncPipe[dict]):
         filter_out_existing_chunks = input.message.get(
             "filter_out_existing_chunks", True
         )
+        max_concurrent_extractions = input.message.get(
+            "max_concurrent_extractions"
+        )
 
         logger = input.message.get("logger", logging.getLogger())
 
@@ -240,27 +282,7 @@ class KGTriplesExtractionPipe(AsyncPipe[dict]):
             f"KGTriplesExtractionPipe: Processing document {document_id} for KG extraction",
         )
 
-        # First get the chunks response
-        chunks_response = await self.database_provider.get_document_chunks(
-            document_id=document_id
-        )
-
-        # Then create the extractions from the results
-        extractions = [
-            DocumentExtraction(
-                id=extraction["extraction_id"],
-                document_id=extraction["document_id"],
-                user_id=extraction["user_id"],
-                collection_ids=extraction["collection_ids"],
-                data=extraction["text"],
-                metadata=extraction["metadata"],
-            )
-            for extraction in (
-                await self.database_provider.get_document_chunks(
-                    document_id=document_id
-                )
-            )["results"]
-        ]
+        extractions = await self.get_document_extractions(document_id)
 
         logger.info(
             f"Found {len(extractions)} extractions for document {document_id}"
@@ -303,9 +325,15 @@ class KGTriplesExtractionPipe(AsyncPipe[dict]):
             f"KGTriplesExtractionPipe: Extracting KG Triples for document and created {len(extractions_groups)} tasks, time from start: {time.time() - start_time:.2f} seconds",
         )
 
-        tasks = [
-            asyncio.create_task(
-                self.extract_kg(
+        semaphore = asyncio.Semaphore(
+            max_concurrent_extractions or len(extractions_groups)
+        )
+
+        async def bounded_extract_kg(
+            extractions_group: list[DocumentExtraction], task_id: int
+        ) -> KGExtraction:
+            async with semaphore:
+                return await self.extract_kg(
                     extractions=extractions_group,
                     generation_config=generation_config,
                     max_knowledge_triples=max_knowledge_triples,
@@ -314,7 +342,9 @@ class KGTriplesExtractionPipe(AsyncPipe[dict]):
                     task_id=task_id,
                     total_tasks=len(extractions_groups),
                 )
-            )
+
+        tasks = [
+            asyncio.create_task(bounded_extract_kg(extractions_group, task_id))
             for task_id, extractions_group in enumerate(extractions_groups)
         ]
 
@@ -1,3 +1,6 @@
+import asyncio
+import heapq
+import itertools
 import json
 import logging
 from typing import Any, AsyncGenerator, Optional
@@ -5,18 +8,22 @@ from uuid import UUID
 
 from core.base import (
     AsyncState,
+    CommunityReport,
     CompletionProvider,
     DatabaseProvider,
     EmbeddingProvider,
 )
 from core.base.abstractions import (
+    EmbeddingPurpose,
     KGCommunityResult,
     KGEntityResult,
+    KGGlobalResult,
     KGSearchMethod,
     KGSearchResult,
     KGSearchResultType,
     KGSearchSettings,
 )
+from core.base.providers.embedding import estimate_tokens
 from core.providers.logger.r2r_logger import SqlitePersistentLoggingProvider
 
 from ..abstractions.generator_pipe import GeneratorPipe
@@ -55,29 +62,37 @@ class KGSearchSearchPipe(GeneratorPipe):
         self.embedding_provider = embedding_provider
         self.pipe_run_info = None
 
+    @staticmethod
+    def parse_points(response: str) -> list[dict]:
+        """The points of a map response that have a positive score."""
+        response = response.strip()
+        if response.startswith("```"):
+            response = response.strip("`").removeprefix("json").strip()
+        points = []
+        try:
+            parsed_response = json.loads(response)
+            for item in parsed_response["points"]:
+                try:
+                    if item["score"] > 0:
+                        points.append(item)
+                except KeyError:
+                    # Skip this item if it doesn't have a 'score' key
+                    logger.warning(f"Item in response missing 'score' key")
+                    continue
+        except json.JSONDecodeError:
+            logger.warning(f"Response is not valid JSON: {response[:100]}...")
+        except (KeyError, TypeError):
+            logger.warning(
+                f"Response is missing 'points' key: {response[:100]}..."
+            )
+        return points
+
     def filter_responses(self, map_responses):
-        filtered_responses = []
-        for response in map_responses:
-            try:
-                parsed_response = json.loads(response)
-                for item in parsed_response["points"]:
-                    try:
-                        if item["score"] > 0:
-                            filtered_responses.append(item)
-                    except KeyError:
-                        # Skip this item if it doesn't have a 'score' key
-                        logger.warning(f"Item in response missing 'score' key")
-                        continue
-            except json.JSONDecodeError:
-                logger.warning(
-                    f"Response is not valid JSON: {response[:100]}..."
-                )
-                continue
-            except KeyError:
-                logger.warning(
-                    f"Response is missing 'points' key: {response[:100]}..."
-                )
-                continue
+        filtered_responses = [
+            point
+            for response in map_responses
+            for point in self.parse_points(response)
+        ]
 
         filtered_responses = sorted(
             filtered_responses, key=lambda x: x["score"], reverse=True
@@ -104,8 +119,12 @@ class KGSearchSearchPipe(GeneratorPipe):
         # do 3 searches. One over entities, one over relationships, one over communities
 
         async for message in input.message:
+            # Same purpose as the vector leg so both share one cached
+            # embedding of the query
             query_embedding = (
-                await self.embedding_provider.async_get_embedding(message)
+                await self.embedding_provider.async_get_embedding(
+                    message, purpose=EmbeddingPurpose.QUERY
+                )
             )
 
             # entity search
@@ -124,6 +143,8 @@ class KGSearchSearchPipe(GeneratorPipe):
                 ],
                 filters=kg_search_settings.filters,
                 entities_level=kg_search_settings.entities_level,
+                ef_search=kg_search_settings.ef_search,
+                probes=kg_search_settings.probes,
             ):
                 yield KGSearchResult(
                     content=KGEntityResult(
@@ -184,6 +205,8 @@ class KGSearchSearchPipe(GeneratorPipe):
                     "summary",
                 ],
                 filters=kg_search_settings.filters,
+                ef_search=kg_search_settings.ef_search,
+                probes=kg_search_settings.probes,
             ):
                 yield KGSearchResult(
                     content=KGCommunityResult(
@@ -200,6 +223,230 @@ class KGSearchSearchPipe(GeneratorPipe):
                     },
                 )
 
+    @staticmethod
+    def _format_report(report: CommunityReport) -> str:
+        findings = "; ".join(report.findings)
+        return f"{report.community_number}|{report.name}|{report.summary}|{findings}|{report.rating}"
+
+    async def _report_batches(
+        self, kg_search_settings: KGSearchSettings
+    ) -> AsyncGenerator[tuple[int, str], None]:
+        """
+        Community reports as map contexts of at most
+        `max_community_description_length` characters each, highest rated
+        reports first, with the number of reports in each.
+        """
+        max_length = kg_search_settings.max_community_description_length
+        collection_ids = (
+            kg_search_settings.filters.get("collection_ids", {}).get(
+                "$overlap"
+            )
+            or kg_search_settings.selected_collection_ids
+            or None
+        )
+        level = (
+            int(kg_search_settings.kg_search_level)
+            if kg_search_settings.kg_search_level is not None
+            else None
+        )
+        header = "id|title|summary|findings|rating"
+        lines: list[str] = []
+        length = len(header)
+        async for report in await self.database_provider.stream_community_reports(  # type: ignore
+            collection_ids=collection_ids, level=level
+        ):
+            line = self._format_report(report)[: max_length - len(header) - 1]
+            if lines and length + len(line) + 1 > max_length:
+                yield len(lines), "\n".join([header, *lines])
+                lines, length = [], len(header)
+            lines.append(line)
+            length += len(line) + 1
+        if lines:
+            yield len(lines), "\n".join([header, *lines])
+
+    async def global_search(
+        self,
+        input: GeneratorPipe.Input,
+        state: AsyncState,
+        run_id: UUID,
+        kg_search_settings: KGSearchSettings,
+        *args: Any,
+        **kwargs: Any,
+    ) -> AsyncGenerator[KGSearchResult, None]:
+        """
+        Answers questions about the whole graph by map-reduce over the
+        community reports.
+
+        Batches of reports are mapped to scored points with up to
+        `max_concurrent_llm_queries_for_global_search` LLM calls in flight.
+        Points are kept only while they rank among the best that fit in
+        `max_community_description_length` characters, which is the
+        context of the reduce call, streamed into the final answer. No
+        more map calls are started once `max_llm_queries_for_global_search`
+        is reached or the estimated tokens of the query would exceed
+        `max_tokens_for_global_search`; the highest rated reports are
+        mapped first so those are the ones that get answered.
+        """
+        generation_config = kg_search_settings.generation_config
+        max_completion_tokens = generation_config.max_tokens_to_sample
+        max_context_length = (
+            kg_search_settings.max_community_description_length
+        )
+        concurrency = max(
+            1, kg_search_settings.max_concurrent_llm_queries_for_global_search
+        )
+        map_config = generation_config.model_copy(update={"stream": False})
+
+        async for message in input.message:
+            # the reduce call needs room for its context and the answer
+            map_budget = kg_search_settings.max_tokens_for_global_search - (
+                max_context_length // 4 + max_completion_tokens
+            )
+            spent_tokens = 0
+            map_queries = 0
+            num_reports = 0
+            # min-heap of (score, order, description), trimmed to the
+            # reduce context as points arrive
+            points: list[tuple[float, int, str]] = []
+            points_length = 0
+            order = itertools.count()
+            # the completion of a call is reserved at its maximum length
+            # until the call returns
+            reserved: dict[asyncio.Task, int] = {}
+
+            async def map_reports(context_data: str) -> tuple[int, list]:
+                messages = await self.database_provider.prompt_handler.get_message_payload(
+                    task_prompt_name=kg_search_settings.graphrag_map_system,
+                    task_inputs={
+                        "context_data": context_data,
+                        "input": message,
+                    },
+                )
+                response = await self.llm_provider.aget_completion(
+                    messages=messages, generation_config=map_config
+                )
+                content = response.choices[0].message.content or ""
+                used_tokens = estimate_tokens(content) + sum(
+                    estimate_tokens(str(m["content"])) for m in messages
+                )
+                return used_tokens, self.parse_points(content)
+
+            def collect(done: set[asyncio.Task]) -> None:
+                nonlocal spent_tokens, points_length
+                for task in done:
+                    spent_tokens -= reserved.pop(task)
+                    try:
+                        used_tokens, new_points = task.result()
+                    except Exception as e:
+                        logger.warning(
+                            f"KG global search map call failed: {e}"
+                        )
+                        continue
+                    spent_tokens += used_tokens
+                    for point in new_points:
+                        description = str(point.get("description", ""))
+                        heapq.heappush(
+                            points, (point["score"], next(order), description)
+                        )
+                        points_length += len(description) + 1
+                        while points_length > max_context_length:
+                            points_length -= len(heapq.heappop(points)[2]) + 1
+
+            async for batch_size, context_data in self._report_batches(
+                kg_search_settings
+            ):
+                if (
+                    map_queries
+                    >= kg_search_settings.max_llm_queries_for_global_search
+                ):
+                    logger.info(
+                        f"KG global search reached {map_queries} map queries, skipping the remaining reports"
+                    )
+                    break
+                reserved_tokens = (
+                    estimate_tokens(context_data)
+                    + estimate_tokens(message)
+                    + max_completion_tokens
+                )
+                if spent_tokens + reserved_tokens > map_budget:
+                    logger.info(
+                        f"KG global search reached its token budget after {map_queries} map queries, skipping the remaining reports"
+                    )
+                    break
+                spent_tokens += reserved_tokens
+                map_queries += 1
+                num_reports += batch_size
+                reserved[asyncio.create_task(map_reports(context_data))] = (
+                    reserved_tokens
+                )
+                if len(reserved) >= concurrency:
+                    done, _ = await asyncio.wait(
+                        reserved, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    collect(done)
+            if reserved:
+                done, _ = await asyncio.wait(reserved)
+                collect(done)
+
+            if not points:
+                logger.info(
+                    f"KG global search found no relevant points in {num_reports} community reports"
+                )
+                continue
+
+            report_data = "\n".join(
+                description
+                for _, _, description in sorted(points, reverse=True)
+            )
+            messages = await self.database_provider.prompt_handler.get_message_payload(
+                task_prompt_name=kg_search_settings.graphrag_reduce_system,
+                task_inputs={
+                    "response_type": "multiple paragraphs",
+                    "report_data": report_data,
+                    "input": message,
+                },
+            )
+            spent_tokens += sum(
+                estimate_tokens(str(m["content"])) for m in messages
+            )
+            remaining_tokens = min(
+                max_completion_tokens,
+                kg_search_settings.max_tokens_for_global_search - spent_tokens,
+            )
+            answer: list[str] = []
+            answer_length = 0
+            stream = self.llm_provider.aget_completion_stream(
+                messages=messages,
+                generation_config=generation_config.model_copy(),
+            )
+            try:
+                async for chunk in stream:
+                    delta = chunk.choices[0].delta.content or ""
+                    answer.append(delta)
+                    answer_length += len(delta)
+                    if answer_length // 4 >= remaining_tokens:
+                        logger.info(
+                            "KG global search answer reached the token budget, truncating it"
+                        )
+                        break
+            finally:
+                await stream.aclose()
+            spent_tokens += answer_length // 4 + 1
+
+            yield KGSearchResult(
+                content=KGGlobalResult(
+                    name="Global Result", description="".join(answer)
+                ),
+                method=KGSearchMethod.GLOBAL,
+                metadata={
+                    "associated_query": message,
+                    "community_reports": num_reports,
+                    "map_queries": map_queries,
+                    "points": len(points),
+                    "estimated_tokens": spent_tokens,
+                },
+            )
+
     async def _run_logic(  # type: ignore
         self,
         input: GeneratorPipe.Input,
@@ -217,5 +464,11 @@ class KGSearchSearchPipe(GeneratorPipe):
                 input, state, run_id, kg_search_settings
             ):
                 yield result
+        elif kg_search_type == "global":
+            logger.info("Performing KG global search")
+            async for result in self.global_search(
+                input, state, run_id, kg_search_settings
+            ):
+                yield result
         else:
             raise ValueError(f"Unsupported KG search type: {kg_search_type}")
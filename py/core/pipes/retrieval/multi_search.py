@@ -1,8 +1,11 @@
+import asyncio
+import json
 from copy import copy, deepcopy
 from typing import Any, AsyncGenerator, Dict, List, Optional
 from uuid import UUID
 
 from core.base.abstractions import (
+    EmbeddingPurpose,
     GenerationConfig,
     SearchSettings,
     VectorSearchResult,
@@ -72,73 +75,147 @@ class MultiSearchPipe(AsyncPipe):
             **kwargs,
         )
 
+        queries = [query async for query in query_generator]
+
         if self.config.use_rrf:
             vector_search_settings.search_limit = (
                 self.config.expansion_factor
                 * vector_search_settings.search_limit
             )
-            results = []
-            async for search_result in await self.vector_search_pipe.run(
-                self.vector_search_pipe.Input(message=query_generator),
-                state,
-                vector_search_settings=vector_search_settings,
-                *args,
-                **kwargs,
-            ):
-                results.append(search_result)
-
-            # Collection results by their associated queries
-            grouped_results: dict[str, list[VectorSearchResult]] = {}
-            for result in results:
-                query = result.metadata["associated_query"]
-                if query not in grouped_results:
-                    grouped_results[query] = []
-                grouped_results[query].append(result)
-
-            fused_results = self.reciprocal_rank_fusion(grouped_results)
-            for result in fused_results[: vector_search_settings.search_limit]:
+
+        # Fusion is a per-document sum over queries, so each query's results
+        # are folded in as soon as that query completes.
+        fusion = _RRFAccumulator(self.config.rrf_k)
+        async for query, results in self._search_concurrently(
+            queries, vector_search_settings, run_id, *args, **kwargs
+        ):
+            if self.config.use_rrf:
+                fusion.add(query, results, queries.index(query))
+            else:
+                for result in results:
+                    yield result
+
+        if self.config.use_rrf:
+            for result in fusion.results()[
+                : vector_search_settings.search_limit
+            ]:
                 yield result
-        else:
-            async for search_result in await self.vector_search_pipe.run(
-                self.vector_search_pipe.Input(message=query_generator),
-                state,
-                vector_search_settings=vector_search_settings,
-                *args,
-                **kwargs,
-            ):
-                yield search_result
+
+    async def _search_concurrently(
+        self,
+        queries: list[str],
+        search_settings: SearchSettings,
+        run_id: UUID,
+        *args: Any,
+        **kwargs: Any,
+    ) -> AsyncGenerator[tuple[str, list[VectorSearchResult]], None]:
+        """
+        Runs every transformed query at once and yields each query's results
+        as soon as it finishes. Query embeddings are computed in a single
+        batched call when the inner pipe exposes its embedding provider.
+        """
+        if not queries:
+            return
+
+        query_vectors: list[Optional[list[float]]] = [None] * len(queries)
+        embedding_provider = getattr(
+            self.vector_search_pipe, "embedding_provider", None
+        )
+        if embedding_provider is not None:
+            query_vectors = await embedding_provider.async_get_embeddings(
+                queries, purpose=EmbeddingPurpose.QUERY
+            )
+
+        async def run_query(
+            query: str, query_vector: Optional[list[float]]
+        ) -> tuple[str, list[VectorSearchResult]]:
+            await self.enqueue_log(
+                run_id=run_id, key="search_query", value=query
+            )
+            results = [
+                result
+                async for result in self.vector_search_pipe.search(
+                    query,
+                    copy(search_settings),
+                    *args,
+                    query_vector=query_vector,
+                    **kwargs,
+                )
+            ]
+            await self.enqueue_log(
+                run_id=run_id,
+                key="search_results",
+                value=json.dumps([result.json() for result in results]),
+            )
+            return query, results
+
+        tasks = [
+            asyncio.create_task(run_query(query, query_vector))
+            for query, query_vector in zip(queries, query_vectors)
+        ]
+        try:
+            for next_completed in asyncio.as_completed(tasks):
+                yield await next_completed
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
     def reciprocal_rank_fusion(
         self, all_results: Dict[str, List[VectorSearchResult]]
     ) -> List[VectorSearchResult]:
-        document_scores: dict[UUID, float] = {}
-        document_results: dict[UUID, VectorSearchResult] = {}
-        document_queries: dict[UUID, set[str]] = {}
-        for query, results in all_results.items():
-            for rank, result in enumerate(results, 1):
-                doc_id = result.extraction_id
-                if doc_id not in document_scores:
-                    document_scores[doc_id] = 0
-                    document_results[doc_id] = result
-                    set_: set[str] = set()
-                    document_queries[doc_id] = set_
-                document_scores[doc_id] += 1 / (rank + self.config.rrf_k)
-                document_queries[doc_id].add(query)  # type: ignore
+        fusion = _RRFAccumulator(self.config.rrf_k)
+        for order, (query, results) in enumerate(all_results.items()):
+            fusion.add(query, results, order)
+        return fusion.results()
+
+
+class _RRFAccumulator:
+    """
+    Reciprocal rank fusion state that accepts one query's results at a time.
+    Ties are broken by (query order, rank) of a document's first appearance,
+    so the outcome does not depend on the order queries complete in.
+    """
+
+    def __init__(self, rrf_k: int):
+        self.rrf_k = rrf_k
+        self.document_scores: dict[UUID, float] = {}
+        self.document_results: dict[UUID, VectorSearchResult] = {}
+        self.document_queries: dict[UUID, set[str]] = {}
+        self.document_first_seen: dict[UUID, tuple[int, int]] = {}
+
+    def add(
+        self, query: str, results: List[VectorSearchResult], order: int
+    ) -> None:
+        for rank, result in enumerate(results, 1):
+            doc_id = result.extraction_id
+            if doc_id not in self.document_scores:
+                self.document_scores[doc_id] = 0
+                self.document_queries[doc_id] = set()
+            if (order, rank) < self.document_first_seen.get(
+                doc_id, (order + 1, 0)
+            ):
+                self.document_first_seen[doc_id] = (order, rank)
+                self.document_results[doc_id] = result
+            self.document_scores[doc_id] += 1 / (rank + self.rrf_k)
+            self.document_queries[doc_id].add(query)
 
+    def results(self) -> List[VectorSearchResult]:
         # Sort documents by their RRF score
         sorted_docs = sorted(
-            document_scores.items(), key=lambda x: x[1], reverse=True
+            self.document_scores.items(),
+            key=lambda x: (-x[1], self.document_first_seen[x[0]]),
         )
 
         # Reconstruct VectorSearchResults with new ranking, RRF score, and associated queries
         fused_results = []
         for doc_id, rrf_score in sorted_docs:
-            result = deepcopy(document_results[doc_id])
+            result = deepcopy(self.document_results[doc_id])
             result.score = (
                 rrf_score  # Replace the original score with the RRF score
             )
             result.metadata["associated_queries"] = list(
-                document_queries[doc_id]  # type: ignore
+                self.document_queries[doc_id]
             )  # Add list of associated queries
             result.metadata["is_rrf_score"] = True
             if "associated_query" in result.metadata:
@@ -71,13 +71,10 @@ class StreamingSearchRAGPipe(GeneratorPipe):
             )
         )
         yield f"<{self.COMPLETION_STREAM_MARKER}>"
-        response = ""
-        for chunk in self.llm_provider.get_completion_stream(
+        async for chunk in self.llm_provider.aget_completion_stream(
             messages=messages, generation_config=rag_generation_config
         ):
-            chunk_txt = StreamingSearchRAGPipe._process_chunk(chunk)
-            response += chunk_txt
-            yield chunk_txt
+            yield StreamingSearchRAGPipe._process_chunk(chunk)
 
         yield f"</{self.COMPLETION_STREAM_MARKER}>"
 
@@ -1,6 +1,6 @@
 import json
 import logging
-from typing import Any, AsyncGenerator
+from typing import Any, AsyncGenerator, Optional
 from uuid import UUID
 
 from core.base import (
@@ -46,6 +46,7 @@ class VectorSearchPipe(SearchPipe):
         message: str,
         search_settings: SearchSettings,
         *args: Any,
+        query_vector: Optional[list[float]] = None,
         **kwargs: Any,
     ) -> AsyncGenerator[VectorSearchResult, None]:
         search_settings.filters = (
@@ -55,10 +56,11 @@ class VectorSearchPipe(SearchPipe):
             search_settings.search_limit or self.config.search_limit
         )
         results = []
-        query_vector = await self.embedding_provider.async_get_embedding(
-            message,
-            purpose=EmbeddingPurpose.QUERY,
-        )
+        if query_vector is None:
+            query_vector = await self.embedding_provider.async_get_embedding(
+                message,
+                purpose=EmbeddingPurpose.QUERY,
+            )
 
         search_results = await (
             self.database_provider.hybrid_search(
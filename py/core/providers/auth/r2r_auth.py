@@ -83,13 +83,24 @@ class R2RAuthProvider(AuthProvider):
         to_encode |= {"exp": expire, "token_type": "refresh"}
         return jwt.encode(to_encode, self.secret_key, algorithm="HS256")
 
+    async def _is_token_blacklisted(self, token: str) -> bool:
+        if self.cache:
+            blacklisted = await self.cache.is_blacklisted(
+                token, self.database_provider.get_blacklisted_tokens
+            )
+            if blacklisted is not None:
+                return blacklisted
+        return await self.database_provider.is_token_blacklisted(token)
+
     async def decode_token(self, token: str) -> TokenData:
         try:
             # First, check if the token is blacklisted
-            if await self.database_provider.is_token_blacklisted(token):
+            if await self._is_token_blacklisted(token):
                 raise R2RException(
                     status_code=401, message="Token has been invalidated"
                 )
+            if self.cache and (token_data := self.cache.get_token(token)):
+                return token_data
 
             payload = jwt.decode(token, self.secret_key, algorithms=["HS256"])
             email: str = payload.get("sub")
@@ -103,9 +114,12 @@ class R2RAuthProvider(AuthProvider):
                 or exp_datetime < datetime.now(timezone.utc)
             ):
                 raise R2RException(status_code=401, message="Invalid token")
-            return TokenData(
+            token_data = TokenData(
                 email=email, token_type=token_type, exp=exp_datetime
             )
+            if self.cache:
+                self.cache.put_token(token, token_data)
+            return token_data
         except jwt.ExpiredSignatureError as e:
             raise R2RException(
                 status_code=401, message="Token has expired"
@@ -119,11 +133,15 @@ class R2RAuthProvider(AuthProvider):
             raise R2RException(
                 status_code=401, message="Could not validate credentials"
             )
+        if self.cache and (user := self.cache.get_user(token_data.email)):
+            return user
         user = await self.database_provider.get_user_by_email(token_data.email)
         if user is None:
             raise R2RException(
                 status_code=401, message="Invalid authentication credentials"
             )
+        if self.cache:
+            self.cache.put_user(user)
         return user
 
     def get_current_active_user(
@@ -187,6 +205,7 @@ class R2RAuthProvider(AuthProvider):
                 status_code=400, message="Invalid or expired verification code"
             )
         await self.database_provider.mark_user_as_verified(user_id)
+        self.invalidate_user(user_id=user_id)
         await self.database_provider.remove_verification_code(
             verification_code
         )
@@ -215,9 +234,11 @@ class R2RAuthProvider(AuthProvider):
             )
 
         try:
-            password_verified = self.crypto_provider.verify_password(
+            password_verified = await self.crypto_provider.async_verify_password(
                 password, user.hashed_password
             )
+        except R2RException:
+            raise
         except Exception as e:
             logger.error(f"Error during password verification: {str(e)}")
             raise HTTPException(
@@ -253,6 +274,8 @@ class R2RAuthProvider(AuthProvider):
 
         # Invalidate the old refresh token and create a new one
         await self.database_provider.blacklist_token(refresh_token)
+        if self.cache:
+            self.cache.blacklist(refresh_token)
 
         new_access_token = self.create_access_token(
             data={"sub": token_data.email}
@@ -279,19 +302,20 @@ class R2RAuthProvider(AuthProvider):
                 detail="Invalid password hash in database",
             )
 
-        if not self.crypto_provider.verify_password(
+        if not await self.crypto_provider.async_verify_password(
             current_password, user.hashed_password
         ):
             raise R2RException(
                 status_code=400, message="Incorrect current password"
             )
 
-        hashed_new_password = self.crypto_provider.get_password_hash(
-            new_password
+        hashed_new_password = (
+            await self.crypto_provider.async_get_password_hash(new_password)
         )
         await self.database_provider.update_user_password(
             user.id, hashed_new_password
         )
+        self.invalidate_user(user_id=user.id, email=user.email)
         return {"message": "Password changed successfully"}
 
     async def request_password_reset(self, email: str) -> dict[str, str]:
@@ -325,22 +349,27 @@ class R2RAuthProvider(AuthProvider):
                 status_code=400, message="Invalid or expired reset token"
             )
 
-        hashed_new_password = self.crypto_provider.get_password_hash(
-            new_password
+        hashed_new_password = (
+            await self.crypto_provider.async_get_password_hash(new_password)
         )
         await self.database_provider.update_user_password(
             user_id, hashed_new_password
         )
         await self.database_provider.remove_reset_token(user_id)
+        self.invalidate_user(user_id=user_id)
         return {"message": "Password reset successfully"}
 
     async def logout(self, token: str) -> dict[str, str]:
         # Add the token to a blacklist
         await self.database_provider.blacklist_token(token)
+        if self.cache:
+            self.cache.blacklist(token)
         return {"message": "Logged out successfully"}
 
     async def clean_expired_blacklisted_tokens(self):
         await self.database_provider.clean_expired_blacklisted_tokens()
+        if self.cache:
+            self.cache.reset_blacklist()
 
     async def send_reset_email(self, email: str) -> dict:
         user = await self.database_provider.get_user_by_email(email)
@@ -7,6 +7,8 @@ import asyncpg
 
 from core.base import DatabaseConnectionManager
 
+from .codecs import register_vector_codecs
+
 logger = logging.getLogger()
 
 
@@ -25,9 +27,18 @@ class SemaphoreConnectionPool:
                 int(self.postgres_configuration_settings.max_connections * 0.9)
             )
 
+            # The vector types must exist before the pool's connections
+            # register their binary codecs.
+            conn = await asyncpg.connect(self.connection_string)
+            try:
+                await conn.execute("CREATE EXTENSION IF NOT EXISTS vector;")
+            finally:
+                await conn.close()
+
             self.pool = await asyncpg.create_pool(
                 self.connection_string,
                 max_size=self.postgres_configuration_settings.max_connections,
+                init=register_vector_codecs,
             )
 
             logger.info(
@@ -0,0 +1,113 @@
+"""
+Binary codecs for the pgvector types.
+
+asyncpg falls back to the text protocol for types it does not know, which for
+`vector` means formatting and re-parsing every float as decimal text. The
+codecs below speak the binary wire format instead and map to NumPy arrays:
+
+- `vector`:  int16 dim, int16 unused, dim x float4 (big endian)
+- `halfvec`: int16 dim, int16 unused, dim x float2 (big endian)
+- `bit`:     int32 length in bits, ceil(length / 8) bytes, MSB first
+"""
+
+import logging
+import struct
+from typing import Any, Union
+
+import asyncpg
+import numpy as np
+
+logger = logging.getLogger()
+
+VectorLike = Union[np.ndarray, list, tuple, str]
+
+_HEADER = struct.Struct("!hh")
+_BIT_HEADER = struct.Struct("!i")
+
+
+def _to_float_array(value: VectorLike, dtype: str) -> np.ndarray:
+    if isinstance(value, str):
+        # Text literals such as "[0.1,0.2]" are still accepted from callers
+        # that have not been migrated off `str(list)`.
+        value = value.strip()[1:-1]
+        return np.array(value.split(",") if value else [], dtype=dtype)
+    return np.asarray(value, dtype=dtype)
+
+
+def encode_vector(value: VectorLike) -> bytes:
+    array = _to_float_array(value, ">f4")
+    if array.ndim != 1:
+        raise ValueError("expected ndim to be 1")
+    return _HEADER.pack(array.shape[0], 0) + array.tobytes()
+
+
+def decode_vector(data: bytes) -> np.ndarray:
+    dim, _ = _HEADER.unpack_from(data)
+    return np.frombuffer(
+        data, dtype=">f4", count=dim, offset=_HEADER.size
+    ).astype(np.float32)
+
+
+def encode_halfvec(value: VectorLike) -> bytes:
+    array = _to_float_array(value, ">f2")
+    if array.ndim != 1:
+        raise ValueError("expected ndim to be 1")
+    return _HEADER.pack(array.shape[0], 0) + array.tobytes()
+
+
+def decode_halfvec(data: bytes) -> np.ndarray:
+    dim, _ = _HEADER.unpack_from(data)
+    return np.frombuffer(
+        data, dtype=">f2", count=dim, offset=_HEADER.size
+    ).astype(np.float32)
+
+
+def encode_bit(value: Union[np.ndarray, list, tuple, str, bytes]) -> bytes:
+    if isinstance(value, (str, bytes)):
+        # A string of "0" / "1" characters, as produced by the text format
+        raw = value.encode("ascii") if isinstance(value, str) else value
+        bits = np.frombuffer(raw, dtype=np.uint8) == ord("1")
+    else:
+        bits = np.asarray(value, dtype=bool)
+    if bits.ndim != 1:
+        raise ValueError("expected ndim to be 1")
+    return _BIT_HEADER.pack(bits.shape[0]) + np.packbits(bits).tobytes()
+
+
+def decode_bit(data: bytes) -> np.ndarray:
+    (length,) = _BIT_HEADER.unpack_from(data)
+    packed = np.frombuffer(data, dtype=np.uint8, offset=_BIT_HEADER.size)
+    return np.unpackbits(packed, count=length).astype(bool)
+
+
+_CODECS: dict[str, tuple[Any, Any]] = {
+    "vector": (encode_vector, decode_vector),
+    "halfvec": (encode_halfvec, decode_halfvec),
+    "bit": (encode_bit, decode_bit),
+}
+
+
+async def register_vector_codecs(conn: asyncpg.Connection) -> None:
+    """
+    Registers the binary pgvector codecs on a connection. Types that are not
+    installed (e.g. `halfvec` on pgvector < 0.7) are skipped.
+    """
+    rows = await conn.fetch(
+        """
+        SELECT t.typname, n.nspname
+        FROM pg_type t
+        JOIN pg_namespace n ON n.oid = t.typnamespace
+        WHERE t.typname = ANY($1::text[])
+        AND (t.typname = 'bit' OR n.nspname <> 'pg_catalog')
+        """,
+        list(_CODECS.keys()),
+    )
+    for row in rows:
+        encoder, decoder = _CODECS[row["typname"]]
+        await conn.set_type_codec(
+            row["typname"],
+            schema=row["nspname"],
+            encoder=encoder,
+            decoder=decoder,
+            format="binary",
+        )
@@ -220,6 +220,55 @@ class PostgresDocumentHandler(DocumentHandler):
 
         await self.connection_manager.execute_query(query, params)
 
+    async def get_document_ids(
+        self,
+        filter_user_ids: Optional[list[UUID]] = None,
+        filter_document_ids: Optional[list[UUID]] = None,
+        filter_collection_ids: Optional[list[UUID]] = None,
+    ) -> list[UUID]:
+        """
+        Returns the ids of the documents matching every given filter, as
+        `get_documents_overview` selects them. Without filters, returns none.
+        """
+        conditions = []
+        params: list[Any] = []
+
+        if filter_document_ids:
+            params.append(filter_document_ids)
+            conditions.append(f"document_id = ANY(${len(params)})")
+        if filter_user_ids:
+            params.append(filter_user_ids)
+            conditions.append(f"user_id = ANY(${len(params)})")
+        if filter_collection_ids:
+            params.append(filter_collection_ids)
+            conditions.append(f"collection_ids && ${len(params)}")
+
+        if not conditions:
+            return []
+
+        query = f"""
+        SELECT document_id
+        FROM {self._get_table_name(PostgresDocumentHandler.TABLE_NAME)}
+        WHERE {" AND ".join(conditions)}
+        """
+        results = await self.connection_manager.fetch_query(query, params)
+        return [result["document_id"] for result in results]
+
+    async def delete_documents(self, document_ids: list[UUID]) -> int:
+        """Deletes many documents from the overview, returning how many."""
+        query = f"""
+        WITH deleted AS (
+            DELETE FROM {self._get_table_name(PostgresDocumentHandler.TABLE_NAME)}
+            WHERE document_id = ANY($1::uuid[])
+            RETURNING 1
+        )
+        SELECT COUNT(*) FROM deleted
+        """
+        result = await self.connection_manager.fetchrow_query(
+            query, [document_ids]
+        )
+        return result["count"]
+
     async def _get_status_from_table(
         self,
         ids: list[UUID],
@@ -494,16 +543,8 @@ class PostgresDocumentHandler(DocumentHandler):
                     and row["summary_embedding"] is not None
                 ):
                     try:
-                        # Parse the vector string returned by Postgres
-                        embedding_str = row["summary_embedding"]
-                        if embedding_str.startswith(
-                            "["
-                        ) and embedding_str.endswith("]"):
-                            embedding = [
-                                float(x)
-                                for x in embedding_str[1:-1].split(",")
-                                if x
-                            ]
+                        # Decoded to a float32 array by the binary codec
+                        embedding = row["summary_embedding"].tolist()
                     except Exception as e:
                         logger.warning(
                             f"Failed to parse embedding for document {row['document_id']}: {e}"
@@ -545,7 +586,7 @@ class PostgresDocumentHandler(DocumentHandler):
         """Search documents using semantic similarity with their summary embeddings."""
 
         where_clauses = ["summary_embedding IS NOT NULL"]
-        params: list[str | int | bytes] = [str(query_embedding)]
+        params: list[Any] = [query_embedding]
 
         # Handle filters
         if search_settings.search_filters:
@@ -621,11 +662,7 @@ class PostgresDocumentHandler(DocumentHandler):
                 created_at=row["created_at"],
                 updated_at=row["updated_at"],
                 summary=row["summary"],
-                summary_embedding=[
-                    float(x)
-                    for x in row["summary_embedding"][1:-1].split(",")
-                    if x
-                ],
+                summary_embedding=row["summary_embedding"].tolist(),
             )
             for row in results
         ]
@@ -711,12 +748,8 @@ class PostgresDocumentHandler(DocumentHandler):
                 updated_at=row["updated_at"],
                 summary=row["summary"],
                 summary_embedding=(
-                    [
-                        float(x)
-                        for x in row["summary_embedding"][1:-1].split(",")
-                        if x
-                    ]
-                    if row["summary_embedding"]
+                    row["summary_embedding"].tolist()
+                    if row["summary_embedding"] is not None
                     else None
                 ),
             )
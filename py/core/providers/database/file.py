@@ -1,6 +1,7 @@
+import asyncio
 import io
 import logging
-from typing import BinaryIO, Optional, Union
+from typing import AsyncGenerator, BinaryIO, Optional, Union
 from uuid import UUID
 
 import asyncpg
@@ -18,6 +19,9 @@ class PostgresFileHandler(FileHandler):
 
     connection_manager: PostgresConnectionManager
 
+    # bytes per lowrite and loread round trip
+    CHUNK_SIZE = 1024 * 1024
+
     async def create_tables(self) -> None:
         """Create the necessary tables for file storage."""
         query = f"""
@@ -78,33 +82,42 @@ class PostgresFileHandler(FileHandler):
         self,
         document_id: UUID,
         file_name: str,
-        file_content: io.BytesIO,
+        file_content: BinaryIO,
         file_type: Optional[str] = None,
-    ) -> None:
-        """Store a new file in the database."""
-        file_size = file_content.getbuffer().nbytes
+    ) -> int:
+        """
+        Store a new file in the database, streaming it from its current
+        position into a large object without loading it into memory.
 
+        Returns:
+            int: The size of the stored file in bytes.
+        """
         async with self.connection_manager.pool.get_connection() as conn:  # type: ignore
             async with conn.transaction():
                 oid = await conn.fetchval("SELECT lo_create(0)")
-                await self._write_lobject(conn, oid, file_content)
+                file_size = await self._write_lobject(conn, oid, file_content)
                 await self.upsert_file(
                     document_id, file_name, oid, file_size, file_type
                 )
+        return file_size
 
     async def _write_lobject(
-        self, conn, oid: int, file_content: io.BytesIO
-    ) -> None:
-        """Write content to a large object."""
+        self, conn, oid: int, file_content: BinaryIO
+    ) -> int:
+        """Write content to a large object, returning the bytes written."""
         lobject = await conn.fetchval("SELECT lo_open($1, $2)", oid, 0x20000)
 
         try:
-            chunk_size = 8192  # 8 KB chunks
+            file_size = 0
             while True:
-                chunk = file_content.read(chunk_size)
+                # uploads are spooled to disk, read them off the event loop
+                chunk = await asyncio.to_thread(
+                    file_content.read, self.CHUNK_SIZE
+                )
                 if not chunk:
                     break
                 await conn.execute("SELECT lowrite($1, $2)", lobject, chunk)
+                file_size += len(chunk)
 
             await conn.execute("SELECT lo_close($1)", lobject)
 
@@ -114,6 +127,7 @@ class PostgresFileHandler(FileHandler):
                 status_code=500,
                 detail=f"Failed to write to large object: {e}",
             )
+        return file_size
 
     async def retrieve_file(
         self, document_id: UUID
@@ -147,7 +161,6 @@ class PostgresFileHandler(FileHandler):
     async def _read_lobject(self, conn, oid: int) -> bytes:
         """Read content from a large object."""
         file_data = io.BytesIO()
-        chunk_size = 8192
 
         async with conn.transaction():
             try:
@@ -173,7 +186,7 @@ class PostgresFileHandler(FileHandler):
 
                 while True:
                     chunk = await conn.fetchval(
-                        "SELECT loread($1, $2)", lobject, chunk_size
+                        "SELECT loread($1, $2)", lobject, self.CHUNK_SIZE
                     )
                     if not chunk:
                         break
@@ -188,6 +201,53 @@ class PostgresFileHandler(FileHandler):
 
         return file_data.getvalue()
 
+    async def stream_file(
+        self, document_id: UUID, start: int = 0, end: Optional[int] = None
+    ) -> AsyncGenerator[bytes, None]:
+        """
+        Stream the bytes from `start` up to `end`, or the end of the file,
+        out of the large object of a file. The large object is read in a
+        transaction of its own, which holds a connection until the stream
+        is exhausted or closed.
+        """
+        query = f"""
+        SELECT file_oid FROM {self._get_table_name('file_storage')}
+        WHERE document_id = $1
+        """
+
+        async with self.connection_manager.pool.get_connection() as conn:  # type: ignore
+            async with conn.transaction():
+                oid = await conn.fetchval(query, document_id)
+                if not oid:
+                    raise R2RException(
+                        status_code=404,
+                        message=f"File for document {document_id} not found",
+                    )
+
+                # the descriptor is closed when the transaction ends
+                lobject = await conn.fetchval(
+                    "SELECT lo_open($1, 262144)", oid
+                )
+                if start:
+                    await conn.execute(
+                        "SELECT lo_lseek64($1, $2, 0)", lobject, start
+                    )
+
+                position = start
+                while end is None or position < end:
+                    chunk_size = (
+                        self.CHUNK_SIZE
+                        if end is None
+                        else min(self.CHUNK_SIZE, end - position)
+                    )
+                    chunk = await conn.fetchval(
+                        "SELECT loread($1, $2)", lobject, chunk_size
+                    )
+                    if not chunk:
+                        break
+                    position += len(chunk)
+                    yield chunk
+
     async def delete_file(self, document_id: UUID) -> bool:
         """Delete a file from storage."""
         query = f"""
@@ -214,6 +274,30 @@ class PostgresFileHandler(FileHandler):
 
         return True
 
+    async def delete_files(self, document_ids: list[UUID]) -> int:
+        """
+        Delete the stored files of many documents and their large objects
+        with one statement, returning the number of files deleted.
+        """
+        query = f"""
+        WITH deleted AS (
+            DELETE FROM {self._get_table_name('file_storage')}
+            WHERE document_id = ANY($1::uuid[])
+            RETURNING file_oid
+        ), unlinked AS (
+            SELECT lo_unlink(deleted.file_oid)
+            FROM deleted
+            JOIN pg_largeobject_metadata lo ON lo.oid = deleted.file_oid
+        )
+        SELECT
+            (SELECT COUNT(*) FROM deleted) AS files,
+            (SELECT COUNT(*) FROM unlinked) AS unlinked
+        """
+        result = await self.connection_manager.fetchrow_query(
+            query, [document_ids]
+        )
+        return result["files"]
+
     async def _delete_lobject(self, conn, oid: int) -> None:
         """Delete a large object."""
         await conn.execute("SELECT lo_unlink($1)", oid)
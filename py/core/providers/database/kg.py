@@ -1,7 +1,7 @@
 import json
 import logging
 import time
-from typing import Any, AsyncGenerator, Optional, Tuple
+from typing import Any, AsyncGenerator, Iterable, Optional, Tuple, Union
 from uuid import UUID
 
 import asyncpg
@@ -20,11 +20,16 @@ from core.base import (
 from core.base.abstractions import (
     CommunityInfo,
     EntityLevel,
+    IndexArgsHNSW,
+    IndexArgsIVFFlat,
+    IndexMeasure,
+    IndexMethod,
     KGCreationSettings,
     KGEnrichmentSettings,
     KGEnrichmentStatus,
     KGEntityDeduplicationSettings,
     VectorQuantizationType,
+    VectorTableName,
 )
 from core.base.api.models import (
     KGCreationEstimationResponse,
@@ -35,6 +40,14 @@ from core.base.utils import _decorate_vector_type, llm_cost_per_million_tokens
 
 from .base import PostgresConnectionManager
 from .collection import PostgresCollectionHandler
+from .kg_clustering import TripleGraph, _import_numpy
+from .vecs.exc import ArgError
+from .vector import (
+    create_vector_index,
+    drop_vector_index,
+    index_measure_to_ops,
+    list_vector_indices,
+)
 
 logger = logging.getLogger()
 
@@ -42,6 +55,14 @@ logger = logging.getLogger()
 class PostgresKGHandler(KGHandler):
     """Handler for Knowledge Graph operations in PostgreSQL."""
 
+    # embedding column searched by `vector_query` in each table
+    VECTOR_COLUMNS = {
+        VectorTableName.ENTITIES_DOCUMENT: "description_embedding",
+        VectorTableName.ENTITIES_COLLECTION: "description_embedding",
+        VectorTableName.TRIPLES: "embedding",
+        VectorTableName.COMMUNITIES: "embedding",
+    }
+
     def __init__(
         self,
         project_name: str,
@@ -57,14 +78,6 @@ class PostgresKGHandler(KGHandler):
         self.collection_handler = collection_handler
         self.dimension = dimension
         self.quantization_type = quantization_type
-        try:
-            import networkx as nx
-
-            self.nx = nx
-        except ImportError as exc:
-            raise ImportError(
-                "NetworkX is not installed. Please install it to use this module."
-            ) from exc
 
     def _get_table_name(self, base_name: str) -> str:
         """Get the fully qualified table name."""
@@ -168,11 +181,50 @@ class PostgresKGHandler(KGHandler):
             rating_explanation TEXT NOT NULL,
             embedding {vector_column_str} NOT NULL,
             attributes JSONB,
+            fingerprint TEXT,
             UNIQUE (community_number, level, collection_id)
         );"""
 
         await self.connection_manager.execute_query(query)
 
+        # reports created before fingerprints were stored
+        query = f"""
+            ALTER TABLE {self._get_table_name("community_report")} ADD COLUMN IF NOT EXISTS fingerprint TEXT;
+            CREATE INDEX IF NOT EXISTS idx_{self.project_name}_community_report_fingerprint
+            ON {self._get_table_name("community_report")} (collection_id, fingerprint);
+        """
+
+        await self.connection_manager.execute_query(query)
+
+        # reports of the previous clustering, reused by communities that
+        # come out of a reclustering with the same entities and triples
+        query = f"""
+            CREATE TABLE IF NOT EXISTS {self._get_table_name("community_report_cache")} (
+            collection_id UUID NOT NULL,
+            fingerprint TEXT NOT NULL,
+            name TEXT NOT NULL,
+            summary TEXT NOT NULL,
+            findings TEXT[] NOT NULL,
+            rating FLOAT NOT NULL,
+            rating_explanation TEXT NOT NULL,
+            embedding {vector_column_str} NOT NULL,
+            attributes JSONB,
+            PRIMARY KEY (collection_id, fingerprint)
+        );"""
+
+        await self.connection_manager.execute_query(query)
+
+        # chunks whose triples extraction finished, so an interrupted
+        # extraction resumes where it stopped
+        query = f"""
+            CREATE TABLE IF NOT EXISTS {self._get_table_name("kg_extraction_checkpoint")} (
+            document_id UUID NOT NULL,
+            extraction_id UUID NOT NULL,
+            PRIMARY KEY (document_id, extraction_id)
+        );"""
+
+        await self.connection_manager.execute_query(query)
+
     async def _add_objects(
         self,
         objects: list[Any],
@@ -239,11 +291,8 @@ class PostgresKGHandler(KGHandler):
                 if entity_dict.get("extraction_ids")
                 else []
             )
-            entity_dict["description_embedding"] = (
-                str(entity_dict["description_embedding"])
-                if entity_dict.get("description_embedding")
-                else None
-            )
+            if not entity_dict.get("description_embedding"):
+                entity_dict["description_embedding"] = None
             cleaned_entities.append(entity_dict)
 
         return await self._add_objects(
@@ -441,6 +490,8 @@ class PostgresKGHandler(KGHandler):
         filters = kwargs.get("filters", {})
         entities_level = kwargs.get("entities_level", EntityLevel.DOCUMENT)
         limit = kwargs.get("limit", 10)
+        ef_search = kwargs.get("ef_search", None)
+        probes = kwargs.get("probes", None)
 
         table_name = ""
         if search_type == "__Entity__":
@@ -488,14 +539,22 @@ class PostgresKGHandler(KGHandler):
             SELECT {property_names_str} FROM {self._get_table_name(table_name)} {filter_query} ORDER BY {embedding_type} <=> $1 LIMIT $2;
         """
 
+        params: list[Any] = [query_embedding, limit]
         if filter_query != "":
-            results = await self.connection_manager.fetch_query(
-                QUERY, (str(query_embedding), limit, filter_ids)
-            )
-        else:
-            results = await self.connection_manager.fetch_query(
-                QUERY, (str(query_embedding), limit)
-            )
+            params.append(filter_ids)
+
+        async with self.connection_manager.pool.get_connection() as conn:  # type: ignore
+            async with conn.transaction():
+                # index search parameters only apply to this query
+                if ef_search is not None:
+                    await conn.execute(
+                        f"SET LOCAL hnsw.ef_search = {int(ef_search)}"
+                    )
+                if probes is not None:
+                    await conn.execute(
+                        f"SET LOCAL ivfflat.probes = {int(probes)}"
+                    )
+                results = await conn.fetch(QUERY, *params)
 
         for result in results:
             yield {
@@ -530,24 +589,42 @@ class PostgresKGHandler(KGHandler):
     async def add_community_info(
         self, communities: list[CommunityInfo]
     ) -> None:
-        QUERY = f"""
-            INSERT INTO {self._get_table_name("community_info")} (node, cluster, parent_cluster, level, is_final_cluster, triple_ids, collection_id)
-            VALUES ($1, $2, $3, $4, $5, $6, $7)
-            """
-        communities_tuples_list = [
+        records = (
             (
-                community.node,
-                community.cluster,
-                community.parent_cluster,
-                community.level,
-                community.is_final_cluster,
-                community.triple_ids,
-                community.collection_id,
+                (
+                    community.node,
+                    community.cluster,
+                    community.parent_cluster,
+                    community.level,
+                    community.is_final_cluster,
+                    community.triple_ids,
+                    community.collection_id,
+                )
+                if isinstance(community, CommunityInfo)
+                else tuple(community)
             )
             for community in communities
-        ]
-        await self.connection_manager.execute_many(
-            QUERY, communities_tuples_list
+        )
+        async with self.connection_manager.pool.get_connection() as conn:  # type: ignore
+            await self._copy_community_info(conn, records)
+
+    async def _copy_community_info(
+        self, conn: asyncpg.Connection, records: Iterable[tuple]
+    ) -> None:
+        """Bulk loads `community_info` rows with COPY."""
+        await conn.copy_records_to_table(
+            "community_info",
+            schema_name=self.project_name,
+            columns=[
+                "node",
+                "cluster",
+                "parent_cluster",
+                "level",
+                "is_final_cluster",
+                "triple_ids",
+                "collection_id",
+            ],
+            records=records,
         )
 
     async def get_communities(
@@ -607,10 +684,6 @@ class PostgresKGHandler(KGHandler):
         self, community_report: CommunityReport
     ) -> None:
 
-        # TODO: Fix in the short term.
-        # we need to do this because postgres insert needs to be a string
-        community_report.embedding = str(community_report.embedding)  # type: ignore[assignment]
-
         non_null_attrs = {
             k: v for k, v in community_report.__dict__.items() if v is not None
         }
@@ -632,80 +705,152 @@ class PostgresKGHandler(KGHandler):
             QUERY, [tuple(non_null_attrs.values())]
         )
 
-    async def _create_graph_and_cluster(
-        self, triples: list[Triple], leiden_params: dict[str, Any]
-    ) -> Any:
-
-        G = self.nx.Graph()
-        for triple in triples:
-            G.add_edge(
-                triple.subject,
-                triple.object,
-                weight=triple.weight,
-                id=triple.id,
-            )
-
-        hierarchical_communities = await self._compute_leiden_communities(
-            G, leiden_params
+    async def reuse_community_report(
+        self,
+        collection_id: UUID,
+        community_number: int,
+        level: int,
+        fingerprint: str,
+    ) -> Optional[str]:
+        """
+        Stores a copy of an earlier report with the same fingerprint, from
+        the previous clustering or another level of this one, as the report
+        of a community. Returns the name of the report, or None when there
+        is no report to reuse.
+        """
+        columns = "name, summary, findings, rating, rating_explanation, embedding, attributes"
+        QUERY = f"""
+            INSERT INTO {self._get_table_name("community_report")}
+                (community_number, collection_id, level, fingerprint, {columns})
+            SELECT $2, $1, $3, $4, {columns} FROM (
+                SELECT {columns} FROM {self._get_table_name("community_report_cache")}
+                WHERE collection_id = $1 AND fingerprint = $4
+                UNION ALL
+                SELECT {columns} FROM {self._get_table_name("community_report")}
+                WHERE collection_id = $1 AND fingerprint = $4
+            ) AS earlier
+            LIMIT 1
+            ON CONFLICT (community_number, level, collection_id) DO UPDATE SET
+                fingerprint = EXCLUDED.fingerprint,
+                {", ".join(f"{column} = EXCLUDED.{column}" for column in columns.split(", "))}
+            RETURNING name
+        """
+        result = await self.connection_manager.fetchrow_query(
+            QUERY, [collection_id, community_number, level, fingerprint]
         )
+        return result["name"] if result else None
 
-        return hierarchical_communities
+    async def _get_triple_graph(
+        self, collection_id: UUID, batch_size: int = 50_000
+    ) -> TripleGraph:
+        """Streams the triples of a collection into a `TripleGraph`."""
+        QUERY = f"""
+            SELECT subject, object, weight, id FROM {self._get_table_name("chunk_triple")}
+            WHERE document_id = ANY(
+                SELECT document_id FROM {self._get_table_name("document_info")} WHERE $1 = ANY(collection_ids)
+            )
+            ORDER BY id
+        """
+        graph = TripleGraph()
+        async with self.connection_manager.pool.get_connection() as conn:  # type: ignore
+            async with conn.transaction():
+                cursor = await conn.cursor(QUERY, collection_id)
+                while rows := await cursor.fetch(batch_size):
+                    graph.add_triples(rows)
+        return graph
+
+    async def get_entity_embeddings(
+        self, collection_id: UUID, batch_size: int = 10_000
+    ) -> tuple[Any, Any]:
+        """
+        Streams the description embeddings of a collection's entities into
+        one float32 matrix, returned with the matching entity ids.
+        """
+        np = _import_numpy()
+        document_filter = f"""
+            description_embedding IS NOT NULL AND document_id = ANY(
+                SELECT document_id FROM {self._get_table_name("document_info")} WHERE $1 = ANY(collection_ids)
+            )
+        """
+        async with self.connection_manager.pool.get_connection() as conn:  # type: ignore
+            async with conn.transaction(isolation="repeatable_read"):
+                count = await conn.fetchval(
+                    f"SELECT COUNT(*) FROM {self._get_table_name('document_entity')} WHERE {document_filter}",
+                    collection_id,
+                )
+                ids = np.empty(count, dtype=np.int64)
+                matrix = None
+                offset = 0
+                cursor = await conn.cursor(
+                    f"SELECT id, description_embedding FROM {self._get_table_name('document_entity')} WHERE {document_filter} ORDER BY id",
+                    collection_id,
+                )
+                while rows := await cursor.fetch(batch_size):
+                    # the vector codec decodes to float32 arrays
+                    batch = np.stack([row[1] for row in rows])
+                    if matrix is None:
+                        matrix = np.empty(
+                            (count, batch.shape[1]), dtype=np.float32
+                        )
+                    ids[offset : offset + len(rows)] = [row[0] for row in rows]
+                    matrix[offset : offset + len(rows)] = batch
+                    offset += len(rows)
+        if matrix is None:
+            matrix = np.empty((0, self.dimension), dtype=np.float32)
+        return ids, matrix
 
     async def _cluster_and_add_community_info(
         self,
-        triples: list[Triple],
-        triple_ids_cache: dict[str, list[int]],
+        graph: TripleGraph,
         leiden_params: dict[str, Any],
         collection_id: UUID,
     ) -> int:
 
-        # clear if there is any old information
-        QUERY = f"""
-            DELETE FROM {self._get_table_name("community_info")} WHERE collection_id = $1
-        """
-        await self.connection_manager.execute_query(QUERY, [collection_id])
-
-        QUERY = f"""
-            DELETE FROM {self._get_table_name("community_report")} WHERE collection_id = $1
-        """
-        await self.connection_manager.execute_query(QUERY, [collection_id])
-
         start_time = time.time()
 
-        hierarchical_communities = await self._create_graph_and_cluster(
-            triples, leiden_params
-        )
+        clusters = await graph.cluster(leiden_params)
 
         logger.info(
             f"Computing Leiden communities completed, time {time.time() - start_time:.2f} seconds."
         )
 
-        def triple_ids(node: str) -> list[int]:
-            return triple_ids_cache.get(node, [])
-
-        logger.info(
-            f"Cached {len(triple_ids_cache)} triple ids, time {time.time() - start_time:.2f} seconds."
-        )
-
-        # upsert the communities into the database.
-        inputs = [
-            CommunityInfo(
-                node=str(item.node),
-                cluster=item.cluster,
-                parent_cluster=item.parent_cluster,
-                level=item.level,
-                is_final_cluster=item.is_final_cluster,
-                triple_ids=triple_ids(item.node),
-                collection_id=collection_id,
-            )
-            for item in hierarchical_communities
-        ]
-
-        await self.add_community_info(inputs)
+        # replace the old information with the new communities in one go
+        async with self.connection_manager.pool.get_connection() as conn:  # type: ignore
+            async with conn.transaction():
+                await conn.execute(
+                    f"DELETE FROM {self._get_table_name('community_info')} WHERE collection_id = $1",
+                    collection_id,
+                )
+                # keep the reports around so that communities with unchanged
+                # entities and triples are not summarized again
+                await conn.execute(
+                    f"DELETE FROM {self._get_table_name('community_report_cache')} WHERE collection_id = $1",
+                    collection_id,
+                )
+                await conn.execute(
+                    f"""
+                    INSERT INTO {self._get_table_name('community_report_cache')}
+                        (collection_id, fingerprint, name, summary, findings, rating, rating_explanation, embedding, attributes)
+                    SELECT collection_id, fingerprint, name, summary, findings, rating, rating_explanation, embedding, attributes
+                    FROM {self._get_table_name('community_report')}
+                    WHERE collection_id = $1 AND fingerprint IS NOT NULL
+                    ON CONFLICT (collection_id, fingerprint) DO NOTHING
+                    """,
+                    collection_id,
+                )
+                await conn.execute(
+                    f"DELETE FROM {self._get_table_name('community_report')} WHERE collection_id = $1",
+                    collection_id,
+                )
+                await self._copy_community_info(
+                    conn,
+                    (
+                        (*record, collection_id)
+                        for record in graph.community_info_records(clusters)
+                    ),
+                )
 
-        num_communities = (
-            max([item.cluster for item in hierarchical_communities]) + 1
-        )
+        num_communities = clusters.num_communities
 
         logger.info(
             f"Generated {num_communities} communities, time {time.time() - start_time:.2f} seconds."
@@ -714,7 +859,7 @@ class PostgresKGHandler(KGHandler):
         return num_communities
 
     async def _use_community_cache(
-        self, collection_id: UUID, triple_ids_cache: dict[str, list[int]]
+        self, collection_id: UUID, num_nodes: int
     ) -> bool:
 
         # check if status is enriched or stale
@@ -740,130 +885,127 @@ class PostgresKGHandler(KGHandler):
         )["count"]
 
         # a hard threshold of 80% of the entities in the cache.
-        if num_entities > 0.8 * len(triple_ids_cache):
+        if num_entities > 0.8 * num_nodes:
             return True
         else:
             return False
 
-    async def _get_triple_ids_cache(
-        self, triples: list[Triple]
-    ) -> dict[str, list[int]]:
-
-        # caching the triple ids
-        triple_ids_cache = dict[str, list[int]]()
-        for triple in triples:
-            if (
-                triple.subject not in triple_ids_cache
-                and triple.subject is not None
-            ):
-                triple_ids_cache[triple.subject] = []
-            if (
-                triple.object not in triple_ids_cache
-                and triple.object is not None
-            ):
-                triple_ids_cache[triple.object] = []
-            if triple.subject is not None and triple.id is not None:
-                triple_ids_cache[triple.subject].append(triple.id)
-            if triple.object is not None and triple.id is not None:
-                triple_ids_cache[triple.object].append(triple.id)
-
-        return triple_ids_cache
-
     async def _incremental_clustering(
         self,
-        triple_ids_cache: dict[str, list[int]],
+        graph: TripleGraph,
         leiden_params: dict[str, Any],
         collection_id: UUID,
     ) -> int:
         """
-        Performs incremental clustering on new triples by:
-        1. Getting all triples and new triples
-        2. Getting community mapping for all existing triples
-        3. For each new triple:
-            - Check if subject/object exists in community mapping
-            - If exists, add its cluster to updated communities set
-            - If not, append triple to new_triple_ids list for clustering
-        4. Run hierarchical clustering on new_triple_ids list
-        5. Update community info table with new clusters, offsetting IDs by max_cluster_id
+        Adds the triples extracted since the last clustering to the
+        existing communities:
+        1. Triples not listed in any community's `triple_ids` are new
+        2. A new triple whose subject or object already belongs to
+           communities is appended to the `triple_ids` of those entities,
+           and the reports of their communities are dropped so they are
+           summarized again
+        3. The remaining new triples are clustered on their own, with
+           cluster ids continuing after the existing ones
         """
+        np = graph.np
 
         QUERY = f"""
-            SELECT node, cluster, is_final_cluster FROM {self._get_table_name("community_info")} WHERE collection_id = $1
+            SELECT node, array_agg(cluster) AS clusters FROM {self._get_table_name("community_info")} WHERE collection_id = $1 GROUP BY node
         """
-
-        communities = await self.connection_manager.fetch_query(
-            QUERY, [collection_id]
-        )
-        max_cluster_id = max(
-            [community["cluster"] for community in communities]
-        )
-
-        # TODO: modify above query to get a dict grouped by node (without aggregation)
-        communities_dict = {}  # type: ignore
-        for community in communities:
-            if community["node"] not in communities_dict:
-                communities_dict[community["node"]] = []
-            communities_dict[community["node"]].append(community)
-
+        communities = {
+            row["node"]: row["clusters"]
+            for row in await self.connection_manager.fetch_query(
+                QUERY, [collection_id]
+            )
+        }
         QUERY = f"""
-            SELECT document_id FROM {self._get_table_name("document_info")} WHERE $1 = ANY(collection_ids) and kg_extraction_status = $2
+            SELECT COALESCE(MAX(cluster), -1) AS max_cluster_id FROM {self._get_table_name("community_info")} WHERE collection_id = $1
         """
-
-        new_document_ids = await self.connection_manager.fetch_query(
-            QUERY, [collection_id, KGExtractionStatus.SUCCESS]
-        )
-
-        new_triple_ids = await self.get_all_triples(
-            collection_id, new_document_ids
-        )
-
-        # community mapping for new triples
-        updated_communities = set()
-        new_triples = []
-        for triple in new_triple_ids:
-            # bias towards subject
-            if triple.subject in communities_dict:
-                for community in communities_dict[triple.subject]:
-                    updated_communities.add(community["cluster"])
-            elif triple.object in communities_dict:
-                for community in communities_dict[triple.object]:
-                    updated_communities.add(community["cluster"])
-            else:
-                new_triples.append(triple)
-
-        # delete the communities information for the updated communities
+        max_cluster_id = (
+            await self.connection_manager.fetchrow_query(
+                QUERY, [collection_id]
+            )
+        )["max_cluster_id"]
         QUERY = f"""
-            DELETE FROM {self._get_table_name("community_report")} WHERE collection_id = $1 AND community_number = ANY($2)
+            SELECT DISTINCT unnest(triple_ids) AS triple_id FROM {self._get_table_name("community_info")} WHERE collection_id = $1
         """
-        await self.connection_manager.execute_query(
-            QUERY, [collection_id, updated_communities]
+        clustered_triple_ids = np.array(
+            [
+                row["triple_id"]
+                for row in await self.connection_manager.fetch_query(
+                    QUERY, [collection_id]
+                )
+            ],
+            dtype=np.int64,
         )
 
-        hierarchical_communities_output = await self._create_graph_and_cluster(
-            new_triples, leiden_params
+        subjects, objects, weights, triple_ids = graph.edges
+        new_triples = np.flatnonzero(
+            ~np.isin(triple_ids, clustered_triple_ids)
         )
+        nodes = graph.nodes
+        attached_nodes: list[str] = []
+        attached_triple_ids: list[int] = []
+        updated_communities: set[int] = set()
+        unattached_triples = []
+        for index in new_triples.tolist():
+            subject, object_ = nodes[subjects[index]], nodes[objects[index]]
+            triple_id = int(triple_ids[index])
+            endpoints = [
+                node
+                for node in dict.fromkeys((subject, object_))
+                if node in communities
+            ]
+            for node in endpoints:
+                attached_nodes.append(node)
+                attached_triple_ids.append(triple_id)
+                updated_communities.update(communities[node])
+            if not endpoints:
+                unattached_triples.append(
+                    (subject, object_, float(weights[index]), triple_id)
+                )
 
-        community_info = []
-        for community in hierarchical_communities_output:
-            community_info.append(
-                CommunityInfo(
-                    node=community.node,
-                    cluster=community.cluster + max_cluster_id,
-                    parent_cluster=(
-                        community.parent_cluster + max_cluster_id
-                        if community.parent_cluster is not None
-                        else None
+        new_graph = TripleGraph()
+        new_graph.add_triples(unattached_triples)
+        clusters = await new_graph.cluster(leiden_params)
+
+        async with self.connection_manager.pool.get_connection() as conn:  # type: ignore
+            async with conn.transaction():
+                await conn.execute(
+                    f"""
+                    UPDATE {self._get_table_name("community_info")} AS ci
+                    SET triple_ids = ci.triple_ids || new.triple_ids
+                    FROM (
+                        SELECT node, array_agg(triple_id) AS triple_ids
+                        FROM unnest($2::text[], $3::int[]) AS t(node, triple_id)
+                        GROUP BY node
+                    ) AS new
+                    WHERE ci.collection_id = $1 AND ci.node = new.node
+                    """,
+                    collection_id,
+                    attached_nodes,
+                    attached_triple_ids,
+                )
+                await conn.execute(
+                    f"DELETE FROM {self._get_table_name('community_report')} WHERE collection_id = $1 AND community_number = ANY($2)",
+                    collection_id,
+                    list(updated_communities),
+                )
+                await self._copy_community_info(
+                    conn,
+                    (
+                        (*record, collection_id)
+                        for record in new_graph.community_info_records(
+                            clusters, cluster_offset=max_cluster_id + 1
+                        )
                     ),
-                    level=community.level,
-                    triple_ids=[],  # FIXME: need to get the triple ids for the community
-                    is_final_cluster=community.is_final_cluster,
-                    collection_id=collection_id,
                 )
-            )
 
-        await self.add_community_info(community_info)
-        num_communities = max([item.cluster for item in community_info]) + 1
-        return num_communities
+        logger.info(
+            f"Added {len(new_triples)} new triples to the communities of collection {collection_id}: {len(updated_communities)} communities updated, {clusters.num_communities} new communities."
+        )
+
+        return max_cluster_id + 1 + clusters.num_communities
 
     async def perform_graph_clustering(
         self,
@@ -887,54 +1029,23 @@ class PostgresKGHandler(KGHandler):
             check_directed: bool = True,
         """
 
-        start_time = time.time()
-
-        triples = await self.get_all_triples(collection_id)
-
-        logger.info(f"Clustering with settings: {leiden_params}")
+        graph = await self._get_triple_graph(collection_id)
 
-        triple_ids_cache = await self._get_triple_ids_cache(triples)
+        logger.info(
+            f"Clustering {graph.num_triples} triples with settings: {leiden_params}"
+        )
 
-        if await self._use_community_cache(collection_id, triple_ids_cache):
+        if await self._use_community_cache(collection_id, graph.num_nodes):
             num_communities = await self._incremental_clustering(
-                triple_ids_cache, leiden_params, collection_id
+                graph, leiden_params, collection_id
             )
         else:
             num_communities = await self._cluster_and_add_community_info(
-                triples, triple_ids_cache, leiden_params, collection_id
+                graph, leiden_params, collection_id
             )
 
         return num_communities
 
-    async def _compute_leiden_communities(
-        self,
-        graph: Any,
-        leiden_params: dict[str, Any],
-    ) -> Any:
-        """Compute Leiden communities."""
-        try:
-            from graspologic.partition import hierarchical_leiden
-
-            if "random_seed" not in leiden_params:
-                leiden_params["random_seed"] = (
-                    7272  # add seed to control randomness
-                )
-
-            start_time = time.time()
-            logger.info(
-                f"Running Leiden clustering with params: {leiden_params}"
-            )
-
-            community_mapping = hierarchical_leiden(graph, **leiden_params)
-
-            logger.info(
-                f"Leiden clustering completed in {time.time() - start_time:.2f} seconds."
-            )
-            return community_mapping
-
-        except ImportError as e:
-            raise ImportError("Please install the graspologic package.") from e
-
     async def get_community_details(
         self, community_number: int, collection_id: UUID
     ) -> Tuple[int, list[Entity], list[Triple]]:
@@ -1010,6 +1121,35 @@ class PostgresKGHandler(KGHandler):
             QUERY, [collection_id]
         )
 
+    async def stream_community_reports(
+        self,
+        collection_ids: Optional[list[UUID]] = None,
+        level: Optional[int] = None,
+        batch_size: int = 1000,
+    ) -> AsyncGenerator[CommunityReport, None]:
+        """
+        Yields community reports, highest rated first, a page at a time so
+        no connection is held while the caller works on a page.
+        """
+        QUERY = f"""
+            SELECT community_number, collection_id, level, name, summary, findings, rating, rating_explanation
+            FROM {self._get_table_name("community_report")}
+            WHERE ($1::uuid[] IS NULL OR collection_id = ANY($1))
+            AND ($2::int IS NULL OR level = $2)
+            ORDER BY rating DESC NULLS LAST, collection_id, community_number, level
+            OFFSET $3 LIMIT $4
+        """
+        offset = 0
+        while True:
+            rows = await self.connection_manager.fetch_query(
+                QUERY, [collection_ids, level, offset, batch_size]
+            )
+            for row in rows:
+                yield CommunityReport(**row)
+            if len(rows) < batch_size:
+                return
+            offset += batch_size
+
     async def check_community_reports_exist(
         self, collection_id: UUID, offset: int, limit: int
     ) -> list[int]:
@@ -1039,6 +1179,7 @@ class PostgresKGHandler(KGHandler):
         DELETE_QUERIES = [
             f"DELETE FROM {self._get_table_name('community_info')} WHERE collection_id = $1;",
             f"DELETE FROM {self._get_table_name('community_report')} WHERE collection_id = $1;",
+            f"DELETE FROM {self._get_table_name('community_report_cache')} WHERE collection_id = $1;",
         ]
 
         document_ids_response = (
@@ -1103,6 +1244,7 @@ class PostgresKGHandler(KGHandler):
             f"DELETE FROM {self._get_table_name('chunk_entity')} WHERE document_id = $1",
             f"DELETE FROM {self._get_table_name('chunk_triple')} WHERE document_id = $1",
             f"DELETE FROM {self._get_table_name('document_entity')} WHERE document_id = $1",
+            f"DELETE FROM {self._get_table_name('kg_extraction_checkpoint')} WHERE document_id = $1",
         ]
 
         for query in delete_queries:
@@ -1119,6 +1261,7 @@ class PostgresKGHandler(KGHandler):
             collection_queries = [
                 f"DELETE FROM {self._get_table_name('community_info')} WHERE collection_id = $1",
                 f"DELETE FROM {self._get_table_name('community_report')} WHERE collection_id = $1",
+                f"DELETE FROM {self._get_table_name('community_report_cache')} WHERE collection_id = $1",
             ]
             for query in collection_queries:
                 await self.connection_manager.execute_query(
@@ -1135,6 +1278,62 @@ class PostgresKGHandler(KGHandler):
             return None
         return None
 
+    async def delete_graphs_for_documents(
+        self, document_ids: list[UUID]
+    ) -> dict[str, int]:
+        """
+        Deletes the entities, triples and extraction checkpoints of many
+        documents with a statement per table. Enriched collections holding
+        any of the documents are marked outdated, their communities were
+        built from the deleted graphs.
+
+        Returns:
+            dict: The number of entities and triples deleted.
+        """
+        counts = {}
+        for table_name in [
+            "chunk_entity",
+            "document_entity",
+            "chunk_triple",
+            "kg_extraction_checkpoint",
+        ]:
+            QUERY = f"""
+                WITH deleted AS (
+                    DELETE FROM {self._get_table_name(table_name)}
+                    WHERE document_id = ANY($1::uuid[])
+                    RETURNING 1
+                )
+                SELECT COUNT(*) FROM deleted
+            """
+            counts[table_name] = (
+                await self.connection_manager.fetchrow_query(
+                    QUERY, [document_ids]
+                )
+            )["count"]
+
+        entities = counts["chunk_entity"] + counts["document_entity"]
+        triples = counts["chunk_triple"]
+        if entities or triples:
+            QUERY = f"""
+                UPDATE {self._get_table_name("collections")}
+                SET kg_enrichment_status = $1
+                WHERE kg_enrichment_status = $2
+                AND collection_id IN (
+                    SELECT unnest(collection_ids)
+                    FROM {self._get_table_name("document_info")}
+                    WHERE document_id = ANY($3::uuid[])
+                )
+            """
+            await self.connection_manager.execute_query(
+                QUERY,
+                [
+                    KGEnrichmentStatus.OUTDATED,
+                    KGEnrichmentStatus.SUCCESS,
+                    document_ids,
+                ],
+            )
+        return {"entities": entities, "triples": triples}
+
     def _get_str_estimation_output(self, x: tuple[Any, Any]) -> str:
         if isinstance(x[0], int) and isinstance(x[1], int):
             return " - ".join(map(str, x))
@@ -1154,6 +1353,48 @@ class PostgresKGHandler(KGHandler):
             )
         ]
 
+    async def get_completed_extraction_ids(
+        self, document_ids: list[UUID]
+    ) -> dict[UUID, set[UUID]]:
+        """
+        Chunks of each document that need no further triples extraction:
+        those checkpointed as extracted, and those that already have
+        entities stored.
+        """
+        QUERY = f"""
+            SELECT document_id, extraction_id FROM {self._get_table_name("kg_extraction_checkpoint")}
+            WHERE document_id = ANY($1)
+            UNION
+            SELECT document_id, unnest(extraction_ids) FROM {self._get_table_name("chunk_entity")}
+            WHERE document_id = ANY($1)
+        """
+        completed: dict[UUID, set[UUID]] = {
+            document_id: set() for document_id in document_ids
+        }
+        for row in await self.connection_manager.fetch_query(
+            QUERY, [document_ids]
+        ):
+            completed[row["document_id"]].add(row["extraction_id"])
+        return completed
+
+    async def add_extraction_checkpoint(
+        self, document_id: UUID, extraction_ids: list[UUID]
+    ) -> None:
+        QUERY = f"""
+            INSERT INTO {self._get_table_name("kg_extraction_checkpoint")} (document_id, extraction_id)
+            SELECT $1, unnest($2::uuid[])
+            ON CONFLICT DO NOTHING
+        """
+        await self.connection_manager.execute_query(
+            QUERY, [document_id, extraction_ids]
+        )
+
+    async def delete_extraction_checkpoints(self, document_id: UUID) -> None:
+        QUERY = f"""
+            DELETE FROM {self._get_table_name("kg_extraction_checkpoint")} WHERE document_id = $1
+        """
+        await self.connection_manager.execute_query(QUERY, [document_id])
+
     async def get_creation_estimate(
         self, collection_id: UUID, kg_creation_settings: KGCreationSettings
     ) -> KGCreationEstimationResponse:
@@ -1307,10 +1548,78 @@ class PostgresKGHandler(KGHandler):
             + self._get_str_estimation_output(estimated_total_time),
         )
 
-    async def create_vector_index(self):
-        # need to implement this. Just call vector db provider's create_vector_index method.
-        # this needs to be run periodically for every collection.
-        raise NotImplementedError
+    def _get_vector_column(
+        self, table_name: VectorTableName
+    ) -> Tuple[str, str]:
+        try:
+            col_name = self.VECTOR_COLUMNS[VectorTableName(table_name)]
+        except (KeyError, ValueError):
+            raise ArgError(f"invalid table name: {table_name}")
+        return self._get_table_name(str(table_name)), col_name
+
+    async def create_vector_index(
+        self,
+        table_name: VectorTableName,
+        index_measure: IndexMeasure = IndexMeasure.cosine_distance,
+        index_method: IndexMethod = IndexMethod.auto,
+        index_arguments: Optional[
+            Union[IndexArgsIVFFlat, IndexArgsHNSW]
+        ] = None,
+        index_name: Optional[str] = None,
+        concurrently: bool = True,
+    ) -> str:
+        """
+        Creates an HNSW or IVFFlat index on the embedding column of a
+        knowledge graph table, so that `vector_query` no longer scans it.
+
+        IVFFlat lists are trained on the rows present at build time, build
+        it once the table is populated.
+
+        Returns:
+            str: The name of the created index.
+
+        Raises:
+            ArgError: If the table, method, arguments or measure are invalid.
+        """
+        table_name_str, col_name = self._get_vector_column(table_name)
+
+        ops = index_measure_to_ops(index_measure, self.quantization_type)
+        if ops is None:
+            raise ArgError("Unknown index measure")
+
+        return await create_vector_index(
+            self.connection_manager,
+            table_name_str,
+            col_name,
+            ops,
+            index_method,
+            index_arguments,
+            index_name,
+            concurrently,
+        )
+
+    async def list_vector_indices(
+        self, table_name: VectorTableName
+    ) -> list[dict[str, Any]]:
+        table_name_str, col_name = self._get_vector_column(table_name)
+        return await list_vector_indices(
+            self.connection_manager, table_name_str, col_name
+        )
+
+    async def delete_vector_index(
+        self,
+        index_name: str,
+        table_name: VectorTableName,
+        concurrently: bool = True,
+    ) -> None:
+        table_name_str, col_name = self._get_vector_column(table_name)
+        await drop_vector_index(
+            self.connection_manager,
+            index_name,
+            table_name_str,
+            col_name,
+            concurrently,
+        )
 
     async def delete_triples(self, triple_ids: list[int]):
         # need to implement this.
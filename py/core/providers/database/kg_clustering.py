@@ -0,0 +1,348 @@
+"""Array-backed hierarchical Leiden clustering for knowledge graphs."""
+
+import asyncio
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Iterable, Iterator, NamedTuple, Optional, Sequence
+
+logger = logging.getLogger()
+
+# Seeds Leiden when the caller does not, so reruns give the same clusters
+DEFAULT_LEIDEN_SEED = 7272
+
+# Graphs with fewer edges are clustered on a thread; spawning a worker
+# costs seconds, more than Leiden itself takes at this size
+PROCESS_MIN_EDGES = 250_000
+
+# `hierarchical_leiden` arguments that only describe how graspologic reads
+# a networkx graph; edges here always carry an explicit weight
+_GRAPH_INPUT_PARAMS = {
+    "weight_attribute",
+    "is_weighted",
+    "weight_default",
+    "check_directed",
+}
+
+
+def _import_numpy():
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise ImportError(
+            "NumPy is not installed. Please install it to cluster the knowledge graph."
+        ) from e
+    return np
+
+
+class LeidenClusters(NamedTuple):
+    """Hierarchical Leiden output as parallel arrays, one row per entry."""
+
+    node: Any
+    cluster: Any
+    # -1 where the entry has no parent cluster
+    parent_cluster: Any
+    level: Any
+    is_final_cluster: Any
+
+    @property
+    def num_communities(self) -> int:
+        return int(self.cluster.max()) + 1 if len(self.cluster) else 0
+
+
+class TripleGraph:
+    """
+    Knowledge graph triples held in compact arrays.
+
+    Entity names are interned to consecutive integer ids as triples are
+    added, and edges are kept as parallel NumPy arrays of ids, weights and
+    triple ids. Millions of triples take tens of megabytes this way instead
+    of the gigabytes a `networkx.Graph` of `Triple` objects needs.
+    """
+
+    def __init__(self):
+        self.np = _import_numpy()
+        self._node_ids: dict[str, int] = {}
+        self._batches: list[tuple[Any, Any, Any, Any]] = []
+        self._edges: Optional[tuple[Any, Any, Any, Any]] = None
+        self._triple_index: Optional[tuple[Any, Any]] = None
+
+    @classmethod
+    def from_triples(cls, triples: Iterable[Any]) -> "TripleGraph":
+        graph = cls()
+        graph.add_triples(
+            (triple.subject, triple.object, triple.weight, triple.id)
+            for triple in triples
+            if triple.subject is not None and triple.object is not None
+        )
+        return graph
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self._node_ids)
+
+    @property
+    def num_triples(self) -> int:
+        return len(self.edges[0])
+
+    @property
+    def nodes(self) -> list[str]:
+        """Entity names indexed by node id."""
+        return list(self._node_ids)
+
+    def add_triples(self, rows: Iterable[Sequence[Any]]) -> None:
+        """Adds `(subject, object, weight, triple_id)` rows."""
+        rows = rows if isinstance(rows, list) else list(rows)
+        if not rows:
+            return
+        np = self.np
+        node_ids = self._node_ids
+        intern = node_ids.setdefault
+        subjects = [intern(row[0], len(node_ids)) for row in rows]
+        objects = [intern(row[1], len(node_ids)) for row in rows]
+        self._batches.append(
+            (
+                np.array(subjects, dtype=np.int32),
+                np.array(objects, dtype=np.int32),
+                np.array([row[2] for row in rows], dtype=np.float64),
+                np.array(
+                    [-1 if row[3] is None else row[3] for row in rows],
+                    dtype=np.int64,
+                ),
+            )
+        )
+        self._edges = None
+        self._triple_index = None
+
+    @property
+    def edges(self) -> tuple[Any, Any, Any, Any]:
+        """Subject ids, object ids, weights and triple ids of every triple."""
+        if self._edges is None:
+            np = self.np
+            if self._batches:
+                self._edges = tuple(  # type: ignore[assignment]
+                    np.concatenate(columns) for columns in zip(*self._batches)
+                )
+            else:
+                self._edges = (
+                    np.empty(0, dtype=np.int32),
+                    np.empty(0, dtype=np.int32),
+                    np.empty(0, dtype=np.float64),
+                    np.empty(0, dtype=np.int64),
+                )
+            self._batches = [self._edges]  # type: ignore[list-item]
+        return self._edges  # type: ignore[return-value]
+
+    def leiden_edges(self) -> tuple[Any, Any, Any]:
+        """
+        Undirected edges to cluster, as source ids, target ids and weights.
+
+        Repeated triples between the same pair of entities collapse into one
+        edge carrying the weight of the last triple, as `networkx.Graph`
+        would, and self loops are dropped like graspologic does for edge
+        lists.
+        """
+        np = self.np
+        subjects, objects, weights, _ = self.edges
+        low = np.minimum(subjects, objects).astype(np.int64)
+        high = np.maximum(subjects, objects).astype(np.int64)
+        keep = np.flatnonzero(low != high)
+        keys = low[keep] * max(self.num_nodes, 1) + high[keep]
+        _, last_in_reversed = np.unique(keys[::-1], return_index=True)
+        last = np.sort(len(keys) - 1 - last_in_reversed)
+        selected = keep[last]
+        return (
+            subjects[selected],
+            objects[selected],
+            weights[selected],
+        )
+
+    def triple_ids(self, node_id: int) -> list[int]:
+        """Ids of the triples an entity appears in, in insertion order."""
+        offsets, triple_ids = self._get_triple_index()
+        return triple_ids[offsets[node_id] : offsets[node_id + 1]].tolist()
+
+    def _get_triple_index(self) -> tuple[Any, Any]:
+        if self._triple_index is None:
+            np = self.np
+            subjects, objects, _, triple_ids = self.edges
+            # Interleaved so each entity lists its triples in insertion
+            # order, subject occurrence before object occurrence
+            nodes = np.column_stack((subjects, objects)).ravel()
+            ids = np.repeat(triple_ids, 2)
+            valid = ids >= 0
+            nodes, ids = nodes[valid], ids[valid]
+            order = np.argsort(nodes, kind="stable")
+            offsets = np.zeros(self.num_nodes + 1, dtype=np.int64)
+            np.cumsum(
+                np.bincount(nodes, minlength=self.num_nodes), out=offsets[1:]
+            )
+            self._triple_index = (offsets, ids[order])
+        return self._triple_index
+
+    def node_id(self, name: str) -> Optional[int]:
+        return self._node_ids.get(name)
+
+    def community_info_records(
+        self, clusters: LeidenClusters, cluster_offset: int = 0
+    ) -> Iterator[tuple]:
+        """
+        Yields `community_info` rows, without the collection id, for the
+        clustering result; cluster ids are shifted by `cluster_offset`.
+        """
+        nodes = self.nodes
+        for node, cluster, parent, level, is_final in zip(
+            clusters.node.tolist(),
+            clusters.cluster.tolist(),
+            clusters.parent_cluster.tolist(),
+            clusters.level.tolist(),
+            clusters.is_final_cluster.tolist(),
+        ):
+            yield (
+                nodes[node],
+                cluster + cluster_offset,
+                parent + cluster_offset if parent >= 0 else None,
+                level,
+                is_final,
+                self.triple_ids(node),
+            )
+
+    async def cluster(
+        self,
+        leiden_params: dict[str, Any],
+        use_process: Optional[bool] = None,
+    ) -> LeidenClusters:
+        """
+        Runs hierarchical Leiden over the graph, off the event loop.
+
+        The work is CPU bound and can take minutes on large collections, so
+        graphs of `PROCESS_MIN_EDGES` or more edges are clustered in a
+        freshly spawned worker process, which also hands the memory of the
+        native graph back to the OS once done. Smaller graphs run on a
+        thread; the native Leiden implementation releases the GIL.
+        """
+        sources, targets, weights = self.leiden_edges()
+        params = _native_leiden_params(leiden_params, self._node_ids)
+        if not len(sources):
+            return _empty_clusters(self.np)
+
+        start_time = time.time()
+        logger.info(
+            f"Running Leiden clustering on {self.num_nodes} nodes and {len(sources)} edges with params: {leiden_params}"
+        )
+        if use_process is None:
+            use_process = len(sources) >= PROCESS_MIN_EDGES
+        if not use_process:
+            clusters = await asyncio.to_thread(
+                run_hierarchical_leiden, sources, targets, weights, params
+            )
+        else:
+            with ProcessPoolExecutor(
+                max_workers=1, mp_context=multiprocessing.get_context("spawn")
+            ) as executor:
+                clusters = await asyncio.get_running_loop().run_in_executor(
+                    executor,
+                    run_hierarchical_leiden,
+                    sources,
+                    targets,
+                    weights,
+                    params,
+                )
+        logger.info(
+            f"Leiden clustering completed in {time.time() - start_time:.2f} seconds."
+        )
+        return clusters
+
+
+def _native_leiden_params(
+    leiden_params: dict[str, Any], node_ids: dict[str, int]
+) -> dict[str, Any]:
+    params = {"random_seed": DEFAULT_LEIDEN_SEED, **leiden_params}
+    native: dict[str, Any] = {}
+    for key, value in params.items():
+        if key in _GRAPH_INPUT_PARAMS:
+            continue
+        elif key == "random_seed":
+            native["seed"] = value
+        elif key == "extra_forced_iterations":
+            native["iterations"] = value + 1
+        elif key == "starting_communities":
+            native[key] = (
+                {
+                    str(node_ids[node]): community
+                    for node, community in value.items()
+                    if node in node_ids
+                }
+                if value
+                else None
+            )
+        elif key in {
+            "max_cluster_size",
+            "resolution",
+            "randomness",
+            "use_modularity",
+        }:
+            native[key] = value
+        else:
+            raise ValueError(f"Unknown Leiden parameter: {key}")
+    return native
+
+
+def _empty_clusters(np) -> LeidenClusters:
+    return LeidenClusters(
+        node=np.empty(0, dtype=np.int32),
+        cluster=np.empty(0, dtype=np.int32),
+        parent_cluster=np.empty(0, dtype=np.int32),
+        level=np.empty(0, dtype=np.int32),
+        is_final_cluster=np.empty(0, dtype=bool),
+    )
+
+
+def run_hierarchical_leiden(
+    sources: Any, targets: Any, weights: Any, params: dict[str, Any]
+) -> LeidenClusters:
+    """Clusters an edge list of node ids; runs inside the worker process."""
+    try:
+        import graspologic_native as gn
+    except ImportError as e:
+        raise ImportError("Please install the graspologic package.") from e
+    np = _import_numpy()
+
+    node_count = int(max(sources.max(), targets.max())) + 1
+    # The native library takes string node names; sharing one string per
+    # node keeps the edge list at a tuple and a float per edge
+    names = [str(i) for i in range(node_count)]
+    edges = list(
+        zip(
+            map(names.__getitem__, sources.tolist()),
+            map(names.__getitem__, targets.tolist()),
+            weights.tolist(),
+        )
+    )
+    del names
+    native_clusters = gn.hierarchical_leiden(edges=edges, **params)
+    del edges
+
+    count = len(native_clusters)
+    clusters = LeidenClusters(
+        node=np.fromiter(
+            (int(c.node) for c in native_clusters), np.int32, count
+        ),
+        cluster=np.fromiter(
+            (c.cluster for c in native_clusters), np.int32, count
+        ),
+        parent_cluster=np.fromiter(
+            (
+                -1 if c.parent_cluster is None else c.parent_cluster
+                for c in native_clusters
+            ),
+            np.int32,
+            count,
+        ),
+        level=np.fromiter((c.level for c in native_clusters), np.int32, count),
+        is_final_cluster=np.fromiter(
+            (c.is_final_cluster for c in native_clusters), bool, count
+        ),
+    )
+    return clusters
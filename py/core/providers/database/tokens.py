@@ -51,6 +51,17 @@ class PostgresTokenHandler(TokenHandler):
         result = await self.connection_manager.fetchrow_query(query, [token])
         return bool(result)
 
+    async def get_blacklisted_tokens(
+        self, since: Optional[datetime] = None
+    ) -> list[tuple[str, datetime]]:
+        query = f"""
+        SELECT token, blacklisted_at
+        FROM {self._get_table_name(PostgresTokenHandler.TABLE_NAME)}
+        WHERE $1::TIMESTAMPTZ IS NULL OR blacklisted_at >= $1
+        """
+        results = await self.connection_manager.fetch_query(query, [since])
+        return [(row["token"], row["blacklisted_at"]) for row in results]
+
     async def clean_expired_blacklisted_tokens(
         self,
         max_age_hours: int = 7 * 24,
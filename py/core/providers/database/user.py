@@ -142,7 +142,7 @@ class PostgresUserHandler(UserHandler):
             if e.status_code != 404:
                 raise e
 
-        hashed_password = self.crypto_provider.get_password_hash(password)  # type: ignore
+        hashed_password = await self.crypto_provider.async_get_password_hash(password)  # type: ignore
         query = f"""
             INSERT INTO {self._get_table_name(PostgresUserHandler.TABLE_NAME)}
             (email, user_id, hashed_password, collection_ids)
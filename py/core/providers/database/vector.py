@@ -1,14 +1,19 @@
-import copy
+import asyncio
+import hashlib
 import json
 import logging
+import math
+import re
 import time
 import uuid
+from collections import Counter
 from typing import Any, Optional, Tuple, TypedDict, Union
 from uuid import UUID
 
 import numpy as np
 
 from core.base import (
+    HybridSearchExecutionMode,
     IndexArgsHNSW,
     IndexArgsIVFFlat,
     IndexMeasure,
@@ -17,6 +22,7 @@ from core.base import (
     VectorEntry,
     VectorHandler,
     VectorQuantizationType,
+    VectorSearchPlan,
     VectorSearchResult,
     VectorTableName,
 )
@@ -37,6 +43,19 @@ def psql_quote_literal(value: str) -> str:
     return "'" + value.replace("'", "''") + "'"
 
 
+def metadata_number_expression(key: str) -> str:
+    """
+    The typed expression numeric metadata filters compare, NULL where the
+    value is not a number. Expression indices are built on the same
+    expression so the planner can match the filters to them.
+    """
+    literal = psql_quote_literal(key)
+    return (
+        f"(CASE WHEN jsonb_typeof(metadata->{literal}) = 'number' "
+        f"THEN (metadata->>{literal})::float END)"
+    )
+
+
 def index_measure_to_ops(
     measure: IndexMeasure,
     quantization_type: VectorQuantizationType = VectorQuantizationType.FP32,
@@ -44,11 +63,225 @@ def index_measure_to_ops(
     return _decorate_vector_type(measure.ops, quantization_type)
 
 
+def validate_index_method(
+    index_method: IndexMethod,
+    index_arguments: Optional[Union[IndexArgsIVFFlat, IndexArgsHNSW]],
+) -> IndexMethod:
+    """
+    Checks the index method against its build arguments and resolves
+    `IndexMethod.auto` to the method to build.
+
+    Raises:
+        ArgError: If the method is unknown or the arguments belong to another method.
+    """
+    if index_method not in (
+        IndexMethod.ivfflat,
+        IndexMethod.hnsw,
+        IndexMethod.auto,
+    ):
+        raise ArgError("invalid index method")
+
+    if index_arguments:
+        # Disallow case where user submits index arguments but uses the
+        # IndexMethod.auto index (index build arguments should only be
+        # used with a specific index)
+        if index_method == IndexMethod.auto:
+            raise ArgError(
+                "Index build parameters are not allowed when using the IndexMethod.auto index."
+            )
+        # Disallow case where user specifies one index type but submits
+        # index build arguments for the other index type
+        if (
+            isinstance(index_arguments, IndexArgsHNSW)
+            and index_method != IndexMethod.hnsw
+        ) or (
+            isinstance(index_arguments, IndexArgsIVFFlat)
+            and index_method != IndexMethod.ivfflat
+        ):
+            raise ArgError(
+                f"{index_arguments.__class__.__name__} build parameters were supplied but {index_method} index was specified."
+            )
+
+    if index_method == IndexMethod.auto:
+        index_method = IndexMethod.hnsw
+
+    return index_method
+
+
+def get_index_options(
+    method: IndexMethod,
+    index_arguments: Optional[Union[IndexArgsIVFFlat, IndexArgsHNSW]],
+) -> str:
+    if method == IndexMethod.ivfflat:
+        if isinstance(index_arguments, IndexArgsIVFFlat):
+            return f"WITH (lists={index_arguments.n_lists})"
+        else:
+            # Default value if no arguments provided
+            return "WITH (lists=100)"
+    elif method == IndexMethod.hnsw:
+        if isinstance(index_arguments, IndexArgsHNSW):
+            return f"WITH (m={index_arguments.m}, ef_construction={index_arguments.ef_construction})"
+        else:
+            # Default values if no arguments provided
+            return "WITH (m=16, ef_construction=64)"
+    else:
+        return ""  # No options for other methods
+
+
+async def execute_index_ddl(
+    connection_manager: PostgresConnectionManager,
+    query: str,
+    concurrently: bool,
+) -> None:
+    """
+    Runs a CREATE INDEX or DROP INDEX statement. CONCURRENTLY statements
+    cannot run inside a transaction block, so they get a connection of
+    their own instead of the managed transaction.
+    """
+    if concurrently:
+        async with (
+            connection_manager.pool.get_connection() as conn  # type: ignore
+        ):
+            # Disable automatic transaction management
+            await conn.execute(
+                "SET SESSION CHARACTERISTICS AS TRANSACTION ISOLATION LEVEL READ COMMITTED"
+            )
+            await conn.execute(query)
+    else:
+        await connection_manager.execute_query(query)
+
+
+async def create_vector_index(
+    connection_manager: PostgresConnectionManager,
+    table_name_str: str,
+    col_name: str,
+    ops: str,
+    index_method: IndexMethod,
+    index_arguments: Optional[Union[IndexArgsIVFFlat, IndexArgsHNSW]],
+    index_name: Optional[str],
+    concurrently: bool,
+    predicate: Optional[str] = None,
+) -> str:
+    """
+    Builds a validated vector index on `col_name` and returns its name. A
+    `predicate` makes it a partial index over the rows matching it.
+    """
+    index_method = validate_index_method(index_method, index_arguments)
+
+    concurrently_sql = "CONCURRENTLY" if concurrently else ""
+
+    index_name = (
+        index_name
+        or f"ix_{ops}_{index_method}__{col_name}_{time.strftime('%Y%m%d%H%M%S')}"
+    )
+
+    create_index_sql = f"""
+    CREATE INDEX {concurrently_sql} {index_name}
+    ON {table_name_str}
+    USING {index_method} ({col_name} {ops}) {get_index_options(index_method, index_arguments)}
+    {f"WHERE {predicate}" if predicate else ""};
+    """
+
+    try:
+        await execute_index_ddl(
+            connection_manager, create_index_sql, concurrently
+        )
+    except Exception as e:
+        raise Exception(f"Failed to create index: {e}")
+    return index_name
+
+
+async def list_vector_indices(
+    connection_manager: PostgresConnectionManager,
+    table_name_str: str,
+    col_name: str,
+) -> list[dict[str, Any]]:
+    """Lists the indices on `col_name` of a schema qualified table."""
+    query = """
+    SELECT
+        i.indexname as name,
+        i.indexdef as definition,
+        am.amname as method,
+        pg_relation_size(c.oid) as size_in_bytes,
+        COALESCE(psat.idx_scan, 0) as number_of_scans,
+        COALESCE(psat.idx_tup_read, 0) as tuples_read,
+        COALESCE(psat.idx_tup_fetch, 0) as tuples_fetched
+    FROM pg_indexes i
+    JOIN pg_class c ON c.relname = i.indexname
+    JOIN pg_am am ON c.relam = am.oid
+    LEFT JOIN pg_stat_user_indexes psat ON psat.indexrelname = i.indexname
+        AND psat.schemaname = i.schemaname
+    WHERE i.schemaname || '.' || i.tablename = $1
+    AND i.indexdef LIKE $2;
+    """
+
+    results = await connection_manager.fetch_query(
+        query, (table_name_str, f"%({col_name}%")
+    )
+
+    return [
+        {
+            "name": result["name"],
+            "definition": result["definition"],
+            "method": result["method"],
+            "size_in_bytes": result["size_in_bytes"],
+            "number_of_scans": result["number_of_scans"],
+            "tuples_read": result["tuples_read"],
+            "tuples_fetched": result["tuples_fetched"],
+        }
+        for result in results
+    ]
+
+
+async def drop_vector_index(
+    connection_manager: PostgresConnectionManager,
+    index_name: str,
+    table_name_str: str,
+    col_name: str,
+    concurrently: bool,
+) -> None:
+    """
+    Drops an index on `col_name` of a schema qualified table.
+
+    Raises:
+        ArgError: If the table has no such index on the column.
+    """
+    # Extract schema and base table name
+    schema_name, base_table_name = table_name_str.split(".")
+
+    # Verify index exists and is a vector index
+    query = """
+    SELECT indexdef
+    FROM pg_indexes
+    WHERE indexname = $1
+    AND schemaname = $2
+    AND tablename = $3
+    AND indexdef LIKE $4
+    """
+
+    result = await connection_manager.fetchrow_query(
+        query, (index_name, schema_name, base_table_name, f"%({col_name}%")
+    )
+
+    if not result:
+        raise ArgError(
+            f"Vector index '{index_name}' does not exist on table {table_name_str}"
+        )
+
+    concurrently_sql = "CONCURRENTLY" if concurrently else ""
+    drop_query = f"DROP INDEX {concurrently_sql} {schema_name}.{index_name}"
+
+    try:
+        await execute_index_ddl(connection_manager, drop_query, concurrently)
+    except Exception as e:
+        raise Exception(f"Failed to delete index: {e}")
+
+
 def quantize_vector_to_binary(
     vector: Union[list[float], np.ndarray], threshold: float = 0.0
-) -> bytes:
+) -> np.ndarray:
     """
-    Quantizes a float vector to a binary vector string for PostgreSQL bit type.
+    Quantizes a float vector to a binary vector for PostgreSQL bit type.
     Used when quantization_type is INT1.
 
     Args:
@@ -56,19 +289,14 @@ def quantize_vector_to_binary(
         threshold (float, optional): Threshold for binarization. Defaults to 0.0.
 
     Returns:
-        str: Binary string representation for PostgreSQL bit type
+        np.ndarray: Boolean array, encoded by the binary `bit` codec
     """
     # Convert input to numpy array if it isn't already
     if not isinstance(vector, np.ndarray):
-        vector = np.array(vector)
+        vector = np.asarray(vector, dtype=np.float32)
 
-    # Convert to binary (1 where value > threshold, 0 otherwise)
-    binary_vector = (vector > threshold).astype(int)
-
-    # Convert to string of 1s and 0s
-    # Convert to string of 1s and 0s, then to bytes
-    binary_string = "".join(map(str, binary_vector))
-    return binary_string.encode("ascii")
+    # 1 where value > threshold, 0 otherwise
+    return vector > threshold
 
 
 class HybridSearchIntermediateResult(TypedDict):
@@ -88,6 +316,16 @@ class PostgresVectorHandler(VectorHandler):
         "collection_ids",
     ]
 
+    # seconds the search planner trusts its statistics for
+    PLAN_STATS_TTL = 60.0
+    # pgvector's upper bound on hnsw.ef_search, an hnsw scan returns no more
+    MAX_EF_SEARCH = 1000
+    COLLECTION_INDEX_PREFIX = "ix_vectors_collection_"
+    FILTER_INDEX_PREFIX = "ix_vectors_metadata_"
+    # metadata keys whose numeric filters are counted, filter keys come from
+    # clients so the least used are evicted past this
+    MAX_TRACKED_FILTER_KEYS = 1_000
+
     def __init__(
         self,
         project_name: str,
@@ -100,6 +338,15 @@ class PostgresVectorHandler(VectorHandler):
         self.dimension = dimension
         self.quantization_type = quantization_type
         self.enable_fts = enable_fts
+        # table size and vector indices, see `_get_plan_stats`
+        self._plan_stats: Optional[dict[str, Any]] = None
+        self._plan_stats_expiry = 0.0
+        # (expiry, rows) per ("user_id" | "collection_ids", id)
+        self._filter_row_counts: dict[Tuple[str, str], Tuple[float, int]] = {}
+        # containment filters compiled, all served by one GIN index
+        self._containment_filter_usage = 0
+        # numeric filters compiled per metadata key
+        self._number_filter_usage: Counter[str] = Counter()
 
     async def create_tables(self):
         # Check for old table name first
@@ -179,7 +426,7 @@ class PostgresVectorHandler(VectorHandler):
                     entry.document_id,
                     entry.user_id,
                     entry.collection_ids,
-                    str(entry.vector.data),
+                    entry.vector.data,
                     quantize_vector_to_binary(
                         entry.vector.data
                     ),  # Convert to binary
@@ -209,7 +456,7 @@ class PostgresVectorHandler(VectorHandler):
                     entry.document_id,
                     entry.user_id,
                     entry.collection_ids,
-                    str(entry.vector.data),
+                    entry.vector.data,
                     entry.text,
                     json.dumps(entry.metadata),
                 ),
@@ -241,7 +488,7 @@ class PostgresVectorHandler(VectorHandler):
                     entry.document_id,
                     entry.user_id,
                     entry.collection_ids,
-                    str(entry.vector.data),
+                    entry.vector.data,
                     quantize_vector_to_binary(
                         entry.vector.data
                     ),  # Convert to binary
@@ -272,7 +519,7 @@ class PostgresVectorHandler(VectorHandler):
                     entry.document_id,
                     entry.user_id,
                     entry.collection_ids,
-                    str(entry.vector.data),
+                    entry.vector.data,
                     entry.text,
                     json.dumps(entry.metadata),
                 )
@@ -281,6 +528,96 @@ class PostgresVectorHandler(VectorHandler):
 
             await self.connection_manager.execute_many(query, params)
 
+    async def bulk_upsert_entries(self, entries: list[VectorEntry]) -> None:
+        """
+        Bulk upsert for large loads. Rows are streamed with binary `COPY` into a
+        transaction-scoped temporary (and therefore unlogged) staging table,
+        then merged into the vectors table with a single set-based
+        `INSERT ... SELECT ... ON CONFLICT`.
+        """
+        if not entries:
+            return
+
+        # A single statement cannot update the same row twice, so keep the
+        # last entry for each extraction id, matching `upsert_entries`.
+        unique_entries = {entry.extraction_id: entry for entry in entries}
+
+        columns = [
+            "extraction_id",
+            "document_id",
+            "user_id",
+            "collection_ids",
+            "vec",
+        ]
+        column_types = [
+            "UUID",
+            "UUID",
+            "UUID",
+            "UUID[]",
+            f"vector({self.dimension})",
+        ]
+        if self.quantization_type == VectorQuantizationType.INT1:
+            columns.append("vec_binary")
+            column_types.append(f"bit({self.dimension})")
+        columns.extend(["text", "metadata"])
+        column_types.extend(["TEXT", "JSONB"])
+
+        if self.quantization_type == VectorQuantizationType.INT1:
+            records = (
+                (
+                    entry.extraction_id,
+                    entry.document_id,
+                    entry.user_id,
+                    entry.collection_ids,
+                    entry.vector.data,
+                    quantize_vector_to_binary(entry.vector.data),
+                    entry.text,
+                    json.dumps(entry.metadata),
+                )
+                for entry in unique_entries.values()
+            )
+        else:
+            records = (
+                (
+                    entry.extraction_id,
+                    entry.document_id,
+                    entry.user_id,
+                    entry.collection_ids,
+                    entry.vector.data,
+                    entry.text,
+                    json.dumps(entry.metadata),
+                )
+                for entry in unique_entries.values()
+            )
+
+        staging_table = "vectors_bulk_staging"
+        column_list = ", ".join(columns)
+        update_list = ",\n".join(
+            f"{column} = EXCLUDED.{column}"
+            for column in columns
+            if column != "extraction_id"
+        )
+        create_staging_sql = f"""
+        CREATE TEMP TABLE {staging_table} (
+            {", ".join(f"{c} {t}" for c, t in zip(columns, column_types))}
+        ) ON COMMIT DROP;
+        """
+        merge_sql = f"""
+        INSERT INTO {self._get_table_name(PostgresVectorHandler.TABLE_NAME)}
+        ({column_list})
+        SELECT {column_list} FROM {staging_table}
+        ON CONFLICT (extraction_id) DO UPDATE SET
+        {update_list};
+        """
+
+        async with self.connection_manager.pool.get_connection() as conn:  # type: ignore
+            async with conn.transaction():
+                await conn.execute(create_staging_sql)
+                await conn.copy_records_to_table(
+                    staging_table, records=records, columns=columns
+                )
+                await conn.execute(merge_sql)
+
     async def semantic_search(
         self, query_vector: list[float], search_settings: SearchSettings
     ) -> list[VectorSearchResult]:
@@ -298,7 +635,8 @@ class PostgresVectorHandler(VectorHandler):
             f"{table_name}.text",
         ]
 
-        params: list[Union[str, int, bytes]] = []
+        params: list[Any] = []
+        search_plan: Optional[VectorSearchPlan]
         # For binary vectors (INT1), implement two-stage search
         if self.quantization_type == VectorQuantizationType.INT1:
             # Convert query vector to binary format
@@ -367,44 +705,18 @@ class PostgresVectorHandler(VectorHandler):
                     extended_limit,  # First stage limit
                     search_settings.offset,
                     search_settings.search_limit,  # Final limit
-                    str(query_vector),  # For re-ranking
+                    query_vector,  # For re-ranking
                 ]
             )
 
-        else:
-            # Standard float vector handling - unchanged from original
-            distance_calc = f"{table_name}.vec {search_settings.index_measure.pgvector_repr} $1::vector({self.dimension})"
-            query_param = str(query_vector)
-
-            if search_settings.include_values:
-                cols.append(f"({distance_calc}) AS distance")
-            if search_settings.include_metadatas:
-                cols.append(f"{table_name}.metadata")
-
-            select_clause = ", ".join(cols)
-            where_clause = ""
-            params.append(query_param)
+            results = await self.connection_manager.fetch_query(query, params)
+            search_plan = None
 
-            if search_settings.filters:
-                where_clause = self._build_filters(
-                    search_settings.filters, params
-                )
-                where_clause = f"WHERE {where_clause}"
-
-            query = f"""
-            SELECT {select_clause}
-            FROM {table_name}
-            {where_clause}
-            ORDER BY {distance_calc}
-            LIMIT ${len(params) + 1}
-            OFFSET ${len(params) + 2}
-            """
-            params.extend(
-                [search_settings.search_limit, search_settings.offset]
+        else:
+            results, search_plan = await self._planned_semantic_search(
+                query_vector, search_settings
             )
 
-        results = await self.connection_manager.fetch_query(query, params)
-
         return [
             VectorSearchResult(
                 extraction_id=UUID(str(result["extraction_id"])),
@@ -422,10 +734,442 @@ class PostgresVectorHandler(VectorHandler):
                     if search_settings.include_metadatas
                     else {}
                 ),
+                search_plan=search_plan,
             )
             for result in results
         ]
 
+    async def _planned_semantic_search(
+        self, query_vector: list[float], search_settings: SearchSettings
+    ) -> Tuple[list, VectorSearchPlan]:
+        """
+        Runs a float vector search with the plan that suits its filters.
+
+        An ANN index scan applies the filters to the nearest candidates it
+        returns, so a selective filter leaves fewer than `search_limit` rows.
+        The candidates are over-fetched by the estimated selectivity and, if
+        that falls short, fetched again with four times as many until
+        `max_candidates`, after which the filtered rows are scanned exactly.
+        """
+        plan_settings = search_settings.search_plan_settings
+        plan, selectivity, collection_id = await self._plan_semantic_search(
+            search_settings
+        )
+
+        if plan == VectorSearchPlan.EXACT:
+            return (
+                await self._exact_semantic_search(
+                    query_vector, search_settings
+                ),
+                plan,
+            )
+
+        needed = search_settings.search_limit + search_settings.offset
+        candidates = min(
+            plan_settings.max_candidates,
+            max(
+                needed,
+                math.ceil(
+                    needed * plan_settings.overfetch_factor / selectivity
+                ),
+            ),
+        )
+        while True:
+            results = await self._ann_semantic_search(
+                query_vector, search_settings, candidates, collection_id
+            )
+            if (
+                len(results) >= search_settings.search_limit
+                or not search_settings.filters
+                or candidates >= plan_settings.max_candidates
+            ):
+                break
+            candidates = min(plan_settings.max_candidates, candidates * 4)
+
+        if len(results) < search_settings.search_limit and (
+            search_settings.filters
+        ):
+            logger.info(
+                f"{plan} search matched {len(results)} of {candidates} candidates, scanning the filtered rows exactly"
+            )
+            return (
+                await self._exact_semantic_search(
+                    query_vector, search_settings
+                ),
+                VectorSearchPlan.EXACT,
+            )
+        return results, plan
+
+    async def _plan_semantic_search(
+        self, search_settings: SearchSettings
+    ) -> Tuple[VectorSearchPlan, float, Optional[str]]:
+        """
+        Picks the plan of a float vector search and estimates the fraction
+        of the scanned index that matches its filters.
+
+        Returns:
+            The plan, the selectivity and, for a partial index plan, the
+            collection of the partial index.
+        """
+        plan_settings = search_settings.search_plan_settings
+        plan = plan_settings.plan
+        if plan == VectorSearchPlan.EXACT:
+            return plan, 1.0, None
+
+        ops = index_measure_to_ops(search_settings.index_measure)
+        stats = await self._get_plan_stats()
+        has_index = any(
+            f"(vec {ops})" in definition for definition in stats["indices"]
+        )
+        collection_id = self._filter_collection(search_settings.filters)
+        has_partial_index = collection_id is not None and any(
+            f"(vec {ops})" in definition
+            for definition in stats["collection_indices"].get(
+                collection_id, []
+            )
+        )
+
+        rows = max(stats["rows"], 1)
+        if not search_settings.filters:
+            estimated_rows = rows
+        else:
+            counts = await self._get_filter_row_counts(
+                search_settings.filters,
+                plan_settings.exact_scan_threshold * 10,
+            )
+            estimated_rows = min(
+                rows,
+                self._estimate_filtered_rows(
+                    search_settings.filters, counts, rows
+                ),
+            )
+
+        if plan == VectorSearchPlan.AUTO:
+            if (
+                not has_index and not has_partial_index
+            ) or estimated_rows <= plan_settings.exact_scan_threshold:
+                return VectorSearchPlan.EXACT, 1.0, None
+            plan = (
+                VectorSearchPlan.PARTIAL_INDEX
+                if has_partial_index
+                else VectorSearchPlan.HNSW
+            )
+
+        if plan == VectorSearchPlan.PARTIAL_INDEX and has_partial_index:
+            collection_rows = self._filter_row_counts.get(
+                ("collection_ids", collection_id), (0.0, rows)  # type: ignore
+            )[1]
+            return (
+                plan,
+                min(1.0, max(estimated_rows, 1) / max(collection_rows, 1)),
+                collection_id,
+            )
+        return (
+            VectorSearchPlan.HNSW,
+            min(1.0, max(estimated_rows, 1) / rows),
+            None,
+        )
+
+    def _semantic_search_columns(
+        self, search_settings: SearchSettings, distance: str
+    ) -> str:
+        cols = [
+            "extraction_id",
+            "document_id",
+            "user_id",
+            "collection_ids",
+            "text",
+        ]
+        if search_settings.include_values:
+            cols.append(f"{distance} AS distance")
+        if search_settings.include_metadatas:
+            cols.append("metadata")
+        return ", ".join(cols)
+
+    async def _exact_semantic_search(
+        self, query_vector: list[float], search_settings: SearchSettings
+    ) -> list:
+        table_name = self._get_table_name(PostgresVectorHandler.TABLE_NAME)
+        distance_calc = f"(vec {search_settings.index_measure.pgvector_repr} $1::vector({self.dimension}))"
+        params: list[Any] = [query_vector]
+
+        where_clause = ""
+        if search_settings.filters:
+            where_clause = (
+                f"WHERE {self._build_filters(search_settings.filters, params)}"
+            )
+
+        query = f"""
+        SELECT {self._semantic_search_columns(search_settings, distance_calc)}
+        FROM {table_name}
+        {where_clause}
+        ORDER BY {distance_calc}
+        LIMIT ${len(params) + 1}
+        OFFSET ${len(params) + 2}
+        """
+        params.extend([search_settings.search_limit, search_settings.offset])
+
+        # ANN indices only serve index scans, the filters keep the bitmap
+        # scans of the user and collection indices
+        return await self._fetch_with_settings(
+            query, params, ["enable_indexscan = off"]
+        )
+
+    async def _ann_semantic_search(
+        self,
+        query_vector: list[float],
+        search_settings: SearchSettings,
+        candidates: int,
+        collection_id: Optional[str] = None,
+    ) -> list:
+        table_name = self._get_table_name(PostgresVectorHandler.TABLE_NAME)
+        distance_calc = f"(vec {search_settings.index_measure.pgvector_repr} $1::vector({self.dimension}))"
+        params: list[Any] = [query_vector]
+
+        # the partial index is only used when its predicate is repeated
+        partial_clause = (
+            f"WHERE {self._collection_index_predicate(collection_id)}"
+            if collection_id
+            else ""
+        )
+        where_clause = ""
+        if search_settings.filters:
+            where_clause = (
+                f"WHERE {self._build_filters(search_settings.filters, params)}"
+            )
+
+        query = f"""
+        WITH candidates AS (
+            SELECT extraction_id, document_id, user_id, collection_ids, text, metadata,
+                {distance_calc} AS distance
+            FROM {table_name}
+            {partial_clause}
+            ORDER BY {distance_calc}
+            LIMIT ${len(params) + 1}
+        )
+        SELECT {self._semantic_search_columns(search_settings, "distance")}
+        FROM candidates
+        {where_clause}
+        ORDER BY distance
+        LIMIT ${len(params) + 2}
+        OFFSET ${len(params) + 3}
+        """
+        params.extend(
+            [candidates, search_settings.search_limit, search_settings.offset]
+        )
+
+        ef_search = min(
+            self.MAX_EF_SEARCH, max(search_settings.ef_search, candidates)
+        )
+        return await self._fetch_with_settings(
+            query,
+            params,
+            [
+                f"hnsw.ef_search = {int(ef_search)}",
+                f"ivfflat.probes = {int(search_settings.probes)}",
+            ],
+        )
+
+    async def _fetch_with_settings(
+        self, query: str, params: list[Any], settings: list[str]
+    ) -> list:
+        async with self.connection_manager.pool.get_connection() as conn:  # type: ignore
+            async with conn.transaction():
+                for setting in settings:
+                    await conn.execute(f"SET LOCAL {setting}")
+                return await conn.fetch(query, *params)
+
+    async def _get_plan_stats(self) -> dict[str, Any]:
+        """
+        Estimated rows of the vectors table and the definitions of its ANN
+        indices, split into full and per collection partial indices.
+        """
+        if self._plan_stats and time.monotonic() < self._plan_stats_expiry:
+            return self._plan_stats
+
+        query = """
+        SELECT c.reltuples::bigint AS rows, i.indexname, i.indexdef
+        FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        LEFT JOIN pg_indexes i
+            ON i.schemaname = n.nspname AND i.tablename = c.relname
+            AND (i.indexdef LIKE '%USING hnsw%' OR i.indexdef LIKE '%USING ivfflat%')
+        WHERE n.nspname = $1 AND c.relname = $2
+        """
+        records = await self.connection_manager.fetch_query(
+            query, (self.project_name, str(PostgresVectorHandler.TABLE_NAME))
+        )
+        rows = records[0]["rows"] if records else 0
+        if rows < 0:
+            # never analyzed
+            rows = await self.connection_manager.fetchrow_query(
+                f"SELECT count(*) AS rows FROM {self._get_table_name(PostgresVectorHandler.TABLE_NAME)}"
+            )
+            rows = rows["rows"]
+
+        indices: list[str] = []
+        collection_indices: dict[str, list[str]] = {}
+        prefix = self.COLLECTION_INDEX_PREFIX
+        for record in records:
+            if not record["indexname"]:
+                continue
+            if record["indexname"].startswith(prefix):
+                collection_id = str(UUID(record["indexname"][len(prefix) :]))
+                collection_indices.setdefault(collection_id, []).append(
+                    record["indexdef"]
+                )
+            elif " WHERE " not in record["indexdef"]:
+                indices.append(record["indexdef"])
+
+        self._plan_stats = {
+            "rows": rows,
+            "indices": indices,
+            "collection_indices": collection_indices,
+        }
+        self._plan_stats_expiry = time.monotonic() + self.PLAN_STATS_TTL
+        return self._plan_stats
+
+    async def _get_filter_row_counts(
+        self, filters: dict, limit: int
+    ) -> dict[Tuple[str, str], int]:
+        """
+        Rows of every user and collection the filters name, counted up to
+        `limit` through the user and collection indices.
+        """
+        now = time.monotonic()
+        keys = self._filter_keys(filters)
+        missing: dict[str, list[str]] = {"user_id": [], "collection_ids": []}
+        for key in keys:
+            cached = self._filter_row_counts.get(key)
+            if not cached or cached[0] < now:
+                missing[key[0]].append(key[1])
+
+        if missing["user_id"] or missing["collection_ids"]:
+            table_name = self._get_table_name(PostgresVectorHandler.TABLE_NAME)
+            query = f"""
+            SELECT 'user_id' AS key, id, (
+                SELECT count(*) FROM (
+                    SELECT 1 FROM {table_name} WHERE user_id = id LIMIT $3
+                ) s
+            ) AS rows
+            FROM unnest($1::uuid[]) AS id
+            UNION ALL
+            SELECT 'collection_ids' AS key, id, (
+                SELECT count(*) FROM (
+                    SELECT 1 FROM {table_name} WHERE collection_ids && ARRAY[id] LIMIT $3
+                ) s
+            ) AS rows
+            FROM unnest($2::uuid[]) AS id
+            """
+            records = await self.connection_manager.fetch_query(
+                query,
+                (missing["user_id"], missing["collection_ids"], limit),
+            )
+            if len(self._filter_row_counts) > 100_000:
+                self._filter_row_counts.clear()
+            for record in records:
+                self._filter_row_counts[(record["key"], str(record["id"]))] = (
+                    now + self.PLAN_STATS_TTL,
+                    record["rows"],
+                )
+
+        return {
+            key: self._filter_row_counts[key][1]
+            for key in keys
+            if key in self._filter_row_counts
+        }
+
+    @staticmethod
+    def _filter_ids(key: str, value: Any) -> Optional[list[str]]:
+        """
+        The users or collections a `user_id` or `collection_ids` filter
+        matches, `None` for filters that do not narrow the search to some.
+        """
+        if key == "user_id":
+            ops: Tuple[Optional[str], ...] = ("$eq", "$in", None)
+        elif key == "collection_ids":
+            ops = ("$overlap", "$contains", "$any")
+        else:
+            return None
+        op = None
+        if isinstance(value, dict):
+            if len(value) != 1:
+                return None
+            op, value = next(iter(value.items()))
+        if op not in ops:
+            return None
+        ids = value if isinstance(value, list) else [value]
+        try:
+            return [str(UUID(str(id))) for id in ids]
+        except ValueError:
+            return None
+
+    @classmethod
+    def _filter_keys(cls, filters: dict) -> set[Tuple[str, str]]:
+        keys: set[Tuple[str, str]] = set()
+        for key, value in filters.items():
+            if key in ("$and", "$or"):
+                for condition in value:
+                    keys |= cls._filter_keys(condition)
+            else:
+                keys |= {(key, id) for id in cls._filter_ids(key, value) or []}
+        return keys
+
+    @classmethod
+    def _estimate_filtered_rows(
+        cls, filters: dict, counts: dict[Tuple[str, str], int], rows: int
+    ) -> int:
+        """
+        Upper bound on the rows matching the filters: a disjunction matches
+        at most the rows of its terms, a conjunction at most those of its
+        most selective term.
+        """
+        estimates = []
+        for key, value in filters.items():
+            if key == "$and":
+                estimates.extend(
+                    cls._estimate_filtered_rows(condition, counts, rows)
+                    for condition in value
+                    if condition
+                )
+            elif key == "$or":
+                estimates.append(
+                    sum(
+                        cls._estimate_filtered_rows(condition, counts, rows)
+                        for condition in value
+                        if condition
+                    )
+                    if value
+                    else rows
+                )
+            else:
+                ids = cls._filter_ids(key, value)
+                if ids is None or not all((key, id) in counts for id in ids):
+                    estimates.append(rows)
+                elif isinstance(value, dict) and "$contains" in value:
+                    estimates.append(min(counts[(key, id)] for id in ids))
+                else:
+                    estimates.append(sum(counts[(key, id)] for id in ids))
+        return min(estimates, default=rows)
+
+    @classmethod
+    def _filter_collection(cls, filters: dict) -> Optional[str]:
+        """The collection every row matching the filters belongs to, if any."""
+        for key, value in filters.items():
+            if key == "$and":
+                for condition in value:
+                    collection_id = cls._filter_collection(condition)
+                    if collection_id:
+                        return collection_id
+            elif key == "collection_ids":
+                ids = cls._filter_ids(key, value)
+                if ids and (
+                    len(ids) == 1
+                    or (isinstance(value, dict) and "$contains" in value)
+                ):
+                    return ids[0]
+        return None
+
     async def full_text_search(
         self, query_text: str, search_settings: SearchSettings
     ) -> list[VectorSearchResult]:
@@ -505,21 +1249,57 @@ class PostgresVectorHandler(VectorHandler):
                 "The `full_text_limit` must be greater than or equal to the `search_limit`."
             )
 
-        semantic_settings = copy.deepcopy(search_settings)
-        semantic_settings.search_limit += search_settings.offset
+        execution_mode = search_settings.hybrid_search_settings.execution_mode
+        if (
+            execution_mode == HybridSearchExecutionMode.SQL
+            # The binary two-stage search cannot be expressed in the fused statement
+            and self.quantization_type != VectorQuantizationType.INT1
+        ):
+            return await self._hybrid_search_sql(
+                query_text, query_vector, search_settings
+            )
 
-        full_text_settings = copy.deepcopy(search_settings)
-        full_text_settings.hybrid_search_settings.full_text_limit += (
-            search_settings.offset
+        semantic_settings = search_settings.model_copy(
+            update={
+                "search_limit": search_settings.search_limit
+                + search_settings.offset
+            }
         )
-
-        semantic_results: list[VectorSearchResult] = (
-            await self.semantic_search(query_vector, semantic_settings)
+        full_text_settings = search_settings.model_copy(
+            update={
+                "hybrid_search_settings": search_settings.hybrid_search_settings.model_copy(
+                    update={
+                        "full_text_limit": search_settings.hybrid_search_settings.full_text_limit
+                        + search_settings.offset
+                    }
+                )
+            }
         )
-        full_text_results: list[VectorSearchResult] = (
-            await self.full_text_search(query_text, full_text_settings)
+
+        if execution_mode == HybridSearchExecutionMode.SEQUENTIAL:
+            semantic_results: list[VectorSearchResult] = (
+                await self.semantic_search(query_vector, semantic_settings)
+            )
+            full_text_results: list[VectorSearchResult] = (
+                await self.full_text_search(query_text, full_text_settings)
+            )
+        else:
+            # Each leg acquires its own pooled connection
+            semantic_results, full_text_results = await asyncio.gather(
+                self.semantic_search(query_vector, semantic_settings),
+                self.full_text_search(query_text, full_text_settings),
+            )
+
+        return self._fuse_hybrid_results(
+            semantic_results, full_text_results, search_settings
         )
 
+    def _fuse_hybrid_results(
+        self,
+        semantic_results: list[VectorSearchResult],
+        full_text_results: list[VectorSearchResult],
+        search_settings: SearchSettings,
+    ) -> list[VectorSearchResult]:
         semantic_limit = search_settings.search_limit
         full_text_limit = (
             search_settings.hybrid_search_settings.full_text_limit
@@ -595,6 +1375,129 @@ class PostgresVectorHandler(VectorHandler):
             for result in offset_results
         ]
 
+    async def _hybrid_search_sql(
+        self,
+        query_text: str,
+        query_vector: list[float],
+        search_settings: SearchSettings,
+    ) -> list[VectorSearchResult]:
+        """
+        Runs both legs of a hybrid search and fuses them with RRF in a single
+        statement. Ranks, limits and offsets mirror `_fuse_hybrid_results`.
+        """
+        if not self.enable_fts:
+            raise ValueError(
+                "Full-text search is not enabled for this collection."
+            )
+
+        table_name = self._get_table_name(PostgresVectorHandler.TABLE_NAME)
+        hybrid_settings = search_settings.hybrid_search_settings
+        semantic_limit = search_settings.search_limit
+        full_text_limit = hybrid_settings.full_text_limit
+
+        params: list[Any] = [
+            query_vector,
+            query_text,
+        ]
+        filter_clause = ""
+        if search_settings.filters:
+            filter_clause = self._build_filters(
+                search_settings.filters, params
+            )
+
+        distance_calc = f"vec {search_settings.index_measure.pgvector_repr} $1::vector({self.dimension})"
+        semantic_where = f"WHERE {filter_clause}" if filter_clause else ""
+        full_text_where = "WHERE fts @@ websearch_to_tsquery('english', $2)"
+        if filter_clause:
+            full_text_where += f" AND {filter_clause}"
+
+        n = len(params)
+        query = f"""
+        WITH semantic AS (
+            SELECT extraction_id, ROW_NUMBER() OVER (ORDER BY distance) AS semantic_rank
+            FROM (
+                SELECT extraction_id, {distance_calc} AS distance
+                FROM {table_name}
+                {semantic_where}
+                ORDER BY distance
+                LIMIT ${n + 1}
+                OFFSET ${n + 3}
+            ) s
+        ),
+        full_text AS (
+            SELECT extraction_id, ROW_NUMBER() OVER (ORDER BY rank DESC) AS full_text_rank
+            FROM (
+                SELECT extraction_id, ts_rank(fts, websearch_to_tsquery('english', $2), 32) AS rank
+                FROM {table_name}
+                {full_text_where}
+                ORDER BY rank DESC
+                OFFSET ${n + 3}
+                LIMIT ${n + 2}
+            ) f
+        ),
+        fused AS (
+            SELECT
+                COALESCE(semantic.extraction_id, full_text.extraction_id) AS extraction_id,
+                COALESCE(semantic.semantic_rank, ${n + 4}) AS semantic_rank,
+                COALESCE(full_text.full_text_rank, ${n + 5}) AS full_text_rank
+            FROM semantic
+            FULL OUTER JOIN full_text USING (extraction_id)
+        ),
+        scored AS (
+            SELECT
+                extraction_id,
+                semantic_rank,
+                full_text_rank,
+                (
+                    (1.0::float8 / (${n + 6} + semantic_rank)) * ${n + 7}::float8
+                    + (1.0::float8 / (${n + 6} + full_text_rank)) * ${n + 8}::float8
+                ) / (${n + 7}::float8 + ${n + 8}::float8) AS rrf_score
+            FROM fused
+            WHERE semantic_rank <= ${n + 4} * 2
+            AND full_text_rank <= ${n + 5} * 2
+            ORDER BY rrf_score DESC, semantic_rank, full_text_rank
+            OFFSET ${n + 3}
+            LIMIT ${n + 4}
+        )
+        SELECT
+            t.extraction_id, t.document_id, t.user_id, t.collection_ids,
+            t.text, t.metadata,
+            scored.semantic_rank, scored.full_text_rank, scored.rrf_score
+        FROM scored
+        JOIN {table_name} t ON t.extraction_id = scored.extraction_id
+        ORDER BY scored.rrf_score DESC, scored.semantic_rank, scored.full_text_rank
+        """
+        params.extend(
+            [
+                semantic_limit + search_settings.offset,
+                full_text_limit + search_settings.offset,
+                search_settings.offset,
+                semantic_limit,
+                full_text_limit,
+                hybrid_settings.rrf_k,
+                hybrid_settings.semantic_weight,
+                hybrid_settings.full_text_weight,
+            ]
+        )
+
+        results = await self.connection_manager.fetch_query(query, params)
+        return [
+            VectorSearchResult(
+                extraction_id=UUID(str(r["extraction_id"])),
+                document_id=UUID(str(r["document_id"])),
+                user_id=UUID(str(r["user_id"])),
+                collection_ids=r["collection_ids"],
+                text=r["text"],
+                score=float(r["rrf_score"]),
+                metadata={
+                    **json.loads(r["metadata"]),
+                    "semantic_rank": r["semantic_rank"],
+                    "full_text_rank": r["full_text_rank"],
+                },
+            )
+            for r in results
+        ]
+
     async def delete(
         self, filters: dict[str, Any]
     ) -> dict[str, dict[str, str]]:
@@ -619,6 +1522,61 @@ class PostgresVectorHandler(VectorHandler):
             for result in results
         }
 
+    async def get_document_ids_by_filters(
+        self, filters: dict[str, Any]
+    ) -> list[UUID]:
+        """Returns the documents with chunks matching `filters`."""
+        params: list[Union[str, int, bytes]] = []
+        where_clause = self._build_filters(filters, params)
+
+        query = f"""
+        SELECT DISTINCT document_id
+        FROM {self._get_table_name(PostgresVectorHandler.TABLE_NAME)}
+        WHERE {where_clause};
+        """
+        results = await self.connection_manager.fetch_query(query, params)
+        return [result["document_id"] for result in results]
+
+    async def delete_document_chunks(
+        self, document_ids: list[UUID], filters: dict[str, Any]
+    ) -> Tuple[int, list[UUID]]:
+        """
+        Deletes the chunks of `document_ids` matching `filters` with one
+        statement, without returning their contents.
+
+        Returns:
+            Tuple[int, list[UUID]]: The number of chunks deleted, and the
+            documents among `document_ids` left without chunks.
+        """
+        table_name = self._get_table_name(PostgresVectorHandler.TABLE_NAME)
+        params: list[Any] = [document_ids]
+        where_clause = self._build_filters(filters, params)
+
+        query = f"""
+        WITH deleted AS (
+            DELETE FROM {table_name}
+            WHERE document_id = ANY($1::uuid[]) AND {where_clause}
+            RETURNING 1
+        )
+        SELECT COUNT(*) FROM deleted;
+        """
+        deleted = (
+            await self.connection_manager.fetchrow_query(query, params)
+        )["count"]
+
+        query = f"""
+        SELECT ids.document_id
+        FROM unnest($1::uuid[]) AS ids(document_id)
+        WHERE NOT EXISTS (
+            SELECT 1 FROM {table_name} v
+            WHERE v.document_id = ids.document_id
+        );
+        """
+        results = await self.connection_manager.fetch_query(
+            query, [document_ids]
+        )
+        return deleted, [result["document_id"] for result in results]
+
     async def assign_document_to_collection_vector(
         self, document_id: UUID, collection_id: UUID
     ) -> None:
@@ -659,6 +1617,7 @@ class PostgresVectorHandler(VectorHandler):
         results = await self.connection_manager.fetchrow_query(
             query, (collection_id,)
         )
+        await self.delete_collection_index(collection_id, concurrently=False)
         return None
 
     async def get_document_chunks(
@@ -697,7 +1656,7 @@ class PostgresVectorHandler(VectorHandler):
                     "text": result["text"],
                     "metadata": json.loads(result["metadata"]),
                     "vector": (
-                        json.loads(result["vec"]) if include_vectors else None
+                        result["vec"].tolist() if include_vectors else None
                     ),
                 }
                 for result in results
@@ -802,37 +1761,6 @@ class PostgresVectorHandler(VectorHandler):
         else:
             raise ArgError("invalid table name")
 
-        if index_method not in (
-            IndexMethod.ivfflat,
-            IndexMethod.hnsw,
-            IndexMethod.auto,
-        ):
-            raise ArgError("invalid index method")
-
-        if index_arguments:
-            # Disallow case where user submits index arguments but uses the
-            # IndexMethod.auto index (index build arguments should only be
-            # used with a specific index)
-            if index_method == IndexMethod.auto:
-                raise ArgError(
-                    "Index build parameters are not allowed when using the IndexMethod.auto index."
-                )
-            # Disallow case where user specifies one index type but submits
-            # index build arguments for the other index type
-            if (
-                isinstance(index_arguments, IndexArgsHNSW)
-                and index_method != IndexMethod.hnsw
-            ) or (
-                isinstance(index_arguments, IndexArgsIVFFlat)
-                and index_method != IndexMethod.ivfflat
-            ):
-                raise ArgError(
-                    f"{index_arguments.__class__.__name__} build parameters were supplied but {index_method} index was specified."
-                )
-
-        if index_method == IndexMethod.auto:
-            index_method = IndexMethod.hnsw
-
         ops = index_measure_to_ops(
             index_measure  # , quantization_type=self.quantization_type
         )
@@ -840,34 +1768,17 @@ class PostgresVectorHandler(VectorHandler):
         if ops is None:
             raise ArgError("Unknown index measure")
 
-        concurrently_sql = "CONCURRENTLY" if concurrently else ""
-
-        index_name = (
-            index_name
-            or f"ix_{ops}_{index_method}__{col_name}_{time.strftime('%Y%m%d%H%M%S')}"
+        await create_vector_index(
+            self.connection_manager,
+            table_name_str,
+            col_name,
+            ops,
+            index_method,
+            index_arguments,
+            index_name,
+            concurrently,
         )
-
-        create_index_sql = f"""
-        CREATE INDEX {concurrently_sql} {index_name}
-        ON {table_name_str}
-        USING {index_method} ({col_name} {ops}) {self._get_index_options(index_method, index_arguments)};
-        """
-
-        try:
-            if concurrently:
-                async with (
-                    self.connection_manager.pool.get_connection() as conn  # type: ignore
-                ):
-                    # Disable automatic transaction management
-                    await conn.execute(
-                        "SET SESSION CHARACTERISTICS AS TRANSACTION ISOLATION LEVEL READ COMMITTED"
-                    )
-                    await conn.execute(create_index_sql)
-            else:
-                # Non-concurrent index creation can use normal query execution
-                await self.connection_manager.execute_query(create_index_sql)
-        except Exception as e:
-            raise Exception(f"Failed to create index: {e}")
+        self._plan_stats = None
         return None
 
     def _build_filters(
@@ -900,8 +1811,8 @@ class PostgresVectorHandler(VectorHandler):
                         return f"{key} @> ${len(parameters)}"
                     elif op == "$any":
                         if key == "collection_ids":
-                            parameters.append(f"%{clause}%")
-                            return f"array_to_string({key}, ',') LIKE ${len(parameters)}"
+                            parameters.append(str(clause))
+                            return f"{key} @> ARRAY[${len(parameters)}::uuid]"
                         parameters.append(clause)
                         return f"${len(parameters)} = ANY({key})"
                     else:
@@ -913,62 +1824,82 @@ class PostgresVectorHandler(VectorHandler):
                     parameters.append(value)
                     return f"{key} = ${len(parameters)}"
             else:
-                # Handle JSON-based filters
-                json_col = "metadata"
+                # Handle JSON-based filters, compiled to predicates the
+                # GIN and expression indices of `create_filter_index` match
                 if key.startswith("metadata."):
                     key = key.split("metadata.")[1]
-                if isinstance(value, dict):
-                    op, clause = next(iter(value.items()))
-                    if op not in (
-                        "$eq",
-                        "$ne",
-                        "$lt",
-                        "$lte",
-                        "$gt",
-                        "$gte",
-                        "$in",
-                        "$contains",
-                    ):
-                        raise FilterError("unknown operator")
+                if not isinstance(value, dict):
+                    # Handle direct equality
+                    value = {"$eq": value}
+                op, clause = next(iter(value.items()))
+                if op not in (
+                    "$eq",
+                    "$ne",
+                    "$lt",
+                    "$lte",
+                    "$gt",
+                    "$gte",
+                    "$in",
+                    "$contains",
+                ):
+                    raise FilterError("unknown operator")
 
-                    if op == "$eq":
+                field = f"metadata->{psql_quote_literal(key)}"
+                if op == "$eq":
+                    if isinstance(clause, (dict, list)):
+                        # containment would also match supersets
                         parameters.append(json.dumps(clause))
-                        return (
-                            f"{json_col}->'{key}' = ${len(parameters)}::jsonb"
+                        return f"{field} = ${len(parameters)}::jsonb"
+                    self._record_filter_key(key, "containment")
+                    parameters.append(json.dumps({key: clause}))
+                    return f"metadata @> ${len(parameters)}::jsonb"
+                elif op == "$ne":
+                    parameters.append(json.dumps(clause))
+                    return f"{field} != ${len(parameters)}::jsonb"
+                elif op in ("$lt", "$lte", "$gt", "$gte"):
+                    if isinstance(clause, bool) or not isinstance(
+                        clause, (int, float)
+                    ):
+                        raise FilterError(
+                            f"argument to {op} filter must be a number"
                         )
-                    elif op == "$ne":
-                        parameters.append(json.dumps(clause))
-                        return (
-                            f"{json_col}->'{key}' != ${len(parameters)}::jsonb"
+                    self._record_filter_key(key, "number")
+                    parameters.append(float(clause))
+                    comparison = {
+                        "$lt": "<",
+                        "$lte": "<=",
+                        "$gt": ">",
+                        "$gte": ">=",
+                    }[op]
+                    return f"{metadata_number_expression(key)} {comparison} ${len(parameters)}::float"
+                elif op == "$in":
+                    if not isinstance(clause, list):
+                        raise FilterError(
+                            "argument to $in filter must be a list"
                         )
-                    elif op == "$lt":
-                        parameters.append(json.dumps(clause))
-                        return f"({json_col}->'{key}')::float < (${len(parameters)}::jsonb)::float"
-                    elif op == "$lte":
-                        parameters.append(json.dumps(clause))
-                        return f"({json_col}->'{key}')::float <= (${len(parameters)}::jsonb)::float"
-                    elif op == "$gt":
-                        parameters.append(json.dumps(clause))
-                        return f"({json_col}->'{key}')::float > (${len(parameters)}::jsonb)::float"
-                    elif op == "$gte":
-                        parameters.append(json.dumps(clause))
-                        return f"({json_col}->'{key}')::float >= (${len(parameters)}::jsonb)::float"
-                    elif op == "$in":
-                        if not isinstance(clause, list):
-                            raise FilterError(
-                                "argument to $in filter must be a list"
-                            )
-                        parameters.append(json.dumps(clause))
-                        return f"{json_col}->'{key}' = ANY(SELECT jsonb_array_elements(${len(parameters)}::jsonb))"
-                    elif op == "$contains":
-                        if not isinstance(clause, (int, str, float, list)):
-                            raise FilterError(
-                                "argument to $contains filter must be a scalar or array"
-                            )
+                    if any(isinstance(v, (dict, list)) for v in clause):
                         parameters.append(json.dumps(clause))
-                        return (
-                            f"{json_col}->'{key}' @> ${len(parameters)}::jsonb"
+                        return f"{field} = ANY(SELECT jsonb_array_elements(${len(parameters)}::jsonb))"
+                    self._record_filter_key(key, "containment")
+                    parameters.append([json.dumps({key: v}) for v in clause])
+                    return f"metadata @> ANY(${len(parameters)}::jsonb[])"
+                elif op == "$contains":
+                    if not isinstance(clause, (int, str, float, list)):
+                        raise FilterError(
+                            "argument to $contains filter must be a scalar or array"
                         )
+                    self._record_filter_key(key, "containment")
+                    if isinstance(clause, list):
+                        parameters.append(json.dumps({key: clause}))
+                        return f"metadata @> ${len(parameters)}::jsonb"
+                    # a scalar is contained in an array or equal to a scalar
+                    parameters.append(
+                        [
+                            json.dumps({key: [clause]}),
+                            json.dumps({key: clause}),
+                        ]
+                    )
+                    return f"metadata @> ANY(${len(parameters)}::jsonb[])"
 
         def parse_filter(filter_dict: dict) -> str:
             filter_conditions = []
@@ -1030,6 +1961,7 @@ class PostgresVectorHandler(VectorHandler):
             table_name_str = (
                 f"{self.project_name}.{VectorTableName.ENTITIES_COLLECTION}"
             )
+            col_name = "description_embedding"
         elif table_name == VectorTableName.COMMUNITIES:
             table_name_str = (
                 f"{self.project_name}.{VectorTableName.COMMUNITIES}"
@@ -1038,41 +1970,10 @@ class PostgresVectorHandler(VectorHandler):
         else:
             raise ArgError("invalid table name")
 
-        query = """
-        SELECT
-            i.indexname as name,
-            i.indexdef as definition,
-            am.amname as method,
-            pg_relation_size(c.oid) as size_in_bytes,
-            COALESCE(psat.idx_scan, 0) as number_of_scans,
-            COALESCE(psat.idx_tup_read, 0) as tuples_read,
-            COALESCE(psat.idx_tup_fetch, 0) as tuples_fetched
-        FROM pg_indexes i
-        JOIN pg_class c ON c.relname = i.indexname
-        JOIN pg_am am ON c.relam = am.oid
-        LEFT JOIN pg_stat_user_indexes psat ON psat.indexrelname = i.indexname
-            AND psat.schemaname = i.schemaname
-        WHERE i.schemaname || '.' || i.tablename = $1
-        AND i.indexdef LIKE $2;
-        """
-
-        results = await self.connection_manager.fetch_query(
-            query, (table_name_str, f"%({col_name}%")
+        return await list_vector_indices(
+            self.connection_manager, table_name_str, col_name
         )
 
-        return [
-            {
-                "name": result["name"],
-                "definition": result["definition"],
-                "method": result["method"],
-                "size_in_bytes": result["size_in_bytes"],
-                "number_of_scans": result["number_of_scans"],
-                "tuples_read": result["tuples_read"],
-                "tuples_fetched": result["tuples_fetched"],
-            }
-            for result in results
-        ]
-
     async def delete_index(
         self,
         index_name: str,
@@ -1113,48 +2014,171 @@ class PostgresVectorHandler(VectorHandler):
         else:
             raise ArgError("invalid table name")
 
-        # Extract schema and base table name
-        schema_name, base_table_name = table_name_str.split(".")
+        await drop_vector_index(
+            self.connection_manager,
+            index_name,
+            table_name_str,
+            col_name,
+            concurrently,
+        )
+        self._plan_stats = None
 
-        # Verify index exists and is a vector index
-        query = """
-        SELECT indexdef
-        FROM pg_indexes
-        WHERE indexname = $1
-        AND schemaname = $2
-        AND tablename = $3
-        AND indexdef LIKE $4
+    def _collection_index_name(self, collection_id: UUID) -> str:
+        return f"{self.COLLECTION_INDEX_PREFIX}{UUID(str(collection_id)).hex}"
+
+    @staticmethod
+    def _collection_index_predicate(collection_id: Union[UUID, str]) -> str:
+        return f"collection_ids && ARRAY['{UUID(str(collection_id))}']::uuid[]"
+
+    async def create_collection_index(
+        self,
+        collection_id: UUID,
+        index_measure: IndexMeasure = IndexMeasure.cosine_distance,
+        index_arguments: Optional[IndexArgsHNSW] = None,
+        concurrently: bool = True,
+    ) -> str:
         """
+        Creates an HNSW index over the chunks of one collection, which
+        semantic searches filtered to the collection scan instead of
+        post-filtering the index of the whole table.
 
-        result = await self.connection_manager.fetchrow_query(
-            query, (index_name, schema_name, base_table_name, f"%({col_name}%")
+        Returns:
+            str: The name of the created index.
+        """
+        ops = index_measure_to_ops(index_measure)
+        if ops is None:
+            raise ArgError("Unknown index measure")
+
+        index_name = await create_vector_index(
+            self.connection_manager,
+            self._get_table_name(PostgresVectorHandler.TABLE_NAME),
+            "vec",
+            ops,
+            IndexMethod.hnsw,
+            index_arguments,
+            self._collection_index_name(collection_id),
+            concurrently,
+            predicate=self._collection_index_predicate(collection_id),
         )
+        self._plan_stats = None
+        return index_name
 
-        if not result:
-            raise ArgError(
-                f"Vector index '{index_name}' does not exist on table {table_name_str}"
+    async def delete_collection_index(
+        self, collection_id: UUID, concurrently: bool = True
+    ) -> None:
+        await execute_index_ddl(
+            self.connection_manager,
+            f"DROP INDEX {'CONCURRENTLY' if concurrently else ''} IF EXISTS {self.project_name}.{self._collection_index_name(collection_id)}",
+            concurrently,
+        )
+        self._plan_stats = None
+
+    def _record_filter_key(self, key: str, kind: str) -> None:
+        if kind == "containment":
+            self._containment_filter_usage += 1
+            return
+        usage = self._number_filter_usage
+        if key not in usage and len(usage) >= self.MAX_TRACKED_FILTER_KEYS:
+            del usage[min(usage, key=usage.__getitem__)]
+        usage[key] += 1
+
+    def _filter_index_name(self, key: Optional[str]) -> str:
+        if key is None:
+            return f"{self.FILTER_INDEX_PREFIX}gin"
+        slug = re.sub(r"[^a-z0-9]+", "_", key.lower()).strip("_")[:24]
+        digest = hashlib.md5(key.encode()).hexdigest()[:8]
+        return f"{self.FILTER_INDEX_PREFIX}{slug}_{digest}"
+
+    @staticmethod
+    def _filter_index_definition(key: Optional[str]) -> str:
+        if key is None:
+            return "USING GIN (metadata jsonb_path_ops)"
+        return f"({metadata_number_expression(key)})"
+
+    async def list_filter_indices(self) -> list[dict[str, Any]]:
+        """Lists the GIN and expression indices on the metadata column."""
+        return await list_vector_indices(
+            self.connection_manager,
+            self._get_table_name(PostgresVectorHandler.TABLE_NAME),
+            "metadata",
+        )
+
+    async def recommend_filter_indices(
+        self, min_usage: int = 1
+    ) -> list[dict[str, Any]]:
+        """
+        Recommends the metadata indices for the filters this handler has
+        compiled since it started: one `jsonb_path_ops` GIN index serving
+        every containment filter, and an expression index per key compared
+        as a number. Keys used fewer than `min_usage` times are left out.
+
+        Returns:
+            list[dict]: The name, key (None for the GIN index), filter kind,
+            usage count, DDL and whether the index exists, most used first.
+        """
+        existing = {
+            index["name"] for index in await self.list_filter_indices()
+        }
+        table_name = self._get_table_name(PostgresVectorHandler.TABLE_NAME)
+
+        def recommendation(key: Optional[str], kind: str, usage: int):
+            name = self._filter_index_name(key)
+            return {
+                "name": name,
+                "key": key,
+                "kind": kind,
+                "usage": usage,
+                "definition": f"CREATE INDEX {name} ON {table_name} {self._filter_index_definition(key)}",
+                "exists": name in existing,
+            }
+
+        recommendations = [
+            recommendation(key, "number", usage)
+            for key, usage in self._number_filter_usage.items()
+            if usage >= min_usage
+        ]
+        containment = self._containment_filter_usage
+        if containment and containment >= min_usage:
+            recommendations.append(
+                recommendation(None, "containment", containment)
             )
+        return sorted(
+            recommendations, key=lambda rec: rec["usage"], reverse=True
+        )
+
+    async def create_filter_index(
+        self, key: Optional[str] = None, concurrently: bool = True
+    ) -> str:
+        """
+        Creates the index serving metadata filters on `key` as a number, or
+        without a key, the GIN index serving every `$eq`, `$in` and
+        `$contains` metadata filter. Existing indices are kept.
 
-        # Drop the index
-        concurrently_sql = "CONCURRENTLY" if concurrently else ""
-        drop_query = (
-            f"DROP INDEX {concurrently_sql} {schema_name}.{index_name}"
+        Returns:
+            str: The name of the index.
+        """
+        index_name = self._filter_index_name(key)
+        await execute_index_ddl(
+            self.connection_manager,
+            f"""
+            CREATE INDEX {'CONCURRENTLY' if concurrently else ''} IF NOT EXISTS {index_name}
+            ON {self._get_table_name(PostgresVectorHandler.TABLE_NAME)}
+            {self._filter_index_definition(key)};
+            """,
+            concurrently,
         )
+        return index_name
 
-        try:
-            if concurrently:
-                async with (
-                    self.connection_manager.pool.get_connection() as conn  # type: ignore
-                ):
-                    # Disable automatic transaction management
-                    await conn.execute(
-                        "SET SESSION CHARACTERISTICS AS TRANSACTION ISOLATION LEVEL READ COMMITTED"
-                    )
-                    await conn.execute(drop_query)
-            else:
-                await self.connection_manager.execute_query(drop_query)
-        except Exception as e:
-            raise Exception(f"Failed to delete index: {e}")
+    async def delete_filter_index(
+        self, index_name: str, concurrently: bool = True
+    ) -> None:
+        await drop_vector_index(
+            self.connection_manager,
+            index_name,
+            self._get_table_name(PostgresVectorHandler.TABLE_NAME),
+            "metadata",
+            concurrently,
+        )
 
     async def get_semantic_neighbors(
         self,
@@ -1193,23 +2217,3 @@ class PostgresVectorHandler(VectorHandler):
             }
             for r in results
         ]
-
-    def _get_index_options(
-        self,
-        method: IndexMethod,
-        index_arguments: Optional[Union[IndexArgsIVFFlat, IndexArgsHNSW]],
-    ) -> str:
-        if method == IndexMethod.ivfflat:
-            if isinstance(index_arguments, IndexArgsIVFFlat):
-                return f"WITH (lists={index_arguments.n_lists})"
-            else:
-                # Default value if no arguments provided
-                return "WITH (lists=100)"
-        elif method == IndexMethod.hnsw:
-            if isinstance(index_arguments, IndexArgsHNSW):
-                return f"WITH (m={index_arguments.m}, ef_construction={index_arguments.ef_construction})"
-            else:
-                # Default values if no arguments provided
-                return "WITH (m=16, ef_construction=64)"
-        else:
-            return ""  # No options for other methods
@@ -16,6 +16,8 @@ from core.base import (
     VectorSearchResult,
 )
 
+from .openai import OpenAIEmbeddingProvider
+
 logger = logging.getLogger()
 
 
@@ -61,6 +63,7 @@ class LiteLLMEmbeddingProvider(EmbeddingProvider):
             logger.warn("Amazon embedding model detected, dropping params")
             litellm.drop_params = True
         self.base_dimension = config.base_dimension
+        self.tokenizer = OpenAIEmbeddingProvider.token_counter(self.base_model)
 
     def _get_embedding_kwargs(self, **kwargs):
         embedding_kwargs = {
@@ -89,7 +92,7 @@ class LiteLLMEmbeddingProvider(EmbeddingProvider):
             error_msg = f"Error getting embeddings: {str(e)}"
             logger.error(error_msg)
 
-            raise R2RException(error_msg, 400)
+            raise R2RException(error_msg, 400) from e
 
     def _execute_task_sync(self, task: dict[str, Any]) -> list[list[float]]:
         texts = task["texts"]
@@ -1,6 +1,6 @@
 import logging
 import os
-from typing import Any, List
+from typing import Any, Callable, List, Optional
 
 from openai import AsyncOpenAI, AuthenticationError, OpenAI
 from openai._types import NOT_GIVEN
@@ -82,6 +82,42 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
                 OpenAIEmbeddingProvider.MODEL_TO_DIMENSIONS[self.base_model]
             )
 
+        self.tokenizer = OpenAIEmbeddingProvider.token_counter(self.base_model)
+
+    @staticmethod
+    def token_counter(model: str) -> Optional[Callable[[str], int]]:
+        """
+        Returns a tiktoken-based token counter for OpenAI embedding models,
+        or None for other models. The encoding is loaded on first use; if it
+        cannot be loaded the counter falls back to a chars / 4 estimate.
+        """
+        encoding_name = OpenAIEmbeddingProvider.MODEL_TO_TOKENIZER.get(
+            model.split("/")[-1]
+        )
+        if not encoding_name:
+            return None
+
+        encoding = None
+        fallback = False
+
+        def count_tokens(text: str) -> int:
+            nonlocal encoding, fallback
+            if encoding is None and not fallback:
+                try:
+                    import tiktoken
+
+                    encoding = tiktoken.get_encoding(encoding_name)
+                except Exception as e:
+                    logger.warning(
+                        f"Could not load tiktoken encoding {encoding_name}, estimating token counts: {e}"
+                    )
+                    fallback = True
+            if encoding is None:
+                return len(text) // 4 + 1
+            return len(encoding.encode(text, disallowed_special=()))
+
+        return count_tokens
+
     def _get_dimensions(self):
         return (
             NOT_GIVEN
@@ -6,12 +6,14 @@ from typing import Any, AsyncGenerator, Optional, Union
 from core import parsers
 from core.base import (
     AsyncParser,
+    CharacterTextSplitter,
     ChunkingStrategy,
     Document,
     DocumentExtraction,
     DocumentType,
     IngestionConfig,
     IngestionProvider,
+    ParserExecutor,
     R2RDocumentProcessingError,
     RecursiveCharacterTextSplitter,
     TextSplitter,
@@ -24,6 +26,9 @@ from ...llm import LiteLLMCompletionProvider, OpenAICompletionProvider
 
 logger = logging.getLogger()
 
+# Number of chunks worth of parsed text buffered at once when streaming
+STREAMING_WINDOW_CHUNKS = 32
+
 
 class R2RIngestionConfig(IngestionConfig):
     chunk_size: int = 1024
@@ -85,6 +90,10 @@ class R2RIngestionProvider(IngestionProvider):
             LiteLLMCompletionProvider, OpenAICompletionProvider
         ] = llm_provider
         self.parsers: dict[DocumentType, AsyncParser] = {}
+        self.parser_executor = ParserExecutor(
+            mode=self.config.parser_execution_mode,
+            max_workers=self.config.parser_max_workers,
+        )
         self.text_splitter = self._build_text_splitter()
         self._initialize_parsers()
 
@@ -109,6 +118,8 @@ class R2RIngestionProvider(IngestionProvider):
                 database_provider=self.database_provider,
                 llm_provider=self.llm_provider,
             )
+        for parser in self.parsers.values():
+            parser.executor = self.parser_executor
 
     def _build_text_splitter(
         self, ingestion_config_override: Optional[dict] = None
@@ -140,8 +151,6 @@ class R2RIngestionProvider(IngestionProvider):
                 chunk_overlap=chunk_overlap,
             )
         elif chunking_strategy == ChunkingStrategy.CHARACTER:
-            from core.base.utils.splitter.text import CharacterTextSplitter
-
             separator = (
                 ingestion_config_override.get("separator", None)
                 or self.config.separator
@@ -182,7 +191,7 @@ class R2RIngestionProvider(IngestionProvider):
             parsed_document = parsed_document.data
 
         if isinstance(parsed_document, str):
-            chunks = text_spliiter.create_documents([parsed_document])
+            chunks = text_spliiter.iter_split_text(parsed_document)
         else:
             # Assuming parsed_document is already a list of text chunks
             chunks = parsed_document
@@ -192,6 +201,59 @@ class R2RIngestionProvider(IngestionProvider):
                 chunk.page_content if hasattr(chunk, "page_content") else chunk
             )
 
+    async def chunk_stream(
+        self,
+        texts: AsyncGenerator[str, None],
+        ingestion_config_override: dict,
+    ) -> AsyncGenerator[str, None]:
+        """
+        Chunks parser output as it arrives instead of joining the whole
+        document first. Text is buffered until it spans roughly
+        `STREAMING_WINDOW_CHUNKS` chunks; every chunk but the last is emitted
+        and the last one seeds the next window, so chunk boundaries only
+        differ from whole-document chunking around window edges.
+        """
+        text_splitter = self.text_splitter
+        if ingestion_config_override:
+            text_splitter = self._build_text_splitter(
+                ingestion_config_override
+            )
+        window_size = text_splitter._chunk_size * STREAMING_WINDOW_CHUNKS
+
+        buffer: list[str] = []
+        buffered = 0
+        split_at = window_size
+        async for text in texts:
+            buffer.append(text + "\n")
+            buffered += len(text) + 1
+            if buffered < split_at:
+                continue
+
+            window = "".join(buffer)
+            chunks = text_splitter.split_text(window)
+            if len(chunks) < 2:
+                # Text the splitter cannot break is re-split only once the
+                # buffer has doubled, which keeps the total work linear
+                split_at = 2 * buffered
+                continue
+            split_at = window_size
+            for chunk in chunks[:-1]:
+                yield chunk
+
+            tail_start = window.rfind(chunks[-1])
+            tail = window[tail_start:] if tail_start != -1 else window
+            buffer = [tail]
+            buffered = len(tail)
+
+        if buffered:
+            for chunk in text_splitter.split_text("".join(buffer)):
+                yield chunk
+
+    @staticmethod
+    async def _iterate_async(iterable) -> AsyncGenerator[Any, None]:
+        for item in iterable:
+            yield item
+
     async def parse(  # type: ignore
         self,
         file_content: bytes,
@@ -207,7 +269,6 @@ class R2RIngestionProvider(IngestionProvider):
             )
         else:
             t0 = time.time()
-            contents = ""
             parser_overrides = ingestion_config_override.get(
                 "parser_overrides", {}
             )
@@ -223,19 +284,32 @@ class R2RIngestionProvider(IngestionProvider):
                     raise ValueError(
                         "Only Zerox PDF parser override is available."
                     )
-                async for text in self.parsers[
-                    f"zerox_{DocumentType.PDF.value}"
-                ].ingest(file_content, **ingestion_config_override):
-                    contents += text + "\n"
+                texts = self.parsers[f"zerox_{DocumentType.PDF.value}"].ingest(
+                    file_content, **ingestion_config_override
+                )
             else:
-                async for text in self.parsers[document.document_type].ingest(
+                texts = self.parsers[document.document_type].ingest(
                     file_content, **ingestion_config_override
-                ):
-                    contents += text + "\n"
+                )
+
+            if ingestion_config_override.get(
+                "use_streaming_ingestion",
+                self.config.use_streaming_ingestion,
+            ):
+                chunks = self.chunk_stream(texts, ingestion_config_override)
+            else:
+                contents = []
+                async for text in texts:
+                    contents.append(text)
+                chunks = self._iterate_async(
+                    self.chunk(
+                        "\n".join(contents) + "\n" if contents else "",
+                        ingestion_config_override,
+                    )
+                )
 
             iteration = 0
-            chunks = self.chunk(contents, ingestion_config_override)
-            for chunk in chunks:
+            async for chunk in chunks:
                 extraction = DocumentExtraction(
                     id=generate_extraction_id(document.id, iteration),
                     document_id=document.id,
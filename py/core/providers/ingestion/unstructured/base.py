@@ -19,6 +19,7 @@ from core.base import (
     Document,
     DocumentExtraction,
     DocumentType,
+    ParserExecutor,
     RecursiveCharacterTextSplitter,
 )
 from core.base.abstractions import R2RSerializable
@@ -157,6 +158,10 @@ class UnstructuredIngestionProvider(IngestionProvider):
             self.client = httpx.AsyncClient()
 
         self.parsers: dict[DocumentType, AsyncParser] = {}
+        self.parser_executor = ParserExecutor(
+            mode=self.config.parser_execution_mode,
+            max_workers=self.config.parser_max_workers,
+        )
         self._initialize_parsers()
 
     def _initialize_parsers(self):
@@ -183,6 +188,8 @@ class UnstructuredIngestionProvider(IngestionProvider):
                 database_provider=self.database_provider,
                 llm_provider=self.llm_provider,
             )
+        for parser in self.parsers.values():
+            parser.executor = self.parser_executor
 
     async def parse_fallback(
         self,
@@ -1,17 +1,21 @@
+import asyncio
 import csv
 import io
 import json
 import logging
 import os
+import time
 import uuid
-from datetime import datetime
-from typing import Optional, Tuple, Union
+from collections import defaultdict, deque
+from datetime import datetime, timezone
+from typing import Any, Optional, Tuple, Union
 from uuid import UUID
 
 from fastapi.responses import StreamingResponse
 
 from core.base import Message
 from core.base.logger.base import (
+    LogBufferSettings,
     PersistentLoggingConfig,
     PersistentLoggingProvider,
     RunInfoLog,
@@ -21,6 +25,156 @@ from core.base.logger.base import (
 logger = logging.getLogger()
 
 
+class BufferedLogSink:
+    """
+    Queues run logs in memory and writes them in batches.
+
+    Records are flushed with one `executemany` per table inside a single
+    commit, either when `max_batch_size` records are queued or every
+    `flush_interval_ms`. When writes fall behind, `log` records are sampled
+    per key above the watermark and every record is dropped once the queue
+    is full, so callers never wait on the database.
+    """
+
+    def __init__(
+        self,
+        provider: "SqlitePersistentLoggingProvider",
+        settings: LogBufferSettings,
+    ):
+        self.provider = provider
+        self.settings = settings
+        self.records: deque[tuple[str, tuple]] = deque()
+        self._key_counts: dict[str, int] = defaultdict(int)
+        self._wakeup = asyncio.Event()
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+        self._stats: dict[str, Any] = {
+            "enqueued": 0,
+            "written": 0,
+            "dropped": 0,
+            "sampled_out": 0,
+            "failed": 0,
+            "flushes": 0,
+            "max_queue_depth": 0,
+            "last_flush_latency_ms": 0.0,
+            "max_flush_latency_ms": 0.0,
+            "total_flush_latency_ms": 0.0,
+        }
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        flushes = self._stats["flushes"]
+        return {
+            **self._stats,
+            "queue_depth": len(self.records),
+            "avg_flush_latency_ms": (
+                self._stats["total_flush_latency_ms"] / flushes
+                if flushes
+                else 0.0
+            ),
+        }
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._closed = False
+            self._task = asyncio.create_task(
+                self._flush_periodically(), name="r2r-log-sink"
+            )
+
+    def add_log(self, run_id: UUID, key: str, value: str) -> None:
+        depth = len(self.records)
+        if depth >= self.settings.max_queue_size:
+            self._stats["dropped"] += 1
+            return
+        if (
+            depth
+            >= self.settings.max_queue_size * self.settings.sample_watermark
+        ):
+            # Keep one record per `sample_every` for each key so every
+            # key stays represented while the sink catches up
+            self._key_counts[key] += 1
+            if (self._key_counts[key] - 1) % self.settings.sample_every:
+                self._stats["sampled_out"] += 1
+                return
+        self._append("log", (_timestamp(), str(run_id), key, value))
+
+    def add_info_log(
+        self, run_id: UUID, run_type: RunType, user_id: UUID
+    ) -> None:
+        if len(self.records) >= self.settings.max_queue_size:
+            self._stats["dropped"] += 1
+            return
+        self._append(
+            "info_log", (_timestamp(), str(run_id), run_type, str(user_id))
+        )
+
+    def _append(self, kind: str, params: tuple) -> None:
+        self.records.append((kind, params))
+        self._stats["enqueued"] += 1
+        depth = len(self.records)
+        if depth > self._stats["max_queue_depth"]:
+            self._stats["max_queue_depth"] = depth
+        if depth >= self.settings.max_batch_size:
+            self._wakeup.set()
+
+    async def flush(self) -> None:
+        """Writes every queued record in one transaction."""
+        async with self._lock:
+            if not self.records or not self.provider.conn:
+                return
+            batch, self.records = self.records, deque()
+            self._key_counts.clear()
+
+            logs = [params for kind, params in batch if kind == "log"]
+            info_logs = [
+                params for kind, params in batch if kind == "info_log"
+            ]
+            start = time.perf_counter()
+            try:
+                await self.provider._write_logs(logs, info_logs)
+            except Exception as e:
+                # Dropping the batch keeps a bad record from blocking the sink
+                self._stats["failed"] += len(batch)
+                logger.error(f"Failed to write {len(batch)} run logs: {e}")
+                return
+            latency = (time.perf_counter() - start) * 1000
+
+            self._stats["written"] += len(batch)
+            self._stats["flushes"] += 1
+            self._stats["last_flush_latency_ms"] = latency
+            self._stats["total_flush_latency_ms"] += latency
+            self._stats["max_flush_latency_ms"] = max(
+                self._stats["max_flush_latency_ms"], latency
+            )
+
+    async def close(self) -> None:
+        self._closed = True
+        if self._task is not None:
+            self._wakeup.set()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def _flush_periodically(self) -> None:
+        interval = self.settings.flush_interval_ms / 1000
+        while not self._closed:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+
+def _timestamp() -> str:
+    # Matches the format of SQLite's `datetime('now')`
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+
 class SqlitePersistentLoggingProvider(PersistentLoggingProvider):
     def __init__(self, config: PersistentLoggingConfig):
         self.log_table = config.log_table
@@ -35,6 +189,9 @@ class SqlitePersistentLoggingProvider(PersistentLoggingProvider):
                 "Please set the environment variable LOCAL_DB_PATH."
             )
         self.conn = None
+        self.sink: Optional[BufferedLogSink] = None
+        if config.buffer_settings.enabled:
+            self.sink = BufferedLogSink(self, config.buffer_settings)
         try:
             import aiosqlite
 
@@ -46,6 +203,10 @@ class SqlitePersistentLoggingProvider(PersistentLoggingProvider):
 
     async def initialize(self):
         self.conn = await self.aiosqlite.connect(self.logging_path)
+        # WAL lets reads proceed during batched writes and avoids an fsync
+        # per transaction
+        await self.conn.execute("PRAGMA journal_mode=WAL")
+        await self.conn.execute("PRAGMA synchronous=NORMAL")
 
         await self.conn.execute(
             f"""
@@ -124,6 +285,8 @@ class SqlitePersistentLoggingProvider(PersistentLoggingProvider):
                 )
 
         await self.conn.commit()
+        if self.sink:
+            self.sink.start()
 
     async def __aenter__(self):
         if self.conn is None:
@@ -134,10 +297,42 @@ class SqlitePersistentLoggingProvider(PersistentLoggingProvider):
         await self.close()
 
     async def close(self):
+        if self.sink:
+            await self.sink.close()
         if self.conn:
             await self.conn.close()
             self.conn = None
 
+    async def flush(self):
+        """Writes buffered run logs so they are visible to reads."""
+        if self.sink:
+            await self.sink.flush()
+
+    async def _write_logs(
+        self, logs: list[tuple], info_logs: list[tuple]
+    ) -> None:
+        if logs:
+            await self.conn.executemany(
+                f"""
+                INSERT INTO {self.project_name}_{self.log_table} (timestamp, run_id, key, value)
+                VALUES (?, ?, ?, ?)
+                """,
+                logs,
+            )
+        if info_logs:
+            await self.conn.executemany(
+                f"""
+                INSERT INTO {self.project_name}_{self.log_info_table} (timestamp, run_id, run_type, user_id)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(run_id) DO UPDATE SET
+                timestamp = excluded.timestamp,
+                run_type = excluded.run_type,
+                user_id = excluded.user_id
+                """,
+                info_logs,
+            )
+        await self.conn.commit()
+
     async def log(
         self,
         run_id: UUID,
@@ -148,6 +343,9 @@ class SqlitePersistentLoggingProvider(PersistentLoggingProvider):
             raise ValueError(
                 "Initialize the connection pool before attempting to log."
             )
+        if self.sink:
+            self.sink.add_log(run_id, key, value)
+            return
 
         await self.conn.execute(
             f"""
@@ -168,6 +366,9 @@ class SqlitePersistentLoggingProvider(PersistentLoggingProvider):
             raise ValueError(
                 "Initialize the connection pool before attempting to log."
             )
+        if self.sink:
+            self.sink.add_info_log(run_id, run_type, user_id)
+            return
 
         await self.conn.execute(
             f"""
@@ -193,6 +394,7 @@ class SqlitePersistentLoggingProvider(PersistentLoggingProvider):
             raise ValueError(
                 "Initialize the connection pool before attempting to log."
             )
+        await self.flush()
 
         cursor = await self.conn.cursor()
         query = "SELECT run_id, run_type, timestamp, user_id"
@@ -837,6 +1039,7 @@ class SqlitePersistentLoggingProvider(PersistentLoggingProvider):
             raise ValueError(
                 "Initialize the connection pool before attempting to log."
             )
+        await self.flush()
 
         cursor = await self.conn.cursor()
         placeholders = ",".join(["?" for _ in run_ids])
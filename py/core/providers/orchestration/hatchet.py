@@ -104,3 +104,13 @@ class HatchetOrchestrationProvider(OrchestrationProvider):
             if self.worker:
                 for workflow in workflows.values():
                     self.worker.register_workflow(workflow)
+
+        elif workflow == Workflow.MANAGEMENT:
+            from core.main.orchestration.hatchet.management_workflow import (
+                hatchet_management_factory,
+            )
+
+            workflows = hatchet_management_factory(self, service)
+            if self.worker:
+                for workflow in workflows.values():
+                    self.worker.register_workflow(workflow)
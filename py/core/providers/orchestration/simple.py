@@ -42,6 +42,13 @@ class SimpleOrchestrationProvider(OrchestrationProvider):
 
             self.kg_workflows = simple_kg_factory(service)
 
+        elif workflow == Workflow.MANAGEMENT:
+            from core.main.orchestration.simple.management_workflow import (
+                simple_management_factory,
+            )
+
+            self.management_workflows = simple_management_factory(service)
+
     async def run_workflow(
         self, workflow_name: str, parameters: dict, options: dict
     ) -> dict[str, str]:
@@ -53,5 +60,10 @@ class SimpleOrchestrationProvider(OrchestrationProvider):
         elif workflow_name in self.kg_workflows:
             await self.kg_workflows[workflow_name](parameters.get("request"))
             return {"message": self.messages[workflow_name]}
+        elif workflow_name in self.management_workflows:
+            await self.management_workflows[workflow_name](
+                parameters.get("request")
+            )
+            return {"message": self.messages[workflow_name]}
         else:
             raise ValueError(f"Workflow '{workflow_name}' not found.")
@@ -17,6 +17,7 @@ from shared.utils.base_utils import (
     validate_uuid,
 )
 from shared.utils.splitter.text import (
+    CharacterTextSplitter,
     RecursiveCharacterTextSplitter,
     TextSplitter,
 )
@@ -39,6 +40,7 @@ __all__ = [
     "validate_uuid",
     "update_settings_from_dict",
     # Text splitter
+    "CharacterTextSplitter",
     "RecursiveCharacterTextSplitter",
     "TextSplitter",
 ]
@@ -318,6 +318,69 @@ class IngestionMixins:
             "DELETE", "delete_vector_index", json=data
         )
 
+    async def list_filter_indices(self, min_usage: int = 1) -> dict:
+        """
+        List the indices on chunk metadata, and the indices recommended for
+        the metadata filters searches have used.
+
+        Args:
+            min_usage (int): Minimum number of filters on a key to recommend an index for it
+
+        Returns:
+            dict: Response containing the indices and recommendations
+        """
+        params = {"min_usage": min_usage}
+        return await self._make_request(  # type: ignore
+            "GET", "list_filter_indices", params=params
+        )
+
+    async def create_filter_index(
+        self,
+        key: Optional[str] = None,
+        recommended: bool = False,
+        min_usage: int = 1,
+        concurrently: bool = True,
+    ) -> dict:
+        """
+        Create an index serving metadata filters.
+
+        Args:
+            key (Optional[str]): Metadata key compared as a number to build an expression index for, or None for the GIN index serving equality and containment filters
+            recommended (bool): Whether to create the missing recommended indices instead
+            min_usage (int): Minimum number of filters on a key to create a recommended index for it
+            concurrently (bool): Whether to create the indices concurrently
+
+        Returns:
+            dict: Response containing the creation status
+        """
+        data = {
+            "key": key,
+            "recommended": recommended,
+            "min_usage": min_usage,
+            "concurrently": concurrently,
+        }
+        return await self._make_request(  # type: ignore
+            "POST", "create_filter_index", json=data
+        )
+
+    async def delete_filter_index(
+        self, index_name: str, concurrently: bool = True
+    ) -> dict:
+        """
+        Delete an index on chunk metadata.
+
+        Args:
+            index_name (str): Name of the index to delete
+            concurrently (bool): Whether to delete the index concurrently
+
+        Returns:
+            dict: Response containing the deletion status
+        """
+        data = {"index_name": index_name, "concurrently": concurrently}
+        return await self._make_request(  # type: ignore
+            "DELETE", "delete_filter_index", json=data
+        )
+
     async def update_document_metadata(
         self,
         document_id: Union[str, UUID],
@@ -1,6 +1,8 @@
 from typing import Optional, Union
 from uuid import UUID
 
+from shared.abstractions import IndexMeasure, IndexMethod, VectorTableName
+
 from ..models import (
     KGCreationSettings,
     KGEnrichmentSettings,
@@ -256,3 +258,72 @@ class KGMixins:
         }
 
         return await self._make_request("DELETE", "delete_graph_for_collection", json=data)  # type: ignore
+
+    async def create_kg_vector_index(
+        self,
+        table_name: VectorTableName,
+        index_method: IndexMethod = IndexMethod.hnsw,
+        index_measure: IndexMeasure = IndexMeasure.cosine_distance,
+        index_arguments: Optional[dict] = None,
+        index_name: Optional[str] = None,
+        concurrently: bool = True,
+    ) -> dict:
+        """
+        Create a vector index on the embeddings of a knowledge graph table.
+
+        Args:
+            table_name (VectorTableName): The table to index, one of document_entity, collection_entity, chunk_triple or community_report.
+            index_method (IndexMethod): Method to use for indexing (hnsw or ivfflat)
+            index_measure (IndexMeasure): Distance measure to use
+            index_arguments (Optional[dict]): Build arguments for the index
+            index_name (Optional[str]): Custom name for the index
+            concurrently (bool): Whether to create the index concurrently
+        """
+        data = {
+            "table_name": table_name,
+            "index_method": index_method,
+            "index_measure": index_measure,
+            "index_arguments": index_arguments,
+            "index_name": index_name,
+            "concurrently": concurrently,
+        }
+        return await self._make_request(  # type: ignore
+            "POST", "create_kg_vector_index", json=data
+        )
+
+    async def list_kg_vector_indices(
+        self, table_name: VectorTableName
+    ) -> dict:
+        """
+        List the vector indices of a knowledge graph table.
+
+        Args:
+            table_name (VectorTableName): The table to list indices from
+        """
+        params = {"table_name": table_name}
+        return await self._make_request(  # type: ignore
+            "GET", "list_kg_vector_indices", params=params
+        )
+
+    async def delete_kg_vector_index(
+        self,
+        index_name: str,
+        table_name: VectorTableName,
+        concurrently: bool = True,
+    ) -> dict:
+        """
+        Delete a vector index of a knowledge graph table.
+
+        Args:
+            index_name (str): Name of the index to delete
+            table_name (VectorTableName): The table containing the index
+            concurrently (bool): Whether to delete the index concurrently
+        """
+        data = {
+            "index_name": index_name,
+            "table_name": table_name,
+            "concurrently": concurrently,
+        }
+        return await self._make_request(  # type: ignore
+            "DELETE", "delete_kg_vector_index", json=data
+        )
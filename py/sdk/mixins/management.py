@@ -187,6 +187,30 @@ class ManagementMixins:
             "DELETE", "delete", params={"filters": filters_json}
         ) or {"results": {}}
 
+    async def bulk_delete(
+        self,
+        filters: dict,
+        batch_size: Optional[int] = None,
+    ) -> dict:
+        """
+        Delete data from the database given a set of filters, in batches of
+        documents in the background.
+
+        Args:
+            filters (dict[str, str]): The filters to delete by.
+            batch_size (Optional[int]): Number of documents deleted per batch.
+
+        Returns:
+            dict: The workflow message.
+        """
+        params: dict = {"filters": json.dumps(filters)}
+        if batch_size is not None:
+            params["batch_size"] = batch_size
+
+        return await self._make_request(  # type: ignore
+            "DELETE", "bulk_delete", params=params
+        )
+
     async def download_file(
         self,
         document_id: Union[str, UUID],
@@ -1,5 +1,6 @@
 from shared.abstractions import (
     GenerationConfig,
+    HybridSearchExecutionMode,
     HybridSearchSettings,
     KGCommunityResult,
     KGCreationSettings,
@@ -19,6 +20,8 @@ from shared.abstractions import (
     R2RSerializable,
     SearchSettings,
     Token,
+    VectorSearchPlan,
+    VectorSearchPlanSettings,
     VectorSearchResult,
 )
 from shared.api.models import (
@@ -33,6 +36,7 @@ from shared.api.models import (
 __all__ = [
     "GenerationConfig",
     "HybridSearchSettings",
+    "HybridSearchExecutionMode",
     "KGCommunityResult",
     "KGCreationSettings",
     "KGEnrichmentSettings",
@@ -49,6 +53,8 @@ __all__ = [
     "R2RException",
     "R2RSerializable",
     "Token",
+    "VectorSearchPlan",
+    "VectorSearchPlanSettings",
     "VectorSearchResult",
     "SearchSettings",
     "KGEntityDeduplicationSettings",
@@ -38,6 +38,7 @@ from .llm import (
 from .prompt import Prompt
 from .search import (
     AggregateSearchResult,
+    HybridSearchExecutionMode,
     HybridSearchSettings,
     KGCommunityResult,
     KGEntityResult,
@@ -48,6 +49,8 @@ from .search import (
     KGSearchResultType,
     KGSearchSettings,
     SearchSettings,
+    VectorSearchPlan,
+    VectorSearchPlanSettings,
     VectorSearchResult,
 )
 from .user import Token, TokenData, UserStats
@@ -113,9 +116,12 @@ __all__ = [
     "KGCommunityResult",
     "KGGlobalResult",
     "KGSearchSettings",
+    "VectorSearchPlan",
+    "VectorSearchPlanSettings",
     "VectorSearchResult",
     "SearchSettings",
     "HybridSearchSettings",
+    "HybridSearchExecutionMode",
     # KG abstractions
     "KGCreationSettings",
     "KGEnrichmentSettings",
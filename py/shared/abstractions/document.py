@@ -201,11 +201,6 @@ class DocumentInfo(R2RSerializable):
         """Prepare the document info for database entry, extracting certain fields from metadata."""
         now = datetime.now()
 
-        # Format the embedding properly for Postgres vector type
-        embedding = None
-        if self.summary_embedding is not None:
-            embedding = f"[{','.join(str(x) for x in self.summary_embedding)}]"
-
         return {
             "document_id": self.id,
             "collection_ids": self.collection_ids,
@@ -221,7 +216,7 @@ class DocumentInfo(R2RSerializable):
             "updated_at": self.updated_at or now,
             "ingestion_attempt_number": self.ingestion_attempt_number or 0,
             "summary": self.summary,
-            "summary_embedding": embedding,
+            "summary_embedding": self.summary_embedding,
         }
 
 
@@ -289,6 +289,9 @@ class CommunityReport(BaseModel):
     attributes: dict[str, Any] | None = None
     """A dictionary of additional attributes associated with the report (optional)."""
 
+    fingerprint: str | None = None
+    """Hash of the entities and triples the report was generated from."""
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         if isinstance(self.attributes, str):
@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import Optional
 
 from pydantic import Field
 
@@ -72,6 +73,16 @@ class KGCreationSettings(R2RSerializable):
         description="The maximum length of the description for a node in the graph.",
     )
 
+    max_concurrent_extractions: int = Field(
+        default=16,
+        description="The maximum number of triples extraction LLM calls in flight at once.",
+    )
+
+    extraction_tokens_per_minute: Optional[int] = Field(
+        default=None,
+        description="The LLM token budget per minute for triples extraction, unset means unpaced.",
+    )
+
     generation_config: GenerationConfig = Field(
         default_factory=GenerationConfig,
         description="Configuration for text generation during graph enrichment.",
@@ -96,6 +107,11 @@ class KGEntityDeduplicationSettings(R2RSerializable):
         description="The prompt to use for knowledge graph entity deduplication.",
     )
 
+    description_deduplication_eps: float = Field(
+        default=0.1,
+        description="The cosine distance within which entity descriptions are merged when deduplicating by description.",
+    )
+
     generation_config: GenerationConfig = Field(
         default_factory=GenerationConfig,
         description="Configuration for text generation during graph entity deduplication.",
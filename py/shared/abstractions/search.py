@@ -22,6 +22,7 @@ class VectorSearchResult(R2RSerializable):
     score: float
     text: str
     metadata: dict[str, Any]
+    search_plan: Optional[str] = None
 
     def __str__(self) -> str:
         return f"VectorSearchResult(id={self.extraction_id}, document_id={self.document_id}, score={self.score})"
@@ -38,6 +39,7 @@ class VectorSearchResult(R2RSerializable):
             "score": self.score,
             "text": self.text,
             "metadata": self.metadata,
+            "search_plan": self.search_plan,
         }
 
     class Config:
@@ -63,6 +65,7 @@ class KGSearchResultType(str, Enum):
 
 class KGSearchMethod(str, Enum):
     LOCAL = "local"
+    GLOBAL = "global"
 
 
 class KGEntityResult(R2RSerializable):
@@ -165,6 +168,12 @@ class AggregateSearchResult(R2RSerializable):
         }
 
 
+class HybridSearchExecutionMode(str, Enum):
+    SEQUENTIAL = "sequential"
+    PARALLEL = "parallel"
+    SQL = "sql"
+
+
 class HybridSearchSettings(R2RSerializable):
     full_text_weight: float = Field(
         default=1.0, description="Weight to apply to full text search"
@@ -179,6 +188,36 @@ class HybridSearchSettings(R2RSerializable):
     rrf_k: int = Field(
         default=50, description="K-value for RRF (Rank Reciprocal Fusion)"
     )
+    execution_mode: HybridSearchExecutionMode = Field(
+        default=HybridSearchExecutionMode.SEQUENTIAL,
+        description="How to run the semantic and full text legs: one after the other, concurrently on separate pooled connections, or fused with RRF inside a single SQL statement",
+    )
+
+
+class VectorSearchPlan(str, Enum):
+    AUTO = "auto"
+    EXACT = "exact"
+    HNSW = "hnsw"
+    PARTIAL_INDEX = "partial_index"
+
+
+class VectorSearchPlanSettings(R2RSerializable):
+    plan: VectorSearchPlan = Field(
+        default=VectorSearchPlan.AUTO,
+        description="How to run a filtered semantic search: chosen from the estimated filter selectivity, an exact scan over the filtered rows, an over-fetching scan of the ANN index, or a scan of the partial index of the filtered collection",
+    )
+    exact_scan_threshold: int = Field(
+        default=10_000,
+        description="Estimated number of rows matching the filters under which the filtered rows are scanned exactly",
+    )
+    overfetch_factor: float = Field(
+        default=2.0,
+        description="Multiplier on the candidates an ANN scan fetches, on top of those the filter selectivity calls for",
+    )
+    max_candidates: int = Field(
+        default=1000,
+        description="Most candidates an ANN scan fetches before falling back to an exact scan of the filtered rows",
+    )
 
 
 class SearchSettings(R2RSerializable):
@@ -247,6 +286,10 @@ class SearchSettings(R2RSerializable):
         default=HybridSearchSettings(),
         description="Settings for hybrid search",
     )
+    search_plan_settings: VectorSearchPlanSettings = Field(
+        default=VectorSearchPlanSettings(),
+        description="Settings for planning filtered semantic search",
+    )
     search_strategy: str = Field(
         default="vanilla",
         description="Search strategy to use (e.g., 'default', 'query_fusion', 'hyde')",
@@ -352,12 +395,23 @@ class KGSearchSettings(R2RSerializable):
         default_factory=GenerationConfig,
         description="Configuration for text generation during graph search.",
     )
+    probes: int = Field(
+        default=10,
+        description="Number of ivfflat index lists to query. Higher increases accuracy but decreases speed.",
+    )
+    ef_search: int = Field(
+        default=40,
+        description="Size of the dynamic candidate list for HNSW index search. Higher increases accuracy but decreases speed.",
+    )
 
     # TODO: add these back in
     # entity_types: list = []
     # relationships: list = []
     max_community_description_length: int = 65536
     max_llm_queries_for_global_search: int = 250
+    max_concurrent_llm_queries_for_global_search: int = 16
+    # estimated prompt and completion tokens of all LLM calls of one query
+    max_tokens_for_global_search: int = 500_000
     local_search_limits: dict[str, int] = {
         "__Entity__": 20,
         "__Relationship__": 20,
@@ -373,6 +427,10 @@ class KGSearchSettings(R2RSerializable):
             "generation_config": GenerationConfig.Config.json_schema_extra,
             "max_community_description_length": 65536,
             "max_llm_queries_for_global_search": 250,
+            "max_concurrent_llm_queries_for_global_search": 16,
+            "max_tokens_for_global_search": 500_000,
+            "probes": 10,
+            "ef_search": 40,
             "local_search_limits": {
                 "__Entity__": 20,
                 "__Relationship__": 20,
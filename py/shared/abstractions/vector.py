@@ -117,8 +117,7 @@ class VectorTableName(str, Enum):
     VECTORS = "vectors"
     ENTITIES_DOCUMENT = "document_entity"
     ENTITIES_COLLECTION = "collection_entity"
-    # TODO: Add support for triples
-    # TRIPLES = "chunk_triple"
+    TRIPLES = "chunk_triple"
     COMMUNITIES = "community_report"
 
     def __str__(self) -> str:
@@ -67,6 +67,11 @@ class ListVectorIndicesResponse(BaseModel):
     indices: list[dict[str, Any]]
 
 
+class ListFilterIndicesResponse(BaseModel):
+    indices: list[dict[str, Any]]
+    recommendations: list[dict[str, Any]]
+
+
 class DeleteVectorIndexResponse(BaseModel):
     message: str
 
@@ -80,5 +85,6 @@ WrappedMetadataUpdateResponse = ResultsWrapper[IngestionResponse]
 WrappedUpdateResponse = ResultsWrapper[UpdateResponse]
 WrappedCreateVectorIndexResponse = ResultsWrapper[CreateVectorIndexResponse]
 WrappedListVectorIndicesResponse = ResultsWrapper[ListVectorIndicesResponse]
+WrappedListFilterIndicesResponse = ResultsWrapper[ListFilterIndicesResponse]
 WrappedDeleteVectorIndexResponse = ResultsWrapper[DeleteVectorIndexResponse]
 WrappedSelectVectorIndexResponse = ResultsWrapper[SelectVectorIndexResponse]
@@ -45,6 +45,8 @@ class ServerStats(BaseModel):
     uptime_seconds: float
     cpu_usage: float
     memory_usage: float
+    auth_cache: Optional[dict[str, Any]] = None
+    password_hashing: Optional[dict[str, Any]] = None
 
 
 class AnalyticsResponse(BaseModel):
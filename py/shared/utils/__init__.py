@@ -18,7 +18,11 @@ from .base_utils import (
     to_async_generator,
     validate_uuid,
 )
-from .splitter.text import RecursiveCharacterTextSplitter, TextSplitter
+from .splitter.text import (
+    CharacterTextSplitter,
+    RecursiveCharacterTextSplitter,
+    TextSplitter,
+)
 
 __all__ = [
     "format_entity_types",
@@ -41,6 +45,7 @@ __all__ = [
     "llm_cost_per_million_tokens",
     "validate_uuid",
     # Text splitter
+    "CharacterTextSplitter",
     "RecursiveCharacterTextSplitter",
     "TextSplitter",
     # Vector utils
@@ -1,3 +1,3 @@
-from .text import RecursiveCharacterTextSplitter
+from .text import CharacterTextSplitter, RecursiveCharacterTextSplitter
 
-__all__ = ["RecursiveCharacterTextSplitter"]
+__all__ = ["CharacterTextSplitter", "RecursiveCharacterTextSplitter"]
@@ -29,19 +29,25 @@ import logging
 import pathlib
 import re
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass
 from enum import Enum
 from io import BytesIO, StringIO
+from itertools import accumulate, islice, repeat
+from operator import add, itemgetter
 from typing import (
     AbstractSet,
     Any,
     Callable,
     Collection,
+    Deque,
     Dict,
     Iterable,
+    Iterator,
     List,
     Literal,
     Optional,
+    Pattern,
     Sequence,
     Tuple,
     Type,
@@ -425,6 +431,69 @@ def _split_text_with_regex(
     return [s for s in splits if s != ""]
 
 
+# A chunk as `(start, end, text)`, where `text` is None when the chunk is
+# exactly `source[start:end]` and the joined text when dropped separators had
+# to be re-inserted between the pieces
+_SpanChunk = Tuple[int, int, Optional[str]]
+
+
+def _iter_split_spans(
+    text: str,
+    start: int,
+    end: int,
+    separator: str,
+    pattern: Optional[Pattern],
+    keep_separator: bool,
+    length_function: Callable[[str], int],
+) -> Iterator[Tuple[int, int, int]]:
+    """
+    Offset equivalent of `_split_text_with_regex` on `text[start:end]`.
+
+    Returns `(start, end, length)` for every non-empty piece. `pattern` is
+    None for literal separators, whose offsets are computed from the piece
+    lengths of `str.split` without a Python-level loop.
+    """
+    if not separator:
+        # An empty separator splits into characters
+        spans = ((i, i + 1, 1) for i in range(start, end))
+    elif pattern is None:
+        separator_len = len(separator)
+        lengths = list(map(len, text[start:end].split(separator)))
+        if keep_separator:
+            # Separators open the piece that follows them
+            lengths[1:] = map(
+                add, islice(lengths, 1, None), repeat(separator_len)
+            )
+            strides = lengths
+        else:
+            strides = map(add, lengths, repeat(separator_len))
+        starts = list(accumulate(strides, initial=start))
+        spans = zip(starts, map(add, starts, lengths), lengths)
+    else:
+        # Anchors and lookarounds see slice boundaries differently than
+        # `pos`/`endpos`, so regex separators search a copy of the range
+        spans = _iter_regex_spans(text, start, end, pattern, keep_separator)
+
+    spans = filter(itemgetter(2), spans)
+    if length_function is len:
+        return spans
+    return (
+        (piece_start, piece_end, length_function(text[piece_start:piece_end]))
+        for piece_start, piece_end, _ in spans
+    )
+
+
+def _iter_regex_spans(
+    text: str, start: int, end: int, pattern: Pattern, keep_separator: bool
+) -> Iterator[Tuple[int, int, int]]:
+    previous = start
+    for match in pattern.finditer(text[start:end]):
+        match_start = match.start() + start
+        yield previous, match_start, match_start - previous
+        previous = match_start if keep_separator else match.end() + start
+    yield previous, end, end - previous
+
+
 class TextSplitter(BaseDocumentTransformer, ABC):
     """Interface for splitting text into chunks."""
 
@@ -459,11 +528,137 @@ class TextSplitter(BaseDocumentTransformer, ABC):
         self._keep_separator = keep_separator
         self._add_start_index = add_start_index
         self._strip_whitespace = strip_whitespace
+        self._separator_patterns: Dict[str, Pattern] = {}
 
     @abstractmethod
     def split_text(self, text: str) -> List[str]:
         """Split text into multiple components."""
 
+    def iter_split_text(self, text: str) -> Iterator[str]:
+        """Split text and yield the components as they are produced."""
+        yield from self.split_text(text)
+
+    def split_text_spans(self, text: str) -> Iterator[Tuple[int, int]]:
+        """Yield the `(start, end)` offsets of each component in `text`."""
+        raise NotImplementedError(
+            f"{type(self).__name__} does not report chunk offsets."
+        )
+
+    def _merge_spans(
+        self,
+        text: str,
+        pieces: Iterable[Tuple[int, int, int]],
+        separator: str,
+        literal_separator: bool = True,
+        split_long: Optional[
+            Callable[[int, int], Iterator[_SpanChunk]]
+        ] = None,
+    ) -> Iterator[_SpanChunk]:
+        """
+        Offset equivalent of `_merge_splits` over `(start, end, length)`
+        pieces of `text`.
+
+        The current chunk is a window over the pieces, so dropping pieces
+        from the front for the overlap is O(1) and chunks are yielded as
+        soon as they are complete. Pieces of at least `chunk_size` are
+        handed to `split_long` when it is given, which ends the current run
+        like `_split_text` does. Chunks are only re-joined with `separator`
+        when the source does not already hold exactly one literal separator
+        between each of their pieces.
+        """
+        chunk_size = self._chunk_size
+        chunk_overlap = self._chunk_overlap
+        strip_whitespace = self._strip_whitespace
+        separator_len = self._length_function(separator)
+        gap = len(separator) if literal_separator else -1
+        window: Deque[Tuple[int, int, int]] = deque()
+        # `(start, previous_end)` of window pieces that are not preceded by
+        # exactly one separator in the source
+        breaks: Deque[Tuple[int, int]] = deque()
+        total = 0
+        previous_end = 0
+
+        def join() -> Optional[_SpanChunk]:
+            start, end = window[0][0], window[-1][1]
+            joined = None
+            if breaks:
+                parts = []
+                run_start = start
+                for piece_start, previous_end in breaks:
+                    parts.append(text[run_start:previous_end])
+                    run_start = piece_start
+                parts.append(text[run_start:end])
+                joined = separator.join(parts)
+            if strip_whitespace:
+                while start < end and text[start].isspace():
+                    start += 1
+                while end > start and text[end - 1].isspace():
+                    end -= 1
+                if joined is not None:
+                    joined = joined.strip()
+            if (joined == "") if joined is not None else start == end:
+                return None
+            return start, end, joined
+
+        for start, end, length in pieces:
+            if split_long is not None and length >= chunk_size:
+                if window:
+                    chunk = join()
+                    if chunk is not None:
+                        yield chunk
+                    window.clear()
+                    breaks.clear()
+                    total = 0
+                yield from split_long(start, end)
+                continue
+            if total + length + (separator_len if window else 0) > chunk_size:
+                if total > chunk_size:
+                    logger.warning(
+                        f"Created a chunk of size {total}, "
+                        f"which is longer than the specified {chunk_size}"
+                    )
+                if window:
+                    chunk = join()
+                    if chunk is not None:
+                        yield chunk
+                    # Keep on popping if:
+                    # - we have a larger chunk than in the chunk overlap
+                    # - or if we still have any chunks and the length is long
+                    while total > chunk_overlap or (
+                        total + length + (separator_len if window else 0)
+                        > chunk_size
+                        and total > 0
+                    ):
+                        total -= window.popleft()[2] + (
+                            separator_len if window else 0
+                        )
+                    while breaks and (
+                        not window or breaks[0][0] <= window[0][0]
+                    ):
+                        breaks.popleft()
+            if window:
+                if start - previous_end != gap:
+                    breaks.append((start, previous_end))
+                total += length + separator_len
+            else:
+                total += length
+            window.append((start, end, length))
+            previous_end = end
+        if window:
+            chunk = join()
+            if chunk is not None:
+                yield chunk
+
+    def _separator_pattern(
+        self, separator: str, is_regex: bool
+    ) -> Optional[Pattern]:
+        """Compiled regex separator, or None for literal separators."""
+        if not separator or not is_regex:
+            return None
+        if separator not in self._separator_patterns:
+            self._separator_patterns[separator] = re.compile(separator)
+        return self._separator_patterns[separator]
+
     def create_documents(
         self, texts: List[str], metadatas: Optional[List[dict]] = None
     ) -> List[SplitterDocument]:
@@ -473,8 +668,10 @@ class TextSplitter(BaseDocumentTransformer, ABC):
         for i, text in enumerate(texts):
             index = 0
             previous_chunk_len = 0
-            for chunk in self.split_text(text):
-                metadata = copy.deepcopy(_metadatas[i])
+            for chunk in self.iter_split_text(text):
+                metadata = (
+                    copy.deepcopy(_metadatas[i]) if _metadatas[i] else {}
+                )
                 if self._add_start_index:
                     offset = index + previous_chunk_len - self._chunk_overlap
                     index = text.find(chunk, max(0, offset))
@@ -496,7 +693,7 @@ class TextSplitter(BaseDocumentTransformer, ABC):
             metadatas.append(doc.metadata)
         return self.create_documents(texts, metadatas=metadatas)
 
-    def _join_docs(self, docs: List[str], separator: str) -> Optional[str]:
+    def _join_docs(self, docs: Iterable[str], separator: str) -> Optional[str]:
         text = separator.join(docs)
         if self._strip_whitespace:
             text = text.strip()
@@ -513,7 +710,7 @@ class TextSplitter(BaseDocumentTransformer, ABC):
         separator_len = self._length_function(separator)
 
         docs = []
-        current_doc: List[str] = []
+        current_doc: Deque[str] = deque()
         total = 0
         for d in splits:
             _len = self._length_function(d)
@@ -543,7 +740,7 @@ class TextSplitter(BaseDocumentTransformer, ABC):
                         total -= self._length_function(current_doc[0]) + (
                             separator_len if len(current_doc) > 1 else 0
                         )
-                        current_doc = current_doc[1:]
+                        current_doc.popleft()
             current_doc.append(d)
             total += _len + (separator_len if len(current_doc) > 1 else 0)
         doc = self._join_docs(current_doc, separator)
@@ -643,6 +840,55 @@ class CharacterTextSplitter(TextSplitter):
 
     def split_text(self, text: str) -> List[str]:
         """Split incoming text and return chunks."""
+        return list(self.iter_split_text(text))
+
+    def iter_split_text(self, text: str) -> Iterator[str]:
+        if not self._supports_spans():
+            yield from self._split_text(text)
+            return
+        for start, end, chunk in self._iter_chunks(text):
+            yield text[start:end] if chunk is None else chunk
+
+    def split_text_spans(self, text: str) -> Iterator[Tuple[int, int]]:
+        """
+        Yield the `(start, end)` offsets of each chunk in `text`.
+
+        With `keep_separator=False` a chunk that spans runs of repeated
+        separators collapses them, so its text can differ from
+        `text[start:end]`.
+        """
+        if not self._supports_spans():
+            raise NotImplementedError(
+                "Chunk offsets are not supported for separators with groups."
+            )
+        for start, end, _ in self._iter_chunks(text):
+            yield start, end
+
+    def _supports_spans(self) -> bool:
+        pattern = self._separator_pattern(
+            self._separator, self._is_separator_regex
+        )
+        return pattern is None or pattern.groups == 0
+
+    def _iter_chunks(self, text: str) -> Iterator[_SpanChunk]:
+        pieces = _iter_split_spans(
+            text,
+            0,
+            len(text),
+            self._separator,
+            self._separator_pattern(self._separator, self._is_separator_regex),
+            self._keep_separator,
+            self._length_function,
+        )
+        yield from self._merge_spans(
+            text,
+            pieces,
+            "" if self._keep_separator else self._separator,
+            not self._is_separator_regex,
+        )
+
+    def _split_text(self, text: str) -> List[str]:
+        """Reference implementation of `split_text` on string copies."""
         # First we naively split the large input into a bunch of smaller ones.
         separator = (
             self._separator
@@ -1248,7 +1494,7 @@ class RecursiveCharacterTextSplitter(TextSplitter):
         self.chunk_overlap = chunk_overlap
 
     def _split_text(self, text: str, separators: List[str]) -> List[str]:
-        """Split incoming text and return chunks."""
+        """Reference implementation of `split_text` on string copies."""
         final_chunks = []
         # Get appropriate separator to use
         separator = separators[-1]
@@ -1290,7 +1536,91 @@ class RecursiveCharacterTextSplitter(TextSplitter):
         return final_chunks
 
     def split_text(self, text: str) -> List[str]:
-        return self._split_text(text, self._separators)
+        return list(self.iter_split_text(text))
+
+    def iter_split_text(self, text: str) -> Iterator[str]:
+        if not self._supports_spans():
+            yield from self._split_text(text, self._separators)
+            return
+        for start, end, chunk in self._iter_chunks(
+            text, 0, len(text), self._separators
+        ):
+            yield text[start:end] if chunk is None else chunk
+
+    def split_text_spans(self, text: str) -> Iterator[Tuple[int, int]]:
+        """
+        Yield the `(start, end)` offsets of each chunk in `text`.
+
+        With `keep_separator=False` a chunk that spans runs of repeated
+        separators collapses them, so its text can differ from
+        `text[start:end]`.
+        """
+        if not self._supports_spans():
+            raise NotImplementedError(
+                "Chunk offsets are not supported for separators with groups."
+            )
+        for start, end, _ in self._iter_chunks(
+            text, 0, len(text), self._separators
+        ):
+            yield start, end
+
+    def _supports_spans(self) -> bool:
+        for separator in self._separators:
+            pattern = self._separator_pattern(
+                separator, self._is_separator_regex
+            )
+            if pattern is not None and pattern.groups:
+                return False
+        return True
+
+    def _iter_chunks(
+        self, text: str, start: int, end: int, separators: List[str]
+    ) -> Iterator[_SpanChunk]:
+        """Offset equivalent of `_split_text` on `text[start:end]`."""
+        # Get appropriate separator to use
+        separator = separators[-1]
+        new_separators = []
+        for i, _s in enumerate(separators):
+            if _s == "":
+                separator = _s
+                break
+            pattern = self._separator_pattern(_s, self._is_separator_regex)
+            if (
+                pattern.search(text[start:end])
+                if pattern is not None
+                else text.find(_s, start, end) != -1
+            ):
+                separator = _s
+                new_separators = separators[i + 1 :]
+                break
+
+        pieces = _iter_split_spans(
+            text,
+            start,
+            end,
+            separator,
+            self._separator_pattern(separator, self._is_separator_regex),
+            self._keep_separator,
+            self._length_function,
+        )
+
+        def split_long(
+            piece_start: int, piece_end: int
+        ) -> Iterator[_SpanChunk]:
+            if not new_separators:
+                return iter([(piece_start, piece_end, None)])
+            return self._iter_chunks(
+                text, piece_start, piece_end, new_separators
+            )
+
+        # Merge runs of short pieces, recursively splitting longer ones
+        yield from self._merge_spans(
+            text,
+            pieces,
+            "" if self._keep_separator else separator,
+            not self._is_separator_regex,
+            split_long,
+        )
 
     @classmethod
     def from_language(
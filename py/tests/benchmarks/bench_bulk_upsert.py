@@ -0,0 +1,94 @@
+"""
+Throughput benchmark for vector chunk loading.
+
+Compares `upsert_entries` (per-row `INSERT ... ON CONFLICT` through
+`executemany`) with `bulk_upsert_entries` (binary `COPY` into a staging table
+followed by one set-based merge). Both are fed batches the same way
+`VectorStoragePipe` does.
+
+Usage (requires a reachable Postgres with pgvector, configured through the
+usual R2R_POSTGRES_* environment variables):
+
+    python -m tests.benchmarks.bench_bulk_upsert --rows 10000 100000 1000000
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+
+import numpy as np
+
+from core import AppConfig, BCryptConfig, DatabaseConfig, Vector, VectorEntry
+from core.providers import BCryptProvider, PostgresDBProvider
+
+
+def make_entries(rows: int, dimension: int) -> list[VectorEntry]:
+    document_id = uuid.uuid4()
+    vectors = np.random.rand(rows, dimension).astype(np.float32)
+    return [
+        VectorEntry(
+            extraction_id=uuid.uuid4(),
+            document_id=document_id,
+            user_id=uuid.uuid4(),
+            collection_ids=[uuid.uuid4()],
+            vector=Vector(data=vectors[i].tolist()),
+            text=f"chunk {i} " * 40,
+            metadata={"chunk_order": i},
+        )
+        for i in range(rows)
+    ]
+
+
+async def load(
+    db: PostgresDBProvider,
+    entries: list[VectorEntry],
+    batch_size: int,
+    bulk: bool,
+) -> float:
+    start = time.perf_counter()
+    for i in range(0, len(entries), batch_size):
+        batch = entries[i : i + batch_size]
+        if bulk:
+            await db.bulk_upsert_entries(batch)
+        else:
+            await db.upsert_entries(batch)
+    return time.perf_counter() - start
+
+
+async def main(args: argparse.Namespace) -> None:
+    app = AppConfig(project_name=f"bench_bulk_{uuid.uuid4().hex[:8]}")
+    db = PostgresDBProvider(
+        DatabaseConfig.create(provider="postgres", app=app),
+        dimension=args.dimension,
+        crypto_provider=BCryptProvider(BCryptConfig(app=app)),
+    )
+    await db.initialize()
+    table = db.vector_handler._get_table_name("vectors")
+    try:
+        print(f"dim={args.dimension} batch_size={args.batch_size}")
+        for rows in args.rows:
+            entries = make_entries(rows, args.dimension)
+            for bulk in (False, True):
+                await db.connection_manager.execute_query(f"TRUNCATE {table};")
+                elapsed = await load(db, entries, args.batch_size, bulk)
+                label = "copy+merge" if bulk else "execute_many"
+                print(
+                    f"rows={rows:>9} {label:>12}: {elapsed:8.2f}s "
+                    f"({rows / elapsed:10.0f} rows/s)"
+                )
+    finally:
+        await db.connection_manager.execute_query(
+            f'DROP SCHEMA "{db.project_name}" CASCADE;'
+        )
+        await db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--dimension", type=int, default=512)
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    asyncio.run(main(parser.parse_args()))
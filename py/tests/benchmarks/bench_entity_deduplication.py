@@ -0,0 +1,160 @@
+"""
+Wall time and peak memory of entity deduplication by description.
+
+Generates `--dimension`-sized embeddings where a fraction of the entities
+are noisy copies of others, and clusters them with `cluster_embeddings`
+using exact blocked matrix products (up to `--exact-limit` entities) and
+inverted-file blocking, and, up to `--legacy-limit` entities, with the
+previous `DBSCAN(metric="cosine")` over a list of lists. `recall` is the
+share of exact duplicate pairs that inverted-file blocking also merges.
+
+Every run happens in a fresh interpreter so peak RSS is comparable.
+
+Usage:
+
+    python -m tests.benchmarks.bench_entity_deduplication --entities 10000 100000 1000000
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+
+EPS = 0.1
+
+
+def generate_embeddings(num_entities: int, dimension: int, seed: int = 0):
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    num_bases = int(num_entities * 0.8)
+    embeddings = np.empty((num_entities, dimension), dtype=np.float32)
+    embeddings[:num_bases] = rng.standard_normal(
+        (num_bases, dimension), dtype=np.float32
+    )
+    # the remaining entities restate one of the others
+    sources = rng.integers(0, num_bases, num_entities - num_bases)
+    embeddings[num_bases:] = embeddings[sources] + rng.normal(
+        scale=0.25 / dimension**0.5,
+        size=(num_entities - num_bases, dimension),
+    ).astype(np.float32)
+    return embeddings
+
+
+def peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def same_cluster_pairs(labels) -> set:
+    import numpy as np
+
+    pairs = set()
+    order = np.argsort(labels, kind="stable")
+    sorted_labels = labels[order]
+    starts = np.flatnonzero(np.diff(sorted_labels, prepend=-2))
+    for start, end in zip(starts, list(starts[1:]) + [len(labels)]):
+        if sorted_labels[start] == -1:
+            continue
+        members = order[start:end].tolist()
+        pairs.update((a, b) for a in members for b in members if a < b)
+    return pairs
+
+
+def child(args: argparse.Namespace) -> None:
+    import numpy as np
+
+    from core.pipes.kg.deduplication_engine import cluster_embeddings
+
+    embeddings = generate_embeddings(args.entities[0], args.dimension)
+    baseline = peak_rss_mb()
+    start = time.perf_counter()
+    if args.child == "legacy":
+        from sklearn.cluster import DBSCAN
+
+        # the previous path held embeddings as lists of floats
+        vectors = embeddings.tolist()
+        baseline = peak_rss_mb()
+        start = time.perf_counter()
+        labels = np.asarray(
+            DBSCAN(eps=EPS, min_samples=2, metric="cosine")
+            .fit(vectors)
+            .labels_
+        )
+    else:
+        labels = cluster_embeddings(embeddings, EPS, method=args.child)
+    elapsed = time.perf_counter() - start
+    np.save(args.labels_path, labels)
+    print(
+        json.dumps(
+            {
+                "seconds": elapsed,
+                "rss_mb": peak_rss_mb() - baseline,
+                "clusters": int(labels.max()) + 1,
+            }
+        )
+    )
+
+
+def run_child(mode: str, num_entities: int, args: argparse.Namespace):
+    import numpy as np
+
+    labels_path = f"/tmp/bench_entity_deduplication_{mode}.npy"
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "tests.benchmarks.bench_entity_deduplication",
+            "--child",
+            mode,
+            "--entities",
+            str(num_entities),
+            "--dimension",
+            str(args.dimension),
+            "--labels-path",
+            labels_path,
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1]), np.load(labels_path)
+
+
+def main(args: argparse.Namespace) -> None:
+    for num_entities in args.entities:
+        modes = ["ivf"]
+        if num_entities <= args.exact_limit:
+            modes.insert(0, "exact")
+        if num_entities <= args.legacy_limit:
+            modes.append("legacy")
+        exact_pairs = None
+        for mode in modes:
+            result, labels = run_child(mode, num_entities, args)
+            line = (
+                f"{num_entities:>9} {mode:>6}: {result['seconds']:8.1f}s "
+                f"rss={result['rss_mb']:7.0f}MB clusters={result['clusters']}"
+            )
+            if mode == "exact":
+                exact_pairs = same_cluster_pairs(labels)
+            elif exact_pairs is not None:
+                found = same_cluster_pairs(labels)
+                line += f" recall={len(found & exact_pairs) / max(len(exact_pairs), 1):.4f}"
+            print(line, flush=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--entities", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--dimension", type=int, default=256)
+    parser.add_argument("--exact-limit", type=int, default=100_000)
+    parser.add_argument("--legacy-limit", type=int, default=10_000)
+    parser.add_argument(
+        "--child", choices=["exact", "ivf", "legacy"], default=None
+    )
+    parser.add_argument("--labels-path")
+    args = parser.parse_args()
+    child(args) if args.child else main(args)
@@ -0,0 +1,126 @@
+"""
+Time to first byte, total time and peak RSS of downloading a stored file.
+
+Stores a `--size-mb` file of random bytes as a large object, then reads it
+back twice: streamed with `stream_file`, as `/download_file` serves it, and
+whole with `retrieve_file`, as it was served before. Each way is run in a
+fresh process so its peak RSS is its own. Also times a 1 MB range from the
+middle of the file.
+
+Usage (requires a reachable Postgres, configured through the usual
+R2R_POSTGRES_* environment variables):
+
+    python -m tests.benchmarks.bench_file_download --size-mb 1024
+"""
+
+import argparse
+import asyncio
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+
+from core import AppConfig, BCryptConfig, DatabaseConfig
+from core.providers import BCryptProvider, PostgresDBProvider
+
+
+def peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def provider(project_name: str) -> PostgresDBProvider:
+    app = AppConfig(project_name=project_name)
+    return PostgresDBProvider(
+        DatabaseConfig.create(provider="postgres", app=app),
+        dimension=4,
+        crypto_provider=BCryptProvider(BCryptConfig(app=app)),
+    )
+
+
+async def download(args: argparse.Namespace) -> None:
+    """Reads the file one way, in a process of its own."""
+    db = provider(args.project_name)
+    await db.initialize()
+    try:
+        document_id = uuid.UUID(args.document_id)
+        baseline = peak_rss_mb()
+        start = time.perf_counter()
+        first_byte, size = None, 0
+        if args.download == "stream":
+            async for chunk in db.stream_file(document_id):
+                first_byte = first_byte or time.perf_counter()
+                size += len(chunk)
+        elif args.download == "range":
+            middle = args.size_mb * 1024 * 1024 // 2
+            async for chunk in db.stream_file(
+                document_id, middle, middle + 1024 * 1024
+            ):
+                first_byte = first_byte or time.perf_counter()
+                size += len(chunk)
+        else:
+            _, file_content, _ = await db.retrieve_file(document_id)
+            while chunk := file_content.read(1024 * 1024):
+                first_byte = first_byte or time.perf_counter()
+                size += len(chunk)
+        end = time.perf_counter()
+        print(
+            f"{args.download:>8}: bytes={size} "
+            f"ttfb={(first_byte - start) * 1000:9.1f}ms "
+            f"total={(end - start) * 1000:9.1f}ms "
+            f"peak_rss=+{peak_rss_mb() - baseline:7.1f}MB"
+        )
+    finally:
+        await db.close()
+
+
+async def main(args: argparse.Namespace) -> None:
+    db = provider(f"bench_download_{uuid.uuid4().hex[:8]}")
+    await db.initialize()
+    try:
+        document_id = uuid.uuid4()
+        with tempfile.TemporaryFile() as file_content:
+            for _ in range(args.size_mb):
+                file_content.write(os.urandom(1024 * 1024))
+            file_content.seek(0)
+            await db.store_file(document_id, "bench.bin", file_content)
+
+        print(f"size={args.size_mb}MB")
+        for way in ["stream", "range", "retrieve"]:
+            subprocess.run(
+                [
+                    sys.executable,
+                    "-m",
+                    "tests.benchmarks.bench_file_download",
+                    "--size-mb",
+                    str(args.size_mb),
+                    "--download",
+                    way,
+                    "--project-name",
+                    db.project_name,
+                    "--document-id",
+                    str(document_id),
+                ],
+                check=True,
+            )
+    finally:
+        async with db.pool.get_connection() as conn:
+            await conn.execute(
+                f"SELECT lo_unlink(file_oid) FROM {db.project_name}.file_storage"
+            )
+            await conn.execute(f'DROP SCHEMA "{db.project_name}" CASCADE;')
+        await db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=int, default=1024)
+    parser.add_argument(
+        "--download", choices=["stream", "range", "retrieve"], default=None
+    )
+    parser.add_argument("--project-name", default=None)
+    parser.add_argument("--document-id", default=None)
+    args = parser.parse_args()
+    asyncio.run(download(args) if args.download else main(args))
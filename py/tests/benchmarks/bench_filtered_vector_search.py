@@ -0,0 +1,192 @@
+"""
+Recall and latency of ACL filtered semantic search across tenant sizes.
+
+Loads `--rows` clustered random chunks of other tenants and, for every size in
+`--tenants`, a tenant whose chunks belong to one user and one collection,
+then builds an HNSW index. Each tenant is searched with the ACL filter the
+retrieval router adds for non-superusers, three ways: a single filtered
+query against the index as `semantic_search` ran it before the planner, the
+planner, and an exact scan that provides the ground truth. Reports the
+recall@k and p50 latency of each, and the plans the planner chose.
+
+Usage (requires a reachable Postgres with pgvector, configured through the
+usual R2R_POSTGRES_* environment variables):
+
+    python -m tests.benchmarks.bench_filtered_vector_search --rows 100000 --tenants 10 100 1000 10000
+"""
+
+import argparse
+import asyncio
+import collections
+import random
+import time
+import uuid
+
+from core import AppConfig, BCryptConfig, DatabaseConfig, Vector, VectorEntry
+from core.base import IndexMeasure, SearchSettings, VectorSearchPlan
+from core.base.abstractions import IndexMethod, VectorTableName
+from core.providers import BCryptProvider, PostgresDBProvider
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+CENTERS: list[list[float]] = []
+
+
+def random_vector(dimension: int) -> list[float]:
+    """A point near one of a fixed set of centers, embeddings cluster."""
+    if not CENTERS:
+        CENTERS.extend(
+            [random.gauss(0, 1) for _ in range(dimension)] for _ in range(64)
+        )
+    center = random.choice(CENTERS)
+    return [x + random.gauss(0, 0.3) for x in center]
+
+
+async def load(
+    db: PostgresDBProvider,
+    rows: int,
+    dimension: int,
+    user_id: uuid.UUID,
+    collection_id: uuid.UUID,
+) -> None:
+    batch: list[VectorEntry] = []
+    for _ in range(rows):
+        batch.append(
+            VectorEntry(
+                extraction_id=uuid.uuid4(),
+                document_id=uuid.uuid4(),
+                user_id=user_id,
+                collection_ids=[collection_id],
+                vector=Vector(data=random_vector(dimension)),
+                text="text",
+                metadata={},
+            )
+        )
+        if len(batch) == 1_000:
+            await db.upsert_entries(batch)
+            batch = []
+    if batch:
+        await db.upsert_entries(batch)
+
+
+async def unplanned_search(
+    db: PostgresDBProvider, query_vector: list[float], settings: SearchSettings
+) -> list[uuid.UUID]:
+    """The filtered index query `semantic_search` ran before the planner."""
+    params: list = [str(query_vector)]
+    where_clause = db.vector_handler._build_filters(settings.filters, params)
+    query = f"""
+    SELECT extraction_id FROM {db.vector_handler._get_table_name("vectors")}
+    WHERE {where_clause}
+    ORDER BY vec <=> $1::vector({db.dimension})
+    LIMIT ${len(params) + 1}
+    """
+    results = await db.connection_manager.fetch_query(
+        query, params + [settings.search_limit]
+    )
+    return [result["extraction_id"] for result in results]
+
+
+async def main(args: argparse.Namespace) -> None:
+    app = AppConfig(project_name=f"bench_filtered_{uuid.uuid4().hex[:8]}")
+    db = PostgresDBProvider(
+        DatabaseConfig.create(provider="postgres", app=app),
+        dimension=args.dimension,
+        crypto_provider=BCryptProvider(BCryptConfig(app=app)),
+    )
+    await db.initialize()
+    try:
+        # other tenants, a user and collection each few hundred chunks
+        for _ in range(0, args.rows, 500):
+            await load(db, 500, args.dimension, uuid.uuid4(), uuid.uuid4())
+        tenants = []
+        for size in args.tenants:
+            user_id, collection_id = uuid.uuid4(), uuid.uuid4()
+            await load(db, size, args.dimension, user_id, collection_id)
+            tenants.append((size, user_id, collection_id))
+        await db.create_index(
+            VectorTableName.VECTORS,
+            IndexMeasure.cosine_distance,
+            IndexMethod.hnsw,
+            concurrently=False,
+        )
+        async with db.pool.get_connection() as conn:
+            # flush the GIN pending list of the bulk load, as autovacuum would
+            await conn.execute(f"VACUUM ANALYZE {db.project_name}.vectors")
+
+        print(
+            f"rows={args.rows + sum(args.tenants)} dim={args.dimension} "
+            f"queries={args.queries} k={args.k}"
+        )
+        for size, user_id, collection_id in tenants:
+            settings = SearchSettings(
+                filters={
+                    "$or": [
+                        {"user_id": {"$eq": str(user_id)}},
+                        {"collection_ids": {"$overlap": [str(collection_id)]}},
+                    ]
+                },
+                search_limit=args.k,
+            )
+            exact = settings.model_copy(deep=True)
+            exact.search_plan_settings.plan = VectorSearchPlan.EXACT
+
+            latencies = collections.defaultdict(list)
+            recalls = collections.defaultdict(list)
+            plans: collections.Counter = collections.Counter()
+            for _ in range(args.queries):
+                query_vector = random_vector(args.dimension)
+
+                start = time.perf_counter()
+                truth = await db.semantic_search(query_vector, exact)
+                latencies["exact"].append(time.perf_counter() - start)
+                expected = {result.extraction_id for result in truth}
+
+                start = time.perf_counter()
+                found = await unplanned_search(db, query_vector, settings)
+                latencies["unplanned"].append(time.perf_counter() - start)
+                recalls["unplanned"].append(
+                    len(expected & set(found)) / len(expected)
+                )
+
+                start = time.perf_counter()
+                results = await db.semantic_search(query_vector, settings)
+                latencies["planned"].append(time.perf_counter() - start)
+                recalls["planned"].append(
+                    len(expected & {r.extraction_id for r in results})
+                    / len(expected)
+                )
+                plans.update(r.search_plan for r in results[:1])
+
+            print(f"tenant={size:>6} plans={dict(plans)}")
+            for name in ["unplanned", "planned", "exact"]:
+                recall = (
+                    sum(recalls[name]) / len(recalls[name])
+                    if recalls[name]
+                    else 1.0
+                )
+                print(
+                    f"    {name:>9}: recall@{args.k}={recall:5.3f} "
+                    f"p50={percentile(latencies[name], 50) * 1000:8.2f}ms"
+                )
+    finally:
+        async with db.pool.get_connection() as conn:
+            await conn.execute(f'DROP SCHEMA "{db.project_name}" CASCADE;')
+        await db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument(
+        "--tenants", type=int, nargs="+", default=[10, 100, 1_000, 10_000]
+    )
+    parser.add_argument("--dimension", type=int, default=128)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--k", type=int, default=10)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,120 @@
+"""
+Latency benchmark for the hybrid search execution modes.
+
+Loads random chunks into a throwaway project and reports p50/p99 latency of
+`hybrid_search` for each `HybridSearchExecutionMode`, with several queries in
+flight at once to mimic a loaded worker.
+
+Usage (requires a reachable Postgres with pgvector, configured through the
+usual R2R_POSTGRES_* environment variables):
+
+    python -m tests.benchmarks.bench_hybrid_search --rows 50000 --queries 500
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import uuid
+
+from core import AppConfig, BCryptConfig, DatabaseConfig, Vector, VectorEntry
+from core.base import HybridSearchExecutionMode, SearchSettings
+from core.providers import BCryptProvider, PostgresDBProvider
+
+WORDS = (
+    "alpha beta gamma delta epsilon zeta eta theta iota kappa lambda mu nu "
+    "xi omicron pi rho sigma tau upsilon phi chi psi omega"
+).split()
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def load(db: PostgresDBProvider, rows: int, dimension: int) -> None:
+    batch: list[VectorEntry] = []
+    for _ in range(rows):
+        batch.append(
+            VectorEntry(
+                extraction_id=uuid.uuid4(),
+                document_id=uuid.uuid4(),
+                user_id=uuid.uuid4(),
+                collection_ids=[uuid.uuid4()],
+                vector=Vector(
+                    data=[random.random() for _ in range(dimension)]
+                ),
+                text=" ".join(random.choices(WORDS, k=40)),
+                metadata={},
+            )
+        )
+        if len(batch) == 1_000:
+            await db.upsert_entries(batch)
+            batch = []
+    if batch:
+        await db.upsert_entries(batch)
+
+
+async def run_mode(
+    db: PostgresDBProvider,
+    mode: HybridSearchExecutionMode,
+    queries: int,
+    concurrency: int,
+    dimension: int,
+) -> list[float]:
+    latencies: list[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one_query() -> None:
+        settings = SearchSettings(use_hybrid_search=True, search_limit=10)
+        settings.hybrid_search_settings.execution_mode = mode
+        query_vector = [random.random() for _ in range(dimension)]
+        query_text = " ".join(random.choices(WORDS, k=2))
+        async with semaphore:
+            start = time.perf_counter()
+            await db.hybrid_search(query_text, query_vector, settings)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    await asyncio.gather(*(one_query() for _ in range(queries)))
+    return latencies
+
+
+async def main(args: argparse.Namespace) -> None:
+    app = AppConfig(project_name=f"bench_hybrid_{uuid.uuid4().hex[:8]}")
+    db = PostgresDBProvider(
+        DatabaseConfig.create(provider="postgres", enable_fts=True, app=app),
+        dimension=args.dimension,
+        crypto_provider=BCryptProvider(BCryptConfig(app=app)),
+    )
+    await db.initialize()
+    try:
+        await load(db, args.rows, args.dimension)
+        print(
+            f"rows={args.rows} dim={args.dimension} queries={args.queries} concurrency={args.concurrency}"
+        )
+        for mode in HybridSearchExecutionMode:
+            # Warm up plans and connections before measuring
+            await run_mode(db, mode, 20, args.concurrency, args.dimension)
+            latencies = await run_mode(
+                db, mode, args.queries, args.concurrency, args.dimension
+            )
+            print(
+                f"{mode.value:>10}: p50={percentile(latencies, 50):7.2f}ms "
+                f"p99={percentile(latencies, 99):7.2f}ms "
+                f"mean={statistics.mean(latencies):7.2f}ms"
+            )
+    finally:
+        async with db.pool.get_connection() as conn:
+            await conn.execute(f'DROP SCHEMA "{db.project_name}" CASCADE;')
+        await db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--dimension", type=int, default=512)
+    parser.add_argument("--queries", type=int, default=300)
+    parser.add_argument("--concurrency", type=int, default=8)
+    asyncio.run(main(parser.parse_args()))
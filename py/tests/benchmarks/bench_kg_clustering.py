@@ -0,0 +1,182 @@
+"""
+Wall time and peak memory of knowledge graph clustering.
+
+Generates a synthetic graph with planted communities and clusters it with
+the array-backed engine (`TripleGraph`, Leiden in a worker process) and,
+up to `--legacy-limit` triples, with the previous path that built `Triple`
+objects and a `networkx.Graph` for graspologic. Triples are fed to the
+engine in batches the way the Postgres cursor delivers them; the database
+round trips themselves are not part of the measurement.
+
+Every run happens in a fresh interpreter so peak RSS is comparable;
+`worker_rss` is the peak of the clustering worker process.
+
+Usage:
+
+    python -m tests.benchmarks.bench_kg_clustering --triples 100000 1000000 5000000
+"""
+
+import argparse
+import asyncio
+import json
+import resource
+import subprocess
+import sys
+import time
+
+BATCH_SIZE = 50_000
+
+
+def generate_batches(num_triples: int, seed: int = 0):
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    num_entities = max(num_triples // 5, 2)
+    community_size = 50
+    for start in range(0, num_triples, BATCH_SIZE):
+        size = min(BATCH_SIZE, num_triples - start)
+        subjects = rng.integers(0, num_entities, size)
+        # Most objects come from the subject's planted community
+        community_start = subjects - subjects % community_size
+        objects = np.where(
+            rng.random(size) < 0.9,
+            np.minimum(
+                community_start + rng.integers(0, community_size, size),
+                num_entities - 1,
+            ),
+            rng.integers(0, num_entities, size),
+        )
+        weights = rng.random(size)
+        yield [
+            (f"entity_{s}", f"entity_{o}", w, start + i + 1)
+            for i, (s, o, w) in enumerate(
+                zip(subjects.tolist(), objects.tolist(), weights.tolist())
+            )
+        ]
+
+
+def peak_rss_mb(who: int) -> float:
+    return resource.getrusage(who).ru_maxrss / 1024
+
+
+async def run_engine(num_triples: int) -> dict:
+    from core.providers.database.kg_clustering import TripleGraph
+
+    start = time.perf_counter()
+    graph = TripleGraph()
+    for batch in generate_batches(num_triples):
+        graph.add_triples(batch)
+    loaded = time.perf_counter()
+    clusters = await graph.cluster({"random_seed": 42})
+    clustered = time.perf_counter()
+    # Stands in for the COPY into community_info
+    rows = sum(1 for _ in graph.community_info_records(clusters))
+    return {
+        "load_s": loaded - start,
+        "cluster_s": clustered - loaded,
+        "records_s": time.perf_counter() - clustered,
+        "communities": clusters.num_communities,
+        "rows": rows,
+    }
+
+
+async def run_legacy(num_triples: int) -> dict:
+    import networkx as nx
+    from graspologic.partition import hierarchical_leiden
+
+    from core.base import Triple
+
+    start = time.perf_counter()
+    triples = [
+        Triple(subject=s, predicate="related_to", object=o, weight=w, id=i)
+        for batch in generate_batches(num_triples)
+        for s, o, w, i in batch
+    ]
+    triple_ids_cache: dict[str, list[int]] = {}
+    for triple in triples:
+        triple_ids_cache.setdefault(triple.subject, []).append(triple.id)
+        triple_ids_cache.setdefault(triple.object, []).append(triple.id)
+    graph = nx.Graph()
+    for triple in triples:
+        graph.add_edge(
+            triple.subject, triple.object, weight=triple.weight, id=triple.id
+        )
+    loaded = time.perf_counter()
+    clusters = hierarchical_leiden(graph, random_seed=42)
+    clustered = time.perf_counter()
+    rows = [
+        (c.node, c.cluster, c.parent_cluster, c.level, c.is_final_cluster)
+        for c in clusters
+    ]
+    return {
+        "load_s": loaded - start,
+        "cluster_s": clustered - loaded,
+        "records_s": time.perf_counter() - clustered,
+        "communities": max(c.cluster for c in clusters) + 1,
+        "rows": len(rows),
+    }
+
+
+def child(args: argparse.Namespace) -> None:
+    run = run_engine if args.child == "engine" else run_legacy
+    # Imports are not part of the measurement
+    import core.providers.database.kg_clustering  # noqa: F401
+
+    if args.child == "legacy":
+        import graspologic.partition  # noqa: F401
+    baseline = peak_rss_mb(resource.RUSAGE_SELF)
+    result = asyncio.run(run(args.triples[0]))
+    result["baseline_rss_mb"] = baseline
+    result["peak_rss_mb"] = peak_rss_mb(resource.RUSAGE_SELF)
+    result["worker_rss_mb"] = peak_rss_mb(resource.RUSAGE_CHILDREN)
+    print(json.dumps(result))
+
+
+def main(args: argparse.Namespace) -> None:
+    for num_triples in args.triples:
+        modes = ["engine"]
+        if num_triples <= args.legacy_limit:
+            modes.append("legacy")
+        for mode in modes:
+            output = subprocess.run(
+                [
+                    sys.executable,
+                    "-m",
+                    "tests.benchmarks.bench_kg_clustering",
+                    "--child",
+                    mode,
+                    "--triples",
+                    str(num_triples),
+                ],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            total = (
+                result["load_s"] + result["cluster_s"] + result["records_s"]
+            )
+            print(
+                f"{num_triples:>9} {mode:>6}: total={total:7.1f}s "
+                f"(load={result['load_s']:6.1f}s "
+                f"cluster={result['cluster_s']:6.1f}s "
+                f"records={result['records_s']:5.1f}s) "
+                f"rss={result['peak_rss_mb'] - result['baseline_rss_mb']:6.0f}MB "
+                f"worker_rss={result['worker_rss_mb']:6.0f}MB "
+                f"communities={result['communities']}",
+                flush=True,
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--triples",
+        type=int,
+        nargs="+",
+        default=[100_000, 1_000_000, 5_000_000],
+    )
+    parser.add_argument("--legacy-limit", type=int, default=1_000_000)
+    parser.add_argument("--child", choices=["engine", "legacy"])
+    args = parser.parse_args()
+    child(args) if args.child else main(args)
@@ -0,0 +1,211 @@
+"""
+Throughput of knowledge graph triples extraction over a collection.
+
+Simulates an LLM with `--latency-ms` per call that answers 429 whenever
+more than `--capacity` calls are in flight, and extracts a collection of
+documents with a skewed number of chunks each, either one document at a
+time with every chunk group of the document started at once (the previous
+`create-graph` path) or through `KGExtractionScheduler`. Reports chunks
+per minute and the number of 429s; database writes are in memory.
+
+Usage:
+
+    python -m tests.benchmarks.bench_kg_extraction --documents 50 --capacity 16
+"""
+
+import argparse
+import asyncio
+import random
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from types import SimpleNamespace
+
+from core import (
+    AppConfig,
+    PersistentLoggingConfig,
+    SqlitePersistentLoggingProvider,
+)
+from core.base import AsyncPipe, DocumentExtraction, GenerationConfig
+from core.pipes.kg.extraction_scheduler import KGExtractionScheduler
+from core.pipes.kg.triples_extraction import KGTriplesExtractionPipe
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+class SimulatedLLM:
+    def __init__(self, latency_ms: float, capacity: int):
+        self.latency = latency_ms / 1000
+        self.capacity = capacity
+        self.in_flight = 0
+        self.rate_limited = 0
+
+    async def aget_completion(self, messages, generation_config):
+        if self.in_flight >= self.capacity:
+            self.rate_limited += 1
+            # a rejected call still costs a round trip
+            await asyncio.sleep(self.latency / 10)
+            raise RateLimitError("rate limit exceeded")
+        self.in_flight += 1
+        try:
+            await asyncio.sleep(self.latency * random.uniform(0.5, 1.5))
+        finally:
+            self.in_flight -= 1
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="none"))]
+        )
+
+
+class InMemoryDatabase:
+    def __init__(self):
+        self.checkpoints: dict = {}
+
+    async def get_completed_extraction_ids(self, document_ids):
+        return {
+            document_id: set(self.checkpoints.get(document_id, ()))
+            for document_id in document_ids
+        }
+
+    async def add_extraction_checkpoint(self, document_id, extraction_ids):
+        self.checkpoints.setdefault(document_id, set()).update(extraction_ids)
+
+    async def delete_extraction_checkpoints(self, document_id):
+        self.checkpoints.pop(document_id, None)
+
+    async def add_kg_extractions(self, kg_extractions):
+        pass
+
+    async def set_workflow_status(self, **kwargs):
+        pass
+
+
+class BenchmarkPipe(KGTriplesExtractionPipe):
+    def __init__(self, llm, chunks, logging_provider):
+        super().__init__(
+            database_provider=InMemoryDatabase(),  # type: ignore
+            llm_provider=llm,
+            config=AsyncPipe.PipeConfig(name="kg_triples_extraction_pipe"),
+            logging_provider=logging_provider,
+        )
+        self.chunks = chunks
+
+    async def get_extraction_messages(self, text, **kwargs):
+        return [{"role": "user", "content": text}]
+
+    async def get_document_extractions(self, document_id):
+        return self.chunks[document_id]
+
+
+def make_chunks(num_documents: int, seed: int = 0) -> dict:
+    rng = random.Random(seed)
+    chunks = {}
+    for _ in range(num_documents):
+        document_id = uuid.uuid4()
+        # a few large documents among many small ones
+        size = int(rng.paretovariate(1.2) * 8)
+        chunks[document_id] = [
+            DocumentExtraction(
+                id=uuid.uuid4(),
+                document_id=document_id,
+                user_id=document_id,
+                collection_ids=[],
+                data="chunk " * 200,
+                metadata={"chunk_order": order},
+            )
+            for order in range(size)
+        ]
+    return chunks
+
+
+async def run_per_document(pipe, chunks, merge_count: int) -> int:
+    extraction_kwargs = {
+        "generation_config": GenerationConfig(),
+        "max_knowledge_triples": 100,
+        "entity_types": [],
+        "relation_types": [],
+    }
+    extracted = 0
+    for extractions in chunks.values():
+        groups = [
+            extractions[i : i + merge_count]
+            for i in range(0, len(extractions), merge_count)
+        ]
+        results = await asyncio.gather(
+            *(
+                pipe.extract_kg(
+                    extractions=group, delay=0, **extraction_kwargs
+                )
+                for group in groups
+            ),
+            return_exceptions=True,
+        )
+        extracted += sum(
+            len(group)
+            for group, result in zip(groups, results)
+            if not isinstance(result, Exception)
+        )
+    return extracted
+
+
+async def run_scheduler(pipe, chunks, merge_count, concurrency) -> int:
+    async def describe_entities(document_id):
+        pass
+
+    scheduler = KGExtractionScheduler(
+        extraction_pipe=pipe,
+        database_provider=pipe.database_provider,
+        describe_entities=describe_entities,
+        max_concurrent_extractions=concurrency,
+        initial_backoff=0.05,
+    )
+    stats = await scheduler.run(
+        document_ids=list(chunks),
+        generation_config=GenerationConfig(),
+        extraction_merge_count=merge_count,
+        max_knowledge_triples=100,
+        entity_types=[],
+        relation_types=[],
+    )
+    return stats["chunks"]
+
+
+async def main(args: argparse.Namespace) -> None:
+    chunks = make_chunks(args.documents)
+    total = sum(len(extractions) for extractions in chunks.values())
+    print(f"{args.documents} documents, {total} chunks")
+    # Only needed to construct the pipe, extraction does not log runs
+    logging_provider = SqlitePersistentLoggingProvider(
+        PersistentLoggingConfig(
+            logging_path=str(Path(tempfile.mkdtemp()) / "logs.sqlite"),
+            app=AppConfig(),
+        )
+    )
+    for mode in ["per-document", "scheduler"]:
+        llm = SimulatedLLM(args.latency_ms, args.capacity)
+        pipe = BenchmarkPipe(llm, chunks, logging_provider)
+        start = time.perf_counter()
+        if mode == "per-document":
+            extracted = await run_per_document(pipe, chunks, args.merge_count)
+        else:
+            extracted = await run_scheduler(
+                pipe, chunks, args.merge_count, args.capacity
+            )
+        elapsed = time.perf_counter() - start
+        print(
+            f"{mode:>12}: {60 * extracted / elapsed:9.0f} chunks/min "
+            f"extracted={extracted}/{total} 429s={llm.rate_limited} "
+            f"elapsed={elapsed:.1f}s"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--documents", type=int, default=50)
+    parser.add_argument("--capacity", type=int, default=16)
+    parser.add_argument("--latency-ms", type=float, default=200)
+    parser.add_argument("--merge-count", type=int, default=4)
+    args = parser.parse_args()
+    asyncio.run(main(args))
@@ -0,0 +1,160 @@
+"""
+Latency of knowledge graph global search over many community reports.
+
+Simulates an LLM with `--latency-ms` per call and runs a global search
+over `--communities` in-memory community reports with one map call in
+flight at a time, as a serial implementation would, and with
+`--concurrency` calls in flight. Reports wall time, map calls and the
+estimated tokens of the query.
+
+Usage:
+
+    python -m tests.benchmarks.bench_kg_global_search --communities 5000 --concurrency 16
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from types import SimpleNamespace
+
+from core import (
+    AppConfig,
+    PersistentLoggingConfig,
+    SqlitePersistentLoggingProvider,
+)
+from core.base import (
+    AsyncPipe,
+    CommunityReport,
+    GenerationConfig,
+    KGSearchSettings,
+)
+from core.pipes.retrieval.kg_search_pipe import KGSearchSearchPipe
+
+
+class SimulatedLLM:
+    def __init__(self, latency_ms: float):
+        self.latency = latency_ms / 1000
+        self.calls = 0
+
+    async def aget_completion(self, messages, generation_config):
+        self.calls += 1
+        await asyncio.sleep(self.latency * random.uniform(0.5, 1.5))
+        points = [
+            {
+                "description": f"point {i} " * 20,
+                "score": random.randint(0, 100),
+            }
+            for i in range(5)
+        ]
+        return SimpleNamespace(
+            choices=[
+                SimpleNamespace(
+                    message=SimpleNamespace(
+                        content=json.dumps({"points": points})
+                    )
+                )
+            ]
+        )
+
+    async def aget_completion_stream(self, messages, generation_config):
+        for _ in range(50):
+            await asyncio.sleep(self.latency / 50)
+            yield SimpleNamespace(
+                choices=[SimpleNamespace(delta=SimpleNamespace(content="x "))]
+            )
+
+
+class InMemoryDatabase:
+    def __init__(self, num_communities: int):
+        collection_id = uuid.uuid4()
+        self.reports = [
+            CommunityReport(
+                community_number=number,
+                level=0,
+                collection_id=collection_id,
+                name=f"community {number}",
+                summary="summary " * 60,
+                findings=["finding " * 20] * 5,
+                rating=random.uniform(0, 10),
+                rating_explanation="",
+            )
+            for number in range(num_communities)
+        ]
+        self.prompt_handler = self
+
+    async def get_message_payload(self, task_prompt_name, task_inputs):
+        return [{"role": "user", "content": json.dumps(task_inputs)}]
+
+    async def stream_community_reports(self, collection_ids, level):
+        async def reports():
+            for report in sorted(
+                self.reports, key=lambda r: r.rating, reverse=True
+            ):
+                yield report
+
+        return reports()
+
+
+async def run(args: argparse.Namespace, concurrency: int, logging_provider):
+    llm = SimulatedLLM(args.latency_ms)
+    pipe = KGSearchSearchPipe(
+        llm_provider=llm,  # type: ignore
+        database_provider=InMemoryDatabase(args.communities),  # type: ignore
+        embedding_provider=None,  # type: ignore
+        config=AsyncPipe.PipeConfig(name="kg_search_pipe"),
+        logging_provider=logging_provider,
+    )
+    settings = KGSearchSettings(
+        kg_search_type="global",
+        max_llm_queries_for_global_search=args.communities,
+        max_concurrent_llm_queries_for_global_search=concurrency,
+        max_tokens_for_global_search=10**9,
+        generation_config=GenerationConfig(),
+    )
+
+    async def queries():
+        yield "What are the main themes?"
+
+    start = time.perf_counter()
+    results = [
+        result
+        async for result in pipe._run_logic(
+            input=pipe.Input(message=queries()),
+            state=None,
+            run_id=uuid.uuid4(),
+            kg_search_settings=settings,
+        )
+    ]
+    elapsed = time.perf_counter() - start
+    metadata = results[0].metadata
+    print(
+        f"concurrency={concurrency:>3}: {elapsed:7.1f}s "
+        f"map_queries={metadata['map_queries']} "
+        f"estimated_tokens={metadata['estimated_tokens']}"
+    )
+
+
+async def main(args: argparse.Namespace) -> None:
+    # Only needed to construct the pipe, the search does not log runs
+    logging_provider = SqlitePersistentLoggingProvider(
+        PersistentLoggingConfig(
+            logging_path=str(Path(tempfile.mkdtemp()) / "logs.sqlite"),
+            app=AppConfig(),
+        )
+    )
+    for concurrency in [1, args.concurrency]:
+        await run(args, concurrency, logging_provider)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--communities", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--latency-ms", type=float, default=500)
+    args = parser.parse_args()
+    asyncio.run(main(args))
@@ -0,0 +1,158 @@
+"""
+Latency benchmark for multi-query (RAG-fusion) search.
+
+Compares the serial path, where `VectorSearchPipe` embeds, searches and
+reranks one transformed query after another, with `MultiSearchPipe`, which
+embeds all sub-queries in one call and searches them concurrently. Provider
+round trips are simulated with fixed delays so the numbers isolate the
+orchestration cost; the query transform step is excluded.
+
+Usage:
+
+    python -m tests.benchmarks.bench_multi_search --sub-queries 1 3 5
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+from core.base import (
+    AppConfig,
+    AsyncPipe,
+    PersistentLoggingConfig,
+    SearchSettings,
+    VectorSearchResult,
+)
+from core.pipes import MultiSearchPipe, VectorSearchPipe
+from core.providers.logger.r2r_logger import SqlitePersistentLoggingProvider
+
+
+class SimulatedEmbeddingProvider:
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    async def async_get_embedding(self, text, purpose=None):
+        await asyncio.sleep(self.delay)
+        return [0.0]
+
+    async def async_get_embeddings(self, texts, purpose=None):
+        await asyncio.sleep(self.delay)
+        return [[0.0] for _ in texts]
+
+    async def arerank(self, query, results, limit):
+        return results[:limit]
+
+
+class SimulatedDatabaseProvider:
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    async def semantic_search(self, query_vector, search_settings):
+        await asyncio.sleep(self.delay)
+        return [
+            VectorSearchResult(
+                extraction_id=uuid.uuid4(),
+                document_id=uuid.uuid4(),
+                user_id=None,
+                collection_ids=[],
+                score=1.0,
+                text="result",
+                metadata={},
+            )
+            for _ in range(search_settings.search_limit)
+        ]
+
+
+class FixedQueryTransformPipe(AsyncPipe):
+    def __init__(self, queries, logging_provider):
+        super().__init__(
+            AsyncPipe.PipeConfig(name="query_transform"), logging_provider
+        )
+        self.queries = queries
+
+    async def _run_logic(self, input, state, run_id, *args, **kwargs):
+        async for _ in input.message:
+            for query in self.queries:
+                yield query
+
+
+async def message():
+    yield "original question"
+
+
+async def serial(pipe: VectorSearchPipe, queries: list[str]) -> None:
+    async def query_generator():
+        for query in queries:
+            yield query
+
+    output = await pipe.run(
+        pipe.Input(message=query_generator()),
+        state=None,
+        vector_search_settings=SearchSettings(search_limit=30),
+    )
+    async for _ in output:
+        pass
+
+
+async def concurrent(pipe: MultiSearchPipe) -> None:
+    output = await pipe.run(
+        pipe.Input(message=message()),
+        state=None,
+        vector_search_settings=SearchSettings(search_limit=10),
+    )
+    async for _ in output:
+        pass
+
+
+async def main(args: argparse.Namespace) -> None:
+    logging_provider = SqlitePersistentLoggingProvider(
+        PersistentLoggingConfig(app=AppConfig(), logging_path=":memory:")
+    )
+    await logging_provider.initialize()
+    vector_search_pipe = VectorSearchPipe(
+        database_provider=SimulatedDatabaseProvider(args.search_ms / 1000),
+        embedding_provider=SimulatedEmbeddingProvider(args.embed_ms / 1000),
+        config=VectorSearchPipe.SearchConfig(),
+        logging_provider=logging_provider,
+    )
+
+    print(
+        f"embed={args.embed_ms}ms search={args.search_ms}ms runs={args.runs}"
+    )
+    for count in args.sub_queries:
+        queries = [f"sub-query {i}" for i in range(count)]
+        multi_search_pipe = MultiSearchPipe(
+            query_transform_pipe=FixedQueryTransformPipe(
+                queries, logging_provider
+            ),
+            inner_search_pipe=vector_search_pipe,
+            config=MultiSearchPipe.PipeConfig(use_rrf=True),
+            logging_provider=logging_provider,
+        )
+        for label, run in (
+            ("serial", lambda: serial(vector_search_pipe, queries)),
+            ("concurrent", lambda: concurrent(multi_search_pipe)),
+        ):
+            latencies = []
+            for _ in range(args.runs):
+                start = time.perf_counter()
+                await run()
+                latencies.append((time.perf_counter() - start) * 1000)
+            print(
+                f"sub_queries={count} {label:>10}: "
+                f"median={statistics.median(latencies):7.1f}ms"
+            )
+    await logging_provider.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sub-queries", type=int, nargs="+", default=[1, 3, 5]
+    )
+    parser.add_argument("--embed-ms", type=float, default=30)
+    parser.add_argument("--search-ms", type=float, default=40)
+    parser.add_argument("--runs", type=int, default=20)
+    asyncio.run(main(parser.parse_args()))
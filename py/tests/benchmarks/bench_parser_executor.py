@@ -0,0 +1,99 @@
+"""
+API latency benchmark for concurrent PDF ingestion.
+
+Parses N generated PDFs concurrently through `R2RIngestionProvider.parse`
+with each parser execution mode while a probe coroutine stands in for API
+traffic: it repeatedly awaits a 10ms timer and records how late the event
+loop wakes it up. With `inline` parsing the probe stalls for the length of
+each page batch; `thread` and `process` keep it close to the timer.
+
+Usage:
+
+    python -m tests.benchmarks.bench_parser_executor --documents 8 --pages 200
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+from core.base import AppConfig, Document, DocumentType, ParserExecutionMode
+from core.providers.ingestion import R2RIngestionConfig, R2RIngestionProvider
+from tests.core.providers.ingestion.test_parser_executor import make_pdf
+
+PROBE_INTERVAL = 0.01
+
+
+async def probe(delays: list[float], done: asyncio.Event) -> None:
+    while not done.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL)
+        delays.append((time.perf_counter() - start - PROBE_INTERVAL) * 1000)
+
+
+async def ingest(provider: R2RIngestionProvider, data: bytes) -> int:
+    document = Document(
+        id=uuid.uuid4(),
+        collection_ids=[],
+        user_id=uuid.uuid4(),
+        document_type=DocumentType.PDF,
+        metadata={},
+    )
+    return len([e async for e in provider.parse(data, document, {})])
+
+
+async def run(mode: ParserExecutionMode, documents: list[bytes], workers):
+    provider = R2RIngestionProvider(
+        R2RIngestionConfig(
+            app=AppConfig(),
+            parser_execution_mode=mode,
+            parser_max_workers=workers,
+        ),
+        None,
+        None,
+    )
+    # Start workers outside the measured window
+    await provider.parser_executor.run(len, b"")
+
+    delays: list[float] = []
+    done = asyncio.Event()
+    probe_task = asyncio.create_task(probe(delays, done))
+    start = time.perf_counter()
+    await asyncio.gather(*(ingest(provider, data) for data in documents))
+    elapsed = time.perf_counter() - start
+    done.set()
+    await probe_task
+    provider.parser_executor.shutdown()
+
+    delays.sort()
+    p99 = delays[min(len(delays) - 1, int(len(delays) * 0.99))]
+    print(
+        f"{mode.value:>8}: ingest={elapsed:6.2f}s "
+        f"probe_median={statistics.median(delays):7.1f}ms "
+        f"probe_p99={p99:7.1f}ms probe_max={delays[-1]:7.1f}ms"
+    )
+
+
+async def main(args: argparse.Namespace) -> None:
+    pages = [
+        f"document page {i} " + "lorem ipsum dolor sit amet " * 40
+        for i in range(args.pages)
+    ]
+    documents = [make_pdf(pages) for _ in range(args.documents)]
+    print(f"documents={args.documents} pages={args.pages}")
+    for mode in args.modes:
+        await run(ParserExecutionMode(mode), documents, args.workers)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--documents", type=int, default=8)
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument(
+        "--modes",
+        nargs="+",
+        default=[mode.value for mode in ParserExecutionMode],
+    )
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,100 @@
+"""
+Latency benchmark for run logging on the request path.
+
+Simulates `--requests` concurrent searches, each doing `--work-ms` of
+awaited work and writing the run logs a search pipe writes (the query and
+a serialized result payload), and reports per-request latency percentiles
+with run logging disabled, written row by row and buffered by
+`BufferedLogSink`.
+
+Usage:
+
+    python -m tests.benchmarks.bench_run_logging --requests 2000
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from core import (
+    AppConfig,
+    LogBufferSettings,
+    PersistentLoggingConfig,
+    RunType,
+    SqlitePersistentLoggingProvider,
+    generate_run_id,
+)
+
+
+async def search(provider, payload: str, work_ms: float) -> float:
+    start = time.perf_counter()
+    run_id = generate_run_id()
+    await asyncio.sleep(work_ms / 1000)
+    if provider:
+        await provider.info_log(run_id, RunType.RETRIEVAL, generate_run_id())
+        await provider.log(run_id, "search_query", "what is r2r?")
+        await provider.log(run_id, "search_results", payload)
+    return (time.perf_counter() - start) * 1000
+
+
+async def run(mode: str, args: argparse.Namespace, directory: str) -> None:
+    provider = None
+    if mode != "disabled":
+        provider = SqlitePersistentLoggingProvider(
+            PersistentLoggingConfig(
+                app=AppConfig(),
+                logging_path=str(Path(directory) / f"{mode}.sqlite"),
+                buffer_settings=LogBufferSettings(enabled=mode == "buffered"),
+            )
+        )
+        await provider.initialize()
+    payload = json.dumps([{"text": "x" * 400, "score": 0.5}] * 10)
+
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def limited() -> float:
+        async with semaphore:
+            return await search(provider, payload, args.work_ms)
+
+    start = time.perf_counter()
+    latencies = sorted(
+        await asyncio.gather(*(limited() for _ in range(args.requests)))
+    )
+    elapsed = time.perf_counter() - start
+    quantiles = statistics.quantiles(latencies, n=100)
+    line = (
+        f"{mode:>9}: p50={quantiles[49]:7.2f}ms p99={quantiles[98]:7.2f}ms "
+        f"max={latencies[-1]:7.2f}ms throughput={args.requests / elapsed:7.0f}/s"
+    )
+    if provider:
+        if provider.sink:
+            stats = provider.sink.stats
+            line += (
+                f" flushes={stats['flushes']}"
+                f" max_queue_depth={stats['max_queue_depth']}"
+                f" max_flush={stats['max_flush_latency_ms']:.1f}ms"
+            )
+        await provider.close()
+    print(line)
+
+
+async def main(args: argparse.Namespace) -> None:
+    print(
+        f"requests={args.requests} concurrency={args.concurrency} "
+        f"work_ms={args.work_ms}"
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        for mode in ("disabled", "unbuffered", "buffered"):
+            await run(mode, args, directory)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--work-ms", type=float, default=5)
+    asyncio.run(main(parser.parse_args()))
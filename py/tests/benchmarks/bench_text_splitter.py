@@ -0,0 +1,107 @@
+"""
+Throughput benchmark for the offset-based text splitter engine.
+
+Splits generated prose of the requested sizes with
+`RecursiveCharacterTextSplitter` and `CharacterTextSplitter`, comparing the
+span engine behind `split_text` with the string-copying reference
+implementation (`_split_text`) and checking both produce the same chunks.
+Each timing is the best of `--repeat` runs; the reference run can be
+skipped above `--reference-limit-mb`.
+
+Usage:
+
+    python -m tests.benchmarks.bench_text_splitter --sizes-mb 1 10 100
+"""
+
+import argparse
+import random
+import time
+
+from core.base import CharacterTextSplitter, RecursiveCharacterTextSplitter
+
+WORDS = ["lorem", "ipsum", "dolor", "sit", "amet", "consectetur", "elit"]
+
+
+def generate(size: int, shape: str = "prose", seed: int = 0) -> str:
+    rng = random.Random(seed)
+    if shape == "words":
+        # No line breaks, so the recursive splitter falls through to words
+        words = " ".join(rng.choices(WORDS, k=size // 4))
+        return words[:size]
+    paragraphs = []
+    total = 0
+    while total < size:
+        sentences = [
+            " ".join(rng.choices(WORDS, k=rng.randint(5, 25))) + "."
+            for _ in range(rng.randint(1, 8))
+        ]
+        paragraph = "\n".join(sentences)
+        paragraphs.append(paragraph)
+        total += len(paragraph) + 2
+    return "\n\n".join(paragraphs)[:size]
+
+
+def measure(run, repeat: int) -> tuple[float, list[str]]:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        chunks = run()
+        best = min(best, time.perf_counter() - start)
+    return best, chunks
+
+
+def main(args: argparse.Namespace) -> None:
+    splitters = {
+        "recursive": RecursiveCharacterTextSplitter(
+            chunk_size=args.chunk_size, chunk_overlap=args.chunk_overlap
+        ),
+        "character": CharacterTextSplitter(
+            separator="\n" if args.shape == "prose" else " ",
+            chunk_size=args.chunk_size,
+            chunk_overlap=args.chunk_overlap,
+            keep_separator=False,
+        ),
+    }
+    print(
+        f"shape={args.shape} chunk_size={args.chunk_size} "
+        f"chunk_overlap={args.chunk_overlap}"
+    )
+    for size_mb in args.sizes_mb:
+        text = generate(int(size_mb * 1024 * 1024), args.shape)
+        for name, splitter in splitters.items():
+            elapsed, chunks = measure(
+                lambda: splitter.split_text(text), args.repeat
+            )
+            line = (
+                f"{size_mb:>6}MB {name:>9}: spans={elapsed:7.2f}s "
+                f"({size_mb / elapsed:6.1f} MB/s, {len(chunks)} chunks)"
+            )
+            if size_mb <= args.reference_limit_mb:
+                if isinstance(splitter, RecursiveCharacterTextSplitter):
+                    reference = lambda: splitter._split_text(  # noqa: E731
+                        text, splitter._separators
+                    )
+                else:
+                    reference = lambda: splitter._split_text(  # noqa: E731
+                        text
+                    )
+                reference_elapsed, expected = measure(reference, args.repeat)
+                assert chunks == expected, "span engine output differs"
+                line += (
+                    f" reference={reference_elapsed:7.2f}s "
+                    f"speedup={reference_elapsed / elapsed:4.1f}x"
+                )
+            print(line)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes-mb", type=float, nargs="+", default=[1, 10, 100]
+    )
+    parser.add_argument("--shape", choices=["prose", "words"], default="prose")
+    parser.add_argument("--chunk-size", type=int, default=1024)
+    parser.add_argument("--chunk-overlap", type=int, default=512)
+    parser.add_argument("--reference-limit-mb", type=float, default=100)
+    parser.add_argument("--repeat", type=int, default=3)
+    main(parser.parse_args())
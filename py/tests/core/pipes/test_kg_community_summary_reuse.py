@@ -0,0 +1,152 @@
+import json
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from core.base import AsyncPipe, Entity, GenerationConfig
+from core.pipes.kg.community_summary import KGCommunitySummaryPipe
+
+
+class FakeLLM:
+    def __init__(self):
+        self.calls = 0
+
+    async def aget_completion(self, messages, generation_config):
+        self.calls += 1
+        report = {
+            "name": f"report {self.calls}",
+            "summary": "summary",
+            "findings": ["finding"],
+            "rating": 5.0,
+            "rating_explanation": "explanation",
+        }
+        content = f"```json\n{json.dumps(report)}\n```"
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))]
+        )
+
+
+class FakeEmbedding:
+    def __init__(self, dimension):
+        self.dimension = dimension
+        self.calls = 0
+
+    async def async_get_embedding(self, text):
+        self.calls += 1
+        return [0.1] * self.dimension
+
+
+async def _load_graph(postgres_db_provider, dimension, groups=3, size=4):
+    """Disjoint cliques of entities, one community each."""
+    collection_id, document_id = uuid.uuid4(), uuid.uuid4()
+    kg_handler = postgres_db_provider.kg_handler
+    connection_manager = postgres_db_provider.connection_manager
+    await connection_manager.execute_query(
+        f"INSERT INTO {kg_handler._get_table_name('document_info')} (document_id, collection_ids) VALUES ($1, $2)",
+        [document_id, [collection_id]],
+    )
+    prefix = collection_id.hex[:8]
+    groups_members = [
+        [f"{prefix}_g{group}_e{i}" for i in range(size)]
+        for group in range(groups)
+    ]
+    await postgres_db_provider.add_entities(
+        [
+            Entity(
+                name=name,
+                description=f"description of {name}",
+                extraction_ids=[uuid.uuid4()],
+                document_id=document_id,
+                description_embedding=[0.1] * dimension,
+            )
+            for members in groups_members
+            for name in members
+        ],
+        table_name="document_entity",
+    )
+    await connection_manager.execute_many(
+        f"""
+        INSERT INTO {kg_handler._get_table_name('chunk_triple')}
+        (subject, predicate, object, weight, description, extraction_ids, document_id, attributes)
+        VALUES ($1, 'related_to', $2, 1.0, '', '{{}}', $3, '{{}}')
+        """,
+        [
+            (subject, object, document_id)
+            for members in groups_members
+            for i, subject in enumerate(members)
+            for object in members[i + 1 :]
+        ],
+    )
+    return collection_id, groups_members
+
+
+async def _cluster(postgres_db_provider, collection_id, seed):
+    kg_handler = postgres_db_provider.kg_handler
+    graph = await kg_handler._get_triple_graph(collection_id)
+    return await kg_handler._cluster_and_add_community_info(
+        graph, {"random_seed": seed}, collection_id
+    )
+
+
+async def _summarize(pipe, collection_id, num_communities):
+    return [
+        summary
+        async for summary in pipe._run_logic(
+            input=pipe.Input(
+                message={
+                    "offset": 0,
+                    "limit": num_communities,
+                    "generation_config": GenerationConfig(),
+                    "max_summary_input_length": 65536,
+                    "collection_id": collection_id,
+                }
+            ),
+            state=None,
+            run_id=uuid.uuid4(),
+        )
+    ]
+
+
+@pytest.mark.asyncio
+async def test_unchanged_communities_are_not_summarized_again(
+    postgres_db_provider, local_logging_provider, dimension
+):
+    collection_id, groups_members = await _load_graph(
+        postgres_db_provider, dimension
+    )
+    llm, embedding = FakeLLM(), FakeEmbedding(dimension)
+    pipe = KGCommunitySummaryPipe(
+        database_provider=postgres_db_provider,
+        llm_provider=llm,  # type: ignore
+        embedding_provider=embedding,  # type: ignore
+        config=AsyncPipe.PipeConfig(name="kg_community_summary_pipe"),
+        logging_provider=local_logging_provider,
+    )
+
+    num_communities = await _cluster(postgres_db_provider, collection_id, 1)
+    summaries = await _summarize(pipe, collection_id, num_communities)
+    assert num_communities == 3
+    assert llm.calls == embedding.calls == 3
+    assert not any(summary["reused"] for summary in summaries)
+
+    # reclustering drops the reports, the unchanged communities get theirs back
+    num_communities = await _cluster(postgres_db_provider, collection_id, 2)
+    summaries = await _summarize(pipe, collection_id, num_communities)
+    assert llm.calls == embedding.calls == 3
+    assert len(summaries) == 3
+    assert all(summary["reused"] for summary in summaries)
+
+    # only the community whose entity changed is summarized again
+    changed = groups_members[0][0]
+    await postgres_db_provider.connection_manager.execute_query(
+        f"UPDATE {postgres_db_provider.kg_handler._get_table_name('document_entity')} SET description = 'changed' WHERE name = $1",
+        [changed],
+    )
+    num_communities = await _cluster(postgres_db_provider, collection_id, 3)
+    summaries = await _summarize(pipe, collection_id, num_communities)
+    assert llm.calls == embedding.calls == 4
+    assert sum(not summary["reused"] for summary in summaries) == 1
+
+    reports = await postgres_db_provider.get_communities(collection_id)
+    assert reports["total_entries"] == 3
@@ -0,0 +1,184 @@
+import asyncio
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from core.base import AsyncPipe, DocumentExtraction, GenerationConfig
+from core.pipes.kg.extraction_scheduler import KGExtractionScheduler
+from core.pipes.kg.triples_extraction import KGTriplesExtractionPipe
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+class FakeLLM:
+    def __init__(self, fail_on: set = set(), rate_limit_first: bool = False):
+        self.fail_on = fail_on
+        self.rate_limit_first = rate_limit_first
+        self.calls: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def aget_completion(self, messages, generation_config):
+        text = messages[0]["content"]
+        if self.rate_limit_first:
+            self.rate_limit_first = False
+            raise RateLimitError("rate limit exceeded")
+        if text in self.fail_on:
+            raise ValueError("LLM is down")
+        self.calls.append(text)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="none"))]
+        )
+
+
+class FakeExtractionPipe(KGTriplesExtractionPipe):
+    def __init__(self, database_provider, llm_provider, chunks, logging):
+        super().__init__(
+            database_provider=database_provider,
+            llm_provider=llm_provider,
+            config=AsyncPipe.PipeConfig(name="kg_triples_extraction_pipe"),
+            logging_provider=logging,
+        )
+        self.chunks = chunks
+
+    async def get_extraction_messages(self, text, **kwargs):
+        return [{"role": "user", "content": text}]
+
+    async def get_document_extractions(self, document_id):
+        return self.chunks[document_id]
+
+
+def _make_chunks(sizes: list[int]) -> dict:
+    chunks = {}
+    for size in sizes:
+        document_id = uuid.uuid4()
+        chunks[document_id] = [
+            DocumentExtraction(
+                id=uuid.uuid4(),
+                document_id=document_id,
+                user_id=uuid.uuid4(),
+                collection_ids=[],
+                data=f"{document_id}-{order}",
+                metadata={"chunk_order": order},
+            )
+            for order in range(size)
+        ]
+    return chunks
+
+
+async def _run(pipe, db, chunks, described, **kwargs):
+    async def describe_entities(document_id):
+        described.append(document_id)
+
+    scheduler = KGExtractionScheduler(
+        extraction_pipe=pipe,
+        database_provider=db,
+        describe_entities=describe_entities,
+        initial_backoff=0.01,
+        **kwargs,
+    )
+    await scheduler.run(
+        document_ids=list(chunks),
+        generation_config=GenerationConfig(),
+        extraction_merge_count=1,
+        max_knowledge_triples=10,
+        entity_types=[],
+        relation_types=[],
+    )
+    return scheduler
+
+
+@pytest.mark.asyncio
+async def test_chunks_are_interleaved_with_bounded_concurrency(
+    postgres_db_provider, local_logging_provider
+):
+    chunks = _make_chunks([6, 2, 2])
+    llm = FakeLLM()
+    pipe = FakeExtractionPipe(
+        postgres_db_provider, llm, chunks, local_logging_provider
+    )
+    described: list = []
+
+    scheduler = await _run(
+        pipe,
+        postgres_db_provider,
+        chunks,
+        described,
+        max_concurrent_extractions=3,
+    )
+
+    assert llm.max_in_flight <= 3
+    # every document gets a call before the large one gets its second
+    first_documents = {call.rsplit("-", 1)[0] for call in llm.calls[:3]}
+    assert first_documents == {str(document_id) for document_id in chunks}
+    assert scheduler.stats["chunks"] == 10
+    assert scheduler.chunks_per_minute > 0
+    assert set(described) == set(chunks)
+    # checkpoints of described documents are dropped
+    completed = await postgres_db_provider.get_completed_extraction_ids(
+        list(chunks)
+    )
+    assert all(not ids for ids in completed.values())
+
+
+@pytest.mark.asyncio
+async def test_failed_run_resumes_from_checkpoints(
+    postgres_db_provider, local_logging_provider
+):
+    chunks = _make_chunks([4])
+    (document_id,) = chunks
+    failing_chunk = chunks[document_id][2]
+    llm = FakeLLM(fail_on={failing_chunk.data})
+    pipe = FakeExtractionPipe(
+        postgres_db_provider, llm, chunks, local_logging_provider
+    )
+    described: list = []
+
+    scheduler = await _run(pipe, postgres_db_provider, chunks, described)
+
+    assert scheduler.stats["failed_groups"] == 1
+    assert described == []
+    completed = await postgres_db_provider.get_completed_extraction_ids(
+        [document_id]
+    )
+    assert completed[document_id] == {
+        chunk.id for chunk in chunks[document_id] if chunk != failing_chunk
+    }
+
+    llm.fail_on, llm.calls = set(), []
+    scheduler = await _run(pipe, postgres_db_provider, chunks, described)
+
+    assert llm.calls == [failing_chunk.data]
+    assert scheduler.stats["skipped_chunks"] == 3
+    assert described == [document_id]
+
+
+@pytest.mark.asyncio
+async def test_rate_limits_shrink_concurrency_and_retry(
+    postgres_db_provider, local_logging_provider
+):
+    chunks = _make_chunks([1])
+    llm = FakeLLM(rate_limit_first=True)
+    pipe = FakeExtractionPipe(
+        postgres_db_provider, llm, chunks, local_logging_provider
+    )
+
+    scheduler = await _run(
+        pipe,
+        postgres_db_provider,
+        chunks,
+        [],
+        max_concurrent_extractions=8,
+        tokens_per_minute=60_000,
+    )
+
+    assert scheduler.stats["rate_limited"] == 1
+    assert scheduler.stats["chunks"] == 1
+    assert scheduler.stats["concurrency_limit"] < 8
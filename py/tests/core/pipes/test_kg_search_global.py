@@ -0,0 +1,158 @@
+import asyncio
+import json
+import re
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from core.base import (
+    AsyncPipe,
+    CommunityReport,
+    GenerationConfig,
+    KGSearchSettings,
+)
+from core.base.abstractions import KGSearchMethod
+from core.pipes.retrieval.kg_search_pipe import KGSearchSearchPipe
+
+
+class FakeLLM:
+    """Scores every report by its community number, streams the answer."""
+
+    def __init__(self):
+        self.map_calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.reduce_prompt = ""
+        self.closed = False
+
+    async def aget_completion(self, messages, generation_config):
+        self.map_calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        prompt = messages[-1]["content"]
+        points = [
+            {
+                "description": f"point {number} " + "x" * 40,
+                "score": int(number) % 5,
+            }
+            for number in re.findall(r"^(\d+)\|", prompt, re.MULTILINE)
+        ]
+        content = f"```json\n{json.dumps({'points': points})}\n```"
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))]
+        )
+
+    async def aget_completion_stream(self, messages, generation_config):
+        self.reduce_prompt = messages[-1]["content"]
+        try:
+            for _ in range(100):
+                yield SimpleNamespace(
+                    choices=[
+                        SimpleNamespace(
+                            delta=SimpleNamespace(content="answer ")
+                        )
+                    ]
+                )
+        finally:
+            self.closed = True
+
+
+async def _add_reports(postgres_db_provider, dimension, count):
+    collection_id = uuid.uuid4()
+    for community_number in range(count):
+        await postgres_db_provider.add_community_report(
+            CommunityReport(
+                community_number=community_number,
+                level=0,
+                collection_id=collection_id,
+                name=f"community {community_number}",
+                summary="summary " * 10,
+                findings=["finding"],
+                rating=float(community_number),
+                rating_explanation="",
+                embedding=[0.1] * dimension,
+            )
+        )
+    return collection_id
+
+
+async def _search(pipe, settings):
+    async def queries():
+        yield "What are the main themes?"
+
+    return [
+        result
+        async for result in pipe._run_logic(
+            input=pipe.Input(message=queries()),
+            state=None,
+            run_id=uuid.uuid4(),
+            kg_search_settings=settings,
+        )
+    ]
+
+
+def _pipe(postgres_db_provider, llm, local_logging_provider):
+    return KGSearchSearchPipe(
+        llm_provider=llm,  # type: ignore
+        database_provider=postgres_db_provider,
+        embedding_provider=None,  # type: ignore
+        config=AsyncPipe.PipeConfig(name="kg_search_pipe"),
+        logging_provider=local_logging_provider,
+    )
+
+
+@pytest.mark.asyncio
+async def test_global_search_maps_reports_concurrently(
+    postgres_db_provider, local_logging_provider, dimension
+):
+    collection_id = await _add_reports(postgres_db_provider, dimension, 40)
+    llm = FakeLLM()
+    settings = KGSearchSettings(
+        kg_search_type="global",
+        filters={"collection_ids": {"$overlap": [str(collection_id)]}},
+        max_community_description_length=400,
+        max_concurrent_llm_queries_for_global_search=3,
+        generation_config=GenerationConfig(max_tokens_to_sample=50),
+    )
+
+    (result,) = await _search(
+        _pipe(postgres_db_provider, llm, local_logging_provider), settings
+    )
+
+    assert result.method == KGSearchMethod.GLOBAL
+    assert result.metadata["community_reports"] == 40
+    assert result.metadata["map_queries"] == llm.map_calls > 3
+    assert 1 < llm.max_in_flight <= 3
+    # only the eight best scored points fit the reduce context
+    assert result.metadata["points"] == 8
+    assert all(f"point {n} " in llm.reduce_prompt for n in range(4, 40, 5))
+    assert "point 38 " not in llm.reduce_prompt
+    # the answer stream is cut at the completion length
+    assert result.content.description.count("answer") < 100
+    assert llm.closed
+
+
+@pytest.mark.asyncio
+async def test_global_search_stops_mapping_at_token_budget(
+    postgres_db_provider, local_logging_provider, dimension
+):
+    collection_id = await _add_reports(postgres_db_provider, dimension, 40)
+    llm = FakeLLM()
+    settings = KGSearchSettings(
+        kg_search_type="global",
+        filters={"collection_ids": {"$overlap": [str(collection_id)]}},
+        max_community_description_length=400,
+        max_tokens_for_global_search=1200,
+        generation_config=GenerationConfig(max_tokens_to_sample=50),
+    )
+
+    (result,) = await _search(
+        _pipe(postgres_db_provider, llm, local_logging_provider), settings
+    )
+
+    assert 0 < llm.map_calls < 10
+    # the highest rated reports are the ones mapped
+    assert "point 39" in llm.reduce_prompt
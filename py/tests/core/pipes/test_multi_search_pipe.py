@@ -0,0 +1,135 @@
+import asyncio
+import time
+import uuid
+
+import pytest
+
+from core.base import AsyncPipe, SearchSettings, VectorSearchResult
+from core.pipes import MultiSearchPipe, VectorSearchPipe
+
+SEARCH_DELAY = 0.05
+
+
+class _QueryTransformPipe(AsyncPipe):
+    def __init__(self, queries, logging_provider):
+        super().__init__(
+            AsyncPipe.PipeConfig(name="query_transform"), logging_provider
+        )
+        self.queries = queries
+
+    async def _run_logic(self, input, state, run_id, *args, **kwargs):
+        async for _ in input.message:
+            for query in self.queries:
+                yield query
+
+
+class _EmbeddingProvider:
+    def __init__(self):
+        self.calls: list[list[str]] = []
+
+    async def async_get_embeddings(self, texts, purpose=None):
+        self.calls.append(list(texts))
+        return [[float(i)] for i in range(len(texts))]
+
+    async def async_get_embedding(self, text, purpose=None):
+        raise AssertionError("queries should be embedded in one batch")
+
+    async def arerank(self, query, results, limit):
+        return results[:limit]
+
+
+class _DatabaseProvider:
+    def __init__(self, documents):
+        self.documents = documents
+
+    async def semantic_search(self, query_vector, search_settings):
+        await asyncio.sleep(SEARCH_DELAY)
+        # Each query ranks the shared documents in a different order
+        offset = int(query_vector[0])
+        ordered = self.documents[offset:] + self.documents[:offset]
+        return [
+            VectorSearchResult(
+                extraction_id=doc_id,
+                document_id=doc_id,
+                user_id=None,
+                collection_ids=[],
+                score=1.0,
+                text=str(doc_id),
+                metadata={},
+            )
+            for doc_id in ordered[: search_settings.search_limit]
+        ]
+
+
+def _pipe(queries, use_rrf, local_logging_provider):
+    embedding_provider = _EmbeddingProvider()
+    documents = [uuid.uuid4() for _ in range(6)]
+    vector_search_pipe = VectorSearchPipe(
+        database_provider=_DatabaseProvider(documents),
+        embedding_provider=embedding_provider,
+        config=VectorSearchPipe.SearchConfig(),
+        logging_provider=local_logging_provider,
+    )
+    pipe = MultiSearchPipe(
+        query_transform_pipe=_QueryTransformPipe(
+            queries, local_logging_provider
+        ),
+        inner_search_pipe=vector_search_pipe,
+        config=MultiSearchPipe.PipeConfig(use_rrf=use_rrf, rrf_k=60),
+        logging_provider=local_logging_provider,
+    )
+    return pipe, embedding_provider
+
+
+async def _run(pipe):
+    async def message():
+        yield "original question"
+
+    output = await pipe.run(
+        pipe.Input(message=message()),
+        state=None,
+        vector_search_settings=SearchSettings(search_limit=3),
+    )
+    return [result async for result in output]
+
+
+@pytest.mark.asyncio
+async def test_queries_run_concurrently_with_one_embedding_call(
+    local_logging_provider,
+):
+    queries = ["q1", "q2", "q3", "q4", "q5"]
+    pipe, embedding_provider = _pipe(queries, False, local_logging_provider)
+
+    start = time.perf_counter()
+    results = await _run(pipe)
+    elapsed = time.perf_counter() - start
+
+    assert embedding_provider.calls == [queries]
+    assert len(results) == 3 * len(queries)
+    assert {r.metadata["associated_query"] for r in results} == set(queries)
+    assert elapsed < SEARCH_DELAY * len(queries) / 2
+
+
+@pytest.mark.asyncio
+async def test_rrf_matches_batch_fusion(local_logging_provider):
+    queries = ["q1", "q2", "q3"]
+    pipe, _ = _pipe(queries, True, local_logging_provider)
+
+    results = await _run(pipe)
+
+    # Expansion factor 3 widens each sub-search to 9 results
+    grouped: dict[str, list[VectorSearchResult]] = {}
+    for index, query in enumerate(queries):
+        database = pipe.vector_search_pipe.database_provider
+        grouped[query] = await database.semantic_search(
+            [float(index)], SearchSettings(search_limit=9)
+        )
+    expected = pipe.reciprocal_rank_fusion(grouped)[:9]
+
+    assert [r.extraction_id for r in results] == [
+        r.extraction_id for r in expected
+    ]
+    assert [r.score for r in results] == pytest.approx(
+        [r.score for r in expected]
+    )
+    assert all(r.metadata["is_rrf_score"] for r in results)
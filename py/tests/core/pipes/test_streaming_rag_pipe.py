@@ -0,0 +1,111 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from core.base import (
+    AggregateSearchResult,
+    CompletionConfig,
+    CompletionProvider,
+    GenerationConfig,
+)
+from core.pipes import StreamingSearchRAGPipe
+
+CHUNKS = 10
+CHUNK_DELAY = 0.05
+
+
+def _chunk(content):
+    return SimpleNamespace(
+        dict=lambda: {
+            "id": "chunk",
+            "object": "chat.completion.chunk",
+            "created": 0,
+            "model": "mock",
+            "choices": [
+                {
+                    "index": 0,
+                    "delta": {"content": content},
+                    "finish_reason": None,
+                }
+            ],
+        }
+    )
+
+
+class SlowStreamingCompletionProvider(CompletionProvider):
+    """Streams `CHUNKS` tokens with a network-like delay between each."""
+
+    async def _execute_task(self, task):
+        async def stream():
+            for i in range(CHUNKS):
+                await asyncio.sleep(CHUNK_DELAY)
+                yield _chunk(f"token{i} ")
+
+        return stream()
+
+    def _execute_task_sync(self, task):
+        for i in range(CHUNKS):
+            time.sleep(CHUNK_DELAY)
+            yield _chunk(f"token{i} ")
+
+
+class _PromptHandler:
+    async def get_message_payload(self, **kwargs):
+        return [{"role": "user", "content": "question"}]
+
+
+@pytest.fixture
+def streaming_rag_pipe(app_config, local_logging_provider):
+    llm_provider = SlowStreamingCompletionProvider(
+        CompletionConfig(provider="litellm", app=app_config)
+    )
+    return StreamingSearchRAGPipe(
+        llm_provider=llm_provider,
+        database_provider=SimpleNamespace(prompt_handler=_PromptHandler()),
+        config=StreamingSearchRAGPipe.PipeConfig(
+            name="streaming_rag_pipe", task_prompt="default_rag"
+        ),
+        logging_provider=local_logging_provider,
+    )
+
+
+async def _stream_answer(pipe: StreamingSearchRAGPipe) -> str:
+    async def search_results():
+        yield "question", AggregateSearchResult(
+            vector_search_results=[], kg_search_results=[]
+        )
+
+    output = await pipe.run(
+        StreamingSearchRAGPipe.Input(message=search_results()),
+        state=None,
+        rag_generation_config=GenerationConfig(model="mock", stream=True),
+    )
+    return "".join([chunk async for chunk in output])
+
+
+@pytest.mark.asyncio
+async def test_streaming_rag_yields_completion(streaming_rag_pipe):
+    answer = await _stream_answer(streaming_rag_pipe)
+    assert answer.startswith("<completion>token0 ")
+    assert answer.endswith("token9 </completion>")
+
+
+@pytest.mark.asyncio
+async def test_parallel_streaming_rag_requests_do_not_block(
+    streaming_rag_pipe,
+):
+    parallel_requests = 8
+    single_duration = CHUNKS * CHUNK_DELAY
+
+    start = time.perf_counter()
+    answers = await asyncio.gather(
+        *(_stream_answer(streaming_rag_pipe) for _ in range(parallel_requests))
+    )
+    elapsed = time.perf_counter() - start
+
+    assert len(answers) == parallel_requests
+    assert all("token9" in answer for answer in answers)
+    # Serialized streams would take `parallel_requests * single_duration`
+    assert elapsed < single_duration * 2
@@ -0,0 +1,129 @@
+import uuid
+
+import pytest
+
+from core.base import (
+    AuthCache,
+    AuthCacheSettings,
+    R2RException,
+    TokenData,
+    UserResponse,
+)
+
+
+def _user(email: str) -> UserResponse:
+    return UserResponse(
+        id=uuid.uuid4(),
+        email=email,
+        is_superuser=False,
+        is_active=True,
+        is_verified=True,
+    )
+
+
+async def _login(auth_provider, email="test@example.com"):
+    await auth_provider.register(email, "password123")
+    tokens = await auth_provider.login(email, "password123")
+    return tokens["access_token"].token
+
+
+@pytest.mark.asyncio
+async def test_user_lookup_is_cached(r2r_auth_provider, monkeypatch):
+    token = await _login(r2r_auth_provider)
+    lookups = []
+    get_user_by_email = r2r_auth_provider.database_provider.get_user_by_email
+
+    async def counting_get_user_by_email(email):
+        lookups.append(email)
+        return await get_user_by_email(email)
+
+    monkeypatch.setattr(
+        r2r_auth_provider.database_provider,
+        "get_user_by_email",
+        counting_get_user_by_email,
+    )
+
+    first = await r2r_auth_provider.user(token)
+    second = await r2r_auth_provider.user(token)
+
+    assert first == second
+    assert lookups == ["test@example.com"]
+    stats = r2r_auth_provider.cache.stats
+    assert stats["token_hits"] == 1
+    assert stats["user_hits"] == 1
+    assert stats["user_hit_rate"] == 0.5
+
+
+@pytest.mark.asyncio
+async def test_logout_invalidates_cached_token(r2r_auth_provider):
+    token = await _login(r2r_auth_provider)
+    await r2r_auth_provider.user(token)
+
+    await r2r_auth_provider.logout(token)
+
+    with pytest.raises(R2RException):
+        await r2r_auth_provider.user(token)
+
+
+@pytest.mark.asyncio
+async def test_blacklist_from_other_workers_is_picked_up(r2r_auth_provider):
+    r2r_auth_provider.cache.settings.blacklist_refresh_seconds = 0
+    token = await _login(r2r_auth_provider)
+    await r2r_auth_provider.user(token)
+
+    # Written straight to the database, as another worker's logout would be
+    await r2r_auth_provider.database_provider.blacklist_token(token)
+
+    with pytest.raises(R2RException):
+        await r2r_auth_provider.decode_token(token)
+
+
+@pytest.mark.asyncio
+async def test_change_password_invalidates_cached_user(r2r_auth_provider):
+    token = await _login(r2r_auth_provider)
+    user = await r2r_auth_provider.user(token)
+
+    await r2r_auth_provider.change_password(
+        user, "password123", "new_password456"
+    )
+    refreshed = await r2r_auth_provider.user(token)
+
+    assert refreshed.hashed_password != user.hashed_password
+
+
+def test_invalidate_user_by_id():
+    cache = AuthCache(AuthCacheSettings())
+    user, other = _user("a@example.com"), _user("b@example.com")
+    cache.put_user(user)
+    cache.put_user(other)
+
+    cache.invalidate_user(user_id=user.id)
+
+    assert cache.get_user(user.email) is None
+    assert cache.get_user(other.email) == other
+
+
+def test_cached_users_cannot_be_mutated():
+    cache = AuthCache(AuthCacheSettings())
+    user = _user("a@example.com")
+    cache.put_user(user)
+
+    cache.get_user(user.email).collection_ids.append(uuid.uuid4())
+
+    assert cache.get_user(user.email).collection_ids == []
+
+
+def test_caches_are_bounded_and_expire():
+    cache = AuthCache(
+        AuthCacheSettings(max_users=2, user_ttl_seconds=0, max_tokens=1)
+    )
+    for i in range(3):
+        cache.put_user(_user(f"{i}@example.com"))
+    assert cache.stats["users"] == 2
+    assert cache.get_user("2@example.com") is None
+
+    token_data = TokenData(email="a@example.com", token_type="access")
+    cache.put_token("one", token_data)
+    cache.put_token("two", token_data)
+    assert cache.get_token("one") is None
+    assert cache.get_token("two") == token_data
@@ -0,0 +1,72 @@
+import asyncio
+import time
+
+import pytest
+
+from core.base import R2RException
+from core.providers import BCryptConfig, BCryptProvider
+
+
+@pytest.mark.asyncio
+async def test_async_hashing_matches_sync(crypto_provider):
+    hashed = await crypto_provider.async_get_password_hash("password123")
+
+    assert crypto_provider.verify_password("password123", hashed)
+    assert await crypto_provider.async_verify_password("password123", hashed)
+    assert not await crypto_provider.async_verify_password("wrong", hashed)
+    stats = crypto_provider.hash_pool.stats
+    assert stats["completed"] == 3
+    assert stats["pending"] == 0
+
+    crypto_provider.hash_pool.shutdown()
+    assert crypto_provider.hash_pool._executor is None
+    # the pool starts again on demand
+    assert await crypto_provider.async_verify_password("password123", hashed)
+    crypto_provider.hash_pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_excess_hashes_are_rejected(app_config):
+    crypto_provider = BCryptProvider(
+        BCryptConfig(app=app_config, salt_rounds=4, max_pending_hashes=2)
+    )
+
+    results = await asyncio.gather(
+        *(crypto_provider.async_get_password_hash("pw") for _ in range(4)),
+        return_exceptions=True,
+    )
+
+    rejected = [r for r in results if isinstance(r, R2RException)]
+    assert len(rejected) == 2
+    assert all(r.status_code == 503 for r in rejected)
+    assert crypto_provider.hash_pool.stats["rejected"] == 2
+
+
+@pytest.mark.asyncio
+async def test_search_latency_stays_flat_during_login_storm(
+    r2r_auth_provider,
+):
+    email, password = "storm@example.com", "password123"
+    await r2r_auth_provider.register(email, password)
+    start = time.perf_counter()
+    r2r_auth_provider.crypto_provider.verify_password(
+        password,
+        (
+            await r2r_auth_provider.database_provider.get_user_by_email(email)
+        ).hashed_password,
+    )
+    hash_seconds = time.perf_counter() - start
+
+    latencies = []
+    storm = asyncio.gather(
+        *(r2r_auth_provider.login(email, password) for _ in range(6))
+    )
+    while not storm.done():
+        # Stands in for a search request doing a few milliseconds of I/O
+        start = time.perf_counter()
+        await asyncio.sleep(0.005)
+        latencies.append(time.perf_counter() - start)
+    await storm
+
+    # Hashing inline would stall the loop for a whole hash per login
+    assert max(latencies) < hash_seconds / 2
@@ -0,0 +1,182 @@
+import io
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from core import Vector, VectorEntry
+from core.base import (
+    DocumentInfo,
+    DocumentType,
+    Entity,
+    KGEnrichmentStatus,
+    R2RException,
+    Triple,
+)
+from core.main.services.management_service import ManagementService
+
+USER_ID = uuid.uuid4()
+OTHER_USER_ID = uuid.uuid4()
+
+
+@pytest.fixture(scope="function")
+async def populated_db(postgres_db_provider, dimension):
+    """Five documents of one user and two of another, each with two chunks,
+    a stored file and a graph, all in one enriched collection."""
+    collection = await postgres_db_provider.create_collection(
+        name="bulk delete"
+    )
+    await postgres_db_provider.connection_manager.execute_query(
+        f"UPDATE {postgres_db_provider.project_name}.collections "
+        "SET kg_enrichment_status = $1",
+        [KGEnrichmentStatus.SUCCESS],
+    )
+
+    document_ids = {USER_ID: [], OTHER_USER_ID: []}
+    for user_id, count in [(USER_ID, 5), (OTHER_USER_ID, 2)]:
+        for _ in range(count):
+            document_id = uuid.uuid4()
+            document_ids[user_id].append(document_id)
+            await postgres_db_provider.upsert_documents_overview(
+                DocumentInfo(
+                    id=document_id,
+                    collection_ids=[collection.collection_id],
+                    user_id=user_id,
+                    document_type=DocumentType.TXT,
+                    metadata={},
+                    version="v0",
+                    size_in_bytes=4,
+                )
+            )
+            await postgres_db_provider.upsert_entries(
+                [
+                    VectorEntry(
+                        extraction_id=uuid.uuid4(),
+                        document_id=document_id,
+                        user_id=user_id,
+                        collection_ids=[collection.collection_id],
+                        vector=Vector(data=[0.1] * dimension),
+                        text="text",
+                        metadata={},
+                    )
+                    for _ in range(2)
+                ]
+            )
+            await postgres_db_provider.store_file(
+                document_id, "file.txt", io.BytesIO(b"text"), "text/plain"
+            )
+            await postgres_db_provider.add_entities(
+                [
+                    Entity(
+                        name=name,
+                        description="description",
+                        extraction_ids=[uuid.uuid4()],
+                        category="category",
+                        document_id=document_id,
+                    )
+                    for name in ["a", "b"]
+                ],
+                table_name="chunk_entity",
+            )
+            await postgres_db_provider.add_triples(
+                [
+                    Triple(
+                        subject="a",
+                        predicate="p",
+                        object="b",
+                        weight=1.0,
+                        description="description",
+                        extraction_ids=[uuid.uuid4()],
+                        attributes={},
+                        document_id=document_id,
+                    )
+                ]
+            )
+    return postgres_db_provider, collection.collection_id, document_ids
+
+
+def _service(db) -> ManagementService:
+    service = ManagementService.__new__(ManagementService)
+    service.providers = SimpleNamespace(database=db)
+    return service
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_cascades(populated_db):
+    db, collection_id, document_ids = populated_db
+    service = _service(db)
+
+    progress = [
+        progress
+        async for progress in service.bulk_delete(
+            {"user_id": {"$eq": str(USER_ID)}}, batch_size=2
+        )
+    ]
+    assert [p["documents_processed"] for p in progress] == [2, 4, 5]
+    assert progress[-1] == {
+        "documents_total": 5,
+        "documents_processed": 5,
+        "chunks_deleted": 10,
+        "documents_deleted": 5,
+        "entities_deleted": 10,
+        "triples_deleted": 5,
+        "files_deleted": 5,
+    }
+
+    overview = await db.get_documents_overview(
+        filter_user_ids=[USER_ID, OTHER_USER_ID]
+    )
+    assert {doc.id for doc in overview["results"]} == set(
+        document_ids[OTHER_USER_ID]
+    )
+    files = await db.get_files_overview(
+        filter_document_ids=document_ids[USER_ID] + document_ids[OTHER_USER_ID]
+    )
+    assert {file["document_id"] for file in files} == set(
+        document_ids[OTHER_USER_ID]
+    )
+    assert (
+        await db.get_document_ids_by_filters(
+            {"user_id": {"$eq": str(USER_ID)}}
+        )
+        == []
+    )
+    (collection,) = (await db.get_collections_overview([collection_id]))[
+        "results"
+    ]
+    assert collection.kg_enrichment_status == KGEnrichmentStatus.OUTDATED
+
+    # the other user's documents and graphs are untouched
+    assert (
+        await db.get_entity_count(
+            document_id=document_ids[OTHER_USER_ID][0],
+            entity_table_name="chunk_entity",
+        )
+        == 2
+    )
+
+    with pytest.raises(R2RException) as error:
+        async for _ in service.bulk_delete({"user_id": {"$eq": str(USER_ID)}}):
+            pass
+    assert error.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_resumes_documents_without_chunks(populated_db):
+    db, _, document_ids = populated_db
+    service = _service(db)
+    # as left behind by an interrupted delete, chunks gone and document not
+    document_id = document_ids[USER_ID][0]
+    await db.delete_document_chunks(
+        [document_id], {"document_id": {"$eq": str(document_id)}}
+    )
+
+    progress = [
+        progress
+        async for progress in service.bulk_delete(
+            {"document_id": {"$eq": str(document_id)}}
+        )
+    ]
+    assert progress[-1]["chunks_deleted"] == 0
+    assert progress[-1]["documents_deleted"] == 1
+    assert progress[-1]["files_deleted"] == 1
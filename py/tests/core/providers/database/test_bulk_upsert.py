@@ -0,0 +1,77 @@
+import uuid
+
+import numpy as np
+import pytest
+
+from core import Vector, VectorEntry
+from core.base import SearchSettings
+
+
+def _entry(dimension, document_id, text, metadata=None, extraction_id=None):
+    return VectorEntry(
+        extraction_id=extraction_id or uuid.uuid4(),
+        document_id=document_id,
+        user_id=uuid.uuid4(),
+        collection_ids=[uuid.uuid4()],
+        vector=Vector(data=np.random.rand(dimension).tolist()),
+        text=text,
+        metadata=metadata or {},
+    )
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_inserts_and_merges(
+    temporary_postgres_db_provider, dimension
+):
+    document_id = uuid.uuid4()
+    entries = [
+        _entry(dimension, document_id, f"chunk {i}", {"chunk_order": i})
+        for i in range(500)
+    ]
+    await temporary_postgres_db_provider.bulk_upsert_entries(entries)
+
+    chunks = await temporary_postgres_db_provider.get_document_chunks(
+        document_id, include_vectors=True
+    )
+    assert chunks["total_entries"] == 500
+    first = chunks["results"][0]
+    assert first["text"] == "chunk 0"
+    assert first["metadata"] == {"chunk_order": 0}
+    np.testing.assert_allclose(
+        first["vector"], entries[0].vector.data, rtol=1e-6
+    )
+
+    # Re-loading existing extraction ids updates them in place; duplicates
+    # within one batch keep the last entry.
+    updated = [
+        _entry(
+            dimension,
+            document_id,
+            f"updated {i}",
+            {"chunk_order": i},
+            extraction_id=entries[i].extraction_id,
+        )
+        for i in range(10)
+    ]
+    updated.append(
+        _entry(
+            dimension,
+            document_id,
+            "updated twice 0",
+            {"chunk_order": 0},
+            extraction_id=entries[0].extraction_id,
+        )
+    )
+    await temporary_postgres_db_provider.bulk_upsert_entries(updated)
+
+    chunks = await temporary_postgres_db_provider.get_document_chunks(
+        document_id, limit=10
+    )
+    assert chunks["total_entries"] == 500
+    assert chunks["results"][0]["text"] == "updated twice 0"
+    assert chunks["results"][1]["text"] == "updated 1"
+
+    results = await temporary_postgres_db_provider.semantic_search(
+        updated[-1].vector.data, SearchSettings(search_limit=1)
+    )
+    assert results[0].extraction_id == entries[0].extraction_id
@@ -0,0 +1,113 @@
+import random
+import uuid
+
+import pytest
+
+from core import DatabaseConfig, Vector, VectorEntry
+from core.base import HybridSearchExecutionMode, SearchSettings
+from core.providers import PostgresDBProvider
+
+WORDS = ["apple", "banana", "cherry", "delta", "echo", "falcon", "granite"]
+
+
+@pytest.fixture(scope="function")
+def hybrid_entries(dimension):
+    rng = random.Random(42)
+    return [
+        VectorEntry(
+            extraction_id=uuid.uuid4(),
+            document_id=uuid.uuid4(),
+            user_id=uuid.uuid4(),
+            collection_ids=[uuid.uuid4()],
+            vector=Vector(data=[rng.random() for _ in range(dimension)]),
+            text=" ".join(
+                rng.choice(WORDS) for _ in range(rng.randint(3, 12))
+            ),
+            metadata={"raw_key": i},
+        )
+        for i in range(60)
+    ]
+
+
+@pytest.fixture(scope="function")
+async def fts_postgres_db_provider(
+    project_name, app_config, dimension, crypto_provider, hybrid_entries
+):
+    config = DatabaseConfig.create(
+        provider="postgres",
+        project_name=project_name,
+        enable_fts=True,
+        app=app_config,
+    )
+    db = PostgresDBProvider(
+        config, dimension=dimension, crypto_provider=crypto_provider
+    )
+    await db.initialize()
+    await db.upsert_entries(hybrid_entries)
+    try:
+        yield db
+    finally:
+        await db.close()
+
+
+def _settings(mode, **kwargs):
+    settings = SearchSettings(use_hybrid_search=True, **kwargs)
+    settings.hybrid_search_settings.execution_mode = mode
+    return settings
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "mode",
+    [HybridSearchExecutionMode.PARALLEL, HybridSearchExecutionMode.SQL],
+)
+@pytest.mark.parametrize("offset", [0, 3])
+async def test_hybrid_search_modes_match_sequential(
+    fts_postgres_db_provider, hybrid_entries, mode, offset
+):
+    query_vector = hybrid_entries[0].vector.data
+    query_text = "apple falcon"
+
+    expected = await fts_postgres_db_provider.hybrid_search(
+        query_text,
+        query_vector,
+        _settings(
+            HybridSearchExecutionMode.SEQUENTIAL,
+            search_limit=10,
+            offset=offset,
+        ),
+    )
+    results = await fts_postgres_db_provider.hybrid_search(
+        query_text,
+        query_vector,
+        _settings(mode, search_limit=10, offset=offset),
+    )
+
+    assert len(results) == len(expected) > 0
+    assert [r.score for r in results] == pytest.approx(
+        [r.score for r in expected]
+    )
+    for result, reference in zip(results, expected):
+        assert result.metadata["semantic_rank"] == (
+            reference.metadata["semantic_rank"]
+        )
+        assert result.metadata["full_text_rank"] == (
+            reference.metadata["full_text_rank"]
+        )
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_sql_mode_applies_filters(
+    fts_postgres_db_provider, hybrid_entries
+):
+    results = await fts_postgres_db_provider.hybrid_search(
+        "apple",
+        hybrid_entries[0].vector.data,
+        _settings(
+            HybridSearchExecutionMode.SQL,
+            search_limit=10,
+            filters={"raw_key": {"$lt": 20}},
+        ),
+    )
+    assert results
+    assert all(r.metadata["raw_key"] < 20 for r in results)
@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from core.base import SearchSettings, VectorQuantizationType
+from core.providers import PostgresDBProvider
+from core.providers.database.codecs import (
+    decode_bit,
+    decode_halfvec,
+    decode_vector,
+    encode_bit,
+    encode_halfvec,
+    encode_vector,
+)
+
+
+def test_vector_codec_roundtrip():
+    values = np.random.rand(1536).astype(np.float32)
+    decoded = decode_vector(encode_vector(values))
+    assert decoded.dtype == np.float32
+    np.testing.assert_array_equal(decoded, values)
+
+
+def test_vector_codec_accepts_lists_and_text():
+    assert decode_vector(encode_vector([1.0, 2.5])).tolist() == [1.0, 2.5]
+    assert decode_vector(encode_vector("[1.0, 2.5]")).tolist() == [1.0, 2.5]
+
+
+def test_halfvec_codec_roundtrip():
+    values = np.array([0.5, -1.25, 3.0], dtype=np.float32)
+    np.testing.assert_array_equal(
+        decode_halfvec(encode_halfvec(values)), values
+    )
+
+
+def test_bit_codec_roundtrip():
+    bits = np.array([True, False, True, True, False, False, True, False, 1])
+    np.testing.assert_array_equal(decode_bit(encode_bit(bits)), bits)
+    np.testing.assert_array_equal(
+        decode_bit(encode_bit("101100101")), bits.astype(bool)
+    )
+
+
+@pytest.mark.asyncio
+async def test_vectors_roundtrip_through_postgres(
+    temporary_postgres_db_provider, sample_entries
+):
+    entry = sample_entries[0]
+    chunks = await temporary_postgres_db_provider.get_document_chunks(
+        entry.document_id, include_vectors=True
+    )
+    vector = chunks["results"][0]["vector"]
+    np.testing.assert_allclose(vector, entry.vector.data, rtol=1e-6)
+
+    results = await temporary_postgres_db_provider.semantic_search(
+        entry.vector.data, SearchSettings(search_limit=1)
+    )
+    assert results[0].extraction_id == entry.extraction_id
+    assert results[0].score == pytest.approx(1.0, abs=1e-5)
+
+
+@pytest.mark.asyncio
+async def test_binary_quantized_upsert(
+    db_config_temporary, dimension, crypto_provider, sample_entries
+):
+    db = PostgresDBProvider(
+        db_config_temporary,
+        dimension=dimension,
+        crypto_provider=crypto_provider,
+        quantization_type=VectorQuantizationType.INT1,
+    )
+    await db.initialize()
+    try:
+        await db.upsert_entries(sample_entries)
+        entry = sample_entries[3]
+        row = await db.connection_manager.fetchrow_query(
+            f"SELECT vec, vec_binary FROM {db.vector_handler._get_table_name('vectors')} WHERE extraction_id = $1",
+            (entry.extraction_id,),
+        )
+        expected = np.asarray(entry.vector.data, dtype=np.float32)
+        np.testing.assert_array_equal(row["vec"], expected)
+        np.testing.assert_array_equal(row["vec_binary"], expected > 0)
+    finally:
+        await db.close()
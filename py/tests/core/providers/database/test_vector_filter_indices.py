@@ -0,0 +1,123 @@
+import uuid
+
+import pytest
+
+from core import Vector, VectorEntry
+from core.providers.database.vecs.exc import FilterError
+
+METADATAS = [
+    {"category": "a", "year": 2020, "tags": ["x", "y"]},
+    {"category": "b", "year": 2021, "tags": "x"},
+    {"category": "a", "year": "2022", "tags": ["z"]},
+    {"category": {"nested": "a"}, "year": 2023},
+]
+
+
+@pytest.fixture(scope="function")
+async def metadata_db(postgres_db_provider, dimension):
+    await postgres_db_provider.upsert_entries(
+        [
+            VectorEntry(
+                extraction_id=uuid.uuid4(),
+                document_id=uuid.uuid4(),
+                user_id=uuid.uuid4(),
+                collection_ids=[uuid.uuid4()],
+                vector=Vector(data=[0.1] * dimension),
+                text=str(i),
+                metadata=metadata,
+            )
+            for i, metadata in enumerate(METADATAS)
+        ]
+    )
+    return postgres_db_provider
+
+
+async def _matching(db, filters) -> list[int]:
+    params: list = []
+    where_clause = db.vector_handler._build_filters(filters, params)
+    results = await db.connection_manager.fetch_query(
+        f"SELECT text FROM {db.project_name}.vectors WHERE {where_clause}",
+        params,
+    )
+    return sorted(int(result["text"]) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_metadata_filters(metadata_db):
+    assert await _matching(metadata_db, {"category": "a"}) == [0, 2]
+    assert await _matching(metadata_db, {"category": {"$eq": "a"}}) == [0, 2]
+    assert await _matching(
+        metadata_db, {"category": {"$eq": {"nested": "a"}}}
+    ) == [3]
+    assert await _matching(
+        metadata_db, {"metadata.category": {"$in": ["b", "c"]}}
+    ) == [1]
+    assert await _matching(metadata_db, {"tags": {"$contains": "x"}}) == [
+        0,
+        1,
+    ]
+    assert await _matching(
+        metadata_db, {"tags": {"$contains": ["x", "y"]}}
+    ) == [0]
+    # the string "2022" is not a number
+    assert await _matching(metadata_db, {"year": {"$gte": 2021}}) == [1, 3]
+    assert await _matching(metadata_db, {"year": {"$lt": 2021.5}}) == [0, 1]
+    assert await _matching(metadata_db, {"it's": {"$eq": 1}}) == []
+
+    with pytest.raises(FilterError):
+        await _matching(metadata_db, {"year": {"$gt": "2021"}})
+
+
+@pytest.mark.asyncio
+async def test_filter_index_recommendations(metadata_db):
+    await _matching(metadata_db, {"category": {"$in": ["a", "b"]}})
+    await _matching(metadata_db, {"tags": {"$contains": "x"}})
+    await _matching(metadata_db, {"year": {"$gt": 2020}})
+
+    recommendations = await metadata_db.recommend_filter_indices()
+    assert [(rec["key"], rec["kind"]) for rec in recommendations] == [
+        (None, "containment"),
+        ("year", "number"),
+    ]
+    assert not any(rec["exists"] for rec in recommendations)
+    assert await metadata_db.recommend_filter_indices(min_usage=2) == [
+        recommendations[0]
+    ]
+
+    names = [
+        await metadata_db.create_filter_index(rec["key"], concurrently=False)
+        for rec in recommendations
+    ]
+    assert names == [rec["name"] for rec in recommendations]
+    indices = await metadata_db.list_filter_indices()
+    assert sorted(index["name"] for index in indices) == sorted(names)
+    assert all(
+        rec["exists"] for rec in await metadata_db.recommend_filter_indices()
+    )
+    # results do not change with the indices in place
+    assert await _matching(metadata_db, {"year": {"$gt": 2020}}) == [1, 3]
+
+    for name in names:
+        await metadata_db.delete_filter_index(name, concurrently=False)
+    assert await metadata_db.list_filter_indices() == []
+
+
+@pytest.mark.asyncio
+async def test_filter_key_usage_is_bounded(metadata_db, monkeypatch):
+    handler = metadata_db.vector_handler
+    monkeypatch.setattr(handler, "MAX_TRACKED_FILTER_KEYS", 2)
+    await _matching(metadata_db, {"year": {"$gt": 2020}})
+    await _matching(metadata_db, {"year": {"$gt": 2021}})
+    await _matching(metadata_db, {"rare": {"$gt": 1}})
+    for key in ["a", "b", "c"]:
+        await _matching(metadata_db, {key: {"$contains": "x"}})
+    await _matching(metadata_db, {"other": {"$lt": 1}})
+
+    recommendations = await metadata_db.recommend_filter_indices()
+    assert [
+        (rec["key"], rec["kind"], rec["usage"]) for rec in recommendations
+    ] == [
+        (None, "containment", 3),
+        ("year", "number", 2),
+        ("other", "number", 1),
+    ]
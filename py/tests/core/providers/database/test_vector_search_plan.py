@@ -0,0 +1,175 @@
+import random
+import uuid
+
+import numpy as np
+import pytest
+
+from core import Vector, VectorEntry
+from core.base import SearchSettings
+from core.base.abstractions import IndexMeasure, IndexMethod, VectorTableName
+from core.providers.database.vector import PostgresVectorHandler
+
+TENANT_USER = uuid.uuid4()
+TENANT_COLLECTION = uuid.uuid4()
+LARGE_COLLECTION = uuid.uuid4()
+
+
+@pytest.fixture(scope="function")
+def tenant_entries(dimension):
+    rng = random.Random(7)
+
+    def entry(user_id, collection_id):
+        return VectorEntry(
+            extraction_id=uuid.uuid4(),
+            document_id=uuid.uuid4(),
+            user_id=user_id,
+            collection_ids=[collection_id],
+            vector=Vector(data=[rng.random() for _ in range(dimension)]),
+            text="text",
+            metadata={},
+        )
+
+    return (
+        [entry(TENANT_USER, uuid.uuid4()) for _ in range(5)]
+        + [entry(uuid.uuid4(), TENANT_COLLECTION) for _ in range(20)]
+        + [entry(uuid.uuid4(), LARGE_COLLECTION) for _ in range(275)]
+    )
+
+
+@pytest.fixture(scope="function")
+async def indexed_db(postgres_db_provider, tenant_entries):
+    await postgres_db_provider.upsert_entries(tenant_entries)
+    await postgres_db_provider.create_index(
+        VectorTableName.VECTORS,
+        IndexMeasure.cosine_distance,
+        IndexMethod.hnsw,
+        concurrently=False,
+    )
+    return postgres_db_provider
+
+
+def _nearest(entries, query_vector, matches, limit):
+    def distance(entry):
+        a, b = np.array(entry.vector.data), np.array(query_vector)
+        return 1 - a @ b / (np.linalg.norm(a) * np.linalg.norm(b))
+
+    return [
+        entry.extraction_id
+        for entry in sorted(filter(matches, entries), key=distance)[:limit]
+    ]
+
+
+def _acl_filter():
+    return {
+        "$or": [
+            {"user_id": {"$eq": str(TENANT_USER)}},
+            {"collection_ids": {"$overlap": [str(TENANT_COLLECTION)]}},
+        ]
+    }
+
+
+def _in_tenant(entry):
+    return (
+        entry.user_id == TENANT_USER
+        or TENANT_COLLECTION in entry.collection_ids
+    )
+
+
+@pytest.mark.asyncio
+async def test_small_tenant_is_scanned_exactly(indexed_db, tenant_entries):
+    query_vector = tenant_entries[-1].vector.data
+    results = await indexed_db.semantic_search(
+        query_vector, SearchSettings(filters=_acl_filter(), search_limit=10)
+    )
+
+    assert {result.search_plan for result in results} == {"exact"}
+    assert [result.extraction_id for result in results] == _nearest(
+        tenant_entries, query_vector, _in_tenant, 10
+    )
+
+
+@pytest.mark.asyncio
+async def test_ann_search_over_fetches_and_falls_back(
+    indexed_db, tenant_entries
+):
+    query_vector = tenant_entries[-1].vector.data
+    settings = SearchSettings(filters=_acl_filter(), search_limit=10)
+    settings.search_plan_settings.exact_scan_threshold = 1
+
+    results = await indexed_db.semantic_search(query_vector, settings)
+    assert {result.search_plan for result in results} == {"hnsw"}
+    assert len(results) == 10
+    assert all(
+        result.user_id == TENANT_USER
+        or TENANT_COLLECTION in result.collection_ids
+        for result in results
+    )
+
+    # too few candidates to fill the page, the filtered rows are scanned
+    settings.search_plan_settings.max_candidates = 20
+    settings.search_plan_settings.overfetch_factor = 1
+    results = await indexed_db.semantic_search(query_vector, settings)
+    assert {result.search_plan for result in results} == {"exact"}
+    assert [result.extraction_id for result in results] == _nearest(
+        tenant_entries, query_vector, _in_tenant, 10
+    )
+
+
+@pytest.mark.asyncio
+async def test_collection_search_uses_partial_index(
+    indexed_db, tenant_entries
+):
+    await indexed_db.create_collection_index(
+        LARGE_COLLECTION, concurrently=False
+    )
+    query_vector = tenant_entries[0].vector.data
+    settings = SearchSettings(
+        filters={"collection_ids": {"$overlap": [str(LARGE_COLLECTION)]}},
+        search_limit=10,
+    )
+    settings.search_plan_settings.exact_scan_threshold = 1
+
+    results = await indexed_db.semantic_search(query_vector, settings)
+    assert {result.search_plan for result in results} == {"partial_index"}
+    assert len(results) == 10
+    assert all(LARGE_COLLECTION in result.collection_ids for result in results)
+
+    await indexed_db.delete_collection_index(
+        LARGE_COLLECTION, concurrently=False
+    )
+    results = await indexed_db.semantic_search(query_vector, settings)
+    assert {result.search_plan for result in results} == {"hnsw"}
+
+
+def test_filtered_rows_estimate():
+    user, first, second = (str(uuid.uuid4()) for _ in range(3))
+    counts = {
+        ("user_id", user): 5,
+        ("collection_ids", first): 100,
+        ("collection_ids", second): 1000,
+    }
+    acl = {
+        "$or": [
+            {"user_id": {"$eq": user}},
+            {"collection_ids": {"$overlap": [first, second]}},
+        ]
+    }
+    estimate = PostgresVectorHandler._estimate_filtered_rows
+    assert estimate(acl, counts, 10**6) == 1105
+    assert estimate({"$and": [acl, {"category": "a"}]}, counts, 10**6) == 1105
+    assert (
+        estimate(
+            {"$and": [acl, {"collection_ids": {"$contains": [first]}}]},
+            counts,
+            10**6,
+        )
+        == 100
+    )
+    assert estimate({"category": "a"}, counts, 10**6) == 10**6
+    assert (
+        PostgresVectorHandler._filter_collection(
+            {"$and": [acl, {"collection_ids": {"$overlap": [first]}}]}
+        )
+        == first
+    )
+    assert PostgresVectorHandler._filter_collection(acl) is None
@@ -0,0 +1,92 @@
+import asyncio
+
+import pytest
+
+from core import EmbeddingBatchingSettings, EmbeddingConfig, EmbeddingPurpose
+from core.providers import LiteLLMEmbeddingProvider
+
+
+class CountingEmbeddingProvider(LiteLLMEmbeddingProvider):
+    def __init__(self, config):
+        super().__init__(config)
+        self.calls: list[list[str]] = []
+
+    async def _execute_task(self, task):
+        self.calls.append(list(task["texts"]))
+        if "fail" in task["texts"]:
+            raise ValueError("upstream failure")
+        return [[float(len(text)), 1.0] for text in task["texts"]]
+
+
+def _provider(app_config, **batching_settings):
+    config = EmbeddingConfig(
+        provider="litellm",
+        base_model="openai/text-embedding-3-small",
+        base_dimension=2,
+        app=app_config,
+        max_retries=1,
+        batching_settings=EmbeddingBatchingSettings(
+            enabled=True, **batching_settings
+        ),
+    )
+    return CountingEmbeddingProvider(config)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_request(app_config):
+    provider = _provider(app_config, max_wait_ms=20)
+
+    single, many = await asyncio.gather(
+        provider.async_get_embedding("a"),
+        provider.async_get_embeddings(["bb", "ccc"]),
+    )
+
+    assert single == [1.0, 1.0]
+    assert many == [[2.0, 1.0], [3.0, 1.0]]
+    assert provider.calls == [["a", "bb", "ccc"]]
+
+    stats = provider.batcher.stats
+    assert stats["batches_sent"] == 1
+    assert stats["requests_batched"] == 2
+    assert stats["avg_fill_rate"] == pytest.approx(3 / 256)
+    assert stats["max_queue_delay_ms"] > 0
+
+
+@pytest.mark.asyncio
+async def test_batches_flush_at_max_texts(app_config):
+    provider = _provider(app_config, max_wait_ms=1_000, max_texts=2)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(
+            *(provider.async_get_embedding(text) for text in "abcd")
+        ),
+        timeout=0.5,
+    )
+
+    assert len(results) == 4
+    assert provider.calls == [["a", "b"], ["c", "d"]]
+
+
+@pytest.mark.asyncio
+async def test_batches_split_by_purpose(app_config):
+    provider = _provider(app_config, max_wait_ms=10)
+
+    await asyncio.gather(
+        provider.async_get_embedding("a", purpose=EmbeddingPurpose.QUERY),
+        provider.async_get_embedding("b", purpose=EmbeddingPurpose.INDEX),
+    )
+
+    assert sorted(provider.calls) == [["a"], ["b"]]
+
+
+@pytest.mark.asyncio
+async def test_failures_propagate_to_every_caller(app_config):
+    provider = _provider(app_config, max_wait_ms=10)
+
+    results = await asyncio.gather(
+        provider.async_get_embedding("fail"),
+        provider.async_get_embedding("ok"),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, Exception) for result in results)
@@ -0,0 +1,132 @@
+import asyncio
+
+import pytest
+
+from core import EmbeddingCacheSettings, EmbeddingConfig, EmbeddingPurpose
+from core.providers import LiteLLMEmbeddingProvider
+
+
+class CountingEmbeddingProvider(LiteLLMEmbeddingProvider):
+    """Returns deterministic vectors and records every upstream call."""
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.calls: list[list[str]] = []
+
+    async def _execute_task(self, task):
+        self.calls.append(list(task["texts"]))
+        await asyncio.sleep(0.01)
+        return [[float(len(text)), 1.0] for text in task["texts"]]
+
+
+def _provider(app_config, **cache_settings):
+    config = EmbeddingConfig(
+        provider="litellm",
+        base_model="openai/text-embedding-3-small",
+        base_dimension=2,
+        app=app_config,
+        cache_settings=EmbeddingCacheSettings(**cache_settings),
+    )
+    return CountingEmbeddingProvider(config)
+
+
+@pytest.mark.asyncio
+async def test_query_embeddings_are_cached(app_config):
+    provider = _provider(app_config)
+
+    first = await provider.async_get_embedding(
+        "what is r2r?", purpose=EmbeddingPurpose.QUERY
+    )
+    # Whitespace differences normalize to the same key
+    second = await provider.async_get_embedding(
+        "  what is   r2r? ", purpose=EmbeddingPurpose.QUERY
+    )
+
+    assert first == second
+    assert len(provider.calls) == 1
+    assert provider.cache.stats["hits"] == 1
+    assert provider.cache.stats["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_index_embeddings_bypass_cache(app_config):
+    provider = _provider(app_config)
+
+    await provider.async_get_embeddings(["chunk"])
+    await provider.async_get_embeddings(["chunk"])
+
+    assert len(provider.calls) == 2
+    assert provider.cache.stats["misses"] == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_embed_once(app_config):
+    provider = _provider(app_config)
+
+    results = await asyncio.gather(
+        *(
+            provider.async_get_embedding(
+                "same query", purpose=EmbeddingPurpose.QUERY
+            )
+            for _ in range(5)
+        )
+    )
+
+    assert len(provider.calls) == 1
+    assert all(result == results[0] for result in results)
+    assert provider.cache.stats["coalesced"] == 4
+
+
+@pytest.mark.asyncio
+async def test_batches_only_embed_missing_texts(app_config):
+    provider = _provider(app_config)
+
+    await provider.async_get_embedding("a", purpose=EmbeddingPurpose.QUERY)
+    vectors = await provider.async_get_embeddings(
+        ["a", "bb", "a"], purpose=EmbeddingPurpose.QUERY
+    )
+
+    assert vectors == [[1.0, 1.0], [2.0, 1.0], [1.0, 1.0]]
+    assert provider.calls == [["a"], ["bb"]]
+
+
+@pytest.mark.asyncio
+async def test_lru_and_ttl_eviction(app_config):
+    provider = _provider(app_config, max_entries=2)
+    for text in ("a", "b", "c"):
+        await provider.async_get_embedding(
+            text, purpose=EmbeddingPurpose.QUERY
+        )
+    assert provider.cache.stats["size"] == 2
+    assert provider.cache.stats["evictions"] == 1
+
+    await provider.async_get_embedding("a", purpose=EmbeddingPurpose.QUERY)
+    assert provider.calls[-1] == ["a"]
+
+    expiring = _provider(app_config, ttl_seconds=0)
+    await expiring.async_get_embedding("a", purpose=EmbeddingPurpose.QUERY)
+    await expiring.async_get_embedding("a", purpose=EmbeddingPurpose.QUERY)
+    assert len(expiring.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_sqlite_backend_shares_hits(app_config, tmp_path):
+    path = str(tmp_path / "embedding_cache.sqlite")
+    first = _provider(app_config, shared_backend="sqlite", sqlite_path=path)
+    second = _provider(app_config, shared_backend="sqlite", sqlite_path=path)
+
+    try:
+        vector = await first.async_get_embedding(
+            "shared", purpose=EmbeddingPurpose.QUERY
+        )
+        assert (
+            await second.async_get_embedding(
+                "shared", purpose=EmbeddingPurpose.QUERY
+            )
+            == vector
+        )
+        assert second.calls == []
+        assert second.cache.stats["shared_hits"] == 1
+    finally:
+        await first.cache.shared_backend.close()
+        await second.cache.shared_backend.close()
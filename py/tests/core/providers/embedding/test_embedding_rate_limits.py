@@ -0,0 +1,118 @@
+import asyncio
+import time
+
+import pytest
+
+from core import EmbeddingConfig, EmbeddingRateLimitSettings
+from core.base.providers.embedding import (
+    AdaptiveConcurrencyLimiter,
+    TokenBucket,
+)
+from core.providers import LiteLLMEmbeddingProvider
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+class ScriptedEmbeddingProvider(LiteLLMEmbeddingProvider):
+    """Fails the first `rate_limited_calls` requests with a 429."""
+
+    def __init__(self, config, rate_limited_calls=0):
+        super().__init__(config)
+        self.calls: list[list[str]] = []
+        self.rate_limited_calls = rate_limited_calls
+
+    async def _execute_task(self, task):
+        self.calls.append(list(task["texts"]))
+        if self.rate_limited_calls:
+            self.rate_limited_calls -= 1
+            raise RateLimitError("Rate limit reached")
+        return [[float(len(text))] for text in task["texts"]]
+
+
+def _provider(app_config, rate_limited_calls=0, **settings):
+    config = EmbeddingConfig(
+        provider="litellm",
+        base_model="huggingface/some-model",
+        base_dimension=1,
+        app=app_config,
+        initial_backoff=0.01,
+        rate_limit_settings=EmbeddingRateLimitSettings(
+            enabled=True, **settings
+        ),
+    )
+    return ScriptedEmbeddingProvider(config, rate_limited_calls)
+
+
+@pytest.mark.asyncio
+async def test_requests_are_packed_by_token_budget(app_config):
+    # 40 chars ~ 11 estimated tokens per text
+    provider = _provider(app_config, max_tokens_per_request=25)
+    texts = ["x" * 40 for _ in range(5)]
+
+    vectors = await provider.async_get_embeddings(texts)
+
+    assert vectors == [[40.0]] * 5
+    assert [len(call) for call in provider.calls] == [2, 2, 1]
+    assert provider.scheduler.stats["tokens_processed"] == 55
+    assert provider.scheduler.stats["tokens_per_second"] > 0
+
+
+@pytest.mark.asyncio
+async def test_rate_limits_shrink_concurrency_and_retry(app_config):
+    provider = _provider(
+        app_config, rate_limited_calls=1, initial_concurrency=8
+    )
+
+    assert await provider.async_get_embedding("abc") == [3.0]
+
+    stats = provider.scheduler.stats
+    assert stats["rate_limited"] == 1
+    assert stats["requests"] == 1
+    assert stats["concurrency_limit"] == 4
+
+
+def test_limiter_aimd():
+    limiter = AdaptiveConcurrencyLimiter(
+        initial=4, minimum=1, maximum=8, decrease_factor=0.5
+    )
+    for _ in range(4):
+        limiter.increase()
+    assert limiter.limit == pytest.approx(5.0, abs=0.1)
+
+    limiter.decrease()
+    limiter.decrease()  # within the cooldown, counted once
+    assert limiter.limit == pytest.approx(2.5, abs=0.1)
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_paces_requests():
+    bucket = TokenBucket(rate_per_minute=600)  # 10 tokens per second
+    await bucket.acquire(600)
+
+    start = time.monotonic()
+    await bucket.acquire(2)
+    assert time.monotonic() - start >= 0.15
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limit_is_enforced(app_config):
+    provider = _provider(app_config, initial_concurrency=2)
+    in_flight = 0
+    peak = 0
+
+    async def slow_execute(task):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return [[0.0] for _ in task["texts"]]
+
+    provider.scheduler.execute_task = slow_execute
+    await asyncio.gather(
+        *(provider.async_get_embedding(str(i)) for i in range(10))
+    )
+
+    assert peak <= 3
@@ -1,8 +1,12 @@
 import io
+import tempfile
+import threading
 import uuid
 
 import pytest
 
+from core.base import R2RException
+
 
 @pytest.mark.asyncio
 async def test_store_and_retrieve_file(postgres_db_provider):
@@ -69,3 +73,66 @@ async def test_get_files_overview(postgres_db_provider):
     assert len(filtered_files_overview) == 1
     assert filtered_files_overview[0]["document_id"] == document_ids[0]
     assert filtered_files_overview[0]["file_name"] == file_names[0]
+
+
+@pytest.mark.asyncio
+async def test_store_file_streams_from_file(postgres_db_provider):
+    document_id = uuid.uuid4()
+    content = bytes(range(256)) * (4096 * 10 + 1)
+    reading_threads = set()
+
+    class RecordingFile(io.BufferedRandom):
+        def read(self, size=-1):
+            reading_threads.add(threading.get_ident())
+            return super().read(size)
+
+    with tempfile.TemporaryFile(buffering=0) as raw:
+        file_content = RecordingFile(raw)
+        file_content.write(content)
+        file_content.seek(0)
+
+        file_size = await postgres_db_provider.store_file(
+            document_id, "large_file.bin", file_content, "octet/stream"
+        )
+
+    assert file_size == len(content)
+    # the blocking reads ran off the event loop
+    assert threading.get_ident() not in reading_threads
+    retrieved_file = await postgres_db_provider.retrieve_file(document_id)
+    assert retrieved_file[1].read() == content
+    assert retrieved_file[2] == len(content)
+
+
+@pytest.mark.asyncio
+async def test_stream_file_ranges(postgres_db_provider, monkeypatch):
+    document_id = uuid.uuid4()
+    content = bytes(range(256)) * 8192
+    await postgres_db_provider.store_file(
+        document_id, "large_file.bin", io.BytesIO(content)
+    )
+    monkeypatch.setattr(postgres_db_provider.file_handler, "CHUNK_SIZE", 1000)
+
+    async def read(document_id, *args):
+        chunks = [
+            chunk
+            async for chunk in postgres_db_provider.stream_file(
+                document_id, *args
+            )
+        ]
+        assert all(len(chunk) <= 1000 for chunk in chunks)
+        return b"".join(chunks)
+
+    assert await read(document_id) == content
+    assert await read(document_id, 0, 10) == content[:10]
+    assert (
+        await read(document_id, 1_000_003, 1_500_000)
+        == content[1_000_003:1_500_000]
+    )
+    assert await read(document_id, len(content) - 5) == content[-5:]
+    assert (
+        await read(document_id, len(content) - 5, len(content) + 5)
+        == content[-5:]
+    )
+
+    with pytest.raises(R2RException):
+        await read(uuid.uuid4())
@@ -0,0 +1,127 @@
+import asyncio
+import tempfile
+from io import BytesIO
+
+import pytest
+from pypdf import PdfWriter
+from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+from core.base import DocumentType, ParserExecutionMode, ParserExecutor
+from core.parsers.media.pdf_parser import PDF_PAGES_PER_TASK
+from core.providers.ingestion import R2RIngestionConfig, R2RIngestionProvider
+
+
+def make_pdf(pages: list[str]) -> bytes:
+    writer = PdfWriter()
+    font = writer._add_object(
+        DictionaryObject(
+            {
+                NameObject("/Type"): NameObject("/Font"),
+                NameObject("/Subtype"): NameObject("/Type1"),
+                NameObject("/BaseFont"): NameObject("/Helvetica"),
+            }
+        )
+    )
+    for text in pages:
+        page = writer.add_blank_page(width=612, height=792)
+        page[NameObject("/Resources")] = DictionaryObject(
+            {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
+        )
+        content = DecodedStreamObject()
+        content.set_data(f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode())
+        page[NameObject("/Contents")] = writer._add_object(content)
+    output = BytesIO()
+    writer.write(output)
+    return output.getvalue()
+
+
+def _pdf_parser(app_config, mode, max_workers=None):
+    config = R2RIngestionConfig(
+        app=app_config,
+        parser_execution_mode=mode,
+        parser_max_workers=max_workers,
+    )
+    provider = R2RIngestionProvider(config, None, None)
+    return provider, provider.parsers[DocumentType.PDF]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "mode", [ParserExecutionMode.INLINE, ParserExecutionMode.THREAD]
+)
+async def test_pdf_pages_are_yielded_in_order(app_config, mode):
+    pages = [f"page {i}" for i in range(PDF_PAGES_PER_TASK * 2 + 3)]
+    provider, parser = _pdf_parser(app_config, mode)
+
+    try:
+        texts = [text async for text in parser.ingest(make_pdf(pages))]
+    finally:
+        provider.parser_executor.shutdown()
+
+    assert texts == pages
+
+
+@pytest.mark.asyncio
+async def test_pdf_pages_are_parsed_in_worker_process(
+    app_config, tmp_path, monkeypatch
+):
+    pages = [f"page {i}" for i in range(PDF_PAGES_PER_TASK * 2 + 1)]
+    provider, parser = _pdf_parser(
+        app_config, ParserExecutionMode.PROCESS, max_workers=1
+    )
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+
+    try:
+        texts = [text async for text in parser.ingest(make_pdf(pages))]
+    finally:
+        provider.parser_executor.shutdown()
+
+    assert texts == pages
+    # the document was handed to the worker through a file, now removed
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_thread_mode_streams_items_as_they_are_produced():
+    produced = []
+
+    def generate():
+        for i in range(3):
+            produced.append(i)
+            yield i
+
+    executor = ParserExecutor(ParserExecutionMode.THREAD, max_workers=1)
+    try:
+        items = executor.iterate(generate)
+        assert await items.__anext__() == 0
+        assert produced == [0]
+        assert [item async for item in items] == [1, 2]
+    finally:
+        executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_event_loop_keeps_running_while_parsing(app_config):
+    pages = [f"page {i} " + "lorem ipsum " * 20 for i in range(200)]
+    data = make_pdf(pages)
+    provider, parser = _pdf_parser(app_config, ParserExecutionMode.THREAD)
+    ticks = 0
+    done = asyncio.Event()
+
+    async def heartbeat():
+        nonlocal ticks
+        while not done.is_set():
+            ticks += 1
+            await asyncio.sleep(0)
+
+    probe = asyncio.create_task(heartbeat())
+    try:
+        async for _ in parser.ingest(data):
+            pass
+    finally:
+        done.set()
+        await probe
+        provider.parser_executor.shutdown()
+
+    # The loop gets a turn at least once per page and once per batch
+    assert ticks > len(pages)
@@ -0,0 +1,172 @@
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from core.base import Document, DocumentExtraction, DocumentType
+from core.base.pipes.base_pipe import AsyncPipe
+from core.pipes import EmbeddingPipe, VectorStoragePipe
+from core.providers.ingestion import R2RIngestionConfig, R2RIngestionProvider
+from core.providers.ingestion.r2r.base import STREAMING_WINDOW_CHUNKS
+
+PAGE = " ".join(f"word{i}" for i in range(200))
+
+
+@pytest.fixture
+def ingestion_provider(app_config):
+    config = R2RIngestionConfig(
+        app=app_config, chunk_size=256, chunk_overlap=32
+    )
+    return R2RIngestionProvider(config, None, None)
+
+
+async def _pages(count):
+    for i in range(count):
+        yield f"page {i} {PAGE}"
+
+
+@pytest.mark.asyncio
+async def test_chunk_stream_matches_full_chunking_for_small_documents(
+    ingestion_provider,
+):
+    pages = [page async for page in _pages(3)]
+    expected = list(ingestion_provider.chunk("\n".join(pages) + "\n", {}))
+
+    streamed = [
+        chunk async for chunk in ingestion_provider.chunk_stream(_pages(3), {})
+    ]
+    assert streamed == expected
+
+
+@pytest.mark.asyncio
+async def test_chunk_stream_covers_large_documents(ingestion_provider):
+    page_count = STREAMING_WINDOW_CHUNKS * 4
+    streamed = [
+        chunk
+        async for chunk in ingestion_provider.chunk_stream(
+            _pages(page_count), {}
+        )
+    ]
+
+    assert all(len(chunk) <= 256 for chunk in streamed)
+    text = " ".join(streamed)
+    for i in range(page_count):
+        assert f"page {i} " in text
+
+
+@pytest.mark.asyncio
+async def test_chunk_stream_resplits_unbreakable_text_rarely(
+    ingestion_provider, monkeypatch
+):
+    class UnbreakableSplitter:
+        _chunk_size = 256
+        calls = 0
+
+        def split_text(self, text):
+            self.calls += 1
+            return [text]
+
+    splitter = UnbreakableSplitter()
+    monkeypatch.setattr(ingestion_provider, "text_splitter", splitter)
+
+    async def texts():
+        for _ in range(1_000):
+            yield "x" * 999
+
+    streamed = [
+        chunk async for chunk in ingestion_provider.chunk_stream(texts(), {})
+    ]
+
+    assert streamed == [("x" * 999 + "\n") * 1_000]
+    # the buffer is re-split each time it doubles, not on every text
+    assert splitter.calls < 20
+
+
+@pytest.mark.asyncio
+async def test_parse_streaming_mode_orders_chunks(ingestion_provider):
+    document = Document(
+        id=uuid.uuid4(),
+        collection_ids=[],
+        user_id=uuid.uuid4(),
+        document_type=DocumentType.TXT,
+        metadata={},
+    )
+    content = "\n".join([f"page {i} {PAGE}" for i in range(100)]).encode()
+
+    extractions = [
+        extraction
+        async for extraction in ingestion_provider.parse(
+            content, document, {"use_streaming_ingestion": True}
+        )
+    ]
+    assert [e.metadata["chunk_order"] for e in extractions] == list(
+        range(len(extractions))
+    )
+
+
+class _FakeEmbeddingProvider:
+    def __init__(self):
+        self.config = SimpleNamespace(concurrent_request_limit=2)
+
+    async def async_get_embeddings(self, texts, stage=None):
+        return [[0.0, 1.0] for _ in texts]
+
+
+class _FakeDatabaseProvider:
+    def __init__(self):
+        self.stored = 0
+
+    async def upsert_entries(self, entries):
+        self.stored += len(entries)
+
+
+@pytest.mark.asyncio
+async def test_embed_and_store_consume_stream_in_bounded_batches(
+    local_logging_provider,
+):
+    embedding_pipe = EmbeddingPipe(
+        embedding_provider=_FakeEmbeddingProvider(),
+        config=AsyncPipe.PipeConfig(name="embedding_pipe"),
+        logging_provider=local_logging_provider,
+        embedding_batch_size=4,
+    )
+    database = _FakeDatabaseProvider()
+    storage_pipe = VectorStoragePipe(
+        database_provider=database,
+        config=AsyncPipe.PipeConfig(name="vector_storage_pipe"),
+        logging_provider=local_logging_provider,
+        storage_batch_size=8,
+    )
+
+    document_id = uuid.uuid4()
+    produced = 0
+    max_in_flight = 0
+
+    async def extractions():
+        nonlocal produced, max_in_flight
+        for i in range(500):
+            produced += 1
+            max_in_flight = max(max_in_flight, produced - database.stored)
+            yield DocumentExtraction(
+                id=uuid.uuid4(),
+                document_id=document_id,
+                user_id=uuid.uuid4(),
+                collection_ids=[],
+                data=f"chunk {i}",
+                metadata={"chunk_order": i},
+            )
+
+    embeddings = await embedding_pipe.run(
+        EmbeddingPipe.Input(message=extractions()), state=None
+    )
+    results = [
+        result
+        async for result in await storage_pipe.run(
+            VectorStoragePipe.Input(message=embeddings), state=None
+        )
+    ]
+
+    assert database.stored == 500
+    assert results[0].num_chunks == 500
+    # Bounded by one storage batch plus the embedding batches in flight
+    assert max_in_flight <= 8 + 4 * 2 + 4
@@ -0,0 +1,102 @@
+import random
+
+import pytest
+
+from core.base import (
+    CharacterTextSplitter,
+    ChunkingStrategy,
+    RecursiveCharacterTextSplitter,
+)
+from core.providers.ingestion import R2RIngestionConfig, R2RIngestionProvider
+from shared.utils.splitter.text import Language
+
+PIECES = ["word", "a", " ", "  ", "\n", "\n\n", "\n\n\n", "\t", ".", "\ndef "]
+
+
+def _texts(count: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    return [
+        "".join(rng.choice(PIECES) for _ in range(rng.randint(0, 400)))
+        for _ in range(count)
+    ]
+
+
+def _settings(seed: int) -> dict:
+    rng = random.Random(seed)
+    chunk_size = rng.randint(1, 64)
+    return {
+        "chunk_size": chunk_size,
+        "chunk_overlap": rng.randint(0, chunk_size),
+        "keep_separator": rng.random() < 0.5,
+        "strip_whitespace": rng.random() < 0.7,
+    }
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_recursive_splitter_matches_reference(seed):
+    splitter = RecursiveCharacterTextSplitter(**_settings(seed))
+    for text in _texts(20, seed):
+        assert splitter.split_text(text) == splitter._split_text(
+            text, splitter._separators
+        )
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_language_splitter_matches_reference(seed):
+    splitter = RecursiveCharacterTextSplitter.from_language(
+        Language.PYTHON, **_settings(seed)
+    )
+    for text in _texts(20, seed):
+        assert splitter.split_text(text) == splitter._split_text(
+            text, splitter._separators
+        )
+
+
+@pytest.mark.parametrize("separator", ["\n\n", " ", ""])
+@pytest.mark.parametrize("seed", range(10))
+def test_character_splitter_matches_reference(separator, seed):
+    splitter = CharacterTextSplitter(separator=separator, **_settings(seed))
+    for text in _texts(20, seed):
+        assert splitter.split_text(text) == splitter._split_text(text)
+
+
+def test_spans_point_into_source():
+    splitter = RecursiveCharacterTextSplitter(chunk_size=50, chunk_overlap=10)
+    for text in _texts(20):
+        chunks = splitter.split_text(text)
+        spans = list(splitter.split_text_spans(text))
+        assert [text[start:end] for start, end in spans] == chunks
+
+
+def test_chunks_are_yielded_lazily():
+    splitter = RecursiveCharacterTextSplitter(chunk_size=100, chunk_overlap=0)
+    text = "\n\n".join(f"paragraph {i}" for i in range(100_000))
+
+    first = next(splitter.iter_split_text(text))
+
+    assert first.startswith("paragraph 0")
+
+
+def test_small_overlap_keeps_chunk_boundaries():
+    splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=1)
+    text = " ".join("x" for _ in range(5000))
+
+    chunks = splitter.split_text(text)
+
+    assert chunks == splitter._split_text(text, splitter._separators)
+    assert all(len(chunk) <= 1000 for chunk in chunks)
+
+
+def test_character_chunking_strategy(app_config):
+    config = R2RIngestionConfig(
+        app=app_config,
+        chunking_strategy=ChunkingStrategy.CHARACTER,
+        chunk_size=20,
+        chunk_overlap=0,
+        separator=" ",
+    )
+    provider = R2RIngestionProvider(config, None, None)
+
+    chunks = list(provider.chunk("one two three four five six seven", {}))
+
+    assert chunks == ["one two three four", "five six seven"]
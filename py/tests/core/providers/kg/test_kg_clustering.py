@@ -0,0 +1,235 @@
+import uuid
+
+import networkx as nx
+import pytest
+
+from core.base import Triple
+from core.providers.database.kg_clustering import TripleGraph
+
+
+def _clique_triples(groups: int = 3, size: int = 6) -> list[Triple]:
+    triples = []
+    for group in range(groups):
+        members = [f"g{group}_e{i}" for i in range(size)]
+        for i, subject in enumerate(members):
+            for object in members[i + 1 :]:
+                triples.append(
+                    Triple(
+                        id=len(triples) + 1,
+                        subject=subject,
+                        predicate="related_to",
+                        object=object,
+                        weight=1.0,
+                    )
+                )
+    # a weak bridge between neighbouring groups
+    for group in range(groups - 1):
+        triples.append(
+            Triple(
+                id=len(triples) + 1,
+                subject=f"g{group}_e0",
+                predicate="related_to",
+                object=f"g{group + 1}_e0",
+                weight=0.1,
+            )
+        )
+    return triples
+
+
+def _final_partition(names, nodes, clusters, is_final) -> set[frozenset]:
+    partition: dict[int, set] = {}
+    for node, cluster, final in zip(nodes, clusters, is_final):
+        if final:
+            partition.setdefault(cluster, set()).add(names[node])
+    return {frozenset(members) for members in partition.values()}
+
+
+def test_triple_ids_follow_insertion_order():
+    graph = TripleGraph()
+    graph.add_triples([("a", "b", 1.0, 10), ("b", "c", 1.0, 11)])
+    graph.add_triples([("c", "a", 2.0, 12), ("b", "b", 1.0, 13)])
+
+    assert graph.nodes == ["a", "b", "c"]
+    assert graph.num_triples == 4
+    assert graph.triple_ids(graph.node_id("a")) == [10, 12]
+    assert graph.triple_ids(graph.node_id("b")) == [10, 11, 13, 13]
+    assert graph.triple_ids(graph.node_id("c")) == [11, 12]
+
+
+def test_leiden_edges_collapse_repeats_and_drop_self_loops():
+    graph = TripleGraph()
+    graph.add_triples(
+        [
+            ("a", "b", 1.0, 1),
+            ("b", "a", 3.0, 2),
+            ("a", "a", 5.0, 3),
+            ("b", "c", 2.0, 4),
+        ]
+    )
+
+    sources, targets, weights = graph.leiden_edges()
+
+    edges = {
+        frozenset((graph.nodes[s], graph.nodes[t])): w
+        for s, t, w in zip(sources, targets, weights)
+    }
+    assert edges == {frozenset("ab"): 3.0, frozenset("bc"): 2.0}
+
+
+@pytest.mark.asyncio
+async def test_clusters_match_networkx_graspologic():
+    from graspologic.partition import hierarchical_leiden
+
+    triples = _clique_triples()
+    params = {"max_cluster_size": 1000, "random_seed": 42}
+    graph = TripleGraph.from_triples(triples)
+
+    clusters = await graph.cluster(params, use_process=False)
+
+    reference_graph = nx.Graph()
+    for triple in triples:
+        reference_graph.add_edge(
+            triple.subject, triple.object, weight=triple.weight
+        )
+    reference = {}
+    for entry in hierarchical_leiden(reference_graph, **params):
+        if entry.is_final_cluster:
+            reference.setdefault(entry.cluster, set()).add(entry.node)
+    assert _final_partition(
+        graph.nodes,
+        clusters.node,
+        clusters.cluster,
+        clusters.is_final_cluster,
+    ) == {frozenset(members) for members in reference.values()}
+    assert clusters.num_communities == 3
+
+
+@pytest.mark.asyncio
+async def test_clustering_in_worker_process_streams_records():
+    graph = TripleGraph.from_triples(_clique_triples())
+
+    clusters = await graph.cluster({"random_seed": 42}, use_process=True)
+    records = list(graph.community_info_records(clusters, cluster_offset=10))
+
+    assert len(records) == graph.num_nodes
+    assert {record[1] for record in records} == {10, 11, 12}
+    node, _, parent_cluster, level, is_final_cluster, triple_ids = records[0]
+    assert parent_cluster is None and level == 0 and is_final_cluster
+    assert triple_ids == graph.triple_ids(graph.node_id(node))
+
+
+@pytest.mark.asyncio
+async def test_community_info_is_bulk_loaded(postgres_db_provider):
+    collection_id = uuid.uuid4()
+    kg_handler = postgres_db_provider.kg_handler
+    graph = TripleGraph.from_triples(_clique_triples())
+
+    num_communities = await kg_handler._cluster_and_add_community_info(
+        graph, {"random_seed": 42}, collection_id
+    )
+
+    rows = await postgres_db_provider.connection_manager.fetch_query(
+        f"SELECT node, cluster, triple_ids FROM {kg_handler._get_table_name('community_info')} WHERE collection_id = $1",
+        [collection_id],
+    )
+    assert num_communities == 3
+    assert len(rows) == graph.num_nodes
+    assert {row["node"]: row["triple_ids"] for row in rows} == {
+        node: graph.triple_ids(graph.node_id(node)) for node in graph.nodes
+    }
+
+
+@pytest.mark.asyncio
+async def test_triples_are_streamed_from_postgres(postgres_db_provider):
+    collection_id, document_id = uuid.uuid4(), uuid.uuid4()
+    kg_handler = postgres_db_provider.kg_handler
+    connection_manager = postgres_db_provider.connection_manager
+    await connection_manager.execute_query(
+        f"INSERT INTO {kg_handler._get_table_name('document_info')} (document_id, collection_ids) VALUES ($1, $2)",
+        [document_id, [collection_id]],
+    )
+    triples = _clique_triples()
+    await connection_manager.execute_many(
+        f"""
+        INSERT INTO {kg_handler._get_table_name('chunk_triple')}
+        (subject, predicate, object, weight, description, extraction_ids, document_id, attributes)
+        VALUES ($1, $2, $3, $4, '', '{{}}', $5, '{{}}')
+        """,
+        [
+            (t.subject, t.predicate, t.object, t.weight, document_id)
+            for t in triples
+        ],
+    )
+
+    graph = await kg_handler._get_triple_graph(collection_id, batch_size=7)
+
+    assert graph.num_triples == len(triples)
+    assert graph.num_nodes == TripleGraph.from_triples(triples).num_nodes
+
+
+@pytest.mark.asyncio
+async def test_incremental_clustering_tracks_new_triples(
+    postgres_db_provider, dimension
+):
+    from core.base import CommunityReport
+
+    collection_id = uuid.uuid4()
+    kg_handler = postgres_db_provider.kg_handler
+    triples = _clique_triples()
+    await kg_handler._cluster_and_add_community_info(
+        TripleGraph.from_triples(triples), {"random_seed": 42}, collection_id
+    )
+    for community_number in range(3):
+        await postgres_db_provider.add_community_report(
+            CommunityReport(
+                community_number=community_number,
+                level=0,
+                collection_id=collection_id,
+                name=f"report {community_number}",
+                rating=1.0,
+                rating_explanation="",
+                embedding=[0.1] * dimension,
+            )
+        )
+
+    # one triple inside an existing community and a new group of entities
+    next_id = len(triples) + 1
+    new_triples = [
+        Triple(id=next_id, subject="g0_e1", predicate="p", object="g0_e2"),
+        *(
+            Triple(
+                id=next_id + 1 + i,
+                subject=f"n_e{i}",
+                predicate="p",
+                object=f"n_e{i + 1}",
+            )
+            for i in range(3)
+        ),
+    ]
+    graph = TripleGraph.from_triples(triples + new_triples)
+
+    num_communities = await kg_handler._incremental_clustering(
+        graph, {"random_seed": 42}, collection_id
+    )
+
+    rows = await postgres_db_provider.connection_manager.fetch_query(
+        f"SELECT node, cluster, triple_ids FROM {kg_handler._get_table_name('community_info')} WHERE collection_id = $1",
+        [collection_id],
+    )
+    info = {row["node"]: row for row in rows}
+    new_clusters = {info[f"n_e{i}"]["cluster"] for i in range(4)}
+    # new communities are numbered after the existing ones
+    assert min(new_clusters) == 3
+    assert num_communities == 3 + len(new_clusters)
+    assert next_id in info["g0_e1"]["triple_ids"]
+    assert next_id in info["g0_e2"]["triple_ids"]
+    for i in range(4):
+        assert info[f"n_e{i}"]["triple_ids"] == graph.triple_ids(
+            graph.node_id(f"n_e{i}")
+        )
+    reports = await postgres_db_provider.check_community_reports_exist(
+        collection_id, 0, num_communities
+    )
+    assert sorted(reports) == sorted(
+        {0, 1, 2} - {info["g0_e1"]["cluster"], info["g0_e2"]["cluster"]}
+    )
@@ -0,0 +1,114 @@
+import json
+import uuid
+
+import numpy as np
+import pytest
+from sklearn.cluster import DBSCAN
+
+from core.base import AsyncPipe, Entity
+from core.pipes.kg.deduplication import KGEntityDeduplicationPipe
+from core.pipes.kg.deduplication_engine import UnionFind, cluster_embeddings
+
+
+def _partition(labels) -> set[frozenset]:
+    clusters: dict[int, set] = {}
+    for index, label in enumerate(labels):
+        if label != -1:
+            clusters.setdefault(label, set()).add(index)
+    return {frozenset(members) for members in clusters.values()}
+
+
+def _near_duplicates(num_bases=400, num_duplicates=300, dimension=32):
+    rng = np.random.default_rng(0)
+    bases = rng.normal(size=(num_bases, dimension))
+    duplicates = bases[rng.integers(0, num_bases, num_duplicates)]
+    duplicates += rng.normal(scale=0.05, size=duplicates.shape)
+    return np.vstack([bases, duplicates]).astype(np.float32)
+
+
+def test_union_find_merges_chains_in_batches():
+    union_find = UnionFind(6)
+    union_find.union(np.array([0, 3, 2]), np.array([1, 4, 1]))
+    union_find.union(np.array([4]), np.array([0]))
+
+    labels = union_find.labels()
+
+    assert labels[5] == -1
+    assert len(set(labels[:5])) == 1
+
+
+@pytest.mark.parametrize("method", ["exact", "ivf"])
+def test_clusters_match_dbscan(method):
+    embeddings = _near_duplicates()
+    reference = DBSCAN(eps=0.1, min_samples=2, metric="cosine").fit(embeddings)
+
+    labels = cluster_embeddings(
+        embeddings.copy(), eps=0.1, method=method, max_block_bytes=4096
+    )
+
+    assert _partition(labels) == _partition(reference.labels_)
+
+
+@pytest.mark.asyncio
+async def test_description_deduplication_streams_embeddings(
+    postgres_db_provider, local_logging_provider, dimension
+):
+    collection_id, document_id = uuid.uuid4(), uuid.uuid4()
+    kg_handler = postgres_db_provider.kg_handler
+    await postgres_db_provider.connection_manager.execute_query(
+        f"INSERT INTO {kg_handler._get_table_name('document_info')} (document_id, collection_ids) VALUES ($1, $2)",
+        [document_id, [collection_id]],
+    )
+    embeddings = _near_duplicates(
+        num_bases=20, num_duplicates=5, dimension=dimension
+    )
+    await postgres_db_provider.add_entities(
+        [
+            Entity(
+                name=f"entity_{i}",
+                description=f"description {i}",
+                extraction_ids=[uuid.uuid4()],
+                document_id=document_id,
+                description_embedding=embedding.tolist(),
+            )
+            for i, embedding in enumerate(embeddings)
+        ],
+        table_name="document_entity",
+    )
+
+    entity_ids, matrix = await postgres_db_provider.get_entity_embeddings(
+        collection_id, batch_size=7
+    )
+    assert len(entity_ids) == len(embeddings)
+    np.testing.assert_allclose(matrix, embeddings, rtol=1e-5)
+
+    pipe = KGEntityDeduplicationPipe(
+        config=AsyncPipe.PipeConfig(name="kg_entity_deduplication_pipe"),
+        database_provider=postgres_db_provider,
+        llm_provider=None,  # type: ignore
+        embedding_provider=None,  # type: ignore
+        logging_provider=local_logging_provider,
+    )
+    results = [
+        result
+        async for result in pipe.kg_description_entity_deduplication(
+            collection_id, eps=0.1
+        )
+    ]
+
+    expected = _partition(
+        DBSCAN(eps=0.1, min_samples=2, metric="cosine").fit(embeddings).labels_
+    )
+    assert results[0]["num_entities"] == len(expected)
+    rows = await postgres_db_provider.connection_manager.fetch_query(
+        f"SELECT attributes FROM {kg_handler._get_table_name('collection_entity')} WHERE collection_id = $1",
+        [collection_id],
+    )
+    aliases = {
+        frozenset(
+            int(name.split("_")[1])
+            for name in json.loads(row["attributes"])["aliases"]
+        )
+        for row in rows
+    }
+    assert aliases == expected
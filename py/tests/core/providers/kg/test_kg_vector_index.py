@@ -0,0 +1,91 @@
+import uuid
+
+import pytest
+
+from core.base import CommunityReport
+from core.base.abstractions import (
+    IndexArgsHNSW,
+    IndexArgsIVFFlat,
+    IndexMethod,
+    VectorTableName,
+)
+from core.providers.database.vecs.exc import ArgError
+
+
+@pytest.mark.asyncio
+async def test_kg_vector_index_lifecycle(postgres_db_provider, dimension):
+    collection_id = uuid.uuid4()
+    for community_number in range(3):
+        await postgres_db_provider.add_community_report(
+            CommunityReport(
+                community_number=community_number,
+                level=0,
+                collection_id=collection_id,
+                name=f"community {community_number}",
+                summary="summary",
+                findings=["finding"],
+                rating=1.0,
+                rating_explanation="",
+                embedding=[0.1 * (community_number + 1)] * dimension,
+            )
+        )
+
+    index_name = f"ix_test_{uuid.uuid4().hex[:12]}"
+    assert (
+        await postgres_db_provider.create_vector_index(
+            VectorTableName.COMMUNITIES,
+            index_method=IndexMethod.hnsw,
+            index_arguments=IndexArgsHNSW(m=8, ef_construction=32),
+            index_name=index_name,
+        )
+        == index_name
+    )
+
+    indices = await postgres_db_provider.list_vector_indices(
+        VectorTableName.COMMUNITIES
+    )
+    (index,) = [index for index in indices if index["name"] == index_name]
+    assert index["method"] == "hnsw"
+    assert "m='8'" in index["definition"]
+
+    results = [
+        result
+        async for result in await postgres_db_provider.vector_query(
+            "query",
+            search_type="__Community__",
+            embedding_type="embedding",
+            query_embedding=str([0.1] * dimension),
+            property_names=["name"],
+            filters={"collection_ids": {"$overlap": [str(collection_id)]}},
+            limit=3,
+            ef_search=100,
+            probes=5,
+        )
+    ]
+    assert len(results) == 3
+
+    await postgres_db_provider.delete_vector_index(
+        index_name, VectorTableName.COMMUNITIES, concurrently=False
+    )
+    indices = await postgres_db_provider.list_vector_indices(
+        VectorTableName.COMMUNITIES
+    )
+    assert index_name not in [index["name"] for index in indices]
+
+
+@pytest.mark.asyncio
+async def test_kg_vector_index_rejects_invalid_requests(postgres_db_provider):
+    with pytest.raises(ArgError):
+        await postgres_db_provider.create_vector_index(VectorTableName.VECTORS)
+
+    with pytest.raises(ArgError):
+        await postgres_db_provider.create_vector_index(
+            VectorTableName.TRIPLES,
+            index_method=IndexMethod.hnsw,
+            index_arguments=IndexArgsIVFFlat(n_lists=10),
+        )
+
+    with pytest.raises(ArgError):
+        await postgres_db_provider.delete_vector_index(
+            "ix_does_not_exist", VectorTableName.ENTITIES_DOCUMENT
+        )
@@ -0,0 +1,115 @@
+import asyncio
+
+import pytest
+
+from core import (
+    LogBufferSettings,
+    PersistentLoggingConfig,
+    RunType,
+    SqlitePersistentLoggingProvider,
+    generate_run_id,
+)
+
+
+@pytest.fixture
+async def make_provider(app_config, tmp_path):
+    providers = []
+
+    async def make(**settings):
+        provider = SqlitePersistentLoggingProvider(
+            PersistentLoggingConfig(
+                app=app_config,
+                logging_path=str(tmp_path / "logs.sqlite"),
+                buffer_settings=LogBufferSettings(**settings),
+            )
+        )
+        await provider.initialize()
+        providers.append(provider)
+        return provider
+
+    yield make
+    for provider in providers:
+        await provider.close()
+
+
+@pytest.mark.asyncio
+async def test_logs_are_written_in_one_batch(make_provider):
+    provider = await make_provider(flush_interval_ms=60_000)
+    run_id = generate_run_id()
+
+    for i in range(20):
+        await provider.log(run_id, f"key_{i}", "value")
+    assert provider.sink.stats["queue_depth"] == 20
+
+    logs = await provider.get_logs([run_id], limit_per_run=100)
+
+    assert len(logs) == 20
+    stats = provider.sink.stats
+    assert stats["queue_depth"] == 0
+    assert stats["flushes"] == 1
+    assert stats["written"] == 20
+    assert stats["last_flush_latency_ms"] > 0
+
+
+@pytest.mark.asyncio
+async def test_batch_size_triggers_flush(make_provider):
+    provider = await make_provider(max_batch_size=5, flush_interval_ms=60_000)
+    run_id = generate_run_id()
+
+    for i in range(5):
+        await provider.log(run_id, "key", str(i))
+    await asyncio.sleep(0.05)
+
+    assert provider.sink.stats["written"] == 5
+
+
+@pytest.mark.asyncio
+async def test_overload_samples_by_key_then_drops(make_provider):
+    provider = await make_provider(
+        flush_interval_ms=60_000,
+        max_queue_size=10,
+        sample_watermark=0.5,
+        sample_every=3,
+    )
+    run_id = generate_run_id()
+
+    for i in range(30):
+        await provider.log(run_id, "search_results", str(i))
+        await provider.log(run_id, "search_query", str(i))
+
+    stats = provider.sink.stats
+    assert stats["queue_depth"] == 10
+    assert stats["sampled_out"] > 0
+    assert stats["dropped"] > 0
+    keys = {params[2] for _, params in provider.sink.records}
+    assert keys == {"search_results", "search_query"}
+
+
+@pytest.mark.asyncio
+async def test_close_flushes_pending_records(make_provider):
+    provider = await make_provider(flush_interval_ms=60_000)
+    run_id = generate_run_id()
+    user_id = generate_run_id()
+    await provider.log(run_id, "key", "value")
+    await provider.info_log(run_id, RunType.RETRIEVAL, user_id)
+    await provider.info_log(run_id, RunType.MANAGEMENT, user_id)
+
+    await provider.close()
+    reopened = await make_provider()
+
+    assert len(await reopened.get_logs([run_id])) == 1
+    info_logs = await reopened.get_info_logs()
+    assert [(log.run_id, log.run_type) for log in info_logs] == [
+        (run_id, RunType.MANAGEMENT)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_unbuffered_mode_writes_immediately(make_provider):
+    provider = await make_provider(enabled=False)
+    run_id = generate_run_id()
+
+    await provider.log(run_id, "key", "value")
+
+    assert provider.sink is None
+    assert len(await provider.get_logs([run_id])) == 1